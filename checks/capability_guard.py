@@ -10,12 +10,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from infrahub_sdk.checks import InfrahubCheck
+from .common import BaseCheck
 
 OVERLAY_ROLES = {"leaf", "border-leaf", "border_leaf"}
 
 
-class CheckCapabilityGuard(InfrahubCheck):
+class CheckCapabilityGuard(BaseCheck):
     """Validate that leaf/border-leaf devices have both underlay and overlay BGP services."""
 
     query = "capability_guard"
@@ -1,8 +1,12 @@
+from collections.abc import Callable
 from typing import Any
 
+from infrahub_sdk.checks import InfrahubCheck
+
 from utils.data_cleaning import clean_data, get_data
+from utils.profiling import payload_target, profiled
 
-__all__ = ["clean_data", "get_data", "validate_interfaces"]
+__all__ = ["BaseCheck", "DeviceCheck", "clean_data", "get_data", "validate_interfaces"]
 
 
 def validate_interfaces(data: dict[str, Any]) -> list[str]:
@@ -22,3 +26,39 @@ def validate_interfaces(data: dict[str, Any]) -> list[str]:
             errors.append(f"Loopback interface '{interface.get('name', 'unknown')}' has no IP address assigned.")
 
     return errors
+
+
+class BaseCheck(InfrahubCheck):
+    """Base class for the repository's checks: runs are profiled when ``PROFILING`` is set.
+
+    Profiles are named after the check and its parameters (or the first
+    object of the payload); see utils/profiling.py.
+    """
+
+    async def run(self, data: dict | None = None) -> bool:
+        target = ",".join(str(value) for value in self.params.values())
+        with profiled("check", self.name, lambda: target or payload_target(data)):
+            return await super().run(data=data)
+
+
+class DeviceCheck(BaseCheck):
+    """Base class for device checks running ``validators`` on one device.
+
+    Checks only read what their validators need, so they run the slim
+    ``device_validation`` query (queries/validation/device.gql: interface
+    name, role and IP presence) instead of the device's config-rendering
+    query. A subclass adding a validator that reads more fields declares its
+    own ``query``.
+
+    Class attributes:
+        validators: Functions returning error messages for the cleaned device data.
+    """
+
+    query = "device_validation"
+    validators: tuple[Callable[[dict[str, Any]], list[str]], ...] = (validate_interfaces,)
+
+    def validate(self, data: Any) -> None:
+        device = get_data(data)
+        for validator in self.validators:
+            for error in validator(device):
+                self.log_error(message=error)
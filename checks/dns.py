@@ -0,0 +1,141 @@
+"""Concurrent, cached DNS resolution for checks.
+
+Checks run inside a shared worker, so a blocking ``socket.gethostbyname`` per
+backend stalls every other check on that worker. ``resolve_all`` resolves
+names concurrently with a per-lookup timeout, through a pluggable async
+resolver (the system resolver via ``loop.getaddrinfo`` by default, a local
+stand-in in tests). Results are kept in a TTL-bounded cache that is shared by
+all checks of the worker process (``DEFAULT_CACHE``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, replace
+from typing import Optional
+
+Resolver = Callable[[str], Awaitable[str]]
+"""Async callable returning the IPv4 address of a hostname (raising on failure)."""
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """Outcome of one hostname lookup."""
+
+    hostname: str
+    address: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.address is not None
+
+    @property
+    def latency_ms(self) -> float:
+        return round(self.seconds * 1000, 1)
+
+
+async def system_resolver(hostname: str) -> str:
+    """Resolve ``hostname`` with the system resolver without blocking the event loop."""
+    infos = await asyncio.get_running_loop().getaddrinfo(hostname, None, family=socket.AF_INET)
+    if not infos:
+        raise socket.gaierror(f"No address for {hostname}")
+    return str(infos[0][4][0])
+
+
+class DNSCache:
+    """TTL-bounded cache of resolutions.
+
+    Failed lookups are cached for ``negative_ttl`` so an unreachable resolver
+    is not hit again by every check, but recovers quickly.
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 30.0, max_entries: int = 10_000) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, Resolution]] = {}
+
+    def get(self, hostname: str) -> Optional[Resolution]:
+        entry = self._entries.get(hostname)
+        if entry is None:
+            return None
+        expires, resolution = entry
+        if expires <= time.monotonic():
+            del self._entries[hostname]
+            return None
+        return replace(resolution, cached=True)
+
+    def put(self, resolution: Resolution) -> None:
+        if len(self._entries) >= self.max_entries:
+            self.purge()
+            if len(self._entries) >= self.max_entries:
+                # Still full: drop the oldest insertions
+                for hostname in list(self._entries)[: len(self._entries) - self.max_entries + 1]:
+                    del self._entries[hostname]
+        ttl = self.ttl if resolution.ok else self.negative_ttl
+        self._entries[resolution.hostname] = (time.monotonic() + ttl, resolution)
+
+    def purge(self) -> None:
+        """Drop expired entries."""
+        now = time.monotonic()
+        for hostname in [name for name, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[hostname]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+DEFAULT_CACHE = DNSCache()
+"""Cache shared by every check running in this worker process."""
+
+
+async def resolve(
+    hostname: str,
+    resolver: Resolver = system_resolver,
+    timeout: float = 2.0,
+    cache: Optional[DNSCache] = DEFAULT_CACHE,
+) -> Resolution:
+    """Resolve one hostname, from ``cache`` when possible."""
+    if cache is not None and (cached := cache.get(hostname)) is not None:
+        return cached
+
+    started = time.perf_counter()
+    try:
+        address = await asyncio.wait_for(resolver(hostname), timeout=timeout)
+        resolution = Resolution(hostname, address=address, seconds=time.perf_counter() - started)
+    except asyncio.TimeoutError:
+        resolution = Resolution(hostname, error=f"timed out after {timeout}s", seconds=time.perf_counter() - started)
+    except (OSError, ValueError) as exc:
+        resolution = Resolution(hostname, error=str(exc), seconds=time.perf_counter() - started)
+
+    if cache is not None:
+        cache.put(resolution)
+    return resolution
+
+
+async def resolve_all(
+    hostnames: Iterable[str],
+    resolver: Resolver = system_resolver,
+    timeout: float = 2.0,
+    cache: Optional[DNSCache] = DEFAULT_CACHE,
+    max_concurrency: int = 32,
+) -> dict[str, Resolution]:
+    """Resolve every distinct hostname concurrently; return ``{hostname: Resolution}``."""
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def _one(hostname: str) -> Resolution:
+        async with semaphore:
+            return await resolve(hostname, resolver=resolver, timeout=timeout, cache=cache)
+
+    names = list(dict.fromkeys(name for name in hostnames if name))
+    results = await asyncio.gather(*(_one(name) for name in names))
+    return dict(zip(names, results))
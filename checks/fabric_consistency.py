@@ -0,0 +1,172 @@
+"""Fabric consistency check — cross-device invariants of one data center.
+
+Runs once per data center (``topologies_dc``) in the proposed change
+pipeline. The ``fabric_consistency`` query fetches a compact projection of
+the whole fabric (cables, interface addresses, BGP processes and sessions)
+in one request; ``index_fabric`` walks it once into hash indexes and
+``fabric_violations`` evaluates every invariant against them:
+
+- An IP address assigned to more than one interface
+- Overlapping loopback prefixes (sort-and-sweep over address intervals)
+- An underlay ASN shared by more than one device
+- Asymmetric BGP sessions: not exactly two BGP processes, the same device
+  on both ends, or a session type contradicting the ASNs of its ends
+- Cables without exactly two endpoints
+
+Cost grows linearly with the fabric (plus one sort of the loopbacks), so a
+DC of thousands of devices is one query and one pass, not N device checks.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from .common import BaseCheck, clean_data
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+
+
+class SessionEnd(NamedTuple):
+    """One side of a BGP session, as seen from the BGP process listing it."""
+
+    device: str
+    process: str
+    asn: int | None
+    session_type: str
+    processes: int
+
+
+@dataclass
+class FabricIndex:
+    """Hash indexes over one data center, built by ``index_fabric``."""
+
+    addresses: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+    loopbacks: list[tuple[IPNetwork, IPAddress, str]] = field(default_factory=list)
+    underlay_asns: dict[int, list[str]] = field(default_factory=lambda: defaultdict(list))
+    sessions: dict[str, list[SessionEnd]] = field(default_factory=lambda: defaultdict(list))
+    cables: list[tuple[str, int]] = field(default_factory=list)
+    devices: int = 0
+
+
+def _asn(process: dict[str, Any]) -> int | None:
+    local_as = process.get("local_as") or {}
+    asn = local_as.get("asn") if isinstance(local_as, dict) else None
+    return int(asn) if asn is not None else None
+
+
+def _index_device(index: FabricIndex, device: dict[str, Any]) -> None:
+    name = device.get("name", "unknown")
+    for interface in device.get("interfaces") or []:
+        address = (interface.get("ip_address") or {}).get("address")
+        if not address:
+            continue
+        owner = f"{name} {interface.get('name', '?')}"
+        # Infrahub stores addresses normalized, so the host part is a hash key as is
+        index.addresses[address.split("/")[0]].append(owner)
+        if interface.get("role") == "loopback":
+            iface = ipaddress.ip_interface(address)
+            index.loopbacks.append((iface.network, iface.ip, owner))
+
+    for capability in device.get("device_capabilities") or []:
+        if capability.get("typename") != "ManagedBGP":
+            continue
+        process = capability.get("name", "")
+        asn = _asn(capability)
+        if "underlay" in process.lower() and asn is not None:
+            index.underlay_asns[asn].append(name)
+        for peering in capability.get("peerings") or []:
+            index.sessions[peering.get("name", "?")].append(
+                SessionEnd(name, process, asn, peering.get("session_type") or "", peering.get("bgp_processes") or 0)
+            )
+
+
+def index_fabric(data: Any) -> FabricIndex:
+    """Index the ``fabric_consistency`` payload (raw or cleaned) in one pass."""
+    cleaned = clean_data(data)
+    cleaned = cleaned.get("data", cleaned)
+    index = FabricIndex()
+    seen: set[str] = set()
+    deployments = (cleaned.get("TopologyDataCenter") or []) + (cleaned.get("TopologyPod") or [])
+    for deployment in deployments:
+        for cable in deployment.get("cables") or []:
+            endpoints = [endpoint for endpoint in cable.get("endpoints") or [] if endpoint]
+            index.cables.append((cable.get("name", "?"), len(endpoints)))
+        for device in deployment.get("devices") or []:
+            if device.get("name") in seen:
+                continue
+            seen.add(device.get("name"))
+            _index_device(index, device)
+    index.devices = len(seen)
+    return index
+
+
+def _overlapping_loopbacks(loopbacks: list[tuple[IPNetwork, IPAddress, str]]) -> list[str]:
+    """Loopback prefixes overlapping an earlier one, by a sweep over (version, start, end)."""
+    errors: list[str] = []
+    ordered = sorted(
+        loopbacks, key=lambda lb: (lb[0].version, int(lb[0].network_address), -int(lb[0].broadcast_address))
+    )
+    widest: tuple[IPNetwork, IPAddress, str] | None = None
+    for loopback in ordered:
+        network, ip, owner = loopback
+        if widest is not None and widest[0].version == network.version:
+            if int(network.network_address) <= int(widest[0].broadcast_address):
+                if ip != widest[1]:  # identical addresses are reported as duplicates
+                    errors.append(
+                        f"Loopback {ip}/{network.prefixlen} ({owner}) overlaps "
+                        f"{widest[1]}/{widest[0].prefixlen} ({widest[2]})"
+                    )
+                if int(network.broadcast_address) <= int(widest[0].broadcast_address):
+                    continue
+        widest = loopback
+    return errors
+
+
+def _session_errors(name: str, ends: list[SessionEnd]) -> list[str]:
+    processes = max(end.processes for end in ends)
+    if processes != 2:
+        return [f"BGP session {name} has {processes} BGP process(es), expected 2"]
+    if len(ends) < 2:  # the other end belongs to a device outside this data center
+        return []
+    a, b = ends[0], ends[1]
+    if a.device == b.device:
+        return [f"BGP session {name} connects {a.device} to itself"]
+    if a.asn is None or b.asn is None:
+        return []
+    if a.session_type == "IBGP" and a.asn != b.asn:
+        return [f"BGP session {name} is IBGP between AS{a.asn} ({a.device}) and AS{b.asn} ({b.device})"]
+    if a.session_type.startswith("EBGP") and a.asn == b.asn:
+        return [f"BGP session {name} is {a.session_type} within AS{a.asn} ({a.device}, {b.device})"]
+    return []
+
+
+def fabric_violations(index: FabricIndex) -> list[str]:
+    """Every cross-device invariant violated in ``index``, one message each."""
+    errors: list[str] = []
+    for ip, owners in sorted(index.addresses.items()):
+        if len(owners) > 1:
+            errors.append(f"IP {ip} assigned to {len(owners)} interfaces: {', '.join(sorted(owners))}")
+    errors += _overlapping_loopbacks(index.loopbacks)
+    for asn, devices in sorted(index.underlay_asns.items()):
+        if len(devices) > 1:
+            errors.append(f"Underlay AS{asn} shared by {', '.join(sorted(devices))}")
+    for name, ends in sorted(index.sessions.items()):
+        errors += _session_errors(name, ends)
+    for name, endpoints in sorted(index.cables):
+        if endpoints != 2:
+            errors.append(f"Cable {name} has {endpoints} endpoint(s), expected 2")
+    return errors
+
+
+class CheckFabricConsistency(BaseCheck):
+    """Validate cross-device invariants of a data center in a single pass."""
+
+    query = "fabric_consistency"
+
+    def validate(self, data: Any) -> None:
+        for error in fabric_violations(index_fabric(data)):
+            self.log_error(message=error)
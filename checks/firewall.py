@@ -2,12 +2,10 @@
 
 from typing import Any
 
-from infrahub_sdk.checks import InfrahubCheck
+from .common import BaseCheck, clean_data
 
-from utils.data_cleaning import clean_data
 
-
-class CheckFirewall(InfrahubCheck):
+class CheckFirewall(BaseCheck):
     """Validate that every zone referenced in a security policy rule has at least
     one member segment (non-empty CIDR list) and exists as a SecurityZone node."""
 
@@ -1,22 +1,35 @@
 """Validate Load Balancer backend connectivity and DNS resolution."""
 
-import socket
-from typing import Any
+from typing import Any, Optional
 
-from infrahub_sdk.checks import InfrahubCheck
+from .common import BaseCheck, clean_data
+from .dns import DEFAULT_CACHE, DNSCache, Resolution, Resolver, resolve_all, system_resolver
 
-from .common import clean_data
 
+class CheckLoadBalancer(BaseCheck):
+    """Check Load Balancer backend connectivity.
 
-class CheckLoadBalancer(InfrahubCheck):
-    """Check Load Balancer backend connectivity."""
+    With ``resolve_backends`` set, backend hostnames are resolved
+    concurrently through ``resolver`` with a per-lookup ``dns_timeout``;
+    results are cached per worker in ``dns_cache``. The lookups are
+    informational only: a check result never depends on DNS. Override the
+    class attributes to enable them or plug in another resolver (e.g. in tests).
+    """
 
     query = "loadbalancer_validation"
 
-    def validate(self, data: Any) -> None:
+    resolve_backends: bool = False
+    resolver: Resolver = staticmethod(system_resolver)  # type: ignore[assignment]
+    dns_timeout: float = 2.0
+    dns_cache: Optional[DNSCache] = DEFAULT_CACHE
+    dns_max_concurrency: int = 32
+
+    async def validate(self, data: Any) -> None:
         """Validate Load Balancer backend servers using proper device_service relationships."""
         errors: list[str] = []
         warnings: list[str] = []
+        # (hostname, configured IP, VIP service) of every on-prem backend server
+        backends: list[tuple[str, Optional[str], str]] = []
 
         # Clean but don't extract first value - we need both queries
         cleaned_data = clean_data(data)
@@ -76,6 +89,11 @@ class CheckLoadBalancer(InfrahubCheck):
                 continue
 
             pool_name = backend_pool.get("name", "Unknown Pool")
+            backends.extend(
+                (server["hostname"], _server_ip(server), service_name)
+                for server in backend_pool.get("onprem_servers") or []
+                if isinstance(server, dict) and server.get("hostname")
+            )
 
             # Count backend servers from both sources (using GraphQL count)
             onprem_servers = backend_pool.get("onprem_servers", {})
@@ -92,6 +110,9 @@ class CheckLoadBalancer(InfrahubCheck):
                     f"VIP service '{service_name}' (pool: {pool_name}) has only {total_backends} backend server - no redundancy"
                 )
 
+        if self.resolve_backends:
+            await self._report_backend_dns(backends)
+
         # Display all errors and warnings
         if errors:
             for error in errors:
@@ -100,30 +121,73 @@ class CheckLoadBalancer(InfrahubCheck):
         # Note: Warnings are handled inline (e.g., backend server redundancy)
         # For now, only critical errors cause check failure
 
+    async def _report_backend_dns(self, backends: list[tuple[str, Optional[str], str]]) -> None:
+        """Resolve all backend hostnames concurrently and log what was found.
+
+        Every lookup is reported with its latency, mismatches included: the
+        resolver sees the worker's DNS, not the one of the backends' network.
+        """
+        if not backends:
+            return
+
+        resolutions = await resolve_all(
+            (hostname for hostname, _, _ in backends),
+            resolver=self.resolver,
+            timeout=self.dns_timeout,
+            cache=self.dns_cache,
+            max_concurrency=self.dns_max_concurrency,
+        )
+
+        for hostname, server_ip, vip_context in backends:
+            dns_errors, dns_notes = self._dns_findings(resolutions[hostname], server_ip, vip_context)
+            for note in dns_errors + dns_notes:
+                self.log_info(message=note)
+
+        latencies = sorted(resolution.latency_ms for resolution in resolutions.values() if not resolution.cached)
+        self.log_info(
+            message=f"Resolved {sum(r.ok for r in resolutions.values())}/{len(resolutions)} backend hostname(s) "
+            f"({len(resolutions) - len(latencies)} cached), slowest lookup {latencies[-1] if latencies else 0.0} ms"
+        )
+
+    @staticmethod
+    def _dns_findings(
+        resolution: Resolution,
+        server_ip: str | None = None,
+        vip_context: str | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """Return (errors, notes) for one backend's DNS resolution."""
+        context = f" (VIP: {vip_context})" if vip_context else ""
+        source = "cached" if resolution.cached else f"{resolution.latency_ms} ms"
+
+        if not resolution.ok:
+            return [], [
+                f"DNS resolution test for '{resolution.hostname}'{context}: {resolution.error} "
+                f"({source}, expected for test data)"
+            ]
+        if server_ip and server_ip != "unknown" and resolution.address != server_ip:
+            return [
+                f"DNS mismatch for '{resolution.hostname}'{context}: configured IP {server_ip} "
+                f"!= resolved IP {resolution.address} ({source})"
+            ], []
+        return [], [f"DNS '{resolution.hostname}'{context} -> {resolution.address} ({source})"]
+
     def _validate_server_connectivity(
         self,
         server_name: str,
         server_ip: str | None = None,
         vip_context: str | None = None,
+        resolution: Optional[Resolution] = None,
     ) -> tuple[list[str], list[str]]:
-        """Validate DNS resolution and ping connectivity for a server."""
-        dns_errors = []
-        ping_errors = []
+        """Validate DNS resolution (from a prior lookup) and ping connectivity for a server."""
+        dns_errors: list[str] = []
+        ping_errors: list[str] = []
 
         context = f" (VIP: {vip_context})" if vip_context else ""
 
-        # 1. DNS Resolution Test
-        try:
-            # Try to resolve hostname to IP
-            resolved_ip = socket.gethostbyname(server_name)
-            if server_ip and server_ip != "unknown" and resolved_ip != server_ip:
-                dns_errors.append(
-                    f"DNS mismatch for '{server_name}'{context}: configured IP {server_ip} != resolved IP {resolved_ip}"
-                )
-        except socket.gaierror as e:
-            dns_errors.append(f"DNS resolution test for '{server_name}'{context}: {str(e)} (expected for test data)")
-        except Exception as e:
-            dns_errors.append(f"DNS check error for '{server_name}'{context}: {str(e)}")
+        # 1. DNS Resolution Test (resolved concurrently by resolve_all, never blocking here)
+        if resolution is not None:
+            dns_errors, dns_notes = self._dns_findings(resolution, server_ip, vip_context)
+            dns_errors.extend(dns_notes)
 
         # 2. Ping Connectivity Test
         # Only test if we have a valid IP
@@ -155,3 +219,10 @@ class CheckLoadBalancer(InfrahubCheck):
                 ping_errors.append(f"Ping check error for '{server_name}' ({server_ip}){context}: {str(e)}")
 
         return dns_errors, ping_errors
+
+
+def _server_ip(server: dict[str, Any]) -> Optional[str]:
+    """Configured IP of a backend server, without prefix length."""
+    ip_address = server.get("ip_address") or {}
+    address = ip_address.get("address") if isinstance(ip_address, dict) else ip_address
+    return str(address).split("/")[0] if address else None
@@ -1,23 +1,7 @@
-"""Validate firewall."""
+"""Validate spine."""
 
-from typing import Any
+from .common import DeviceCheck
 
-from infrahub_sdk.checks import InfrahubCheck
 
-from .common import get_data, validate_interfaces
-
-
-class CheckSpine(InfrahubCheck):
+class CheckSpine(DeviceCheck):
     """Check Spine."""
-
-    query = "spine_config"
-
-    def validate(self, data: Any) -> None:
-        """Validate Sonic Spine."""
-        errors: list[str] = []
-        data = get_data(data)
-        errors.extend(validate_interfaces(data))
-        # Display all errors
-        if errors:
-            for error in errors:
-                self.log_error(message=error)
@@ -7,6 +7,7 @@ from utils.data_cleaning import clean_data
 from ..common import CommonGenerator, DeviceOptions
 from ..helpers import calculate_super_spine_loopback_prefix, name_to_asn_range
 from ..helpers.routing import RoutingStrategy
+from ..instrumentation import phased
 from ..models import DCModel
 from ..protocols import RoutingAutonomousSystem, RoutingOSPFArea, TopologyPod
 from ..types import RoutingOptions
@@ -15,6 +16,7 @@ from ..types import RoutingOptions
 class DCTopologyGenerator(CommonGenerator):
     """Generate data center topology with super-spine infrastructure."""
 
+    @phased("checksum")
     async def update_checksum(self) -> None:
         """Update checksum for all pods in the data center.
 
@@ -231,7 +233,11 @@ class DCTopologyGenerator(CommonGenerator):
             RoutingStrategy.EBGP_IBGP.value,
             RoutingStrategy.OSPF_IBGP.value,
         ):
-            routing_opts = RoutingOptions(design=self.data.design, asn_pool=ss_asn_pool_id)
+            routing_opts = RoutingOptions(
+                design=self.data.design,
+                asn_pool=ss_asn_pool_id,
+                rr_redundancy=self.data.design.rr_redundancy,
+            )
             if routing_strategy == RoutingStrategy.OSPF_IBGP.value:
                 routing_opts["skip_underlay"] = True
             await self.create_routing(
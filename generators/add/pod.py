@@ -6,6 +6,7 @@ from utils.data_cleaning import clean_data
 
 from ..common import CablingOptions, CommonGenerator, DeviceOptions, RoutingOptions
 from ..helpers.routing import RoutingStrategy
+from ..instrumentation import phased
 from ..models import PodModel
 from ..protocols import LocationRack
 
@@ -17,12 +18,17 @@ class PodTopologyGenerator(CommonGenerator):
     within a pod topology.
     """
 
+    @phased("checksum")
     async def update_checksum(self) -> None:
         """Update checksum for racks in the pod and add them to group context for protection.
 
         Combined operation to avoid querying racks twice:
         1. Protects all existing racks from deletion
         2. Updates checksum for network/tor racks to trigger their generation
+
+        In mixed deployments only the network racks are triggered here; each one
+        triggers the ToR racks of its row once its leafs exist (see
+        ``RackGenerator.update_checksum``).
         """
 
         # Query all racks in this pod once
@@ -147,131 +153,141 @@ class PodTopologyGenerator(CommonGenerator):
                 f"p2p={p2p_addressing}, ipv6={is_ipv6}, dual_stack={is_dual_stack}, deployment={deployment_type})"
             )
 
-        # Allocate/upsert pools (idempotent via identifier + allow_upsert)
-        # Must always run so objects are tracked by the generator framework
-        pod_pools = await self.allocate_resource_pools(
-            id=pod_id,
-            strategy="pod",
-            pools=pool_sizes,
-        )
-
-        # Reference DC-level ASN pool (one pool per DC, shared by all devices)
-        # DC generator creates the pool; pod just references it for routing and propagates to pod.asn_pool
-        dc_asn_pool_id: str | None = None
-        dc_asn_pool_name: str | None = None
-        if dc.super_spine_asn_pool and dc.super_spine_asn_pool.name:
-            dc_asn_pool_id = dc.super_spine_asn_pool.id
-            dc_asn_pool_name = dc.super_spine_asn_pool.name
-
-            # Propagate DC pool reference to pod so rack generator can find it via pod.asn_pool
-            pod_obj = await self.client.get(kind="TopologyPod", id=pod_id)
-            if pod_obj:
-                pod_obj.asn_pool = {"id": dc.super_spine_asn_pool.id}
-                await pod_obj.save(allow_upsert=True)
-                self.logger.info(f"Pod {self.data.name}: linked to DC ASN pool '{dc_asn_pool_name}'")
-
-        # Pass management pool ID from DC parent (create_devices resolves ID to SDK object)
-        management_pool_id = dc.management_pool.id if dc.management_pool else None
-
-        spines = await self.create_devices(
-            deployment_id=self.data.id,
-            device_role="spine",
-            amount=spine_count,
-            template=spine_template.model_dump(),
-            naming_convention=naming_conv,
-            options=DeviceOptions(
-                indexes=indexes,
-                allocate_loopback=True,
-                loopback_pool=pod_pools.get("loopback"),
-                loopback_prefix_length=128 if is_ipv6 else 32,
-                management_pool=management_pool_id,
-            ),
-        )
-
-        parent = self.data.parent
-        super_spine_devices = [device.name for device in (parent.devices or [])]
-        super_spine_interfaces = [iface.name for iface in parent.super_spine_template.interfaces]
-
-        # Create spine underlay BGP processes immediately after device creation.
-        # Super-spines are declared as top_devices so the planner skips AS+BGP
-        # creation for them (already owned by DC generator). No underlay peerings
-        # are created here since cables don't exist yet — they are created in the
-        # second routing call after cabling is complete below.
-        if (
-            dc_design
-            and dc_asn_pool_id
-            and dc_design.routing_strategy
-            in (
-                RoutingStrategy.EBGP_EBGP.value,
-                RoutingStrategy.EBGP_IBGP.value,
-            )
-        ):
-            await self.create_routing(
-                bottom_devices=spines,
-                top_devices=super_spine_devices,
-                options=RoutingOptions(design=dc_design, asn_pool=dc_asn_pool_id),
-            )
-
-        spine_interfaces_data = spine_template.interfaces
-        spine_interfaces = [iface.name for iface in spine_interfaces_data]
-        if not spine_interfaces:
-            self.logger.error(
-                f"Pod {self.data.name}: No uplink interfaces found in spine template. "
-                "Cannot create spine-to-super-spine cabling."
+        with self.phase("pools"):
+            # Allocate/upsert pools (idempotent via identifier + allow_upsert)
+            # Must always run so objects are tracked by the generator framework
+            pod_pools = await self.allocate_resource_pools(
+                id=pod_id,
+                strategy="pod",
+                pools=pool_sizes,
             )
-            raise RuntimeError(f"Pod {self.data.name}: Cannot cable spines - no uplink interfaces in template")
 
-        # Skip cabling if no super-spines (single-pod DC scenario)
-        skip_cabling = False
-        if not super_spine_devices or not super_spine_interfaces:
-            self.logger.info(
-                f"Pod {self.data.name}: Skipping spine-to-super-spine cabling (single-pod DC or no super-spines)"
-            )
-            skip_cabling = True
-
-        if not skip_cabling:
-            dc_max_spines = dc_design.max_spines_per_pod if dc_design else spine_count
-            cabling_offset = (self.data.index - 1) * dc_max_spines
-
-            technical_pool = pod_pools.get("technical")
-
-            # Cable all spines to super-spines — upsert handles idempotency.
-            # Existing cables are re-saved (tracked by group), new ones are created.
-            p2p_prefix_length = 127 if is_ipv6 else 31
-            await self.create_cabling(
-                bottom_devices=spines,
-                bottom_interfaces=spine_interfaces,
-                top_devices=super_spine_devices,
-                top_interfaces=super_spine_interfaces,
-                strategy="pod",
-                options=CablingOptions(
-                    cabling_offset=cabling_offset,
-                    pool=technical_pool,
-                    p2p_prefix_length=p2p_prefix_length,
+            # Reference DC-level ASN pool (one pool per DC, shared by all devices)
+            # DC generator creates the pool; pod just references it for routing and propagates to pod.asn_pool
+            dc_asn_pool_id: str | None = None
+            dc_asn_pool_name: str | None = None
+            if dc.super_spine_asn_pool and dc.super_spine_asn_pool.name:
+                dc_asn_pool_id = dc.super_spine_asn_pool.id
+                dc_asn_pool_name = dc.super_spine_asn_pool.name
+
+                # Propagate DC pool reference to pod so rack generator can find it via pod.asn_pool
+                pod_obj = await self.client.get(kind="TopologyPod", id=pod_id)
+                if pod_obj:
+                    pod_obj.asn_pool = {"id": dc.super_spine_asn_pool.id}
+                    await pod_obj.save(allow_upsert=True)
+                    self.logger.info(f"Pod {self.data.name}: linked to DC ASN pool '{dc_asn_pool_name}'")
+
+        with self.phase("spines"):
+            # Pass management pool ID from DC parent (create_devices resolves ID to SDK object)
+            management_pool_id = dc.management_pool.id if dc.management_pool else None
+
+            spines = await self.create_devices(
+                deployment_id=self.data.id,
+                device_role="spine",
+                amount=spine_count,
+                template=spine_template.model_dump(),
+                naming_convention=naming_conv,
+                options=DeviceOptions(
+                    indexes=indexes,
+                    allocate_loopback=True,
+                    loopback_pool=pod_pools.get("loopback"),
+                    loopback_prefix_length=128 if is_ipv6 else 32,
+                    management_pool=management_pool_id,
                 ),
-                bottom_sorting=self.data.spine_interface_sorting_method,
-                top_sorting=parent.fabric_interface_sorting_method,
             )
 
-        # Create routing for super-spine ↔ spine peerings (after spine-to-super-spine cabling)
-        if dc_design:
-            super_spine_names = [device.name for device in (parent.devices or [])]
-
-            routing_options: RoutingOptions = RoutingOptions(design=dc_design)
-            if dc_asn_pool_id:
-                routing_options["asn_pool"] = dc_asn_pool_id
+            parent = self.data.parent
+            super_spine_devices = [device.name for device in (parent.devices or [])]
+            super_spine_interfaces = [iface.name for iface in parent.super_spine_template.interfaces]
+
+            # Create spine underlay BGP processes immediately after device creation.
+            # Super-spines are declared as top_devices so the planner skips AS+BGP
+            # creation for them (already owned by DC generator). No underlay peerings
+            # are created here since cables don't exist yet — they are created in the
+            # second routing call after cabling is complete below.
+            if (
+                dc_design
+                and dc_asn_pool_id
+                and dc_design.routing_strategy
+                in (
+                    RoutingStrategy.EBGP_EBGP.value,
+                    RoutingStrategy.EBGP_IBGP.value,
+                )
+            ):
+                await self.create_routing(
+                    bottom_devices=spines,
+                    top_devices=super_spine_devices,
+                    options=RoutingOptions(
+                        design=dc_design,
+                        asn_pool=dc_asn_pool_id,
+                        rr_redundancy=dc_design.rr_redundancy,
+                    ),
+                )
 
-            strategy = dc_design.routing_strategy
+        with self.phase("uplinks"):
+            spine_interfaces_data = spine_template.interfaces
+            spine_interfaces = [iface.name for iface in spine_interfaces_data]
+            if not spine_interfaces:
+                self.logger.error(
+                    f"Pod {self.data.name}: No uplink interfaces found in spine template. "
+                    "Cannot create spine-to-super-spine cabling."
+                )
+                raise RuntimeError(f"Pod {self.data.name}: Cannot cable spines - no uplink interfaces in template")
 
-            if super_spine_names:
+            # Skip cabling if no super-spines (single-pod DC scenario)
+            skip_cabling = False
+            if not super_spine_devices or not super_spine_interfaces:
                 self.logger.info(
-                    f"Creating spine ↔ super-spine peerings: {len(spines)} spine(s) + "
-                    f"{len(super_spine_names)} super-spine(s) [strategy={strategy}]"
+                    f"Pod {self.data.name}: Skipping spine-to-super-spine cabling (single-pod DC or no super-spines)"
+                )
+                skip_cabling = True
+
+            if not skip_cabling:
+                dc_max_spines = dc_design.max_spines_per_pod if dc_design else spine_count
+                cabling_offset = (self.data.index - 1) * dc_max_spines
+
+                technical_pool = pod_pools.get("technical")
+
+                # Cable all spines to super-spines — upsert handles idempotency.
+                # Existing cables are re-saved (tracked by group), new ones are created.
+                p2p_prefix_length = 127 if is_ipv6 else 31
+                await self.create_cabling(
+                    bottom_devices=spines,
+                    bottom_interfaces=spine_interfaces,
+                    top_devices=super_spine_devices,
+                    top_interfaces=super_spine_interfaces,
+                    strategy="pod",
+                    options=CablingOptions(
+                        cabling_offset=cabling_offset,
+                        pool=technical_pool,
+                        p2p_prefix_length=p2p_prefix_length,
+                    ),
+                    bottom_sorting=self.data.spine_interface_sorting_method,
+                    top_sorting=parent.fabric_interface_sorting_method,
                 )
 
-            await self.create_routing(
-                bottom_devices=spines,
-                top_devices=super_spine_names,
-                options=routing_options,
-            )
+            # Create routing for super-spine ↔ spine peerings (after spine-to-super-spine cabling)
+            if dc_design:
+                super_spine_names = [device.name for device in (parent.devices or [])]
+
+                routing_options: RoutingOptions = RoutingOptions(
+                    design=dc_design,
+                    rr_redundancy=dc_design.rr_redundancy,
+                )
+                if dc_asn_pool_id:
+                    routing_options["asn_pool"] = dc_asn_pool_id
+
+                strategy = dc_design.routing_strategy
+
+                if super_spine_names:
+                    self.logger.info(
+                        f"Creating spine ↔ super-spine peerings: {len(spines)} spine(s) + "
+                        f"{len(super_spine_names)} super-spine(s) [strategy={strategy}]"
+                    )
+
+                await self.create_routing(
+                    bottom_devices=spines,
+                    top_devices=super_spine_names,
+                    options=routing_options,
+                )
         await self.update_checksum()
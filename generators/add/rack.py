@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Literal, cast
 
 from utils.data_cleaning import clean_data
 
 from ..common import CablingOptions, CommonGenerator, DeviceOptions, RoutingOptions
-from ..helpers import DeviceNamingConfig
+from ..helpers import DeviceNamingConfig, calculate_cabling_offset
+from ..instrumentation import phased
 from ..models import RackModel
 from ..protocols import DcimPhysicalDevice, DcimPhysicalInterface, LocationRack
 
@@ -103,6 +103,7 @@ class RackGenerator(CommonGenerator):
 
         return devices_with_interfaces
 
+    @phased("checksum")
     async def update_checksum(self) -> None:
         """Update checksum for ToR racks in same row (mixed mode only).
 
@@ -141,11 +142,8 @@ class RackGenerator(CommonGenerator):
 
         network_checksum = network_racks[0].checksum.value if network_racks[0].checksum else self.data.checksum
 
-        for i, rack in enumerate(tor_racks):
-            # Stagger ToR rack triggers so the middle rack generator finishes creating leafs
-            # before each ToR rack generator fires. ToR racks depend on leaf devices existing.
-            if i > 0:
-                await asyncio.sleep(5)
+        # Leafs exist (checked above), so every ToR rack can be triggered at once
+        for rack in tor_racks:
             rack.checksum.value = network_checksum
             await rack.save(allow_upsert=True)
             self.logger.info(
@@ -271,11 +269,11 @@ class RackGenerator(CommonGenerator):
         device_type: str = "leaf",
         racks_in_previous_rows: int | None = None,
     ) -> int:
-        """Calculate cabling offset using simple formula based on rack position."""
+        """Calculate cabling offset using simple formula based on rack position.
 
-        current_index = self.data.index
-
-        # Get deployment_type from pod and max_tors from design
+        Thin wrapper around ``calculate_cabling_offset`` (also used by the offline
+        simulator) that reads the rack position and pod design from ``self.data``.
+        """
         pod = self.data.pod
 
         # deployment_type is on pod, max_tors_per_row can be calculated from design
@@ -285,60 +283,20 @@ class RackGenerator(CommonGenerator):
         else:
             max_tors_per_row = 8
 
-        # For middle_rack deployment ToRs: always offset=0 (ToRs connect to leafs in same rack)
-        if deployment_type == "middle_rack" and device_type == "tor":
-            offset = 0
-            self.logger.info(
-                f"Calculated {device_type} offset={offset} for rack {self.data.name} "
-                f"(mode=middle_rack) - intra-rack cabling"
-            )
-
-        # For mixed deployment ToRs: static offset based on rack index
-        # Formula: (rack_index - 1) × tors_per_rack
-        elif deployment_type == "mixed" and device_type == "tor":
-            offset = (current_index - 1) * device_count
-            self.logger.info(
-                f"Calculated {device_type} offset={offset} for rack {self.data.name} "
-                f"(index={current_index}, tors_per_rack={device_count}, mode=mixed)"
-            )
-
-        # For mixed/middle_rack deployment leafs: calculate offset based on row position
-        # Middle rack leafs serve all ToRs in their row
-        elif deployment_type in ("mixed", "middle_rack") and device_type == "leaf":
-            offset = (self.data.row_index - 1) * device_count
-
-            self.logger.info(
-                f"Calculated {device_type} offset={offset} for rack {self.data.name} "
-                f"(row_index={self.data.row_index}, leafs_per_rack={device_count}, mode={deployment_type})"
-            )
-
-        # For tor deployment ToRs: calculate cumulative offset across pod
-        # ToRs connect to spines, need cumulative offset across all rows
-        # Uses actual racks in previous rows (passed in) to avoid exceeding spine port capacity
-        elif deployment_type == "tor" and device_type == "tor":
-            if racks_in_previous_rows is not None:
-                tors_in_previous_rows = racks_in_previous_rows * device_count
-            else:
-                # Fallback to design max if actual count not provided
-                max_tors_int = int(max_tors_per_row)
-                tors_in_previous_rows = max_tors_int * (self.data.row_index - 1)
-
-            # Offset from previous racks in current row
-            offset_in_current_row = device_count * (current_index - 1)
-
-            offset = tors_in_previous_rows + offset_in_current_row
-
-            self.logger.info(
-                f"Calculated {device_type} offset={offset} for rack {self.data.name} "
-                f"(row={self.data.row_index}, index={current_index}, tors_in_rack={device_count}, "
-                f"tors_in_previous_rows={tors_in_previous_rows}, mode={deployment_type})"
-            )
-
-        else:
-            # Other cases: no offset needed
-            offset = 0
-            self.logger.info(f"No offset needed for {device_type} in rack {self.data.name} (mode={deployment_type})")
-
+        offset = calculate_cabling_offset(
+            deployment_type=deployment_type,
+            device_type=device_type,
+            device_count=device_count,
+            rack_index=self.data.index,
+            row_index=self.data.row_index,
+            max_tors_per_row=max_tors_per_row,
+            racks_in_previous_rows=racks_in_previous_rows,
+        )
+        self.logger.info(
+            f"Calculated {device_type} offset={offset} for rack {self.data.name} "
+            f"(row={self.data.row_index}, index={self.data.index}, devices={device_count}, "
+            f"racks_in_previous_rows={racks_in_previous_rows}, mode={deployment_type})"
+        )
         return offset
 
     @staticmethod
@@ -426,105 +384,106 @@ class RackGenerator(CommonGenerator):
             f"Starting rack generation: {self.data.name} [type={self.data.rack_type}, deployment={deployment_type}]"
         )
 
-        # Validate checksum is set (required for proper generation ordering in mixed deployments)
-        if not self.data.checksum:
-            # Special case: ToR racks in mixed deployments can inherit checksum from middle rack
-            if deployment_type == "mixed" and self.data.rack_type == "tor":
-                # Query middle rack in same row to get checksum
-                middle_racks = await self.client.filters(
-                    kind=LocationRack,
-                    pod__ids=[self.data.pod.id],
-                    row_index__value=self.data.row_index,
-                    rack_type__value="network",  # Middle racks have network type
-                )
+        with self.phase("prerequisites"):
+            # Validate checksum is set (required for proper generation ordering in mixed deployments)
+            if not self.data.checksum:
+                # Special case: ToR racks in mixed deployments can inherit checksum from middle rack
+                if deployment_type == "mixed" and self.data.rack_type == "tor":
+                    # Query middle rack in same row to get checksum
+                    middle_racks = await self.client.filters(
+                        kind=LocationRack,
+                        pod__ids=[self.data.pod.id],
+                        row_index__value=self.data.row_index,
+                        rack_type__value="network",  # Middle racks have network type
+                    )
 
-                if middle_racks and middle_racks[0].checksum.value:
-                    # Inherit checksum from middle rack
-                    rack_obj = await self.client.get(kind=LocationRack, id=self.data.id)
-                    rack_obj.checksum.value = middle_racks[0].checksum.value
-                    await rack_obj.save(allow_upsert=True)
-                    self.logger.info(
-                        f"ToR rack {self.data.name} inherited checksum {middle_racks[0].checksum.value} "
-                        f"from middle rack {middle_racks[0].name.value}. "
-                        "Checksum update will trigger generator again to create devices."
+                    if middle_racks and middle_racks[0].checksum.value:
+                        # Inherit checksum from middle rack
+                        rack_obj = await self.client.get(kind=LocationRack, id=self.data.id)
+                        rack_obj.checksum.value = middle_racks[0].checksum.value
+                        await rack_obj.save(allow_upsert=True)
+                        self.logger.info(
+                            f"ToR rack {self.data.name} inherited checksum {middle_racks[0].checksum.value} "
+                            f"from middle rack {middle_racks[0].name.value}. "
+                            "Checksum update will trigger generator again to create devices."
+                        )
+                        # Return here - checksum update will trigger this generator again
+                        return
+                    else:
+                        self.logger.warning(
+                            f"ToR rack {self.data.name} has no checksum and no middle rack found "
+                            f"in row {self.data.row_index} - skipping generation."
+                        )
+                        return
+
+                # Special case: new network racks in middle_rack deployments inherit checksum
+                # from a sibling rack in the same pod (all pod racks share the same pod checksum)
+                elif deployment_type == "middle_rack" and self.data.rack_type == "network":
+                    sibling_racks = await self.client.filters(
+                        kind=LocationRack,
+                        pod__ids=[self.data.pod.id],
+                        rack_type__value="network",
                     )
-                    # Return here - checksum update will trigger this generator again
-                    return
+                    sibling_with_checksum = [r for r in sibling_racks if r.id != self.data.id and r.checksum.value]
+
+                    if sibling_with_checksum:
+                        rack_obj = await self.client.get(kind=LocationRack, id=self.data.id)
+                        rack_obj.checksum.value = sibling_with_checksum[0].checksum.value
+                        await rack_obj.save(allow_upsert=True)
+                        self.logger.info(
+                            f"Network rack {self.data.name} inherited checksum {sibling_with_checksum[0].checksum.value} "
+                            f"from sibling rack {sibling_with_checksum[0].name.value}. "
+                            "Checksum update will trigger generator again to create devices."
+                        )
+                        return
+                    else:
+                        self.logger.warning(
+                            f"Network rack {self.data.name} has no checksum and no sibling racks found in pod "
+                            f"to inherit from — run pod generator first."
+                        )
+                        return
+
                 else:
                     self.logger.warning(
-                        f"ToR rack {self.data.name} has no checksum and no middle rack found "
-                        f"in row {self.data.row_index} - skipping generation."
+                        f"Rack {self.data.name} has no checksum set - skipping generation. "
+                        "Checksum will be set by pod or middle rack generator."
                     )
                     return
 
-            # Special case: new network racks in middle_rack deployments inherit checksum
-            # from a sibling rack in the same pod (all pod racks share the same pod checksum)
-            elif deployment_type == "middle_rack" and self.data.rack_type == "network":
-                sibling_racks = await self.client.filters(
+            # In mixed deployment, ToR racks should wait for middle rack to generate leafs first
+            if deployment_type == "mixed" and self.data.rack_type == "tor":
+                # Query network rack(s) in same pod and row
+                network_racks = await self.client.filters(
                     kind=LocationRack,
                     pod__ids=[self.data.pod.id],
+                    row_index__value=self.data.row_index,
                     rack_type__value="network",
                 )
-                sibling_with_checksum = [r for r in sibling_racks if r.id != self.data.id and r.checksum.value]
 
-                if sibling_with_checksum:
-                    rack_obj = await self.client.get(kind=LocationRack, id=self.data.id)
-                    rack_obj.checksum.value = sibling_with_checksum[0].checksum.value
-                    await rack_obj.save(allow_upsert=True)
+                if not network_racks:
                     self.logger.info(
-                        f"Network rack {self.data.name} inherited checksum {sibling_with_checksum[0].checksum.value} "
-                        f"from sibling rack {sibling_with_checksum[0].name.value}. "
-                        "Checksum update will trigger generator again to create devices."
-                    )
-                    return
-                else:
-                    self.logger.warning(
-                        f"Network rack {self.data.name} has no checksum and no sibling racks found in pod "
-                        f"to inherit from — run pod generator first."
+                        f"ToR rack {self.data.name} waiting for network rack in row {self.data.row_index} - skipping this run."
                     )
                     return
 
-            else:
-                self.logger.warning(
-                    f"Rack {self.data.name} has no checksum set - skipping generation. "
-                    "Checksum will be set by pod or middle rack generator."
+                # Fetch leaf devices with interfaces from network rack
+                leaf_data = await self.fetch_rack_devices_with_interfaces(
+                    rack=network_racks[0],
+                    role_filter="leaf",
                 )
-                return
-
-        # In mixed deployment, ToR racks should wait for middle rack to generate leafs first
-        if deployment_type == "mixed" and self.data.rack_type == "tor":
-            # Query network rack(s) in same pod and row
-            network_racks = await self.client.filters(
-                kind=LocationRack,
-                pod__ids=[self.data.pod.id],
-                row_index__value=self.data.row_index,
-                rack_type__value="network",
-            )
-
-            if not network_racks:
-                self.logger.info(
-                    f"ToR rack {self.data.name} waiting for network rack in row {self.data.row_index} - skipping this run."
-                )
-                return
-
-            # Fetch leaf devices with interfaces from network rack
-            leaf_data = await self.fetch_rack_devices_with_interfaces(
-                rack=network_racks[0],
-                role_filter="leaf",
-            )
 
-            if leaf_data:
-                # Leafs exist with interfaces ready - proceed with ToR generation
-                self.logger.info(
-                    f"ToR rack {self.data.name} found {len(leaf_data)} leaf devices in row {self.data.row_index} "
-                    "- proceeding with ToR generation"
-                )
-            else:
-                # No leafs yet - wait for middle rack to generate them
-                self.logger.info(
-                    f"ToR rack {self.data.name} waiting for leafs to be generated in row {self.data.row_index} - skipping this run."
-                )
-                return
+                if leaf_data:
+                    # Leafs exist with interfaces ready - proceed with ToR generation
+                    self.logger.info(
+                        f"ToR rack {self.data.name} found {len(leaf_data)} leaf devices in row {self.data.row_index} "
+                        "- proceeding with ToR generation"
+                    )
+                else:
+                    # No leafs yet - wait for middle rack to generate them
+                    self.logger.info(
+                        f"ToR rack {self.data.name} waiting for leafs to be generated in row {self.data.row_index} - skipping this run."
+                    )
+                    return
 
         self.logger.info(f"Generating topology for rack {self.data.name}")
 
@@ -607,6 +566,8 @@ class RackGenerator(CommonGenerator):
         routing_options: RoutingOptions = RoutingOptions(design=dc_design)
         if pod and pod.asn_pool and pod.asn_pool.id:
             routing_options["asn_pool"] = pod.asn_pool.id
+        if dc_design:
+            routing_options["rr_redundancy"] = dc_design.rr_redundancy
 
         # Store shared cabling context for _cable_and_route calls
         self._technical_pool_id = technical_pool_id
@@ -617,224 +578,228 @@ class RackGenerator(CommonGenerator):
         leaf_row_cache: tuple[list[str], list[str]] | None = None
 
         # Process leaf devices: create → cable → route
-        for leaf_role in self.data.leafs or []:
-            # Skip if this template would create devices already created by a previous template
-            expected_names = set(
-                DeviceNamingConfig(strategy=naming_conv).format_device_name(
-                    self.fabric_name,
-                    "leaf",
-                    index=idx,
-                    fabric_name=self.fabric_name,
-                    indexes=leaf_indexes,
+        with self.phase("leafs"):
+            for leaf_role in self.data.leafs or []:
+                # Skip if this template would create devices already created by a previous template
+                expected_names = set(
+                    DeviceNamingConfig(strategy=naming_conv).format_device_name(
+                        self.fabric_name,
+                        "leaf",
+                        index=idx,
+                        fabric_name=self.fabric_name,
+                        indexes=leaf_indexes,
+                    )
+                    for idx in range(1, leaf_role.quantity + 1)
                 )
-                for idx in range(1, leaf_role.quantity + 1)
-            )
-            if expected_names <= _created_device_names:
-                self.logger.info(
-                    f"Skipping duplicate leaf template (devices already created: {sorted(expected_names)})"
+                if expected_names <= _created_device_names:
+                    self.logger.info(
+                        f"Skipping duplicate leaf template (devices already created: {sorted(expected_names)})"
+                    )
+                    continue
+
+                leaf_devices = await self.create_devices(
+                    deployment_id=pod.id,
+                    device_role="leaf",
+                    amount=leaf_role.quantity,
+                    template=leaf_role.template.model_dump(),
+                    naming_convention=naming_conv,
+                    options=DeviceOptions(
+                        indexes=leaf_indexes,
+                        allocate_loopback=True,
+                        rack=self.data.id,
+                        loopback_pool=loopback_pool_id,
+                        loopback_prefix_length=128 if is_ipv6 else 32,
+                        management_pool=management_pool_id,
+                    ),
                 )
-                continue
-
-            leaf_devices = await self.create_devices(
-                deployment_id=pod.id,
-                device_role="leaf",
-                amount=leaf_role.quantity,
-                template=leaf_role.template.model_dump(),
-                naming_convention=naming_conv,
-                options=DeviceOptions(
-                    indexes=leaf_indexes,
-                    allocate_loopback=True,
-                    rack=self.data.id,
-                    loopback_pool=loopback_pool_id,
-                    loopback_prefix_length=128 if is_ipv6 else 32,
-                    management_pool=management_pool_id,
-                ),
-            )
 
-            _created_device_names.update(leaf_devices)
-            created_leaf_devices.extend(leaf_devices)
-
-            leaf_interfaces = [interface.name for interface in leaf_role.template.interfaces]
-            cabling_offset = self.calculate_cabling_offsets(device_count=leaf_role.quantity, device_type="leaf")
-
-            await self._cable_and_route(
-                bottom_devices=leaf_devices,
-                bottom_interfaces=leaf_interfaces,
-                top_devices=spine_device_names,
-                top_interfaces=spine_interfaces,
-                strategy="rack",
-                offset=cabling_offset,
-                bottom_sorting=pod.leaf_interface_sorting_method,
-                top_sorting=pod.spine_interface_sorting_method,
-            )
+                _created_device_names.update(leaf_devices)
+                created_leaf_devices.extend(leaf_devices)
+
+                leaf_interfaces = [interface.name for interface in leaf_role.template.interfaces]
+                cabling_offset = self.calculate_cabling_offsets(device_count=leaf_role.quantity, device_type="leaf")
+
+                await self._cable_and_route(
+                    bottom_devices=leaf_devices,
+                    bottom_interfaces=leaf_interfaces,
+                    top_devices=spine_device_names,
+                    top_interfaces=spine_interfaces,
+                    strategy="rack",
+                    offset=cabling_offset,
+                    bottom_sorting=pod.leaf_interface_sorting_method,
+                    top_sorting=pod.spine_interface_sorting_method,
+                )
 
         # Process ToR devices: create → cable → route (per deployment type)
-        for tor_role in self.data.tors or []:
-            # Skip if this template would create devices already created by a previous template
-            expected_names = set(
-                DeviceNamingConfig(strategy=naming_conv).format_device_name(
-                    self.fabric_name,
-                    "tor",
-                    index=idx,
-                    fabric_name=self.fabric_name,
-                    indexes=tor_indexes,
+        with self.phase("tors"):
+            for tor_role in self.data.tors or []:
+                # Skip if this template would create devices already created by a previous template
+                expected_names = set(
+                    DeviceNamingConfig(strategy=naming_conv).format_device_name(
+                        self.fabric_name,
+                        "tor",
+                        index=idx,
+                        fabric_name=self.fabric_name,
+                        indexes=tor_indexes,
+                    )
+                    for idx in range(1, tor_role.quantity + 1)
+                )
+                if expected_names <= _created_device_names:
+                    self.logger.info(
+                        f"Skipping duplicate tor template (devices already created: {sorted(expected_names)})"
+                    )
+                    continue
+
+                tor_devices = await self.create_devices(
+                    deployment_id=pod.id,
+                    device_role="tor",
+                    amount=tor_role.quantity,
+                    template=tor_role.template.model_dump(),
+                    naming_convention=naming_conv,
+                    options=DeviceOptions(
+                        indexes=tor_indexes,
+                        allocate_loopback=True,
+                        rack=self.data.id,
+                        loopback_pool=loopback_pool_id,
+                        loopback_prefix_length=128 if is_ipv6 else 32,
+                        management_pool=management_pool_id,
+                    ),
                 )
-                for idx in range(1, tor_role.quantity + 1)
-            )
-            if expected_names <= _created_device_names:
-                self.logger.info(f"Skipping duplicate tor template (devices already created: {sorted(expected_names)})")
-                continue
-
-            tor_devices = await self.create_devices(
-                deployment_id=pod.id,
-                device_role="tor",
-                amount=tor_role.quantity,
-                template=tor_role.template.model_dump(),
-                naming_convention=naming_conv,
-                options=DeviceOptions(
-                    indexes=tor_indexes,
-                    allocate_loopback=True,
-                    rack=self.data.id,
-                    loopback_pool=loopback_pool_id,
-                    loopback_prefix_length=128 if is_ipv6 else 32,
-                    management_pool=management_pool_id,
-                ),
-            )
-
-            _created_device_names.update(tor_devices)
-            created_tor_devices.extend(tor_devices)
-
-            # Get only uplink interfaces from ToR template (role="uplink")
-            tor_interfaces = [
-                interface.name for interface in tor_role.template.interfaces if interface.role == "uplink"
-            ]
 
-            # Deployment type: middle_rack - ToRs connect to local leafs in same rack
-            if deployment_type == "middle_rack":
-                cabling_offset = 0
+                _created_device_names.update(tor_devices)
+                created_tor_devices.extend(tor_devices)
 
-                if created_leaf_devices:
-                    leaf_interfaces_objects = await self.client.filters(
-                        kind=DcimPhysicalInterface,
-                        device__name__values=created_leaf_devices,
-                        role__value="downlink",
-                    )
+                # Get only uplink interfaces from ToR template (role="uplink")
+                tor_interfaces = [
+                    interface.name for interface in tor_role.template.interfaces if interface.role == "uplink"
+                ]
 
-                    if leaf_interfaces_objects:
-                        leaf_interfaces = sorted(set(iface.name.value for iface in leaf_interfaces_objects))
+                # Deployment type: middle_rack - ToRs connect to local leafs in same rack
+                if deployment_type == "middle_rack":
+                    cabling_offset = 0
 
-                        await self._cable_and_route(
-                            bottom_devices=tor_devices,
-                            bottom_interfaces=tor_interfaces,
-                            top_devices=created_leaf_devices,
-                            top_interfaces=leaf_interfaces,
-                            strategy="intra_rack_middle",
-                            offset=cabling_offset,
+                    if created_leaf_devices:
+                        leaf_interfaces_objects = await self.client.filters(
+                            kind=DcimPhysicalInterface,
+                            device__name__values=created_leaf_devices,
+                            role__value="downlink",
                         )
+
+                        if leaf_interfaces_objects:
+                            leaf_interfaces = sorted(set(iface.name.value for iface in leaf_interfaces_objects))
+
+                            await self._cable_and_route(
+                                bottom_devices=tor_devices,
+                                bottom_interfaces=tor_interfaces,
+                                top_devices=created_leaf_devices,
+                                top_interfaces=leaf_interfaces,
+                                strategy="intra_rack_middle",
+                                offset=cabling_offset,
+                            )
+                        else:
+                            self.logger.error(
+                                f"middle_rack deployment for {self.data.name}: No downlink interfaces found on leaf devices. "
+                                "Cannot create ToR-to-leaf cabling."
+                            )
+                            raise RuntimeError(
+                                f"Rack {self.data.name}: Cannot cable ToRs - no downlink interfaces on leaf devices"
+                            )
                     else:
                         self.logger.error(
-                            f"middle_rack deployment for {self.data.name}: No downlink interfaces found on leaf devices. "
+                            f"middle_rack deployment for {self.data.name} has ToRs but no leafs. "
                             "Cannot create ToR-to-leaf cabling."
                         )
-                        raise RuntimeError(
-                            f"Rack {self.data.name}: Cannot cable ToRs - no downlink interfaces on leaf devices"
-                        )
-                else:
-                    self.logger.error(
-                        f"middle_rack deployment for {self.data.name} has ToRs but no leafs. "
-                        "Cannot create ToR-to-leaf cabling."
+                        raise RuntimeError(f"Rack {self.data.name}: Cannot cable ToRs - no leaf devices in rack")
+
+                # Deployment type: tor - ToRs connect directly to spines
+                elif deployment_type == "tor":
+                    tors_per_rack = sum(tor_role.quantity or 0 for tor_role in self.data.tors or [])
+                    sibling_racks = await self.client.filters(
+                        kind="LocationRack",
+                        pod__ids=[pod.id],
                     )
-                    raise RuntimeError(f"Rack {self.data.name}: Cannot cable ToRs - no leaf devices in rack")
-
-            # Deployment type: tor - ToRs connect directly to spines
-            elif deployment_type == "tor":
-                tors_per_rack = sum(tor_role.quantity or 0 for tor_role in self.data.tors or [])
-                sibling_racks = await self.client.filters(
-                    kind="LocationRack",
-                    pod__ids=[pod.id],
-                )
-                prev_row_racks = sum(
-                    1
-                    for r in sibling_racks
-                    if hasattr(r, "row_index") and r.row_index and r.row_index.value < self.data.row_index
-                )
-                cabling_offset = self.calculate_cabling_offsets(
-                    device_count=tors_per_rack,
-                    device_type="tor",
-                    racks_in_previous_rows=prev_row_racks,
-                )
-
-                if spine_device_names:
-                    await self._cable_and_route(
-                        bottom_devices=tor_devices,
-                        bottom_interfaces=tor_interfaces,
-                        top_devices=spine_device_names,
-                        top_interfaces=spine_interfaces,
-                        strategy="rack",
-                        offset=cabling_offset,
-                        bottom_sorting=pod.leaf_interface_sorting_method,
-                        top_sorting=pod.spine_interface_sorting_method,
+                    prev_row_racks = sum(
+                        1
+                        for r in sibling_racks
+                        if hasattr(r, "row_index") and r.row_index and r.row_index.value < self.data.row_index
                     )
-                else:
-                    self.logger.error(
-                        f"tor deployment for {self.data.name}: No spine devices found in pod. "
-                        "Cannot create ToR-to-spine cabling."
+                    cabling_offset = self.calculate_cabling_offsets(
+                        device_count=tors_per_rack,
+                        device_type="tor",
+                        racks_in_previous_rows=prev_row_racks,
                     )
-                    raise RuntimeError(f"Rack {self.data.name}: Cannot cable ToRs - no spine devices in pod")
 
-            # Deployment type: mixed - ToRs connect to local leafs if present, otherwise middle rack leafs
-            elif deployment_type == "mixed":
-                if created_leaf_devices:
-                    cabling_offset = 0
-                    leaf_device_names = created_leaf_devices
-                    leaf_interfaces = [
-                        iface.name
-                        for leaf_role in self.data.leafs or []
-                        for iface in leaf_role.template.interfaces
-                        if iface.role == "downlink"
-                    ]
-
-                    await self._cable_and_route(
-                        bottom_devices=tor_devices,
-                        bottom_interfaces=tor_interfaces,
-                        top_devices=leaf_device_names,
-                        top_interfaces=leaf_interfaces,
-                        strategy="rack",
-                        offset=cabling_offset,
-                        bottom_sorting=pod.leaf_interface_sorting_method,
-                        top_sorting=pod.leaf_interface_sorting_method,
-                    )
-                else:
-                    # ToR-only rack - connect to middle rack leafs in same row
-                    tors_per_rack = len(tor_devices)
-                    cabling_offset = (self.data.index - 1) * tors_per_rack
-
-                    if leaf_row_cache is None:
-                        leaf_row_cache = await self._get_leaf_devices_in_row(
-                            pod_id=pod.id, row_index=self.data.row_index
+                    if spine_device_names:
+                        await self._cable_and_route(
+                            bottom_devices=tor_devices,
+                            bottom_interfaces=tor_interfaces,
+                            top_devices=spine_device_names,
+                            top_interfaces=spine_interfaces,
+                            strategy="rack",
+                            offset=cabling_offset,
+                            bottom_sorting=pod.leaf_interface_sorting_method,
+                            top_sorting=pod.spine_interface_sorting_method,
                         )
-                    leaf_device_names, leaf_interfaces = leaf_row_cache
+                    else:
+                        self.logger.error(
+                            f"tor deployment for {self.data.name}: No spine devices found in pod. "
+                            "Cannot create ToR-to-spine cabling."
+                        )
+                        raise RuntimeError(f"Rack {self.data.name}: Cannot cable ToRs - no spine devices in pod")
+
+                # Deployment type: mixed - ToRs connect to local leafs if present, otherwise middle rack leafs
+                elif deployment_type == "mixed":
+                    if created_leaf_devices:
+                        cabling_offset = 0
+                        leaf_device_names = created_leaf_devices
+                        leaf_interfaces = [
+                            iface.name
+                            for leaf_role in self.data.leafs or []
+                            for iface in leaf_role.template.interfaces
+                            if iface.role == "downlink"
+                        ]
 
-                    if leaf_device_names:
                         await self._cable_and_route(
                             bottom_devices=tor_devices,
                             bottom_interfaces=tor_interfaces,
                             top_devices=leaf_device_names,
                             top_interfaces=leaf_interfaces,
-                            strategy="intra_rack_mixed",
+                            strategy="rack",
                             offset=cabling_offset,
+                            bottom_sorting=pod.leaf_interface_sorting_method,
+                            top_sorting=pod.leaf_interface_sorting_method,
                         )
                     else:
-                        self.logger.error(
-                            f"Mixed deployment for rack {self.data.name}: No middle rack leafs found in row {self.data.row_index}. "
-                            "Cannot create ToR-to-leaf cabling."
-                        )
-                        raise RuntimeError(
-                            f"Rack {self.data.name}: Cannot cable ToRs - no leaf devices found in row {self.data.row_index}"
-                        )
+                        # ToR-only rack - connect to middle rack leafs in same row
+                        tors_per_rack = len(tor_devices)
+                        cabling_offset = (self.data.index - 1) * tors_per_rack
+
+                        if leaf_row_cache is None:
+                            leaf_row_cache = await self._get_leaf_devices_in_row(
+                                pod_id=pod.id, row_index=self.data.row_index
+                            )
+                        leaf_device_names, leaf_interfaces = leaf_row_cache
+
+                        if leaf_device_names:
+                            await self._cable_and_route(
+                                bottom_devices=tor_devices,
+                                bottom_interfaces=tor_interfaces,
+                                top_devices=leaf_device_names,
+                                top_interfaces=leaf_interfaces,
+                                strategy="intra_rack_mixed",
+                                offset=cabling_offset,
+                            )
+                        else:
+                            self.logger.error(
+                                f"Mixed deployment for rack {self.data.name}: No middle rack leafs found in row {self.data.row_index}. "
+                                "Cannot create ToR-to-leaf cabling."
+                            )
+                            raise RuntimeError(
+                                f"Rack {self.data.name}: Cannot cable ToRs - no leaf devices found in row {self.data.row_index}"
+                            )
 
-            else:
-                self.logger.warning(f"Unknown deployment_type '{deployment_type}' for rack {self.data.name}")
+                else:
+                    self.logger.warning(f"Unknown deployment_type '{deployment_type}' for rack {self.data.name}")
 
         # Generation completion summary
         total_devices = len(created_leaf_devices or []) + sum(tor_role.quantity for tor_role in (self.data.tors or []))
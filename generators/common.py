@@ -3,13 +3,18 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import ipaddress
+import json
+from contextlib import AbstractContextManager
 from typing import Any, Literal, Optional
 
 from infrahub_sdk.exceptions import ValidationError
 from infrahub_sdk.generator import InfrahubGenerator
 from infrahub_sdk.protocols import CoreIPAddressPool, CoreIPPrefixPool, CoreStandardGroup
 
+from utils.profiling import profiled
+
 from .helpers import CablingPlanner, DeviceNamingConfig
+from .instrumentation import GeneratorMetrics, metrics_setting, phase, phased
 from .protocols import (
     DcimCable,
     DcimPhysicalDevice,
@@ -49,6 +54,52 @@ class CommonGenerator(RoutingMixin, InfrahubGenerator):
     fabric_name: str = ""  # Required: set to fabric/DC name
     pod_name: Optional[str] = None  # Optional: only for pod/rack generators
 
+    # Seconds to wait for device templates to instantiate interfaces before cabling.
+    # Benchmarks against an in-memory client (no async template processing) set this to 0.
+    interface_settle_delay: float = 2.0
+
+    # Opt-in client instrumentation (see generators/instrumentation.py).
+    # None follows the GENERATOR_METRICS environment variable.
+    metrics_enabled: Optional[bool] = None
+    metrics: Optional[GeneratorMetrics] = None
+
+    async def run(self, identifier: str, data: dict | None = None) -> None:
+        """Run the generator, profiled when ``PROFILING`` is set (see utils/profiling.py)."""
+        with profiled("generator", type(self).__name__, self._target):
+            await self._run_with_metrics(identifier, data)
+
+    def _target(self) -> str:
+        """Generator target label (its parameter values) for metrics and profile file names."""
+        return ",".join(str(value) for value in (self.params or {}).values())
+
+    async def _run_with_metrics(self, identifier: str, data: dict | None) -> None:
+        """Run the generator, collecting per-phase client metrics when enabled."""
+        enabled, output_dir = metrics_setting()
+        if self.metrics_enabled is not None:
+            enabled = self.metrics_enabled
+        if not enabled:
+            await super().run(identifier=identifier, data=data)
+            return
+
+        self.metrics = GeneratorMetrics(generator=type(self).__name__, target=self._target())
+        try:
+            with self.metrics.attach(self._init_client):
+                await super().run(identifier=identifier, data=data)
+        finally:
+            self.metrics.finish()
+            summary = self.metrics.summary()
+            self.logger.info(f"Generator metrics: {json.dumps(summary)}")
+            if output_dir is not None:
+                self.logger.info(f"Generator metrics written to {self.metrics.write(output_dir)}")
+
+    async def collect_data(self) -> dict:
+        with phase("query"):
+            return await super().collect_data()
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """Name the phase client calls inside the block are attributed to (no-op without metrics)."""
+        return phase(name)
+
     async def _resolve_pool(
         self,
         provided: Any,
@@ -173,6 +224,7 @@ class CommonGenerator(RoutingMixin, InfrahubGenerator):
             parent_attr=parent_attr,
         )
 
+    @phased("pools")
     async def allocate_resource_pools(
         self,
         strategy: Literal["fabric", "pod"],
@@ -307,6 +359,7 @@ class CommonGenerator(RoutingMixin, InfrahubGenerator):
 
         return created_pools
 
+    @phased("devices")
     async def create_devices(
         self,
         device_role: str,
@@ -474,6 +527,7 @@ class CommonGenerator(RoutingMixin, InfrahubGenerator):
             raise
         return device_names
 
+    @phased("cabling")
     async def create_cabling(
         self,
         bottom_devices: list[str],
@@ -507,7 +561,8 @@ class CommonGenerator(RoutingMixin, InfrahubGenerator):
         )
 
         # Wait for device templates to instantiate interfaces
-        await asyncio.sleep(2.0)
+        if self.interface_settle_delay:
+            await asyncio.sleep(self.interface_settle_delay)
 
         # Query interfaces including cable so we don't need per-connection re-fetches
         src_interfaces = await self.client.filters(
@@ -7,6 +7,7 @@ This module provides reusable utilities for generator implementations:
 - pools: IP address pool and prefix calculation
 - interfaces: Speed matching, cable type detection, and validation
 - routing: Routing protocol generation with strategy pattern
+- records: Compact planner input records (flattened SDK nodes)
 """
 
 # Re-export all public APIs for backward compatibility
@@ -21,6 +22,7 @@ from .cabling import (
     IntraRackMixedCablingStrategy,
     PodCablingStrategy,
     RackCablingStrategy,
+    calculate_cabling_offset,
 )
 from .naming import DeviceNamingConfig
 from .pools import (
@@ -30,6 +32,14 @@ from .pools import (
     calculate_super_spine_loopback_prefix,
     name_to_asn_range,
 )
+from .records import (
+    InterfaceRecord,
+    LoopbackRecord,
+    ProcessRecord,
+    as_interface_records,
+    as_loopback_records,
+    as_process_records,
+)
 from .routing import RoutingPlan, RoutingPlanInput, RoutingPlanner, RoutingStrategy
 
 __all__ = [
@@ -46,6 +56,7 @@ __all__ = [
     "IntraRackCablingStrategy",
     "IntraRackMiddleCablingStrategy",
     "IntraRackMixedCablingStrategy",
+    "calculate_cabling_offset",
     # Naming
     "DeviceNamingConfig",
     # Pools
@@ -58,4 +69,11 @@ __all__ = [
     "InterfaceSpeedMatcher",
     "CableTypeDetector",
     "ConnectionValidator",
+    # Records
+    "InterfaceRecord",
+    "LoopbackRecord",
+    "ProcessRecord",
+    "as_interface_records",
+    "as_loopback_records",
+    "as_process_records",
 ]
@@ -6,6 +6,11 @@ This module provides comprehensive cabling functionality:
 - InterfaceSpeedMatcher: Speed extraction and grouping
 - CableTypeDetector: Cable type detection (copper/fiber)
 - ConnectionValidator: Connection plan validation
+
+The planner flattens its inputs into ``InterfaceRecord`` tuples once (see
+``records.py``); strategies work purely on records and the original SDK
+nodes are handed back by ``build_cabling_plan`` from the planner's own
+``record_key`` -> node map.
 """
 
 from __future__ import annotations
@@ -13,10 +18,13 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, Sequence
 
 from netutils.interface import sort_interface_list
 
+from .records import InterfaceRecord, interface_record, record_key
+
 if TYPE_CHECKING:
     from generators.protocols import DcimPhysicalInterface
 
@@ -36,6 +44,12 @@ UPLINKS_PER_TOR_IN_PAIRED_MODE = 2
 # ============================================================================
 
 
+@lru_cache(maxsize=1024)
+def _sorted_interface_names(names: frozenset[str]) -> tuple[str, ...]:
+    """Naturally sort interface names (cached: devices of one template share them)."""
+    return tuple(sort_interface_list(list(names)))
+
+
 class InterfaceSpeedMatcher:
     """Extract and group interfaces by speed for mixed-speed deployments."""
 
@@ -168,7 +182,7 @@ class CablingStrategy(ABC):
         self.logger = planner.logger
 
     @abstractmethod
-    def build_plan(self, **kwargs) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
+    def build_plan(self, **kwargs) -> list[tuple[InterfaceRecord, InterfaceRecord]]:
         """Build cabling plan for this strategy."""
         pass
 
@@ -176,11 +190,9 @@ class CablingStrategy(ABC):
 class PodCablingStrategy(CablingStrategy):
     """Pod-to-pod cabling strategy."""
 
-    def build_plan(
-        self, cabling_offset: int = 0, **kwargs
-    ) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
+    def build_plan(self, cabling_offset: int = 0, **kwargs) -> list[tuple[InterfaceRecord, InterfaceRecord]]:
         """Builds a cabling plan between source and destination interfaces based on cabling offset."""
-        cabling_plan: list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]] = []
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]] = []
 
         for top_index, top_device in enumerate(sorted(self.planner.top_by_device.keys())):
             top_interfaces = self.planner.top_by_device[top_device]
@@ -196,11 +208,9 @@ class PodCablingStrategy(CablingStrategy):
 class RackCablingStrategy(CablingStrategy):
     """Rack-to-rack cabling strategy (any-to-any connectivity)."""
 
-    def build_plan(
-        self, cabling_offset: int = 0, **kwargs
-    ) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
+    def build_plan(self, cabling_offset: int = 0, **kwargs) -> list[tuple[InterfaceRecord, InterfaceRecord]]:
         """Builds a cabling plan for any-to-any connectivity (e.g., ToRs/Leafs to Spines)."""
-        cabling_plan: list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]] = []
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]] = []
 
         for bottom_index, bottom_device in enumerate(self.planner._sorted_bottom_devices):
             top_interface_index = bottom_index + cabling_offset
@@ -232,9 +242,9 @@ class RackCablingStrategy(CablingStrategy):
 class IntraRackCablingStrategy(CablingStrategy):
     """Intra-rack cabling strategy with round-robin distribution."""
 
-    def build_plan(self, **kwargs) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
+    def build_plan(self, **kwargs) -> list[tuple[InterfaceRecord, InterfaceRecord]]:
         """Build cabling plan for intra-rack connections using round-robin distribution."""
-        cabling_plan: list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]] = []
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]] = []
 
         num_top_devices = len(self.planner._sorted_top_devices)
         if num_top_devices == 0:
@@ -283,9 +293,9 @@ class IntraRackCablingStrategy(CablingStrategy):
     def _create_connections_to_existing_tops(
         self,
         bottom_device: str,
-        bottom_interfaces: list[Any],
+        bottom_interfaces: list[InterfaceRecord],
         existing_tops: set[str],
-        cabling_plan: list[tuple[Any, Any]],
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]],
     ) -> None:
         """Create connections to existing top devices for idempotency."""
         reuse_top_devices = sorted(existing_tops)
@@ -306,12 +316,12 @@ class IntraRackCablingStrategy(CablingStrategy):
     def _create_round_robin_connections(
         self,
         bottom_device: str,
-        bottom_interfaces: list[Any],
+        bottom_interfaces: list[InterfaceRecord],
         tor_index: int,
         uplinks_per_tor: int,
         num_top_devices: int,
         sorted_top_devices: list[str],
-        cabling_plan: list[tuple[Any, Any]],
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]],
     ) -> None:
         """Create round-robin connections for first run."""
         for uplink_idx, bottom_intf in enumerate(bottom_interfaces):
@@ -334,7 +344,7 @@ class IntraRackCablingStrategy(CablingStrategy):
             else:
                 self.logger.error(
                     f"INSUFFICIENT INTERFACES - Cannot create connection from "
-                    f"{bottom_intf.device.display_label}:{bottom_intf.name.value} to {top_device}. "
+                    f"{bottom_intf.device}:{bottom_intf.name} to {top_device}. "
                     f"Required port offset {port_offset} but only {len(top_interfaces)} interface(s) available."
                 )
 
@@ -342,9 +352,9 @@ class IntraRackCablingStrategy(CablingStrategy):
 class IntraRackMiddleCablingStrategy(CablingStrategy):
     """Middle rack deployment strategy."""
 
-    def build_plan(self, **kwargs) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
+    def build_plan(self, **kwargs) -> list[tuple[InterfaceRecord, InterfaceRecord]]:
         """Build cabling plan for middle_rack deployment."""
-        cabling_plan: list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]] = []
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]] = []
 
         num_top_devices = len(self.planner._sorted_top_devices)
         if not self._validate_min_top_devices(num_top_devices, MIN_LEAF_DEVICES_FOR_PAIRING, "Middle rack"):
@@ -389,7 +399,7 @@ class IntraRackMiddleCablingStrategy(CablingStrategy):
         tor_index: int,
         leaf_pairs: list[list[str]],
         num_pairs: int,
-        cabling_plan: list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]],
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]],
     ) -> None:
         """Connect a ToR device to its assigned leaf pair."""
         bottom_interfaces = self.planner.bottom_by_device[bottom_device]
@@ -409,7 +419,7 @@ class IntraRackMiddleCablingStrategy(CablingStrategy):
             else:
                 self.logger.error(
                     f"INSUFFICIENT INTERFACES - Cannot create connection from "
-                    f"{bottom_intf.device.display_label}:{bottom_intf.name.value} to {top_device}. "
+                    f"{bottom_intf.device}:{bottom_intf.name} to {top_device}. "
                     f"Leaf pair slot {tors_using_same_pair} required but only {len(top_interfaces)} interface(s) available."
                 )
 
@@ -417,11 +427,9 @@ class IntraRackMiddleCablingStrategy(CablingStrategy):
 class IntraRackMixedCablingStrategy(CablingStrategy):
     """Mixed deployment strategy (ToR racks to middle rack leafs)."""
 
-    def build_plan(
-        self, cabling_offset: int = 0, **kwargs
-    ) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
+    def build_plan(self, cabling_offset: int = 0, **kwargs) -> list[tuple[InterfaceRecord, InterfaceRecord]]:
         """Build cabling plan for mixed deployment (ToR racks to middle rack leafs)."""
-        cabling_plan: list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]] = []
+        cabling_plan: list[tuple[InterfaceRecord, InterfaceRecord]] = []
 
         num_top_devices = len(self.planner._sorted_top_devices)
         if num_top_devices < MIN_LEAF_DEVICES_FOR_PAIRING:
@@ -442,6 +450,45 @@ class IntraRackMixedCablingStrategy(CablingStrategy):
         return cabling_plan
 
 
+# ============================================================================
+# Cabling Offsets
+# ============================================================================
+
+
+def calculate_cabling_offset(
+    deployment_type: str,
+    device_type: str,
+    device_count: int,
+    rack_index: int,
+    row_index: int,
+    max_tors_per_row: int = 8,
+    racks_in_previous_rows: int | None = None,
+) -> int:
+    """Calculate the top-layer port offset for a rack's devices.
+
+    - middle_rack ToRs: 0 (intra-rack cabling to the rack's own leafs)
+    - mixed ToRs: ``(rack_index - 1) * device_count``
+    - mixed / middle_rack leafs: ``(row_index - 1) * device_count``
+    - tor ToRs: ToRs in previous rows + ``device_count * (rack_index - 1)``.
+      Previous rows use ``racks_in_previous_rows`` when known, otherwise the
+      design maximum ``max_tors_per_row`` per row.
+    - anything else: 0
+    """
+    if deployment_type == "middle_rack" and device_type == "tor":
+        return 0
+    if deployment_type == "mixed" and device_type == "tor":
+        return (rack_index - 1) * device_count
+    if deployment_type in ("mixed", "middle_rack") and device_type == "leaf":
+        return (row_index - 1) * device_count
+    if deployment_type == "tor" and device_type == "tor":
+        if racks_in_previous_rows is not None:
+            tors_in_previous_rows = racks_in_previous_rows * device_count
+        else:
+            tors_in_previous_rows = int(max_tors_per_row) * (row_index - 1)
+        return tors_in_previous_rows + device_count * (rack_index - 1)
+    return 0
+
+
 # ============================================================================
 # Cabling Planner
 # ============================================================================
@@ -465,8 +512,14 @@ class CablingPlanner:
         self._bottom_sorting = bottom_sorting
         self._top_sorting = top_sorting
 
-        self.bottom_by_device: dict = self._create_device_interface_map(bottom_interfaces, bottom_sorting)
-        self.top_by_device: dict = self._create_device_interface_map(top_interfaces, top_sorting)
+        # Source node of every record built from an SDK node, to hand back in the plan
+        self._nodes: dict[tuple[str, str], Any] = {}
+        self.bottom_by_device: dict[str, list[InterfaceRecord]] = self._create_device_interface_map(
+            self._records(bottom_interfaces), bottom_sorting
+        )
+        self.top_by_device: dict[str, list[InterfaceRecord]] = self._create_device_interface_map(
+            self._records(top_interfaces), top_sorting
+        )
 
         self._sorted_bottom_devices = sorted(self.bottom_by_device.keys())
         self._sorted_top_devices = sorted(self.top_by_device.keys())
@@ -479,11 +532,25 @@ class CablingPlanner:
             "intra_rack_mixed": IntraRackMixedCablingStrategy(self),
         }
 
+    def _records(self, interfaces: Sequence[Any]) -> list[InterfaceRecord]:
+        """Flatten interfaces to records, remembering the SDK node behind each one."""
+        records = []
+        for interface in interfaces:
+            record = interface_record(interface)
+            if record is not interface:
+                self._nodes[record_key(record)] = interface
+            records.append(record)
+        return records
+
+    def _node(self, record: InterfaceRecord) -> Any:
+        """SDK node behind a record, or the record itself when it was passed in directly."""
+        return self._nodes.get(record_key(record), record)
+
     def _create_device_interface_map(
         self,
-        interfaces: Sequence[Any],
+        interfaces: Sequence[InterfaceRecord],
         sorting: Literal["top_down", "bottom_up"] | str = "top_down",
-    ) -> dict[Any, list[Any]]:
+    ) -> dict[str, list[InterfaceRecord]]:
         """Return a mapping of device peer -> list of its interfaces sorted."""
         if sorting == "sequential":
             sorting = "bottom_up"
@@ -493,43 +560,31 @@ class CablingPlanner:
         if sorting not in {"top_down", "bottom_up"}:
             raise ValueError(f"Unsupported sorting value '{sorting}'. Use 'top_down' or 'bottom_up'.")
 
-        device_interface_map = defaultdict(list)
+        device_interface_map: dict[str, list[InterfaceRecord]] = defaultdict(list)
 
         for interface in interfaces:
-            device_interface_map[interface.device.display_label].append(interface)
+            device_interface_map[interface.device].append(interface)
 
         for device, intfs in device_interface_map.items():
-            interface_map = {interface.name.value: interface for interface in intfs}
-            sorted_names = sort_interface_list(list(interface_map.keys()))
+            interface_map = {interface.name: interface for interface in intfs}
+            sorted_names = _sorted_interface_names(frozenset(interface_map))
             if sorting == "top_down":
-                sorted_names.reverse()
+                sorted_names = sorted_names[::-1]
             device_interface_map[device] = [interface_map[name] for name in sorted_names]
 
         return device_interface_map
 
     def _extract_connected_peer_devices(
         self,
-        interfaces: list[DcimPhysicalInterface],
+        interfaces: list[InterfaceRecord],
         candidate_peers: set[str],
     ) -> set[str]:
         """Extract connected peer device names from interface cable names."""
         peers: set[str] = set()
 
         for intf in interfaces:
-            cable = getattr(intf, "cable", None)
-            if cable is None:
-                continue
-
-            cable_peer = getattr(cable, "_peer", None) or cable
-            if cable_peer is None:
-                continue
-
-            raw_name = getattr(cable_peer, "name", None)
-            if raw_name is None:
-                continue
-
-            cable_name = getattr(raw_name, "value", None) or raw_name
-            if not isinstance(cable_name, str) or "__" not in cable_name:
+            cable_name = intf.cable_name
+            if not cable_name or "__" not in cable_name:
                 continue
 
             for endpoint in cable_name.split("__"):
@@ -564,45 +619,33 @@ class CablingPlanner:
 
         return connections_from_previous_tors + connections_from_current_tor
 
-    def _get_interface_speed(self, interface: DcimPhysicalInterface) -> int | None:
-        """Extract speed from interface type."""
-        if not hasattr(interface, "interface_type") or not interface.interface_type:
-            return None
-
-        interface_type = (
-            interface.interface_type.value if hasattr(interface.interface_type, "value") else interface.interface_type
-        )
-        return InterfaceSpeedMatcher.extract_speed(str(interface_type)) if interface_type else None
+    def _get_interface_speed(self, interface: Any) -> int | None:
+        """Extract speed from interface type (precomputed on the record)."""
+        return interface_record(interface).speed
 
     def _validate_interface_speeds(
         self,
-        cabling_plan: list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]],
+        cabling_plan: list[tuple[Any, Any]],
         strict: bool = False,
-    ) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
-        """Validate interface speed compatibility in cabling plan."""
+    ) -> list[tuple[Any, Any]]:
+        """Validate interface speed compatibility in cabling plan.
+
+        Accepts records or SDK nodes and returns the same objects it was given.
+        """
         validated_plan = []
         mismatches = []
         skipped_connections = []
 
         for bottom_intf, top_intf in cabling_plan:
-            bottom_speed = self._get_interface_speed(bottom_intf)
-            top_speed = self._get_interface_speed(top_intf)
-
-            bottom_type = (
-                getattr(bottom_intf.interface_type, "value", bottom_intf.interface_type)
-                if hasattr(bottom_intf, "interface_type")
-                else "unknown"
-            )
-            top_type = (
-                getattr(top_intf.interface_type, "value", top_intf.interface_type)
-                if hasattr(top_intf, "interface_type")
-                else "unknown"
-            )
+            bottom = interface_record(bottom_intf)
+            top = interface_record(top_intf)
+            bottom_speed = bottom.speed
+            top_speed = top.speed
 
             if bottom_speed and top_speed and bottom_speed != top_speed:
                 mismatch_msg = (
-                    f"{bottom_intf.device.display_label}:{bottom_intf.name.value} ({bottom_type}, {bottom_speed}Gbps) "
-                    f"↔ {top_intf.device.display_label}:{top_intf.name.value} ({top_type}, {top_speed}Gbps)"
+                    f"{bottom.device}:{bottom.name} ({bottom.interface_type}, {bottom_speed}Gbps) "
+                    f"↔ {top.device}:{top.name} ({top.interface_type}, {top_speed}Gbps)"
                 )
                 mismatches.append(mismatch_msg)
 
@@ -639,24 +682,28 @@ class CablingPlanner:
         self,
         scenario: str,
         cabling_offset: int = 0,
-    ) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
+    ) -> list[tuple[InterfaceRecord, InterfaceRecord]]:
         """Build cabling plan with speed-aware grouping."""
-        all_bottom_intfs = []
-        all_top_intfs = []
+        bottom_by_speed: dict[int, list[InterfaceRecord]] = defaultdict(list)
+        top_by_speed: dict[int, list[InterfaceRecord]] = defaultdict(list)
 
         for device_intfs in self.bottom_by_device.values():
-            all_bottom_intfs.extend(device_intfs)
+            for intf in device_intfs:
+                if intf.speed:
+                    bottom_by_speed[intf.speed].append(intf)
         for device_intfs in self.top_by_device.values():
-            all_top_intfs.extend(device_intfs)
+            for intf in device_intfs:
+                if intf.speed:
+                    top_by_speed[intf.speed].append(intf)
 
-        speed_groups = InterfaceSpeedMatcher.group_by_speed(all_bottom_intfs, all_top_intfs)
+        speed_groups = {
+            speed: (bottom_by_speed[speed], top_by_speed[speed])
+            for speed in bottom_by_speed.keys() & top_by_speed.keys()
+        }
 
         if not speed_groups:
-            bottom_speeds = {self._get_interface_speed(i) for i in all_bottom_intfs if self._get_interface_speed(i)}
-            top_speeds = {self._get_interface_speed(i) for i in all_top_intfs if self._get_interface_speed(i)}
-
-            bottom_speeds_str = ", ".join(str(s) for s in sorted([s for s in bottom_speeds if s is not None]))
-            top_speeds_str = ", ".join(str(s) for s in sorted([s for s in top_speeds if s is not None]))
+            bottom_speeds_str = ", ".join(str(s) for s in sorted(bottom_by_speed))
+            top_speeds_str = ", ".join(str(s) for s in sorted(top_by_speed))
             self.logger.error(
                 f"INTERFACE TYPE MISMATCH - No matching speed groups found for speed-aware cabling. "
                 f"Bottom devices have: {bottom_speeds_str}Gbps, Top devices have: {top_speeds_str}Gbps. "
@@ -702,7 +749,11 @@ class CablingPlanner:
         strict_speed_validation: bool = False,
         **kwargs: Any,
     ) -> list[tuple[DcimPhysicalInterface, DcimPhysicalInterface]]:
-        """Build cabling plan using specified scenario strategy."""
+        """Build cabling plan using specified scenario strategy.
+
+        Strategies plan on records; the returned tuples carry the original
+        SDK nodes (or the records themselves when records were passed in).
+        """
         strategy = self._strategies.get(scenario)
         if not strategy:
             raise ValueError(f"Unknown cabling scenario: {scenario}")
@@ -718,4 +769,4 @@ class CablingPlanner:
                     strict=strict_speed_validation,
                 )
 
-        return cabling_plan
+        return [(self._node(bottom_intf), self._node(top_intf)) for bottom_intf, top_intf in cabling_plan]
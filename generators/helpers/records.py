@@ -0,0 +1,151 @@
+"""Compact planner input records.
+
+The cabling and routing planners only read a handful of scalar fields from
+the SDK nodes they receive (interface name, device label, cable id, ...).
+Reading those through ``intf.device.display_label`` / ``intf.name.value`` /
+``cable._peer`` inside nested planning loops is slow and keeps the whole
+node graph alive. The adapters below flatten each node into an immutable
+NamedTuple exactly once, so the planners can run purely on records.
+
+Records hold no reference to their source node: planners that hand the
+original SDK objects back (``CablingPlanner.build_cabling_plan``) keep their
+own ``record_key`` -> node map. Records built directly (benchmarks, offline
+simulation) are returned as-is.
+
+All adapters are idempotent: passing a record returns it unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, NamedTuple
+
+
+class InterfaceRecord(NamedTuple):
+    """Flattened physical interface used by CablingPlanner and RoutingPlanner."""
+
+    id: str | None
+    name: str
+    device: str
+    """Device display label — grouping key for cabling strategies."""
+    device_id: str | None = None
+    interface_type: str | None = None
+    speed: int | None = None
+    cable_id: str | None = None
+    cable_name: str | None = None
+    """Cable name (``<dev>-<intf>__<dev>-<intf>``) used for idempotent re-cabling."""
+
+
+class LoopbackRecord(NamedTuple):
+    """Flattened loopback interface used to build the routing device map."""
+
+    id: str
+    device_id: str
+    device_name: str
+    device_role: str
+    ip_id: str | None = None
+    ip_label: str | None = None
+
+
+class ProcessRecord(NamedTuple):
+    """Flattened ManagedBGP / ManagedOSPF process (only what the planner reads)."""
+
+    device_name: str | None
+    as_id: str | None = None
+
+
+def _attr_value(obj: Any) -> Any:
+    """Return ``obj.value`` for SDK attributes, or ``obj`` itself for plain values."""
+    return getattr(obj, "value", obj)
+
+
+def _cable_name(cable: Any) -> str | None:
+    """Extract the cable name from a related cable node (prefetched or not)."""
+    if cable is None:
+        return None
+    cable_peer = getattr(cable, "_peer", None) or cable
+    raw_name = getattr(cable_peer, "name", None)
+    if raw_name is None:
+        return None
+    cable_name = getattr(raw_name, "value", None) or raw_name
+    return cable_name if isinstance(cable_name, str) else None
+
+
+def interface_record(obj: Any) -> InterfaceRecord:
+    """Convert an SDK DcimPhysicalInterface (or compatible object) into an InterfaceRecord."""
+    from .cabling import InterfaceSpeedMatcher  # local import: cabling imports this module
+
+    if isinstance(obj, InterfaceRecord):
+        return obj
+
+    device = obj.device
+    cable = getattr(obj, "cable", None)
+    raw_type = getattr(obj, "interface_type", None)
+    interface_type = _attr_value(raw_type) if raw_type else None
+
+    return InterfaceRecord(
+        id=getattr(obj, "id", None),
+        name=obj.name.value,
+        device=device.display_label,
+        device_id=getattr(device, "id", None),
+        interface_type=interface_type,
+        speed=InterfaceSpeedMatcher.extract_speed(str(interface_type)) if interface_type else None,
+        cable_id=getattr(cable, "id", None) if cable else None,
+        cable_name=_cable_name(cable),
+    )
+
+
+def loopback_record(obj: Any) -> LoopbackRecord:
+    """Convert a prefetched DcimVirtualInterface loopback into a LoopbackRecord.
+
+    The loopback must be queried with ``include=["device", "ip_address"]`` and
+    ``prefetch_relationships=True``.
+    """
+    if isinstance(obj, LoopbackRecord):
+        return obj
+
+    dev = obj.device.peer
+    ip = obj.ip_address
+    ip_id = ip.id or None
+    return LoopbackRecord(
+        id=obj.id,
+        device_id=dev.id,
+        device_name=dev.name.value,
+        device_role=dev.role.value,
+        ip_id=ip_id,
+        ip_label=str(ip.display_label) if ip_id else None,
+    )
+
+
+def process_record(obj: Any) -> ProcessRecord:
+    """Convert a prefetched ManagedBGP / ManagedOSPF node into a ProcessRecord."""
+    if isinstance(obj, ProcessRecord):
+        return obj
+
+    try:
+        peers = obj.device_capabilities.peers
+        device_name = peers[0].name.value if peers else None
+    except (AttributeError, ValueError, IndexError):
+        device_name = None
+
+    local_as = getattr(obj, "local_as", None)
+    return ProcessRecord(device_name=device_name, as_id=getattr(local_as, "id", None) or None)
+
+
+def as_interface_records(items: Iterable[Any]) -> list[InterfaceRecord]:
+    """Convert interfaces to records (records pass through unchanged)."""
+    return [interface_record(item) for item in items]
+
+
+def as_loopback_records(items: Iterable[Any]) -> list[LoopbackRecord]:
+    """Convert loopback interfaces to records (records pass through unchanged)."""
+    return [loopback_record(item) for item in items]
+
+
+def as_process_records(items: Iterable[Any]) -> list[ProcessRecord]:
+    """Convert routing processes to records (records pass through unchanged)."""
+    return [process_record(item) for item in items]
+
+
+def record_key(record: InterfaceRecord) -> tuple[str, str]:
+    """Identity of an interface record: (device label, interface name)."""
+    return record.device, record.name
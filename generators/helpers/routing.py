@@ -15,21 +15,34 @@ Strategies:
     - ebgp-ebgp: eBGP underlay + eBGP overlay (per-device ASN)
     - ebgp-ibgp: eBGP underlay + iBGP overlay (shared ASN)
     - ospf-ibgp: OSPF underlay + iBGP overlay (shared ASN)
+
+SDK inputs are flattened into records (see ``records.py``) once at the top of
+``build_routing_plan``; every planning step reads records only.
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
+import hashlib
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, NamedTuple
 
+from .records import (
+    InterfaceRecord,
+    LoopbackRecord,
+    as_interface_records,
+    as_loopback_records,
+    as_process_records,
+)
+
 
 @dataclass
 class RoutingPlanInput:
     """Input for routing plan builder.
 
-    All objects come pre-queried by the generator as SDK objects:
+    All objects come pre-queried by the generator as SDK objects, or as the
+    equivalent records from ``records.py``:
       - bottom_devices / top_devices: device name strings
       - underlay: ManagedBGP underlay processes (SDK objects with device + local_as)
       - overlay: ManagedBGP overlay or ManagedOSPF (existing) SDK objects
@@ -88,6 +101,35 @@ class _BGPDevice(NamedTuple):
     role: str
 
 
+@dataclass
+class RRClusterPlan:
+    """Overlay sessions of a route-reflector cluster design.
+
+    ``clusters`` lists the RR names of each cluster, head first. Clients peer
+    with every RR of the cluster their name hashes to; heads are full-meshed
+    (``head_mesh``) and every other RR peers with its own head. Session
+    counts per device are kept for the flat design (every client with every
+    RR) and the clustered one.
+    """
+
+    clusters: list[list[str]] = field(default_factory=list)
+    assignments: dict[str, int] = field(default_factory=dict)
+    sessions: list[BGPSession] = field(default_factory=list)
+    head_mesh: set[frozenset[str]] = field(default_factory=set)
+    rr_links: set[frozenset[str]] = field(default_factory=set)
+    sessions_before: dict[str, int] = field(default_factory=dict)
+    sessions_after: dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        sizes = "/".join(str(len(cluster)) for cluster in self.clusters)
+        before, after = self.sessions_before, self.sessions_after
+        return (
+            f"RR clusters: {len(self.clusters)} [{sizes} RRs], "
+            f"overlay sessions {sum(before.values()) // 2} -> {sum(after.values()) // 2}, "
+            f"max per device {max(before.values(), default=0)} -> {max(after.values(), default=0)}"
+        )
+
+
 class RoutingStrategy(str, Enum):
     """Supported routing strategies for fabric underlay + overlay."""
 
@@ -96,22 +138,6 @@ class RoutingStrategy(str, Enum):
     OSPF_IBGP = "ospf-ibgp"
 
 
-def _safe_device_name(bgp: Any) -> str | None:
-    """Extract device name from a prefetched ManagedBGP/ManagedOSPF object."""
-    try:
-        peers = bgp.device_capabilities.peers
-        if peers:
-            return peers[0].name.value
-        return None
-    except (AttributeError, ValueError, IndexError):
-        return None
-
-
-def _safe_as_id(bgp: Any) -> str | None:
-    """Extract AS ID from a ManagedBGP object's local_as relationship."""
-    return bgp.local_as.id or None
-
-
 def _make_bgp_proc(
     name: str,
     suffix: str,
@@ -161,6 +187,11 @@ class RoutingPlanner:
                 self.logger.warning("No routing devices provided")
             return plan
 
+        # Flatten SDK inputs once; everything below reads records only
+        interfaces = as_interface_records(inp.interfaces)
+        underlay = as_process_records(inp.underlay)
+        overlay = as_process_records(inp.overlay)
+
         # Build device map from loopback interfaces
         device_map = self._build_device_map(inp.loopback_interfaces)
 
@@ -169,12 +200,9 @@ class RoutingPlanner:
         # not idempotent across create()). BGP processes themselves are always
         # re-saved with allow_upsert=True — local_as is cardinality-one and upserts
         # cleanly (verified on Infrahub 1.9.6), so no new/existing split is needed.
-        existing_as_by_device: dict[str, str] = {}
-        for bgp in inp.underlay:
-            dev_name = _safe_device_name(bgp)
-            as_id = _safe_as_id(bgp)
-            if dev_name and as_id:
-                existing_as_by_device[dev_name] = as_id
+        existing_as_by_device: dict[str, str] = {
+            bgp.device_name: bgp.as_id for bgp in underlay if bgp.device_name and bgp.as_id
+        }
 
         design = inp.options.get("design")
         asn_pool = inp.options.get("asn_pool")
@@ -187,7 +215,7 @@ class RoutingPlanner:
                 self._plan_ebgp_underlay(
                     plan,
                     device_map,
-                    inp.interfaces,
+                    interfaces,
                     existing_as_by_device,
                     asn_pool,
                     set(inp.top_devices),
@@ -203,7 +231,7 @@ class RoutingPlanner:
                 self._plan_ospf_underlay(
                     plan,
                     device_map,
-                    inp.interfaces,
+                    interfaces,
                     inp.deployment_name,
                     existing_ospf_area,
                 )
@@ -229,11 +257,7 @@ class RoutingPlanner:
             planned_device_ids = {b["device_capabilities"][0]["id"] for b in overlay_bgp}
 
             # Include remote devices with existing overlay BGP not yet in plan
-            existing_overlay_names: set[str] = set()
-            for obj in inp.overlay:
-                dev_name = _safe_device_name(obj)
-                if dev_name:
-                    existing_overlay_names.add(dev_name)
+            existing_overlay_names: set[str] = {obj.device_name for obj in overlay if obj.device_name}
 
             for name, info in device_map.items():
                 if info["id"] in planned_device_ids:
@@ -254,6 +278,7 @@ class RoutingPlanner:
                     device_map=device_map,
                     bottom_device_names=set(inp.bottom_devices),
                     top_device_names=set(inp.top_devices),
+                    rr_redundancy=int(inp.options.get("rr_redundancy") or 0),
                 )
 
         return plan
@@ -263,7 +288,7 @@ class RoutingPlanner:
     # ================================================================
 
     @staticmethod
-    def _build_device_map(loopback_interfaces: list[Any]) -> dict[str, dict[str, Any]]:
+    def _build_device_map(loopback_interfaces: list[Any] | list[LoopbackRecord]) -> dict[str, dict[str, Any]]:
         """Build device info from loopback interfaces.
 
         Returns dict keyed by device name::
@@ -274,28 +299,24 @@ class RoutingPlanner:
 
         Loopback interfaces must be queried with:
             include=["device", "ip_address"], prefetch_relationships=True
+        (or passed as ``LoopbackRecord`` tuples).
         """
         device_map: dict[str, dict[str, Any]] = {}
 
         # Sort by interface id so router_id selection is deterministic regardless of
         # query-return order: the lowest-id loopback with a valid IP wins per device.
-        for lb in sorted(loopback_interfaces, key=lambda lb: lb.id):
-            dev = lb.device.peer
-            name = dev.name.value
-            dev_id = dev.id
-            role = dev.role.value
+        for lb in sorted(as_loopback_records(loopback_interfaces), key=lambda lb: lb.id):
+            name = lb.device_name
 
             if name not in device_map:
-                device_map[name] = {"id": dev_id, "role": role}
+                device_map[name] = {"id": lb.device_id, "role": lb.device_role}
 
             # First loopback (by sorted id) with a valid IP wins for router_id
-            if "router_id" not in device_map[name]:
-                ip_id = lb.ip_address.id
-                if ip_id:
-                    device_map[name]["router_id"] = {"id": ip_id}
-                    # display_label is "10.0.0.1/32" — strip prefix
-                    device_map[name]["loopback_ip"] = str(lb.ip_address.display_label).split("/")[0]
-                    device_map[name]["loopback_interface_id"] = lb.id
+            if "router_id" not in device_map[name] and lb.ip_id:
+                device_map[name]["router_id"] = {"id": lb.ip_id}
+                # display_label is "10.0.0.1/32" — strip prefix
+                device_map[name]["loopback_ip"] = str(lb.ip_label).split("/")[0]
+                device_map[name]["loopback_interface_id"] = lb.id
 
         return device_map
 
@@ -307,7 +328,7 @@ class RoutingPlanner:
         self,
         plan: RoutingPlan,
         device_map: dict[str, dict],
-        interfaces: list[Any],
+        interfaces: list[Any] | list[InterfaceRecord],
         existing_as_by_device: dict[str, str],
         asn_pool: Any,
         top_device_names: set[str] | None = None,
@@ -369,18 +390,18 @@ class RoutingPlanner:
             bgp_planned.add(name)
 
         # Phase 2: Peerings — cable-driven, requires both ends to have BGP.
-        cable_map: dict[str, list] = defaultdict(list)
-        for iface in interfaces:
-            if iface.cable and iface.cable.id:
-                cable_map[iface.cable.id].append(iface)
+        cable_map: dict[str, list[InterfaceRecord]] = defaultdict(list)
+        for iface in as_interface_records(interfaces):
+            if iface.cable_id:
+                cable_map[iface.cable_id].append(iface)
 
-        cable_pairs: list[tuple] = []
+        cable_pairs: list[tuple[InterfaceRecord, InterfaceRecord, str, str]] = []
         for ifaces in cable_map.values():
             if len(ifaces) != 2:
                 continue
             a, b = ifaces
-            a_name = id_to_name.get(a.device.id)
-            b_name = id_to_name.get(b.device.id)
+            a_name = id_to_name.get(a.device_id)
+            b_name = id_to_name.get(b.device_id)
             if not a_name or not b_name:
                 continue
             if a_name > b_name:
@@ -400,8 +421,8 @@ class RoutingPlanner:
             if (a_name not in bgp_planned and a_name not in _top) or (b_name not in bgp_planned and b_name not in _top):
                 continue
 
-            ia = a.name.value
-            ib = b.name.value
+            ia = a.name
+            ib = b.name
             ia_h = ia.replace("/", "_")
             ib_h = ib.replace("/", "_")
 
@@ -493,7 +514,7 @@ class RoutingPlanner:
         self,
         plan: RoutingPlan,
         device_map: dict[str, dict],
-        interfaces: list[Any],
+        interfaces: list[Any] | list[InterfaceRecord],
         deployment_name: str,
         existing_area_id: str,
     ) -> None:
@@ -501,9 +522,9 @@ class RoutingPlanner:
         area_ref: dict[str, Any] = {"id": existing_area_id}
         id_to_name = {info["id"]: name for name, info in device_map.items()}
         # Group interfaces by device name
-        device_interfaces: dict[str, list] = defaultdict(list)
-        for iface in interfaces:
-            dev_name = id_to_name.get(iface.device.id)
+        device_interfaces: dict[str, list[InterfaceRecord]] = defaultdict(list)
+        for iface in as_interface_records(interfaces):
+            dev_name = id_to_name.get(iface.device_id)
             if dev_name:
                 device_interfaces[dev_name].append(iface)
 
@@ -532,9 +553,9 @@ class RoutingPlanner:
             )
 
             for iface in device_interfaces.get(name, []):
-                if not (iface.cable and iface.cable.id):
+                if not iface.cable_id:
                     continue
-                iname = iface.name.value
+                iname = iface.name
                 plan.ospf_interfaces.append(
                     {
                         "name": f"{name}-{iname}-ospf-underlay",
@@ -558,8 +579,16 @@ class RoutingPlanner:
         device_map: dict[str, dict],
         bottom_device_names: set[str] | None = None,
         top_device_names: set[str] | None = None,
+        rr_redundancy: int = 0,
     ) -> None:
-        """Build overlay peerings using device loopback IPs from device_map."""
+        """Build overlay peerings using device loopback IPs from device_map.
+
+        With ``rr_redundancy`` set, an iBGP overlay uses route-reflector
+        clusters of that many RRs (see ``_BGPSessionPlanner.build_cluster_plan``)
+        instead of peering every client with every RR. RR-to-RR sessions of
+        the cluster design are kept by the scope filter whenever both ends are
+        in scope, since clients no longer reach every RR.
+        """
         id_to_name = {info["id"]: name for name, info in device_map.items()}
         device_bgp_map: dict[str, dict] = {}
 
@@ -590,16 +619,26 @@ class RoutingPlanner:
             return
 
         session_planner = _BGPSessionPlanner(devices=device_data)
-        session_plan = session_planner.build_session_plan(session_type=overlay_type)
+        cluster_plan: RRClusterPlan | None = None
+        if rr_redundancy and overlay_type == "ibgp":
+            cluster_plan = session_planner.build_cluster_plan(overlay_type, rr_redundancy)
+            session_plan = cluster_plan.sessions
+            if self.logger:
+                self.logger.info(cluster_plan.summary())
+        else:
+            session_plan = session_planner.build_session_plan(session_type=overlay_type)
+        rr_links = cluster_plan.rr_links if cluster_plan else set()
 
         if bottom_device_names is not None and top_device_names is not None:
             if bottom_device_names and top_device_names:
-                # Cross-layer: one device in bottom, the other in top
+                # Cross-layer: one device in bottom, the other in top (plus in-scope RR links)
+                all_scoped = bottom_device_names | top_device_names
                 session_plan = [
                     s
                     for s in session_plan
                     if (s[0] in bottom_device_names and s[2] in top_device_names)
                     or (s[0] in top_device_names and s[2] in bottom_device_names)
+                    or (frozenset((s[0], s[2])) in rr_links and s[0] in all_scoped and s[2] in all_scoped)
                 ]
             else:
                 # Single-set: both devices must be in the combined set
@@ -615,7 +654,9 @@ class RoutingPlanner:
 
             bgp1, bgp2 = device_bgp_map[d1_id], device_bgp_map[d2_id]
             left_name, right_name = sorted([d1_name, d2_name])
-            is_rr = overlay_type == "ibgp"
+            # RR-to-RR links (head mesh, member to head) peer as non-clients; every
+            # other iBGP session has an RR client (the end with the higher tier reflects)
+            is_rr = overlay_type == "ibgp" and frozenset((d1_name, d2_name)) not in rr_links
 
             # Overlay peers via loopback interfaces
             peering_interfaces = []
@@ -646,12 +687,85 @@ class RoutingPlanner:
 # ================================================================
 
 
+_RR_TIERS: tuple[tuple[str, ...], ...] = (("super-spine", "super_spine"), ("spine",))
+"""Route-reflector roles, highest tier first."""
+
+_CLIENT_ROLES = ("leaf", "border-leaf", "tor")
+
+
+def _cluster_index(name: str, clusters: int) -> int:
+    """Stable cluster of ``name`` (same on every run and Python process)."""
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big") % clusters
+
+
+def _session_counts(sessions: list[BGPSession]) -> dict[str, int]:
+    counts: Counter[str] = Counter()
+    for session in sessions:
+        counts[session.dev1_name] += 1
+        counts[session.dev2_name] += 1
+    return dict(sorted(counts.items()))
+
+
 class _BGPSessionPlanner:
     """Plans BGP session topology (route reflector, spine-leaf, etc.)."""
 
     def __init__(self, devices: list[_BGPDevice]):
         self.devices = devices
 
+    def build_cluster_plan(self, session_type: str, redundancy: int) -> RRClusterPlan:
+        """Plan RR clusters of ``redundancy`` route reflectors each.
+
+        The highest RR tier present (super-spines, else spines, else
+        leafs/border-leafs over tors) reflects for every other device, so
+        spines become clients of the super-spines. RRs are split by name into
+        ``len(rrs) // redundancy`` clusters (a remainder joins the last one)
+        and each client is hashed onto one cluster, so a client keeps its RRs
+        when other clients come and go. Sessions: client to each RR of its
+        cluster, full mesh between cluster heads, every other RR to its head.
+        """
+        af = ["evpn"]
+        rrs, clients = self._cluster_tiers()
+        rrs = sorted(rrs, key=lambda d: d.name)
+        count = max(len(rrs) // max(redundancy, 1), 1)
+        clusters = [rrs[i * redundancy : (i + 1) * redundancy] for i in range(count)]
+        if clusters:
+            clusters[-1] += rrs[count * redundancy :]
+        clusters = [cluster for cluster in clusters if cluster]
+
+        plan = RRClusterPlan(clusters=[[rr.name for rr in cluster] for cluster in clusters])
+        heads = [cluster[0] for cluster in clusters]
+        for i, head in enumerate(heads):
+            for other in heads[i + 1 :]:
+                plan.sessions.append(BGPSession(head.name, head.id, other.name, other.id, session_type, af))
+                plan.head_mesh.add(frozenset((head.name, other.name)))
+        for cluster in clusters:
+            for member in cluster[1:]:
+                plan.sessions.append(
+                    BGPSession(member.name, member.id, cluster[0].name, cluster[0].id, session_type, af)
+                )
+        plan.rr_links = {frozenset((s.dev1_name, s.dev2_name)) for s in plan.sessions}
+        if clusters:
+            for client in sorted(clients, key=lambda d: d.name):
+                index = _cluster_index(client.name, len(clusters))
+                plan.assignments[client.name] = index
+                plan.sessions.extend(
+                    BGPSession(client.name, client.id, rr.name, rr.id, session_type, af) for rr in clusters[index]
+                )
+
+        plan.sessions_before = _session_counts(self.build_session_plan(session_type))
+        plan.sessions_after = _session_counts(plan.sessions)
+        return plan
+
+    def _cluster_tiers(self) -> tuple[list[_BGPDevice], list[_BGPDevice]]:
+        """(route reflectors, clients): the highest RR tier present reflects for everyone else."""
+        for tier in _RR_TIERS:
+            rrs = [d for d in self.devices if d.role in tier]
+            if rrs:
+                client_roles = {*_CLIENT_ROLES, *(role for roles in _RR_TIERS for role in roles)} - set(tier)
+                return rrs, [d for d in self.devices if d.role in client_roles]
+        rrs = [d for d in self.devices if d.role in ("leaf", "border-leaf")]
+        return rrs, [d for d in self.devices if d.role == "tor"]
+
     def build_session_plan(self, session_type: str) -> list[BGPSession]:
         """Build BGP session plan using route-reflector topology."""
         sessions = self._build_route_reflector(session_type)
@@ -0,0 +1,289 @@
+"""Opt-in client instrumentation for generators.
+
+``CommonGenerator`` wraps its client with ``GeneratorMetrics`` when the
+``GENERATOR_METRICS`` environment variable is set (or ``metrics_enabled`` is
+overridden on the class):
+
+- ``GENERATOR_METRICS=1`` logs a JSON summary at the end of the run
+- ``GENERATOR_METRICS=/some/dir`` also writes it to ``/some/dir/<generator>-<target>.json``
+
+Every server round trip is counted as a query, mutation or pool allocation,
+and ``create_batch()`` batches are counted when executed. Counts and latency
+percentiles are grouped by the active phase. Phases are named with
+``phase()`` / ``CommonGenerator.phase()`` (a context manager) or the
+``phased()`` decorator; nested phases are recorded under their innermost name
+(``phases``) and their full path (``paths``), e.g. ``leafs/cabling``.
+
+Instrumentation sits on the client's transport, so saves made through
+``node.save()`` are counted too: ``execute_graphql`` for the SDK client, and
+round-trip observers for ``InMemoryInfrahubClient``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import math
+import os
+import re
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+METRICS_ENV = "GENERATOR_METRICS"
+"""Environment variable enabling instrumentation (``1`` / ``true`` or an output directory)."""
+
+DEFAULT_PHASE = "other"
+"""Phase name for calls made outside any named phase (e.g. group tracking updates)."""
+
+PERCENTILES = (50, 90, 99)
+
+_ENABLED_VALUES = frozenset({"1", "true", "yes", "on"})
+_DISABLED_VALUES = frozenset({"", "0", "false", "no", "off"})
+
+# Round-trip categories of InMemoryInfrahubClient methods (everything else is a query)
+_MEMORY_CATEGORIES = {
+    "save": "mutations",
+    "delete": "mutations",
+    "allocate_next_ip_address": "allocations",
+    "allocate_next_ip_prefix": "allocations",
+}
+
+_PHASE: ContextVar[tuple[str, ...]] = ContextVar("generator_phase", default=())
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# ============================================================================
+# Phases
+# ============================================================================
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Attribute client calls made inside the block to phase ``name``.
+
+    Phases nest; re-entering the innermost phase is a no-op so helpers that
+    name their own phase can be called from a block with the same name.
+    Asyncio tasks (e.g. batch executions) inherit the phase they were started in.
+    """
+    current = _PHASE.get()
+    if current and current[-1] == name:
+        yield
+        return
+    token = _PHASE.set((*current, name))
+    try:
+        yield
+    finally:
+        _PHASE.reset(token)
+
+
+def phased(name: str) -> Callable[[F], F]:
+    """Decorate a coroutine method so its client calls are attributed to phase ``name``."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with phase(name):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def current_phase() -> tuple[str, ...]:
+    """Return the active phase path (empty outside any phase)."""
+    return _PHASE.get()
+
+
+# ============================================================================
+# Metrics
+# ============================================================================
+
+
+def percentiles(samples: list[float], points: tuple[int, ...] = PERCENTILES) -> dict[str, float]:
+    """Nearest-rank percentiles of ``samples`` in milliseconds, plus max and mean."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    result = {f"p{point}": ordered[max(math.ceil(point / 100 * len(ordered)) - 1, 0)] for point in points}
+    result["max"] = ordered[-1]
+    result["mean"] = sum(ordered) / len(ordered)
+    return {key: round(value * 1000, 3) for key, value in result.items()}
+
+
+def classify_graphql(query: str, tracker: str | None = None) -> str:
+    """Return the round-trip category of a GraphQL request sent by the SDK."""
+    if re.search(r"\w+PoolGetResource", query):
+        return "allocations"
+    if (tracker or "").startswith("mutation") or query.lstrip().startswith("mutation"):
+        return "mutations"
+    return "queries"
+
+
+@dataclass
+class PhaseMetrics:
+    """Counts and round-trip latencies of one phase."""
+
+    queries: int = 0
+    mutations: int = 0
+    allocations: int = 0
+    batches: int = 0
+    batch_tasks: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "queries": self.queries,
+            "mutations": self.mutations,
+            "allocations": self.allocations,
+            "batches": self.batches,
+            "batch_tasks": self.batch_tasks,
+            "round_trips": len(self.latencies),
+            "seconds": round(sum(self.latencies), 4),
+            "latency_ms": percentiles(self.latencies),
+        }
+
+
+class GeneratorMetrics:
+    """Collect per-phase client metrics for one generator run.
+
+    Args:
+        generator: Generator class name.
+        target: Object the generator runs for (e.g. the rack name).
+    """
+
+    def __init__(self, generator: str, target: str = "") -> None:
+        self.generator = generator
+        self.target = target
+        self.paths: dict[tuple[str, ...], PhaseMetrics] = {}
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def _current(self) -> PhaseMetrics:
+        path = current_phase() or (DEFAULT_PHASE,)
+        metrics = self.paths.get(path)
+        if metrics is None:
+            metrics = self.paths[path] = PhaseMetrics()
+        return metrics
+
+    def record(self, category: str, seconds: float) -> None:
+        """Record one round trip of ``category`` (queries, mutations or allocations)."""
+        metrics = self._current()
+        setattr(metrics, category, getattr(metrics, category) + 1)
+        metrics.latencies.append(seconds)
+
+    def record_batch(self, tasks: int) -> None:
+        metrics = self._current()
+        metrics.batches += 1
+        metrics.batch_tasks += tasks
+
+    def finish(self) -> None:
+        self.seconds = time.perf_counter() - self.started
+
+    # ---------------------------------------------------------------- client
+
+    @contextmanager
+    def attach(self, client: Any) -> Iterator[None]:
+        """Instrument ``client`` for the duration of the block, then restore it."""
+        patched: dict[str, Any] = {}
+
+        def _patch(name: str, replacement: Any) -> None:
+            patched[name] = client.__dict__.get(name)
+            setattr(client, name, replacement)
+
+        observers = getattr(client, "round_trip_observers", None)
+        if observers is not None:
+            observers.append(self._observe)
+        else:
+            _patch("execute_graphql", self._wrap_execute_graphql(client.execute_graphql))
+        _patch("create_batch", self._wrap_create_batch(client.create_batch))
+        try:
+            yield
+        finally:
+            for name, previous in patched.items():
+                if previous is None:
+                    delattr(client, name)
+                else:
+                    setattr(client, name, previous)
+            if observers is not None:
+                observers.remove(self._observe)
+
+    def _observe(self, method: str, seconds: float) -> None:
+        self.record(_MEMORY_CATEGORIES.get(method, "queries"), seconds)
+
+    def _wrap_execute_graphql(self, execute_graphql: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(execute_graphql)
+        async def wrapper(query: str, *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await execute_graphql(query, *args, **kwargs)
+            finally:
+                self.record(classify_graphql(query, kwargs.get("tracker")), time.perf_counter() - start)
+
+        return wrapper
+
+    def _wrap_create_batch(self, create_batch: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(create_batch)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            batch = await create_batch(*args, **kwargs)
+            execute = batch.execute
+
+            async def _execute() -> AsyncIterator[Any]:
+                self.record_batch(batch.num_tasks)
+                async for item in execute():
+                    yield item
+
+            batch.execute = _execute
+            return batch
+
+        return wrapper
+
+    # ---------------------------------------------------------------- summary
+
+    def summary(self) -> dict[str, Any]:
+        """Return the JSON-serialisable run summary."""
+        phases: dict[str, PhaseMetrics] = {}
+        for path, metrics in self.paths.items():
+            rollup = phases.setdefault(path[-1], PhaseMetrics())
+            for name in ("queries", "mutations", "allocations", "batches", "batch_tasks"):
+                setattr(rollup, name, getattr(rollup, name) + getattr(metrics, name))
+            rollup.latencies.extend(metrics.latencies)
+
+        total = PhaseMetrics()
+        for metrics in phases.values():
+            for name in ("queries", "mutations", "allocations", "batches", "batch_tasks"):
+                setattr(total, name, getattr(total, name) + getattr(metrics, name))
+            total.latencies.extend(metrics.latencies)
+
+        return {
+            "generator": self.generator,
+            "target": self.target,
+            "seconds": round(self.seconds, 4),
+            "total": total.as_dict(),
+            "phases": {name: metrics.as_dict() for name, metrics in phases.items()},
+            "paths": {"/".join(path): metrics.as_dict() for path, metrics in self.paths.items()},
+        }
+
+    def write(self, directory: str | Path) -> Path:
+        """Write the summary to ``<directory>/<generator>-<target>.json`` and return the path."""
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{self.generator}-{self.target}".strip("-"))
+        path = Path(directory) / f"{slug}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2))
+        return path
+
+
+def metrics_setting() -> tuple[bool, Path | None]:
+    """Read ``GENERATOR_METRICS``: (enabled, output directory or None)."""
+    value = os.getenv(METRICS_ENV, "").strip()
+    if value.lower() in _DISABLED_VALUES:
+        return False, None
+    if value.lower() in _ENABLED_VALUES:
+        return True, None
+    return True, Path(value)
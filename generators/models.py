@@ -132,6 +132,7 @@ class DataCenterDesignData(BaseModel):
     # Routing architecture
     routing_strategy: str = "ebgp-ebgp"
     underlay_protocol: str = "ipv6"
+    rr_redundancy: int = 0
 
     # Capacity planning
     max_pods: int = 2
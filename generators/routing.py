@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     import logging
 
 from .helpers import RoutingPlanInput, RoutingPlanner, RoutingStrategy
+from .instrumentation import phased
 from .protocols import (
     DcimPhysicalInterface,
     DcimVirtualInterface,
@@ -37,6 +38,7 @@ class RoutingMixin:
     fabric_name: str
     data: Any
 
+    @phased("routing")
     async def create_routing(
         self,
         bottom_devices: list[str],
@@ -0,0 +1,1284 @@
+"""Offline whole-fabric planning simulator.
+
+Composes the pure planners from ``generators.helpers`` (DeviceNamingConfig,
+calculate_pod_pools, name_to_asn_range, CablingPlanner, RoutingPlanner) with
+in-memory IP / ASN / VLAN / VNI pools to produce the device, cable, address,
+routing and segment plan that the DC → Pod → Rack and segment generators
+would build — without an Infrahub server.
+
+The simulation follows the generator order:
+
+- DC: fabric pools, ASN / VLAN / VNI pools, super-spines
+- Pod: pod pools (``calculate_pod_pools``), spines, spine → super-spine cabling
+- Rack: leafs and ToRs, cabled with the same strategies and offsets as
+  ``RackGenerator`` (network racks run before ToR racks of the same row, so
+  mixed-deployment ToRs find their row leafs)
+- Segments: one deployment per ``DataCenterSpec.segments`` entry, with a VLAN
+  ID per segment, an L2 VNI per VXLAN segment and an L3 VNI per VRF namespace
+  (``add_vlan_segment`` / ``add_vxlan_segment`` / ``add_vrf``)
+
+Every cabling step is routed with RoutingPlanner, using the design's
+``rr_redundancy`` (route-reflector clusters for an iBGP overlay) unless
+``FabricSimulator`` is given another one.
+
+Designs are read from the object files under ``data/`` (``load_data_centers``);
+``replicate_rows`` scales a pod's rack layout for capacity what-ifs, with
+optional overrides of the DC pool sizes, pod pool sizes and spines;
+``load_segments`` reads the segment catalog under ``data/segments`` and
+``replicate_segments`` scales it for VLAN / VNI pool what-ifs.
+
+Errors follow the generator conventions: a rack that cannot be planned (pool
+exhausted, missing leafs, ...) is recorded in ``SimulationStats.errors`` and the
+simulation continues with the next rack.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Iterator, Literal, NamedTuple, Union
+
+import yaml
+from infrahub_sdk.spec.range_expansion import range_expansion
+
+from .helpers import (
+    CablingPlanner,
+    DeviceNamingConfig,
+    InterfaceRecord,
+    LoopbackRecord,
+    ProcessRecord,
+    RoutingPlan,
+    RoutingPlanInput,
+    RoutingPlanner,
+    RoutingStrategy,
+    calculate_cabling_offset,
+    calculate_pod_pools,
+    calculate_super_spine_loopback_prefix,
+    name_to_asn_range,
+)
+from .models import DataCenterDesignData, PodDesign
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+SortingMethod = Literal["top_down", "bottom_up"]
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+BOOTSTRAP_DIR = DATA_DIR / "bootstrap"
+SEGMENTS_DIR = DATA_DIR / "segments"
+
+DEFAULT_PARENT_POOLS: dict[str, str] = {
+    "Technical-IPv4": "1.0.0.0/16",
+    "Loopback-IPv4": "1.127.0.0/16",
+    "Management-IPv4": "172.16.0.0/18",
+    "Technical-IPv6": "fd00:2100::/40",
+    "Loopback-IPv6": "fd00:2000::/32",
+}
+"""Global parent pools, mirroring ``data/bootstrap/17_ip_prefix_pools.yml``."""
+
+
+# ============================================================================
+# In-memory Pools
+# ============================================================================
+
+
+class PoolExhaustedError(ValueError):
+    """Raised when an in-memory pool has no room left for an allocation."""
+
+
+class PoolUsage(NamedTuple):
+    name: str
+    resource: str
+    allocations: int
+    utilization: float
+
+
+class InMemoryPrefixPool:
+    """Sequential stand-in for CoreIPPrefixPool / CoreIPAddressPool.
+
+    Allocations are aligned to their prefix length and keyed by identifier:
+    asking twice for the same identifier returns the same prefix, matching
+    ``allocate_next_ip_prefix(identifier=...)``. Address pools skip the
+    network address of their resource.
+    """
+
+    def __init__(self, name: str, prefix: str | IPNetwork, address_pool: bool = False) -> None:
+        self.name = name
+        self.network: IPNetwork = ipaddress.ip_network(prefix, strict=False)
+        self.address_pool = address_pool
+        self._end = int(self.network.broadcast_address) + 1
+        self._next = int(self.network.network_address)
+        if address_pool and self.network.num_addresses > 2:
+            self._next += 1
+        self._allocations: dict[str, IPNetwork] = {}
+        self._allocated_addresses = 0
+
+    def allocate_prefix(self, identifier: str, prefix_length: int) -> IPNetwork:
+        """Allocate (or return the existing) prefix for ``identifier``."""
+        existing = self._allocations.get(identifier)
+        if existing is not None:
+            return existing
+
+        if not self.network.prefixlen <= prefix_length <= self.network.max_prefixlen:
+            raise ValueError(f"Pool {self.name}: cannot allocate /{prefix_length} from {self.network}")
+
+        size = 1 << (self.network.max_prefixlen - prefix_length)
+        start = -(-self._next // size) * size
+        if start + size > self._end:
+            raise PoolExhaustedError(
+                f"Pool {self.name} ({self.network}) exhausted: no room for /{prefix_length} ({identifier})"
+            )
+
+        self._next = start + size
+        prefix = self.network.__class__((start, prefix_length))
+        self._allocations[identifier] = prefix
+        self._allocated_addresses += size
+        return prefix
+
+    def allocate_address(self, identifier: str) -> str:
+        """Allocate a host address for ``identifier`` (returned without prefix length)."""
+        return str(self.allocate_prefix(identifier, self.network.max_prefixlen).network_address)
+
+    @property
+    def allocations(self) -> int:
+        return len(self._allocations)
+
+    @property
+    def utilization(self) -> float:
+        return self._allocated_addresses / self.network.num_addresses
+
+    def usage(self) -> PoolUsage:
+        return PoolUsage(self.name, str(self.network), self.allocations, self.utilization)
+
+
+class InMemoryNumberPool:
+    """Sequential, identifier-keyed stand-in for CoreNumberPool (ASN, VLAN, VNI)."""
+
+    def __init__(self, name: str, start: int, end: int) -> None:
+        if start > end:
+            raise ValueError(f"Pool {name}: start {start} is greater than end {end}")
+        self.name = name
+        self.start = start
+        self.end = end
+        self._next = start
+        self._allocations: dict[str, int] = {}
+
+    def allocate(self, identifier: str) -> int:
+        """Allocate (or return the existing) number for ``identifier``."""
+        existing = self._allocations.get(identifier)
+        if existing is not None:
+            return existing
+        if self._next > self.end:
+            raise PoolExhaustedError(f"Pool {self.name} ({self.start}-{self.end}) exhausted ({identifier})")
+        value = self._next
+        self._next += 1
+        self._allocations[identifier] = value
+        return value
+
+    @property
+    def allocations(self) -> int:
+        return len(self._allocations)
+
+    @property
+    def utilization(self) -> float:
+        return len(self._allocations) / (self.end - self.start + 1)
+
+    def usage(self) -> PoolUsage:
+        return PoolUsage(self.name, f"{self.start}-{self.end}", self.allocations, self.utilization)
+
+
+def default_parent_pools() -> dict[str, InMemoryPrefixPool]:
+    """Return fresh global parent pools (shared by every DC of one simulation)."""
+    return {name: InMemoryPrefixPool(name, prefix) for name, prefix in DEFAULT_PARENT_POOLS.items()}
+
+
+# ============================================================================
+# Fabric Specification
+# ============================================================================
+
+
+class InterfaceTemplate(NamedTuple):
+    name: str
+    role: str | None = None
+    interface_type: str | None = None
+
+
+class DeviceTemplate(NamedTuple):
+    """Physical device template with expanded interface names."""
+
+    name: str
+    interfaces: tuple[InterfaceTemplate, ...] = ()
+
+    def interface_names(self, role: str) -> list[str]:
+        return [intf.name for intf in self.interfaces if intf.role == role]
+
+
+class RackRole(NamedTuple):
+    """One ``fabric_templates`` entry of a rack: quantity × role from template."""
+
+    role: str
+    quantity: int
+    template: str
+
+
+@dataclass
+class RackSpec:
+    name: str
+    pod_index: int
+    row_index: int
+    index: int
+    rack_type: str
+    suite_index: int = 1
+    roles: list[RackRole] = field(default_factory=list)
+
+    @property
+    def leafs(self) -> list[RackRole]:
+        return [role for role in self.roles if role.role == "leaf"]
+
+    @property
+    def tors(self) -> list[RackRole]:
+        return [role for role in self.roles if role.role == "tor"]
+
+
+@dataclass
+class PodSpec:
+    index: int
+    name: str
+    spine_template: str
+    design: PodDesign | None = None
+    deployment_type: Literal["middle_rack", "tor", "mixed"] = "tor"
+    amount_of_spines: int = 4
+    leaf_interface_sorting_method: SortingMethod = "bottom_up"
+    spine_interface_sorting_method: SortingMethod = "bottom_up"
+    prefix_lengths: dict[str, int] = field(default_factory=dict)
+    """Pod pool prefix lengths (``technical`` / ``loopback``) replacing the ``calculate_pod_pools`` sizes."""
+
+
+class SegmentSpec(NamedTuple):
+    """Network segment deployed in the data center (ManagedVlanSegment / ManagedVxlanSegment)."""
+
+    name: str
+    kind: Literal["vlan", "vxlan"]
+    namespace: str | None = None
+    """VRF (IP namespace) of the segment prefix; VXLAN VRFs get an L3 VNI."""
+
+
+@dataclass
+class DataCenterSpec:
+    """Everything the DC, Pod and Rack generators read from Infrahub, as plain data."""
+
+    name: str
+    index: int
+    design: DataCenterDesignData
+    super_spine_template: str
+    templates: dict[str, DeviceTemplate]
+    amount_of_super_spines: int = 2
+    naming_convention: Literal["standard", "hierarchical", "flat"] = "standard"
+    overlay_technology: str = "vxlan_evpn"
+    fabric_interface_sorting_method: SortingMethod = "bottom_up"
+    loopback_prefix_length: int = 23
+    technical_prefix_length: int = 19
+    management_prefix_length: int = 25
+    pods: list[PodSpec] = field(default_factory=list)
+    racks: list[RackSpec] = field(default_factory=list)
+    segments: list[SegmentSpec] = field(default_factory=list)
+
+    @property
+    def fabric_name(self) -> str:
+        return self.name.lower()
+
+
+def pod_name(dc_name: str, dc_index: int, pod_index: int) -> str:
+    """Pod name as computed by the TopologyPod schema (``DC1-1-POD-2``)."""
+    return f"{dc_name.upper()}-{dc_index}-POD-{pod_index}"
+
+
+def replicate_rows(
+    dc: DataCenterSpec,
+    rows: int,
+    *,
+    technical_prefix_length: int | None = None,
+    loopback_prefix_length: int | None = None,
+    management_prefix_length: int | None = None,
+    pod_prefix_lengths: dict[int, dict[str, int]] | None = None,
+    spines: int | None = None,
+    spine_template: str | None = None,
+) -> DataCenterSpec:
+    """Return a copy of ``dc`` whose pods repeat their rack rows up to ``rows`` rows.
+
+    Rows are copied cyclically (row N reuses the racks of row ``(N-1) % len + 1``).
+    Pod designs are widened to ``rows`` so pod pools are sized for the scaled
+    layout; everything else keeps the design unless overridden:
+
+    - ``technical_prefix_length`` / ``loopback_prefix_length`` /
+      ``management_prefix_length``: DC pool sizes, as the ``TopologyDataCenter``
+      attributes (technical and loopback on an IPv4 base, +96 for IPv6)
+    - ``pod_prefix_lengths``: pod index → ``{"technical": ..., "loopback": ...}``
+      pod pool prefix lengths (as returned by ``calculate_pod_pools``)
+    - ``spines`` / ``spine_template``: spines per pod and their template (the
+      spine downlinks bound the leafs and ToRs a pod can cable); designs are
+      widened to allow ``spines``
+
+    Raises:
+        ValueError: If ``rows`` or ``spines`` is below 1 or ``spine_template`` is unknown.
+    """
+    if rows < 1:
+        raise ValueError(f"rows must be >= 1, got {rows}")
+    if spines is not None and spines < 1:
+        raise ValueError(f"spines must be >= 1, got {spines}")
+    if spine_template is not None and spine_template not in dc.templates:
+        raise ValueError(f"Unknown device template '{spine_template}'")
+
+    design = dc.design
+    if spines is not None and design.max_spines_per_pod < spines:
+        design = design.model_copy(update={"max_spines_per_pod": spines})
+
+    pods: list[PodSpec] = []
+    racks: list[RackSpec] = []
+    for pod in dc.pods:
+        pod_racks = [rack for rack in dc.racks if rack.pod_index == pod.index]
+        template_rows = sorted({rack.row_index for rack in pod_racks})
+        pod_design = pod.design
+        if pod_design is not None and pod_design.rows < rows:
+            pod_design = pod_design.model_copy(update={"rows": rows})
+        if pod_design is not None and spines is not None and pod_design.max_spines_per_pod < spines:
+            pod_design = pod_design.model_copy(update={"max_spines_per_pod": spines})
+        pod = replace(
+            pod,
+            design=pod_design,
+            amount_of_spines=spines if spines is not None else pod.amount_of_spines,
+            spine_template=spine_template or pod.spine_template,
+            prefix_lengths={**pod.prefix_lengths, **((pod_prefix_lengths or {}).get(pod.index) or {})},
+        )
+        pods.append(pod)
+        if not template_rows:
+            continue
+        for row in range(1, rows + 1):
+            source_row = template_rows[(row - 1) % len(template_rows)]
+            racks.extend(
+                replace(rack, row_index=row, name=f"{pod.name}-R{row}-{rack.index}")
+                for rack in pod_racks
+                if rack.row_index == source_row
+            )
+
+    return replace(
+        dc,
+        design=design,
+        technical_prefix_length=technical_prefix_length or dc.technical_prefix_length,
+        loopback_prefix_length=loopback_prefix_length or dc.loopback_prefix_length,
+        management_prefix_length=management_prefix_length or dc.management_prefix_length,
+        pods=pods,
+        racks=racks,
+    )
+
+
+# ============================================================================
+# Loading from data/ object files
+# ============================================================================
+
+
+def _object_data(path: Path, kind: str) -> list[dict[str, Any]]:
+    """Return the ``spec.data`` entries of every ``kind`` document in an object file."""
+    items: list[dict[str, Any]] = []
+    for doc in yaml.safe_load_all(path.read_text(encoding="utf-8")):
+        spec = (doc or {}).get("spec") or {}
+        if spec.get("kind") == kind:
+            items.extend(spec.get("data") or [])
+    return items
+
+
+def _expand(name: str) -> list[str]:
+    return range_expansion(name) if "[" in name else [name]
+
+
+def load_device_templates(bootstrap_dir: Path = BOOTSTRAP_DIR) -> dict[str, DeviceTemplate]:
+    """Load physical device templates, expanding interface ranges (``Ethernet1/[1-30]``).
+
+    A template may be listed several times (physical and console interfaces are
+    upserted separately); only physical interfaces are kept.
+    """
+    templates: dict[str, DeviceTemplate] = {}
+    for path in sorted(Path(bootstrap_dir).glob("10_physical_devices_templates_*.yaml")):
+        for item in _object_data(path, "TemplateDcimPhysicalDevice"):
+            interfaces = item.get("interfaces") or {}
+            if interfaces.get("kind", "TemplateDcimPhysicalInterface") != "TemplateDcimPhysicalInterface":
+                interfaces = {}
+            existing = templates.get(item["template_name"])
+            templates[item["template_name"]] = DeviceTemplate(
+                name=item["template_name"],
+                interfaces=(existing.interfaces if existing else ())
+                + tuple(
+                    InterfaceTemplate(name=name, role=intf.get("role"), interface_type=intf.get("interface_type"))
+                    for intf in interfaces.get("data") or []
+                    for name in _expand(str(intf["name"]))
+                ),
+            )
+    return templates
+
+
+def load_segments(segments_dir: Path = SEGMENTS_DIR) -> list[SegmentSpec]:
+    """Load the VLAN and VXLAN segments defined in ``segments_dir`` (named by their HFID)."""
+    files = sorted(Path(segments_dir).glob("*.yml")) + sorted(Path(segments_dir).glob("*.yaml"))
+    segments: list[SegmentSpec] = []
+    for kind, schema_kind in (("vlan", "ManagedVlanSegment"), ("vxlan", "ManagedVxlanSegment")):
+        for item in (segment for path in files for segment in _object_data(path, schema_kind)):
+            name = "__".join(str(item.get(key, "")) for key in ("owner", "environment", "customer_name"))
+            prefixes = item.get("prefix") or []
+            namespace = prefixes[0][1] if prefixes and len(prefixes[0]) > 1 else None
+            segments.append(SegmentSpec(name=name, kind=kind, namespace=namespace))  # type: ignore[arg-type]
+    return segments
+
+
+def replicate_segments(segments: list[SegmentSpec], count: int) -> list[SegmentSpec]:
+    """Repeat ``segments`` cyclically up to ``count`` segments (copies get a ``-<n>`` suffix).
+
+    Copies keep the namespace of their original, so only VLAN IDs and L2 VNIs
+    scale with ``count``.
+
+    Raises:
+        ValueError: If ``count`` is negative or ``segments`` is empty while ``count`` is not.
+    """
+    if count < 0:
+        raise ValueError(f"count must be >= 0, got {count}")
+    if count and not segments:
+        raise ValueError("no segments to replicate")
+    replicated: list[SegmentSpec] = []
+    for i in range(count):
+        copy, segment = divmod(i, len(segments))
+        template = segments[segment]
+        replicated.append(template._replace(name=f"{template.name}-{copy}") if copy else template)
+    return replicated
+
+
+def load_data_centers(dc_dir: Path, bootstrap_dir: Path = BOOTSTRAP_DIR) -> list[DataCenterSpec]:
+    """Load the data centers defined in a demo directory (e.g. ``data/demos/01_data_center/dc1``).
+
+    Reads ``TopologyDataCenter`` / ``LocationSuite`` / ``LocationRack`` objects from
+    the directory and resolves design and template references from ``bootstrap_dir``.
+
+    Raises:
+        ValueError: if a referenced design or template does not exist.
+    """
+    dc_dir = Path(dc_dir)
+    bootstrap_dir = Path(bootstrap_dir)
+    files = sorted(dc_dir.glob("*.yml")) + sorted(dc_dir.glob("*.yaml"))
+
+    dc_designs = {d["name"]: d for d in _object_data(bootstrap_dir / "11_dc_designs.yml", "TopologyDataCenterDesign")}
+    pod_designs = {d["name"]: d for d in _object_data(bootstrap_dir / "12_pod_designs.yml", "TopologyPodDesign")}
+    templates = load_device_templates(bootstrap_dir)
+
+    suites = {s.get("shortname"): int(s["index"]) for path in files for s in _object_data(path, "LocationSuite")}
+    raw_racks = [rack for path in files for rack in _object_data(path, "LocationRack")]
+
+    def _template(name: str) -> str:
+        if name not in templates:
+            raise ValueError(f"Unknown device template '{name}'")
+        return name
+
+    data_centers: list[DataCenterSpec] = []
+    for item in (dc for path in files for dc in _object_data(path, "TopologyDataCenter")):
+        design_name = item.get("design")
+        if design_name not in dc_designs:
+            raise ValueError(f"DC {item['name']}: unknown design '{design_name}'")
+        design_fields = {k: v for k, v in dc_designs[design_name].items() if k in DataCenterDesignData.model_fields}
+        dc_index = int(item["index"])
+
+        pods: list[PodSpec] = []
+        for pod in (item.get("children") or {}).get("data") or []:
+            pod_design = None
+            if pod.get("design"):
+                if pod["design"] not in pod_designs:
+                    raise ValueError(f"DC {item['name']} pod {pod['index']}: unknown design '{pod['design']}'")
+                fields = {k: v for k, v in pod_designs[pod["design"]].items() if k in PodDesign.model_fields}
+                pod_design = PodDesign(**{**fields, "id": pod["design"]})
+            pods.append(
+                PodSpec(
+                    index=int(pod["index"]),
+                    name=pod_name(item["name"], dc_index, int(pod["index"])),
+                    spine_template=_template(pod["spine_template"]),
+                    design=pod_design,
+                    deployment_type=pod.get("deployment_type", "tor"),
+                    amount_of_spines=int(pod.get("amount_of_spines", 4)),
+                    leaf_interface_sorting_method=pod.get("leaf_interface_sorting_method", "bottom_up"),
+                    spine_interface_sorting_method=pod.get("spine_interface_sorting_method", "bottom_up"),
+                )
+            )
+
+        pods_by_name = {pod.name: pod for pod in pods}
+        racks = [
+            RackSpec(
+                name=rack.get("shortname") or f"{rack['pod']}-R{rack['row_index']}-{rack['index']}",
+                pod_index=pods_by_name[rack["pod"]].index,
+                row_index=int(rack["row_index"]),
+                index=int(rack["index"]),
+                rack_type=rack.get("rack_type", "tor"),
+                suite_index=suites.get(rack.get("parent"), 1),
+                roles=[
+                    RackRole(role=role, quantity=int(quantity), template=_template(template))
+                    for quantity, role, template in rack.get("fabric_templates") or []
+                ],
+            )
+            for rack in raw_racks
+            if rack.get("pod") in pods_by_name
+        ]
+
+        data_centers.append(
+            DataCenterSpec(
+                name=item["name"],
+                index=dc_index,
+                design=DataCenterDesignData(**{**design_fields, "id": design_name}),
+                super_spine_template=_template(item["super_spine_template"]),
+                templates=templates,
+                amount_of_super_spines=int(item.get("amount_of_super_spines", 2)),
+                naming_convention=str(item.get("naming_convention", "standard")).lower(),  # type: ignore[arg-type]
+                overlay_technology=item.get("overlay_technology", "vxlan_evpn"),
+                fabric_interface_sorting_method=item.get("fabric_interface_sorting_method", "bottom_up"),
+                loopback_prefix_length=int(item.get("loopback_prefix_length", 23)),
+                technical_prefix_length=int(item.get("technical_prefix_length", 19)),
+                management_prefix_length=int(item.get("management_prefix_length", 25)),
+                pods=pods,
+                racks=racks,
+            )
+        )
+    return data_centers
+
+
+# ============================================================================
+# Simulation Result
+# ============================================================================
+
+
+class DevicePlan(NamedTuple):
+    name: str
+    role: str
+    template: str
+    pod: str | None = None
+    rack: str | None = None
+    management_ip: str | None = None
+    loopback_ip: str | None = None
+
+
+class CablePlan(NamedTuple):
+    name: str
+    a_device: str
+    a_interface: str
+    a_address: str | None
+    b_device: str
+    b_interface: str
+    b_address: str | None
+    strategy: str
+    prefix: str | None = None
+
+
+@dataclass
+class SimulationStats:
+    racks: int = 0
+    racks_failed: int = 0
+    devices: int = 0
+    cables: int = 0
+    addresses: int = 0
+    autonomous_systems: int = 0
+    bgp_processes: int = 0
+    bgp_peerings: int = 0
+    ospf_interfaces: int = 0
+    port_conflicts: int = 0
+    segment_deployments: int = 0
+    uncabled_devices: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    phases: dict[str, float] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def racks_per_second(self) -> float:
+        return self.racks / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def devices_per_second(self) -> float:
+        return self.devices / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def cables_per_second(self) -> float:
+        return self.cables / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "racks": self.racks,
+            "racks_failed": self.racks_failed,
+            "devices": self.devices,
+            "cables": self.cables,
+            "addresses": self.addresses,
+            "autonomous_systems": self.autonomous_systems,
+            "bgp_processes": self.bgp_processes,
+            "bgp_peerings": self.bgp_peerings,
+            "ospf_interfaces": self.ospf_interfaces,
+            "port_conflicts": self.port_conflicts,
+            "segment_deployments": self.segment_deployments,
+            "uncabled_devices": len(self.uncabled_devices),
+            "errors": len(self.errors),
+            "elapsed_s": round(self.elapsed, 4),
+            "racks_per_s": round(self.racks_per_second, 1),
+            "devices_per_s": round(self.devices_per_second, 1),
+            "cables_per_s": round(self.cables_per_second, 1),
+            "phases_s": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+        }
+
+
+@dataclass
+class SimulationResult:
+    data_center: str
+    devices: list[DevicePlan]
+    cables: list[CablePlan]
+    asns: dict[str, int]
+    routing: RoutingPlan
+    pools: list[PoolUsage]
+    stats: SimulationStats
+
+    @property
+    def errors(self) -> list[str]:
+        """Planning errors and fabric devices left without cables (e.g. spine ports exhausted)."""
+        return self.stats.errors + [f"{device}: not cabled" for device in self.stats.uncabled_devices]
+
+
+# ============================================================================
+# Simulator
+# ============================================================================
+
+
+@dataclass
+class _PodState:
+    spec: PodSpec
+    spines: list[str]
+    loopback_pool: InMemoryPrefixPool | None
+    technical_pool: InMemoryPrefixPool | None
+    row_leafs: dict[int, list[str]] = field(default_factory=dict)
+
+
+class FabricSimulator:
+    """Plan a whole data center in memory, the way the DC → Pod → Rack generators would.
+
+    Device ids, interface ids and cable ids are the device / interface / cable
+    names, so plans are deterministic and readable. ``rr_redundancy``
+    overrides the design's route-reflector cluster size for the iBGP overlay
+    (0: flat overlay, every client with every RR).
+
+    Example:
+        >>> dc = load_data_centers(DATA_DIR / "demos/01_data_center/dc1")[0]
+        >>> result = FabricSimulator(replicate_rows(dc, rows=100)).run()
+        >>> result.stats.as_dict()["racks_per_s"]
+    """
+
+    def __init__(
+        self,
+        dc: DataCenterSpec,
+        parent_pools: dict[str, InMemoryPrefixPool] | None = None,
+        rr_redundancy: int | None = None,
+    ) -> None:
+        if rr_redundancy is not None:
+            dc = replace(dc, design=dc.design.model_copy(update={"rr_redundancy": rr_redundancy}))
+        self.dc = dc
+        self.parent_pools = parent_pools if parent_pools is not None else default_parent_pools()
+        self.naming = DeviceNamingConfig(strategy=dc.naming_convention)
+        self.stats = SimulationStats()
+
+        self._pools: dict[str, InMemoryPrefixPool | InMemoryNumberPool] = {}
+        self._devices: dict[str, DevicePlan] = {}
+        self._cables: dict[str, CablePlan] = {}
+        self._cabled: dict[tuple[str, str], str] = {}
+        self._loopbacks: dict[str, LoopbackRecord] = {}
+        self._asns: dict[str, int] = {}
+        self._overlay_devices: set[str] = set()
+        self._routing: dict[str, dict[str, dict]] = {
+            "autonomous_systems": {},
+            "bgp_processes": {},
+            "ospf_processes": {},
+            "ospf_interfaces": {},
+            "bgp_peerings": {},
+        }
+        self._asn_pool: InMemoryNumberPool | None = None
+        self._shared_options: dict[str, Any] = {}
+
+    # ================================================================
+    # Main Entry Point
+    # ================================================================
+
+    def run(self) -> SimulationResult:
+        """Simulate the DC, every pod and every rack; never raises for per-rack failures."""
+        start = time.perf_counter()
+
+        super_spines = self._simulate_dc()
+        pods: dict[int, _PodState] = {}
+        for pod in sorted(self.dc.pods, key=lambda p: p.index):
+            try:
+                pods[pod.index] = self._simulate_pod(pod, super_spines)
+            except ValueError as exc:
+                self.stats.errors.append(f"{pod.name}: {exc}")
+
+        rack_order = sorted(
+            self.dc.racks,
+            key=lambda r: (r.pod_index, r.row_index, 0 if r.rack_type == "network" else 1, r.index),
+        )
+        # Racks in earlier rows of the same pod, for tor-deployment offsets
+        previous_racks: dict[tuple[int, int], int] = {}
+        seen: dict[int, int] = {}
+        for (pod_index, row_index), count in sorted(Counter((r.pod_index, r.row_index) for r in rack_order).items()):
+            previous_racks[(pod_index, row_index)] = seen.get(pod_index, 0)
+            seen[pod_index] = seen.get(pod_index, 0) + count
+
+        for rack in rack_order:
+            self.stats.racks += 1
+            pod_state = pods.get(rack.pod_index)
+            try:
+                if pod_state is None:
+                    raise ValueError(f"pod {rack.pod_index} was not planned")
+                self._simulate_rack(pod_state, rack, previous_racks[(rack.pod_index, rack.row_index)])
+            except ValueError as exc:
+                self.stats.racks_failed += 1
+                self.stats.errors.append(f"{rack.name}: {exc}")
+
+        self._simulate_segments()
+
+        self.stats.elapsed = time.perf_counter() - start
+        return self._result(has_super_spines=bool(super_spines))
+
+    # ================================================================
+    # Layers
+    # ================================================================
+
+    def _simulate_dc(self) -> list[str]:
+        dc = self.dc
+        design = dc.design
+        fabric = dc.fabric_name
+
+        if dc.amount_of_super_spines > design.max_super_spines_per_fabric:
+            raise ValueError(
+                f"DC {dc.name} requests {dc.amount_of_super_spines} super-spines but the assigned "
+                f"design allows at most {design.max_super_spines_per_fabric}"
+            )
+
+        with self._phase("pools"):
+            technical = dc.technical_prefix_length + (96 if design.is_ipv6 or design.is_dual_stack else 0)
+            loopback = dc.loopback_prefix_length + (96 if design.is_ipv6 else 0)
+            technical_parent = "Technical-IPv6" if design.is_ipv6 or design.is_dual_stack else "Technical-IPv4"
+            loopback_parent = "Loopback-IPv6" if design.is_ipv6 else "Loopback-IPv4"
+
+            self._prefix_pool(f"{fabric}-technical-pool", self.parent_pools[technical_parent], technical)
+            dc_loopback = self._prefix_pool(f"{fabric}-loopback-pool", self.parent_pools[loopback_parent], loopback)
+            self._prefix_pool(
+                f"{fabric}-management-pool",
+                self.parent_pools["Management-IPv4"],
+                dc.management_prefix_length,
+                address_pool=True,
+            )
+            self._prefix_pool(
+                f"{fabric}-super-spine-loopback-pool",
+                dc_loopback,
+                calculate_super_spine_loopback_prefix(dc.amount_of_super_spines, ipv6=design.is_ipv6),
+                address_pool=True,
+            )
+
+            asn_start, asn_end = name_to_asn_range(
+                dc_name=dc.name,
+                max_pods=design.max_pods,
+                amount_of_super_spines=dc.amount_of_super_spines,
+                max_spines_per_pod=design.max_spines_per_pod,
+            )
+            if design.routing_strategy in (RoutingStrategy.EBGP_EBGP.value, RoutingStrategy.EBGP_IBGP.value):
+                self._asn_pool = self._number_pool(f"{fabric}-asn-pool", asn_start, asn_end)
+            self._number_pool(f"{fabric}-vlan-pool", 100, 3999)
+            if dc.overlay_technology == "vxlan_evpn":
+                self._number_pool(f"{fabric}-vni-pool", 10001, 16777215)
+                self._number_pool(f"{fabric}-l3vni-pool", 50001, 59999)
+
+            # Shared routing objects created once by the DC generator
+            if design.routing_strategy in (RoutingStrategy.EBGP_IBGP.value, RoutingStrategy.OSPF_IBGP.value):
+                self._asns[f"{fabric}-overlay"] = asn_end
+                self._shared_options["overlay_as_id"] = f"AS{asn_end}"
+            if design.routing_strategy == RoutingStrategy.OSPF_IBGP.value:
+                self._shared_options["ospf_area_id"] = f"{fabric}-ospf-area-0"
+
+        super_spines = self._create_devices(
+            role="super-spine",
+            amount=dc.amount_of_super_spines,
+            template=dc.super_spine_template,
+            indexes=[dc.index],
+            loopback_pool=self._pools[f"{fabric}-super-spine-loopback-pool"],  # type: ignore[arg-type]
+        )
+        if super_spines:
+            self._route(
+                super_spines,
+                [],
+                [],
+                skip_underlay=design.routing_strategy == RoutingStrategy.OSPF_IBGP.value,
+            )
+        return super_spines
+
+    def _simulate_segments(self) -> None:
+        """Allocate the VLAN ID, L2 VNI and L3 VNI of every segment deployment, like the segment generators."""
+        fabric = self.dc.fabric_name
+        vlan_pool = self._pools.get(f"{fabric}-vlan-pool")
+        vni_pool = self._pools.get(f"{fabric}-vni-pool")
+        l3vni_pool = self._pools.get(f"{fabric}-l3vni-pool")
+        with self._phase("segments"):
+            for segment in self.dc.segments:
+                try:
+                    if not isinstance(vlan_pool, InMemoryNumberPool):
+                        raise ValueError(f"no vlan pool in {self.dc.name}")
+                    vlan_pool.allocate(f"{segment.name}-{self.dc.name}-vlan")
+                    if segment.kind == "vxlan" and isinstance(vni_pool, InMemoryNumberPool):
+                        vni_pool.allocate(f"{segment.name}-vni")
+                        if segment.namespace and isinstance(l3vni_pool, InMemoryNumberPool):
+                            l3vni_pool.allocate(f"{segment.namespace}-l3vni")
+                except ValueError as exc:
+                    self.stats.errors.append(f"{segment.name}: {exc}")
+                    continue
+                self.stats.segment_deployments += 1
+
+    def _simulate_pod(self, pod: PodSpec, super_spines: list[str]) -> _PodState:
+        dc = self.dc
+        design = pod.design
+        dc_design = dc.design
+        fabric = dc.fabric_name
+        pod_prefix = pod.name.lower()
+
+        if design and pod.amount_of_spines > design.max_spines_per_pod:
+            raise ValueError(
+                f"requests {pod.amount_of_spines} spines but pod design '{design.name}' "
+                f"allows at most {design.max_spines_per_pod}"
+            )
+
+        loopback_pool = technical_pool = None
+        if design:
+            with self._phase("pools"):
+                rows = design.rows
+                if pod.deployment_type == "middle_rack":
+                    max_leafs = rows * design.network_racks_per_row * design.max_leafs_per_network_rack
+                    max_tors = rows * design.network_racks_per_row * design.max_tors_per_network_rack
+                elif pod.deployment_type == "tor":
+                    max_leafs = 0
+                    max_tors = rows * design.compute_racks_per_row * design.max_tors_per_compute_rack
+                else:
+                    max_leafs = rows * design.network_racks_per_row * design.max_leafs_per_network_rack
+                    max_tors = rows * design.compute_racks_per_row * design.max_tors_per_compute_rack
+
+                sizes = calculate_pod_pools(
+                    max_super_spines_per_fabric=dc.amount_of_super_spines,
+                    max_spines_per_pod=pod.amount_of_spines,
+                    max_leafs=max_leafs,
+                    max_tors=max_tors,
+                    deployment_type=pod.deployment_type,
+                    p2p_addressing=dc_design.p2p_addressing,
+                    ipv6=dc_design.is_ipv6,
+                    dual_stack=dc_design.is_dual_stack,
+                    compute_racks=rows * design.compute_racks_per_row,
+                    network_racks=rows * design.network_racks_per_row,
+                )
+                sizes.update(pod.prefix_lengths)
+                technical_pool = self._prefix_pool(
+                    f"{pod_prefix}-technical-pool",
+                    self._pools[f"{fabric}-technical-pool"],  # type: ignore[arg-type]
+                    sizes["technical"],
+                )
+                loopback_pool = self._prefix_pool(
+                    f"{pod_prefix}-loopback-pool",
+                    self._pools[f"{fabric}-loopback-pool"],  # type: ignore[arg-type]
+                    sizes["loopback"],
+                    address_pool=True,
+                )
+
+        state = _PodState(spec=pod, spines=[], loopback_pool=loopback_pool, technical_pool=technical_pool)
+        if loopback_pool is None:
+            raise ValueError("pod pools not planned (pod has no design)")
+
+        state.spines = self._create_devices(
+            role="spine",
+            amount=pod.amount_of_spines,
+            template=pod.spine_template,
+            indexes=[dc.index, pod.index],
+            pod=pod.name,
+            loopback_pool=loopback_pool,
+        )
+
+        endpoints: list[InterfaceRecord] = []
+        super_spine_downlinks = self._template(dc.super_spine_template).interface_names("downlink")
+        if super_spines and super_spine_downlinks:
+            endpoints = self._cable(
+                bottom_devices=state.spines,
+                bottom_interfaces=self._template(pod.spine_template).interface_names("uplink"),
+                top_devices=super_spines,
+                top_interfaces=super_spine_downlinks,
+                strategy="pod",
+                offset=(pod.index - 1) * dc_design.max_spines_per_pod,
+                pool=technical_pool,
+                bottom_sorting=pod.spine_interface_sorting_method,
+                top_sorting=dc.fabric_interface_sorting_method,
+            )
+        self._route(state.spines, super_spines, endpoints)
+        return state
+
+    def _simulate_rack(self, state: _PodState, rack: RackSpec, previous_racks: int) -> None:
+        dc = self.dc
+        pod = state.spec
+        deployment_type = pod.deployment_type
+        indexes = [dc.index, pod.index, rack.suite_index, rack.row_index, rack.index]
+        design = pod.design
+        max_tors_per_row = design.compute_racks_per_row * design.max_tors_per_compute_rack if design else 8
+
+        spine_downlinks = sorted(self._template(pod.spine_template).interface_names("downlink"))
+        created: set[str] = set()
+        leafs: list[str] = []
+        leaf_downlinks: list[str] = []
+
+        for role in rack.leafs:
+            if self._already_created("leaf", role.quantity, indexes, created):
+                continue
+            template = self._template(role.template)
+            devices = self._create_devices(
+                role="leaf",
+                amount=role.quantity,
+                template=role.template,
+                indexes=indexes,
+                pod=pod.name,
+                rack=rack.name,
+                loopback_pool=state.loopback_pool,
+            )
+            created.update(devices)
+            leafs.extend(devices)
+            leaf_downlinks.extend(template.interface_names("downlink"))
+
+            self._cable_and_route(
+                bottom_devices=devices,
+                bottom_interfaces=template.interface_names("uplink"),
+                top_devices=state.spines,
+                top_interfaces=spine_downlinks,
+                strategy="rack",
+                offset=calculate_cabling_offset(
+                    deployment_type, "leaf", role.quantity, rack.index, rack.row_index, max_tors_per_row
+                ),
+                pool=state.technical_pool,
+                bottom_sorting=pod.leaf_interface_sorting_method,
+                top_sorting=pod.spine_interface_sorting_method,
+            )
+
+        if leafs:
+            state.row_leafs.setdefault(rack.row_index, []).extend(leafs)
+
+        for role in rack.tors:
+            if self._already_created("tor", role.quantity, indexes, created):
+                continue
+            devices = self._create_devices(
+                role="tor",
+                amount=role.quantity,
+                template=role.template,
+                indexes=indexes,
+                pod=pod.name,
+                rack=rack.name,
+                loopback_pool=state.loopback_pool,
+            )
+            created.update(devices)
+            uplinks = self._template(role.template).interface_names("uplink")
+
+            if deployment_type == "middle_rack":
+                if not leafs:
+                    raise ValueError("cannot cable ToRs - no leaf devices in rack")
+                self._cable_and_route(
+                    bottom_devices=devices,
+                    bottom_interfaces=uplinks,
+                    top_devices=leafs,
+                    top_interfaces=sorted(set(leaf_downlinks)),
+                    strategy="intra_rack_middle",
+                    offset=0,
+                    pool=state.technical_pool,
+                )
+            elif deployment_type == "tor":
+                tors_per_rack = sum(r.quantity for r in rack.tors)
+                self._cable_and_route(
+                    bottom_devices=devices,
+                    bottom_interfaces=uplinks,
+                    top_devices=state.spines,
+                    top_interfaces=spine_downlinks,
+                    strategy="rack",
+                    offset=calculate_cabling_offset(
+                        deployment_type,
+                        "tor",
+                        tors_per_rack,
+                        rack.index,
+                        rack.row_index,
+                        max_tors_per_row,
+                        racks_in_previous_rows=previous_racks,
+                    ),
+                    pool=state.technical_pool,
+                    bottom_sorting=pod.leaf_interface_sorting_method,
+                    top_sorting=pod.spine_interface_sorting_method,
+                )
+            elif deployment_type == "mixed":
+                if leafs:
+                    self._cable_and_route(
+                        bottom_devices=devices,
+                        bottom_interfaces=uplinks,
+                        top_devices=leafs,
+                        top_interfaces=leaf_downlinks,
+                        strategy="rack",
+                        offset=0,
+                        pool=state.technical_pool,
+                        bottom_sorting=pod.leaf_interface_sorting_method,
+                        top_sorting=pod.leaf_interface_sorting_method,
+                    )
+                else:
+                    row_leafs = state.row_leafs.get(rack.row_index, [])
+                    if not row_leafs:
+                        raise ValueError(f"cannot cable ToRs - no leaf devices found in row {rack.row_index}")
+                    self._cable_and_route(
+                        bottom_devices=devices,
+                        bottom_interfaces=uplinks,
+                        top_devices=row_leafs,
+                        top_interfaces=sorted(
+                            {
+                                name
+                                for leaf in row_leafs
+                                for name in self._template(self._devices[leaf].template).interface_names("downlink")
+                            }
+                        ),
+                        strategy="intra_rack_mixed",
+                        offset=calculate_cabling_offset(
+                            deployment_type, "tor", len(devices), rack.index, rack.row_index, max_tors_per_row
+                        ),
+                        pool=state.technical_pool,
+                    )
+            else:
+                raise ValueError(f"unknown deployment_type '{deployment_type}'")
+
+    # ================================================================
+    # Building Blocks
+    # ================================================================
+
+    def _create_devices(
+        self,
+        role: str,
+        amount: int,
+        template: str,
+        indexes: list[int],
+        loopback_pool: InMemoryPrefixPool | None,
+        pod: str | None = None,
+        rack: str | None = None,
+    ) -> list[str]:
+        """Name devices like ``CommonGenerator.create_devices`` and allocate management + loopback IPs."""
+        self._template(template)
+        names = sorted(self._device_name(role, idx, indexes) for idx in range(1, amount + 1))
+        management = self._pools[f"{self.dc.fabric_name}-management-pool"]
+
+        with self._phase("devices"):
+            for name in names:
+                if name in self._devices:
+                    continue
+                management_ip = management.allocate_address(name)  # type: ignore[union-attr]
+                loopback_ip = loopback_pool.allocate_address(name) if loopback_pool else None
+                self.stats.addresses += 2 if loopback_ip else 1
+                self._devices[name] = DevicePlan(name, role, template, pod, rack, management_ip, loopback_ip)
+                if loopback_ip and loopback_pool:
+                    self._loopbacks[name] = LoopbackRecord(
+                        id=f"{name}-Loopback0",
+                        device_id=name,
+                        device_name=name,
+                        device_role=role,
+                        ip_id=loopback_ip,
+                        ip_label=f"{loopback_ip}/{loopback_pool.network.max_prefixlen}",
+                    )
+        return names
+
+    def _cable(
+        self,
+        bottom_devices: list[str],
+        bottom_interfaces: list[str],
+        top_devices: list[str],
+        top_interfaces: list[str],
+        strategy: str,
+        offset: int,
+        pool: InMemoryPrefixPool | None,
+        bottom_sorting: SortingMethod = "bottom_up",
+        top_sorting: SortingMethod = "bottom_up",
+    ) -> list[InterfaceRecord]:
+        """Plan cables with CablingPlanner and allocate P2P prefixes; returns the cabled endpoints."""
+        p2p_length = 127 if self.dc.design.p2p_ipv6 else 31
+        endpoints: list[InterfaceRecord] = []
+
+        with self._phase("cabling"):
+            src_interfaces = self._interface_records(bottom_devices, bottom_interfaces)
+            dst_interfaces = self._interface_records(top_devices, top_interfaces)
+            if not src_interfaces or not dst_interfaces:
+                self.stats.errors.append(
+                    f"{strategy} cabling {bottom_devices} -> {top_devices}: no interfaces found "
+                    f"(src={len(src_interfaces)}, dst={len(dst_interfaces)})"
+                )
+                return endpoints
+
+            planner = CablingPlanner(
+                bottom_interfaces=src_interfaces,
+                top_interfaces=dst_interfaces,
+                bottom_sorting=bottom_sorting,
+                top_sorting=top_sorting,
+            )
+            plan = planner.build_cabling_plan(scenario=strategy, cabling_offset=offset)
+
+            for src, dst in plan:
+                cable_name = "__".join(sorted([f"{src.device}-{src.name}", f"{dst.device}-{dst.name}"]))
+                for intf in (src, dst):
+                    existing = self._cabled.get((intf.device, intf.name))
+                    if existing and existing != cable_name:
+                        self.stats.port_conflicts += 1
+                    self._cabled[(intf.device, intf.name)] = cable_name
+
+                src_ip = dst_ip = prefix = None
+                if pool is not None:
+                    network = pool.allocate_prefix("__".join(sorted([src.id or "", dst.id or ""])), p2p_length)
+                    src_ip, dst_ip = (f"{addr}/{p2p_length}" for addr in list(network)[:2])
+                    prefix = str(network)
+                    if cable_name not in self._cables:
+                        self.stats.addresses += 2
+
+                self._cables[cable_name] = CablePlan(
+                    cable_name, src.device, src.name, src_ip, dst.device, dst.name, dst_ip, strategy, prefix
+                )
+                endpoints.extend((intf._replace(cable_id=cable_name, cable_name=cable_name) for intf in (src, dst)))
+        return endpoints
+
+    def _route(
+        self,
+        bottom_devices: list[str],
+        top_devices: list[str],
+        endpoints: list[InterfaceRecord],
+        skip_underlay: bool = False,
+    ) -> None:
+        """Plan routing with RoutingPlanner; resolve new ASNs from the in-memory ASN pool."""
+        design = self.dc.design
+        strategy = design.routing_strategy
+        if strategy not in {s.value for s in RoutingStrategy}:
+            return
+
+        with self._phase("routing"):
+            devices = bottom_devices + top_devices
+            options: dict[str, Any] = {"design": design, **self._shared_options}
+            if self._asn_pool is not None:
+                options["asn_pool"] = self._asn_pool.name
+            if skip_underlay:
+                options["skip_underlay"] = True
+            if design.rr_redundancy:
+                options["rr_redundancy"] = design.rr_redundancy
+
+            plan = RoutingPlanner(deployment_id=self.dc.name).build_routing_plan(
+                RoutingPlanInput(
+                    bottom_devices=bottom_devices,
+                    top_devices=top_devices,
+                    underlay=[ProcessRecord(name, f"AS{self._asns[name]}") for name in devices if name in self._asns],
+                    overlay=[ProcessRecord(name) for name in top_devices if name in self._overlay_devices],
+                    interfaces=endpoints,
+                    loopback_interfaces=[self._loopbacks[name] for name in devices if name in self._loopbacks],
+                    options=options,
+                    routing_strategy=strategy,
+                    deployment_name=self.dc.fabric_name,
+                )
+            )
+
+            for as_dict in plan.autonomous_systems:
+                device = as_dict["_for_device"]
+                if "asn" in as_dict and self._asn_pool is not None:
+                    self._asns[device] = self._asn_pool.allocate(device)
+                    self._routing["autonomous_systems"][device] = {**as_dict, "asn": self._asns[device]}
+
+            for key in ("bgp_processes", "ospf_processes", "ospf_interfaces", "bgp_peerings"):
+                merged = self._routing[key]
+                for item in getattr(plan, key):
+                    merged[item["name"]] = item
+            for proc in plan.bgp_processes + plan.ospf_processes:
+                if proc["name"].endswith(("-bgp-overlay", "-ospf-underlay")):
+                    self._overlay_devices.add(proc["device_capabilities"][0]["id"])
+
+    def _cable_and_route(self, *, bottom_devices: list[str], top_devices: list[str], **cabling: Any) -> None:
+        endpoints = self._cable(bottom_devices=bottom_devices, top_devices=top_devices, **cabling)
+        self._route(bottom_devices, top_devices, endpoints)
+
+    # ================================================================
+    # Helpers
+    # ================================================================
+
+    @contextmanager
+    def _phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stats.phases[name] = self.stats.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def _template(self, name: str) -> DeviceTemplate:
+        template = self.dc.templates.get(name)
+        if template is None:
+            raise ValueError(f"unknown device template '{name}'")
+        return template
+
+    def _device_name(self, role: str, index: int, indexes: list[int]) -> str:
+        fabric = self.dc.fabric_name
+        return self.naming.format_device_name(fabric, role, index=index, fabric_name=fabric, indexes=indexes)
+
+    def _already_created(self, role: str, amount: int, indexes: list[int], created: set[str]) -> bool:
+        """Mirror RackGenerator's duplicate-template guard."""
+        return {self._device_name(role, idx, indexes) for idx in range(1, amount + 1)} <= created
+
+    def _interface_records(self, devices: list[str], names: list[str]) -> list[InterfaceRecord]:
+        wanted = set(names)
+        records: list[InterfaceRecord] = []
+        for device in devices:
+            for intf in self._template(self._devices[device].template).interfaces:
+                if intf.name not in wanted:
+                    continue
+                cable = self._cabled.get((device, intf.name))
+                records.append(
+                    InterfaceRecord(
+                        id=f"{device}-{intf.name}",
+                        name=intf.name,
+                        device=device,
+                        device_id=device,
+                        interface_type=intf.interface_type,
+                        cable_id=cable,
+                        cable_name=cable,
+                    )
+                )
+        return records
+
+    def _prefix_pool(
+        self, name: str, parent: InMemoryPrefixPool, prefix_length: int, address_pool: bool = False
+    ) -> InMemoryPrefixPool:
+        pool = InMemoryPrefixPool(name, parent.allocate_prefix(name, prefix_length), address_pool=address_pool)
+        self._pools[name] = pool
+        return pool
+
+    def _number_pool(self, name: str, start: int, end: int) -> InMemoryNumberPool:
+        pool = InMemoryNumberPool(name, start, end)
+        self._pools[name] = pool
+        return pool
+
+    def _result(self, has_super_spines: bool) -> SimulationResult:
+        stats = self.stats
+        routing = RoutingPlan(**{key: list(items.values()) for key, items in self._routing.items()})
+
+        cabled_devices = {device for device, _ in self._cabled}
+        fabric_roles = {"leaf", "tor"} | ({"spine"} if has_super_spines else set())
+        stats.uncabled_devices = sorted(
+            d.name for d in self._devices.values() if d.role in fabric_roles and d.name not in cabled_devices
+        )
+        stats.devices = len(self._devices)
+        stats.cables = len(self._cables)
+        stats.autonomous_systems = len(routing.autonomous_systems)
+        stats.bgp_processes = len(routing.bgp_processes)
+        stats.bgp_peerings = len(routing.bgp_peerings)
+        stats.ospf_interfaces = len(routing.ospf_interfaces)
+
+        return SimulationResult(
+            data_center=self.dc.name,
+            devices=list(self._devices.values()),
+            cables=list(self._cables.values()),
+            asns=dict(self._asns),
+            routing=routing,
+            pools=[pool.usage() for pool in self._pools.values()],
+            stats=stats,
+        )
@@ -52,3 +52,6 @@ class RoutingOptions(TypedDict, total=False):
     """Pre-resolved OSPF area ID to skip DB lookup in create_routing."""
     skip_underlay: bool
     """Skip underlay planning entirely (overlay BGP only). Used for super-spines in ospf-ibgp."""
+    rr_redundancy: int
+    """iBGP overlay: route reflectors per RR cluster (0 = every client peers with every RR).
+    The DC, pod and rack generators take it from the DC design's ``rr_redundancy``."""
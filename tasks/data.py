@@ -1,9 +1,19 @@
-"""Data tasks — schema, menu, and object loading."""
+"""Data tasks — schema, menu, and object loading; cable matrix export."""
 
+import asyncio
+import logging
+import sys
+from pathlib import Path
 from typing import cast
 
 from invoke import Collection, Context, Task, task
 
+log = logging.getLogger("data")
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+OBJECT_LOAD_CONCURRENCY = 10  # objects upserted concurrently by load-objects
+
 
 @task(optional=["schema", "branch"])
 def load_schema(context: Context, schema: str = "./schemas/", branch: str = "main") -> None:
@@ -27,15 +37,38 @@ def load_menu(context: Context, menu: str = "menu", branch: str = "main") -> Non
     context.run(f"uv run infrahubctl menu load {menu} --branch {branch}", pty=True)
 
 
-@task(optional=["branch"])
-def load_objects(context: Context, path: str = "data/bootstrap/", branch: str = "main") -> None:
-    """Load object YAML files from a path.
+@task(optional=["branch", "concurrency"])
+def load_objects(
+    context: Context,
+    path: str = "data/bootstrap/",
+    branch: str = "main",
+    concurrency: int = OBJECT_LOAD_CONCURRENCY,
+) -> None:
+    """Load object YAML files from one or more paths, in-process.
+
+    All files are read up front, ordered by the relationships between their
+    kinds and upserted on one client with up to --concurrency objects in
+    flight. Reports throughput in objects per second.
 
     Example:
         uv run invoke data.load-objects
         uv run invoke data.load-objects --path data/demos/100_full/01_dc/dc1
+        uv run invoke data.load-objects --path "data/bootstrap data/demos/01_data_center/dc1"
     """
-    context.run(f"uv run infrahubctl object load {path} --branch {branch}", pty=True)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s  %(levelname)-8s  %(message)s")
+    if str(_PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(_PROJECT_ROOT))
+    from infrahub_sdk import Config, InfrahubClient
+
+    from utils.object_loader import load_object_files
+
+    client = InfrahubClient(config=Config(default_branch=branch, max_concurrent_execution=concurrency))
+    try:
+        report = asyncio.run(load_object_files(client, path.split(), branch=branch, logger=log))
+    except (ValueError, RuntimeError) as exc:
+        log.error("✗ %s", exc)
+        raise SystemExit(1) from exc
+    log.info("✓ %s", report.summary())
 
 
 @task(optional=["branch"])
@@ -48,8 +81,70 @@ def load_data(context: Context, name: str = "bootstrap.py", branch: str = "main"
     context.run(f"uv run infrahubctl run bootstrap/{name} --branch {branch}", pty=True)
 
 
+@task(optional=["output", "output_format", "partition", "branch"])
+def export_cabling(
+    context: Context,
+    deployment: str,
+    output: str = "",
+    output_format: str = "csv",
+    partition: str = "",
+    branch: str = "main",
+) -> None:
+    """Export the cable matrix of a physical deployment (DC or POP).
+
+    Rows are written as they are produced from the query response. With
+    --partition, one file per pod (or source rack) is written to the --output
+    directory.
+
+    Options:
+        --output         File (or directory with --partition); stdout when omitted
+        --output-format  csv (default) or jsonl
+        --partition      pod or rack
+
+    Example:
+        uv run invoke data.export-cabling --deployment DC-1
+        uv run invoke data.export-cabling --deployment DC-1 --output-format jsonl --output dc1.jsonl
+        uv run invoke data.export-cabling --deployment DC-1 --partition pod --output cabling/dc1
+    """
+    if str(_PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(_PROJECT_ROOT))
+    from infrahub_sdk import Config, InfrahubClient
+    from infrahub_sdk.node import InfrahubNode
+
+    from transforms.common import clean_data
+    from transforms.topology_cabling import TopologyCabling, iter_export, write_partitioned
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s  %(levelname)-8s  %(message)s")
+    if partition and not output:
+        raise SystemExit("--partition requires --output <directory>")
+
+    async def _fetch() -> tuple[TopologyCabling, dict]:
+        client = InfrahubClient(config=Config(default_branch=branch))
+        node = await client.get(kind="TopologyPhysicalDeployment", name__value=deployment, branch=branch)
+        query = (_PROJECT_ROOT / "queries" / "topology" / "cabling.gql").read_text(encoding="utf-8")
+        data = await client.execute_graphql(query=query, variables={"id": node.id}, branch_name=branch)
+        transform = TopologyCabling(client=client, infrahub_node=InfrahubNode, branch=branch)
+        return transform, clean_data(data)
+
+    transform, cleaned = asyncio.run(_fetch())
+    cables = transform.iter_cables(cleaned)
+    try:
+        if partition:
+            paths = write_partitioned(cables, output, output_format=output_format, partition_by=partition)
+            for name, path in paths.items():
+                log.info("✓ %s → %s", name, path)
+        elif output:
+            with Path(output).open("w", encoding="utf-8", newline="") as handle:
+                handle.writelines(iter_export(cables, output_format))
+        else:
+            sys.stdout.writelines(iter_export(cables, output_format))
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+
 ns = Collection("data")
 ns.add_task(cast(Task, load_schema), name="load-schema")
 ns.add_task(cast(Task, load_menu), name="load-menu")
 ns.add_task(cast(Task, load_objects), name="load-objects")
 ns.add_task(cast(Task, load_data), name="load-data")
+ns.add_task(cast(Task, export_cabling), name="export-cabling")
@@ -13,17 +13,21 @@ Demo sequence
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import datetime
+import functools
 import logging
 import os
-import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from invoke import Collection, Context, Task, task
 
+if TYPE_CHECKING:
+    from utils.phase_runner import PhaseRunner
+
 # ---------------------------------------------------------------------------
 # Logging / config
 # ---------------------------------------------------------------------------
@@ -37,7 +41,14 @@ _DEMOS_ROOT = "data/demos"
 INFRAHUB_ADDRESS = os.getenv("INFRAHUB_ADDRESS", "http://localhost:8000")
 INFRAHUB_API_TOKEN = os.getenv("INFRAHUB_API_TOKEN", "06438eb2-8019-4776-878c-0941b1f1d1ec")
 
-TASK_POLL_INTERVAL = 5  # seconds between task state polls
+TASK_POLL_INTERVAL = 5  # seconds between task state polls (upper bound of the backoff)
+TASK_MIN_POLL_INTERVAL = 1  # seconds between polls right after a task starts or finishes
+TASK_SETTLE_WINDOW = 6  # seconds without active tasks before a branch counts as quiet
+# Data centers deployed concurrently in phase 01. Only 1 is accepted for now:
+# add_dc allocates each DC's pools from the shared main pools on the DC's own
+# branch, so DCs deployed in parallel can be handed the same prefixes.
+DEFAULT_PARALLEL_DCS = 1
+MAX_PARALLEL_DCS = 1
 TASK_TIMEOUT = 1800  # 30 min total wait per phase
 
 
@@ -46,42 +57,20 @@ TASK_TIMEOUT = 1800  # 30 min total wait per phase
 # ---------------------------------------------------------------------------
 
 
-def _infrahubctl(command: str, branch: str | None = None) -> subprocess.CompletedProcess[str]:
-    """Run an infrahubctl command, optionally appending --branch."""
-    full_cmd = command
-    if branch:
-        full_cmd += f" --branch {branch}"
-    env = os.environ.copy()
-    env["INFRAHUB_ADDRESS"] = INFRAHUB_ADDRESS
-    env["INFRAHUB_API_TOKEN"] = INFRAHUB_API_TOKEN
-    log.debug("Running: %s", full_cmd)
-    return subprocess.run(
-        full_cmd,
-        shell=True,
-        capture_output=True,
-        text=True,
-        env=env,
-        check=False,
-        cwd=_PROJECT_ROOT,
-    )
+async def _load_objects(client: object, paths: str | list[str], branch: str, dry_run: bool = False) -> None:
+    """Load YAML object files in-process, in relationship dependency order."""
+    from infrahub_sdk import InfrahubClient
 
+    from utils.object_loader import load_object_files
 
-def _load_objects(path: str, branch: str, dry_run: bool = False) -> None:
-    """Load YAML object files via infrahubctl."""
-    log.info("Loading %s …", path)
+    assert isinstance(client, InfrahubClient)
+    paths = [paths] if isinstance(paths, str) else paths
+    log.info("Loading %s …", ", ".join(paths))
     if dry_run:
         log.info("  [dry-run] skipped")
         return
-    result = _infrahubctl(f"uv run infrahubctl object load {path}", branch=branch)
-    if result.returncode != 0:
-        log.error(
-            "Failed to load %s\n  stdout: %s\n  stderr: %s",
-            path,
-            result.stdout,
-            result.stderr,
-        )
-        raise SystemExit(1)
-    log.info("  ✓ loaded")
+    report = await load_object_files(client, [_PROJECT_ROOT / path for path in paths], branch=branch, logger=log)
+    log.info("  ✓ loaded %d object(s) (%.1f objects/s)", report.objects, report.objects_per_second)
 
 
 async def _ensure_branch(client: object, branch: str, dry_run: bool) -> None:
@@ -103,37 +92,29 @@ async def _ensure_branch(client: object, branch: str, dry_run: bool) -> None:
     log.info("  ✓ branch '%s' created", branch)
 
 
-async def _wait_for_tasks(client: object, branch: str, initial_delay: int = 3) -> None:
-    """Poll until no PENDING/RUNNING/SCHEDULED tasks remain on the branch.
-
-    Requires 5 consecutive empty polls (25 s of silence) to declare completion —
-    guards against tasks that trigger with a delay after a PC creation or merge.
+async def _wait_for_tasks(client: object, branch: str) -> None:
+    """Wait until the branch is quiet (no active tasks for TASK_SETTLE_WINDOW seconds).
 
-    initial_delay: seconds to sleep before the first poll (default 3 s).
+    Polling backs off while tasks run and restarts at TASK_MIN_POLL_INTERVAL
+    whenever a task starts or finishes, so tasks that trigger with a delay after
+    a PC creation, merge or generator run are still caught. Failures are logged;
+    _check_failed_tasks decides whether they abort the demo.
     """
     from infrahub_sdk import InfrahubClient
-    from infrahub_sdk.task.models import TaskFilter, TaskState
-
-    assert isinstance(client, InfrahubClient)
-    deadline = time.monotonic() + TASK_TIMEOUT
-    in_flight_states = [TaskState.PENDING, TaskState.RUNNING, TaskState.SCHEDULED]
-    consecutive_zero = 0
 
-    await asyncio.sleep(initial_delay)
-
-    while time.monotonic() < deadline:
-        in_flight = await client.task.filter(filter=TaskFilter(state=in_flight_states, branch=branch))
-        if not in_flight:
-            consecutive_zero += 1
-            if consecutive_zero >= 5:
-                log.info("  All tasks completed on branch '%s'", branch)
-                return
-        else:
-            consecutive_zero = 0
-            log.info("  ⏳ %d task(s) still running on %s …", len(in_flight), branch)
-        await asyncio.sleep(TASK_POLL_INTERVAL)
+    from utils.task_manager import TaskWaitPolicy, wait_for_branch_tasks
 
-    raise TimeoutError(f"Tasks on branch '{branch}' did not complete within {TASK_TIMEOUT}s")
+    assert isinstance(client, InfrahubClient)
+    await wait_for_branch_tasks(
+        client,
+        branch=branch,
+        timeout=TASK_TIMEOUT,
+        policy=TaskWaitPolicy(
+            min_interval=TASK_MIN_POLL_INTERVAL, max_interval=TASK_POLL_INTERVAL, settle=TASK_SETTLE_WINDOW
+        ),
+        logger=log,
+        raise_on_failure=False,
+    )
 
 
 async def _check_failed_tasks(
@@ -313,8 +294,13 @@ async def _create_pc_and_merge(
     source_branch: str,
     dry_run: bool,
     skip_merge: bool,
+    merge_lock: asyncio.Lock | None = None,
 ) -> None:
-    """Create a proposed change and merge it to main."""
+    """Create a proposed change and merge it to main.
+
+    merge_lock: held while merging, so that merges into main (and the tasks
+                they trigger on main) run one at a time across concurrent callers.
+    """
     from infrahub_sdk import InfrahubClient
 
     assert isinstance(client, InfrahubClient)
@@ -380,6 +366,16 @@ async def _create_pc_and_merge(
     # Validation can trigger additional tasks; merge will fail if the branch is busy.
     await _wait_for_tasks(client, source_branch)
 
+    async with merge_lock or contextlib.nullcontext():
+        await _merge_pc(client, pc_id, pc_name)
+
+
+async def _merge_pc(client: object, pc_id: str, pc_name: str) -> None:
+    """Merge a validated proposed change and wait for the tasks it triggers on main."""
+    from infrahub_sdk import InfrahubClient
+
+    assert isinstance(client, InfrahubClient)
+
     log.info("Merging PC '%s' …", pc_name)
     merge_response = await client.execute_graphql(
         query="""
@@ -417,11 +413,13 @@ async def _phase_single_dc(
     dry_run: bool,
     skip_generators: bool,
     skip_merge: bool,
+    merge_lock: asyncio.Lock | None = None,
 ) -> None:
     """Load one DC, run add_dc generator, create PC and merge.
 
-    Designed to be called concurrently via asyncio.gather().
-    Each DC gets its own branch: demo-dc1, demo-dc2, …
+    Designed to be called concurrently (see _phase_01_data_centers).
+    Each DC gets its own branch: demo-dc1, demo-dc2, …; merges into main
+    are serialized through merge_lock.
     """
     from infrahub_sdk import InfrahubClient
 
@@ -442,7 +440,7 @@ async def _phase_single_dc(
 
     dc_client.default_branch = "main"
     await _ensure_branch(dc_client, branch, dry_run)
-    _load_objects(f"{_DEMOS_ROOT}/01_data_center/{dc_folder}", branch, dry_run)
+    await _load_objects(dc_client, f"{_DEMOS_ROOT}/01_data_center/{dc_folder}", branch, dry_run)
 
     # Wait for any event-triggered generators that fired during object load
     # (e.g. add_dc, add_pod, add_rack from topology/rack creation).
@@ -458,7 +456,7 @@ async def _phase_single_dc(
             raise RuntimeError(f"{dc_name} not found after data load on branch '{branch}'")
         await _run_generator(dc_client, "add_dc", [dc.id], branch, dry_run)
 
-    await _create_pc_and_merge(dc_client, f"demo-{dc_folder}", branch, dry_run, skip_merge)
+    await _create_pc_and_merge(dc_client, f"demo-{dc_folder}", branch, dry_run, skip_merge, merge_lock)
     log.info("  ✓ %s complete", dc_name)
 
 
@@ -468,14 +466,30 @@ async def _phase_01_data_centers(
     skip_generators: bool,
     skip_merge: bool,
     only_dcs: list[str] | None = None,
+    runner: PhaseRunner | None = None,
+    max_parallel: int = DEFAULT_PARALLEL_DCS,
 ) -> None:
-    """Phase 01 – all data centers sequentially, one branch per DC.
+    """Phase 01 – all data centers, one branch per DC, up to max_parallel at a time.
+
+    The DCs are deployed one by one and the first failing DC stops the phase.
+    max_parallel above MAX_PARALLEL_DCS is refused: the DC pools are allocated
+    on each DC's branch, so concurrent DCs could be handed overlapping prefixes.
 
     only_dcs: optional list of folder names to run (e.g. ["dc5", "dc6"]).
               When None all discovered DC folders are run.
+    runner: PhaseRunner recording per-DC timings (a new one when None).
     """
+    from utils.phase_runner import PhaseRunner
+
+    if max_parallel > MAX_PARALLEL_DCS:
+        raise ValueError(
+            f"max_parallel={max_parallel} is not supported: DC pools are allocated per branch, "
+            f"so parallel DCs can receive overlapping prefixes (maximum {MAX_PARALLEL_DCS})"
+        )
+    runner = runner or PhaseRunner(log)
+
     log.info("══════════════════════════════════════════════")
-    log.info("  PHASE 01: Data Centers (sequential)")
+    log.info("  PHASE 01: Data Centers (%d in parallel)", max_parallel)
     log.info("══════════════════════════════════════════════")
 
     # Discover DC folders automatically from the data directory
@@ -493,16 +507,29 @@ async def _phase_01_data_centers(
 
     log.info("  Found %d DC(s): %s", len(dc_folders), ", ".join(dc_folders))
 
+    merge_lock = asyncio.Lock()
+
     # Derive DC name from folder name: dc1 → DC1, dc2 → DC2, …
-    for folder in dc_folders:
-        await _phase_single_dc(
-            client,
-            dc_folder=folder,
-            dc_name=folder.upper(),
-            dry_run=dry_run,
-            skip_generators=skip_generators,
-            skip_merge=skip_merge,
-        )
+    await runner.gather(
+        "01 Data Centers",
+        [
+            (
+                folder,
+                functools.partial(
+                    _phase_single_dc,
+                    client,
+                    dc_folder=folder,
+                    dc_name=folder.upper(),
+                    dry_run=dry_run,
+                    skip_generators=skip_generators,
+                    skip_merge=skip_merge,
+                    merge_lock=merge_lock,
+                ),
+            )
+            for folder in dc_folders
+        ],
+        max_parallel=max_parallel,
+    )
 
     log.info("  ✓ Phase 01 — all data centers complete")
 
@@ -528,7 +555,7 @@ async def _phase_02_switch(
     c.default_branch = "main"
 
     await _ensure_branch(c, branch, dry_run)
-    _load_objects(f"{_DEMOS_ROOT}/02_switch", branch, dry_run)
+    await _load_objects(c, f"{_DEMOS_ROOT}/02_switch", branch, dry_run)
 
     if not dry_run:
         log.info("  Waiting for event-triggered rack generator(s) …")
@@ -560,7 +587,7 @@ async def _phase_03_rack(
     c.default_branch = "main"
 
     await _ensure_branch(c, branch, dry_run)
-    _load_objects(f"{_DEMOS_ROOT}/03_rack", branch, dry_run)
+    await _load_objects(c, f"{_DEMOS_ROOT}/03_rack", branch, dry_run)
 
     if not dry_run:
         c.default_branch = branch
@@ -600,8 +627,12 @@ async def _phase_04_pod(
 
     await _ensure_branch(c, branch, dry_run)
 
-    for fname in ("00_suite.yml", "01_pod.yml", "02_racks.yml"):
-        _load_objects(f"{_DEMOS_ROOT}/04_pod/{fname}", branch, dry_run)
+    await _load_objects(
+        c,
+        [f"{_DEMOS_ROOT}/04_pod/{fname}" for fname in ("00_suite.yml", "01_pod.yml", "02_racks.yml")],
+        branch,
+        dry_run,
+    )
 
     if not dry_run:
         c.default_branch = branch
@@ -648,7 +679,7 @@ async def _phase_05_llm(
     c.default_branch = "main"
 
     await _ensure_branch(c, branch, dry_run)
-    _load_objects(f"{_DEMOS_ROOT}/05_llm_time", branch, dry_run)
+    await _load_objects(c, f"{_DEMOS_ROOT}/05_llm_time", branch, dry_run)
 
     if not dry_run:
         log.info("  Waiting for event-triggered generator(s) …")
@@ -677,19 +708,18 @@ async def _phase_06_servers(
 
     # Device types are global — load on main (idempotent)
     servers_base = f"{_DEMOS_ROOT}/06_servers"
-    _load_objects(f"{servers_base}/device_types", "main", dry_run)
-    _load_objects(f"{servers_base}/templates", "main", dry_run)
+    await _load_objects(c, [f"{servers_base}/device_types", f"{servers_base}/templates"], "main", dry_run)
 
     c.default_branch = "main"
     await _ensure_branch(c, branch, dry_run)
 
-    _load_objects(f"{servers_base}/racks", branch, dry_run)
+    await _load_objects(c, f"{servers_base}/racks", branch, dry_run)
 
     # Wait for event-driven rack generators before loading servers
     if not dry_run:
         await _wait_for_tasks(c, branch)
 
-    _load_objects(f"{servers_base}/servers", branch, dry_run)
+    await _load_objects(c, f"{servers_base}/servers", branch, dry_run)
 
     if not skip_generators:
         if str(_PROJECT_ROOT) not in sys.path:
@@ -729,9 +759,14 @@ async def _run_demo(
     skip_merge: bool,
     phases: list[int],
     only_dcs: list[str] | None = None,
+    parallel_dcs: int = DEFAULT_PARALLEL_DCS,
 ) -> None:
     from infrahub_sdk import Config, InfrahubClient
 
+    if str(_PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(_PROJECT_ROOT))
+    from utils.phase_runner import PhaseRunner
+
     # Root client used only for orchestration (phases create their own clients)
     client = InfrahubClient(config=Config(address=INFRAHUB_ADDRESS, api_token=INFRAHUB_API_TOKEN))
 
@@ -742,32 +777,51 @@ async def _run_demo(
     log.info("Skip merge      : %s", skip_merge)
     log.info("Phases          : %s", phases or "all")
     log.info("Only DCs        : %s", only_dcs or "all")
+    log.info("Parallel DCs    : %d", parallel_dcs)
+
+    runner = PhaseRunner(log)
 
     def _run(phase_num: int) -> bool:
         return not phases or phase_num in phases
 
     try:
         if _run(1):
-            await _phase_01_data_centers(client, dry_run, skip_generators, skip_merge, only_dcs=only_dcs)
+            with runner.phase("01 Data Centers"):
+                await _phase_01_data_centers(
+                    client,
+                    dry_run,
+                    skip_generators,
+                    skip_merge,
+                    only_dcs=only_dcs,
+                    runner=runner,
+                    max_parallel=parallel_dcs,
+                )
 
         if _run(2):
-            await _phase_02_switch(client, dry_run, skip_merge)
+            with runner.phase("02 Switch"):
+                await _phase_02_switch(client, dry_run, skip_merge)
 
         if _run(3):
-            await _phase_03_rack(client, dry_run, skip_merge)
+            with runner.phase("03 Rack"):
+                await _phase_03_rack(client, dry_run, skip_merge)
 
         if _run(4):
-            await _phase_04_pod(client, dry_run, skip_merge)
+            with runner.phase("04 Pod"):
+                await _phase_04_pod(client, dry_run, skip_merge)
 
         if _run(5):
-            await _phase_05_llm(client, dry_run, skip_merge)
+            with runner.phase("05 LLM"):
+                await _phase_05_llm(client, dry_run, skip_merge)
 
         if _run(6):
-            await _phase_06_servers(client, dry_run, skip_generators, skip_merge)
+            with runner.phase("06 Servers"):
+                await _phase_06_servers(client, dry_run, skip_generators, skip_merge)
 
     except (AssertionError, RuntimeError) as exc:
         log.error("✗ Step failed: %s", exc)
         raise SystemExit(1) from exc
+    finally:
+        log.info("Timings:\n%s", runner.timing_table())
 
     log.info("=== ✅ All phases completed successfully ===")
 
@@ -797,7 +851,301 @@ def deploy_dc(
 
 
 @task(
-    optional=["phases", "skip_generators", "skip_merge", "dry_run", "dcs"],
+    optional=[
+        "scenario",
+        "rows",
+        "technical_prefix_length",
+        "loopback_prefix_length",
+        "management_prefix_length",
+        "spines",
+        "spine_template",
+        "segments",
+        "rr_redundancy",
+        "output",
+        "verbose",
+    ]
+)
+def simulate_dc(
+    context: Context,
+    scenario: str = "dc1",
+    rows: int = 0,
+    technical_prefix_length: int = 0,
+    loopback_prefix_length: int = 0,
+    management_prefix_length: int = 0,
+    spines: int = 0,
+    spine_template: str = "",
+    segments: int = 0,
+    rr_redundancy: int = -1,
+    output: str = "",
+    verbose: bool = False,
+) -> None:
+    """Plan a DC scenario offline (no Infrahub server) and print capacity stats.
+
+    Runs the DC → Pod → Rack planners against in-memory pools, deploys the
+    segment catalog of data/segments in the DC (VLAN IDs, L2 / L3 VNIs) and
+    reports devices, cables, addresses, routing objects, segment deployments,
+    pool utilization and anything that could not be planned.
+
+    Options:
+        --scenario  DC folder name under data/demos/01_data_center (default: dc1)
+        --rows      Repeat each pod's rack rows up to this many rows (capacity what-if)
+        --technical-prefix-length / --loopback-prefix-length / --management-prefix-length
+                    Override the DC pool sizes (as the data center attributes)
+        --spines    Override the spines per pod
+        --spine-template
+                    Override the spine device template
+        --segments  Repeat the segment catalog up to this many segments (VLAN / VNI pool what-if)
+        --rr-redundancy
+                    Override the design's route reflectors per iBGP overlay cluster (0: flat overlay)
+        --output    Write the full plan (devices, cables, ASNs, stats) as JSON
+        --verbose   Keep per-rack cabling log output
+
+    Examples:
+        uv run invoke demo.simulate-dc --scenario dc2
+        uv run invoke demo.simulate-dc --scenario dc2 --rr-redundancy 2
+        uv run invoke demo.simulate-dc --scenario dc1 --rows 4 --spine-template N9K-C9364C-GX_SPINE \\
+            --technical-prefix-length 18 --loopback-prefix-length 22 --management-prefix-length 23
+        uv run invoke demo.simulate-dc --scenario dc1 --rows 20 --technical-prefix-length 15 \\
+            --loopback-prefix-length 20 --management-prefix-length 20 --output /tmp/dc1.json
+    """
+    import json
+
+    sys.path.insert(0, str(_PROJECT_ROOT))
+    from dataclasses import replace
+
+    from generators.simulator import (
+        FabricSimulator,
+        load_data_centers,
+        load_segments,
+        replicate_rows,
+        replicate_segments,
+    )
+
+    if not verbose:
+        logging.getLogger("generators").setLevel(logging.WARNING)
+
+    data_centers = load_data_centers(_PROJECT_ROOT / _DEMOS_ROOT / "01_data_center" / scenario)
+    if not data_centers:
+        raise SystemExit(f"No data center found in scenario {scenario}")
+
+    catalog = load_segments()
+    plans = []
+    for dc in data_centers:
+        dc = replace(dc, segments=replicate_segments(catalog, segments) if segments else catalog)
+        if rows:
+            dc = replicate_rows(
+                dc,
+                rows,
+                technical_prefix_length=technical_prefix_length or None,
+                loopback_prefix_length=loopback_prefix_length or None,
+                management_prefix_length=management_prefix_length or None,
+                spines=spines or None,
+                spine_template=spine_template or None,
+            )
+        result = FabricSimulator(dc, rr_redundancy=rr_redundancy if rr_redundancy >= 0 else None).run()
+        stats = result.stats
+        log.info("=== %s ===", result.data_center)
+        for key, value in stats.as_dict().items():
+            log.info("  %-18s %s", key, value)
+        for pool in result.pools:
+            log.info(
+                "  pool %-40s %-24s %6d  %5.1f%%", pool.name, pool.resource, pool.allocations, pool.utilization * 100
+            )
+        for error in result.errors:
+            log.warning("  ✗ %s", error)
+        plans.append(
+            {
+                "data_center": result.data_center,
+                "stats": stats.as_dict(),
+                "errors": result.errors,
+                "uncabled_devices": stats.uncabled_devices,
+                "pools": [pool._asdict() for pool in result.pools],
+                "asns": result.asns,
+                "devices": [device._asdict() for device in result.devices],
+                "cables": [cable._asdict() for cable in result.cables],
+            }
+        )
+
+    if output:
+        Path(output).write_text(json.dumps(plans, indent=2), encoding="utf-8")
+        log.info("Plan written to %s", output)
+
+
+@task(optional=["scenario", "rows", "latency", "servers_per_rack", "output", "verbose"])
+def benchmark_generators(
+    context: Context,
+    scenario: str = "dc1",
+    rows: int = 0,
+    latency: float = 0.0,
+    servers_per_rack: int = 1,
+    output: str = "",
+    verbose: bool = False,
+) -> None:
+    """Run the DC, Pod, Rack and Endpoint generators against an in-memory Infrahub.
+
+    Seeds an in-memory client with the scenario, runs every generator once in
+    trigger order and reports wall time, client calls and server round trips
+    per generator. Use it to compare generator changes without a server.
+
+    Options:
+        --scenario          DC folder name under data/demos/01_data_center (default: dc1)
+        --rows              Repeat each pod's rack rows up to this many rows
+        --latency           Simulated seconds per server round trip (e.g. 0.005)
+        --servers-per-rack  Servers per compute rack for the endpoint generator (default: 1)
+        --output            Write the full report (per-run calls and round trips) as JSON
+        --verbose           Keep generator log output
+
+    Examples:
+        uv run invoke demo.benchmark-generators --scenario dc2
+        uv run invoke demo.benchmark-generators --scenario dc1 --rows 4 --latency 0.005 --output /tmp/bench.json
+    """
+    import json
+
+    sys.path.insert(0, str(_PROJECT_ROOT))
+    from tests.unit.simulators.benchmark import GeneratorBenchmark
+    from generators.simulator import load_data_centers, replicate_rows
+
+    if not verbose:
+        logging.getLogger("generators").setLevel(logging.CRITICAL)
+
+    data_centers = load_data_centers(_PROJECT_ROOT / _DEMOS_ROOT / "01_data_center" / scenario)
+    if not data_centers:
+        raise SystemExit(f"No data center found in scenario {scenario}")
+
+    reports = []
+    for dc in data_centers:
+        if rows:
+            dc = replicate_rows(dc, rows)
+        result = asyncio.run(GeneratorBenchmark(dc, latency=latency, servers_per_rack=servers_per_rack).run())
+        log.info("=== %s (latency=%ss/round trip) ===", result.data_center, latency)
+        for name, summary in result.by_generator().items():
+            log.info(
+                "  %-32s runs=%-4d %8.3fs  calls=%-6d round_trips=%d",
+                name,
+                summary["runs"],
+                summary["seconds"],
+                summary["calls"],
+                summary["round_trips"],
+            )
+        totals = result.stats.as_dict()
+        log.info(
+            "  total %.3fs, %d calls, %d round trips", result.seconds, totals["total_calls"], totals["round_trips"]
+        )
+        for kind, count in result.objects.items():
+            log.info("  %-24s %d", kind, count)
+        for error in result.errors:
+            log.warning("  ✗ %s", error)
+        reports.append(result.as_dict())
+
+    if output:
+        Path(output).write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        log.info("Report written to %s", output)
+
+
+@task(optional=["vpcs", "subnets", "security_groups", "workers", "repeat", "output"])
+def benchmark_cloud(
+    context: Context,
+    vpcs: int = 200,
+    subnets: int = 4,
+    security_groups: int = 4,
+    workers: str = "0 2 4",
+    repeat: int = 3,
+    output: str = "",
+) -> None:
+    """Benchmark the Terraform and Pulumi cloud transforms on a synthetic AWS account.
+
+    Builds the account with the smoke fixture builders, renders it with each
+    worker count (best of --repeat runs, cloud IR already cached) and checks
+    that every worker count produces the same output.
+
+    Options:
+        --vpcs             VPCs in the account (default: 200)
+        --subnets          Subnets (and instances) per VPC (default: 4)
+        --security-groups  Security groups per VPC (default: 4)
+        --workers          Space-separated worker counts, 0 = in-process (default: "0 2 4")
+        --repeat           Runs per worker count (default: 3)
+        --output           Write the timings as JSON
+
+    Examples:
+        uv run invoke demo.benchmark-cloud
+        uv run invoke demo.benchmark-cloud --vpcs 1000 --subnets 8 --workers "0 8"
+    """
+    import json
+
+    sys.path.insert(0, str(_PROJECT_ROOT))
+    sys.path.insert(0, str(_PROJECT_ROOT / "tests" / "smoke"))
+    from generate_cloud_fixtures import build_aws_scaled
+
+    from transforms.cloud_vpc_pulumi import CloudVpcPulumi
+    from transforms.cloud_vpc_terraform import CloudVpcTerraform
+
+    data = build_aws_scaled(vpcs=vpcs, subnets_per_vpc=subnets, sgs_per_vpc=security_groups)
+    log.info("Synthetic account: %d VPCs, %d subnets, %d security groups", vpcs, vpcs * subnets, vpcs * security_groups)
+
+    report: dict[str, dict[str, float]] = {}
+    for transform_cls in (CloudVpcTerraform, CloudVpcPulumi):
+        transform = transform_cls.__new__(transform_cls)
+        baseline = asyncio.run(transform.transform(data))  # warms the cloud IR cache
+        timings: dict[str, float] = {}
+        for count in (int(w) for w in workers.split()):
+            transform.vpc_workers = count
+            best = float("inf")
+            for _ in range(max(repeat, 1)):
+                started = time.perf_counter()
+                rendered = asyncio.run(transform.transform(data))
+                best = min(best, time.perf_counter() - started)
+            if rendered != baseline:
+                raise SystemExit(f"{transform_cls.__name__}: output differs with {count} workers")
+            timings[str(count)] = round(best, 4)
+            log.info("  %-18s workers=%-3d %8.3fs  (%d bytes)", transform_cls.__name__, count, best, len(rendered))
+        report[transform_cls.__name__] = timings
+
+    if output:
+        Path(output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        log.info("Report written to %s", output)
+
+
+@task(optional=["iterations", "keyword", "output", "compare", "threshold"])
+def benchmark_render(
+    context: Context,
+    iterations: int = 20,
+    keyword: str = "",
+    output: str = "",
+    compare: str = "",
+    threshold: float = 0.15,
+) -> None:
+    """Benchmark config rendering throughput over the smoke test fixtures.
+
+    Replays every tests/smoke/configs fixture through its transform and reports
+    renders/s, p50/p99 latency and peak memory per role and platform. With
+    --compare, exits non-zero when a group regressed beyond --threshold.
+
+    Options:
+        --iterations  Timed renders per fixture (default: 20)
+        --keyword     Only fixtures whose name contains this, e.g. "leaf_arista"
+        --output      Write the results as a JSON baseline
+        --compare     Baseline JSON to compare against
+        --threshold   Allowed regression, 0.15 = 15% (default: 0.15)
+
+    Examples:
+        uv run invoke demo.benchmark-render --output /tmp/render-baseline.json
+        uv run invoke demo.benchmark-render --compare /tmp/render-baseline.json --threshold 0.1
+    """
+    sys.path.insert(0, str(_PROJECT_ROOT))
+    sys.path.insert(0, str(_PROJECT_ROOT / "tests" / "smoke"))
+    from benchmark_render import main
+
+    argv = ["--iterations", str(iterations), "--keyword", keyword, "--threshold", str(threshold)]
+    if output:
+        argv += ["--output", output]
+    if compare:
+        argv += ["--compare", compare]
+    if main(argv):
+        raise SystemExit("Render benchmark regressed against the baseline")
+
+
+@task(
+    optional=["phases", "skip_generators", "skip_merge", "dry_run", "dcs", "parallel"],
 )
 def run_demo(
     context: Context,
@@ -806,10 +1154,11 @@ def run_demo(
     skip_merge: bool = False,
     dry_run: bool = False,
     dcs: str = "",
+    parallel: int = DEFAULT_PARALLEL_DCS,
 ) -> None:
-    """Run the full demo flow — 6 sequential phases, DC phase runs one by one.
+    """Run the full demo flow — 6 sequential phases.
 
-    Phase 01  Data Centers   – dc1…dc6 each on its own branch, one by one
+    Phase 01  Data Centers   – dc1…dc6 each on its own branch, merged one at a time
     Phase 02  Switch         – add 2 ToRs to DC1 rack (event-driven)
     Phase 03  Rack           – add single ToR rack to DC1-POD-2 (event-driven)
     Phase 04  Pod            – add new POD-4 to DC1 (event-driven)
@@ -819,6 +1168,8 @@ def run_demo(
     Options:
         --phases           Space-separated phase numbers, e.g. "1 2" (default: all)
         --dcs              Space-separated DC folder names for phase 1, e.g. "dc5 dc6" (default: all)
+        --parallel         DCs deployed concurrently in phase 1 (default and maximum: 1, one by one;
+                           DC pool allocations are not serialized across branches yet)
         --skip-generators  Load data but skip explicit generator runs
         --skip-merge       Create proposed changes but do not merge
         --dry-run          Print what would happen without executing any writes
@@ -839,6 +1190,7 @@ def run_demo(
             skip_merge=skip_merge,
             phases=phase_list,
             only_dcs=dc_list,
+            parallel_dcs=parallel,
         )
     )
 
@@ -846,3 +1198,7 @@ def run_demo(
 ns = Collection("demo")
 ns.add_task(cast(Task, deploy_dc), name="deploy-dc")
 ns.add_task(cast(Task, run_demo), name="run-demo")
+ns.add_task(cast(Task, simulate_dc), name="simulate-dc")
+ns.add_task(cast(Task, benchmark_generators), name="benchmark-generators")
+ns.add_task(cast(Task, benchmark_cloud), name="benchmark-cloud")
+ns.add_task(cast(Task, benchmark_render), name="benchmark-render")
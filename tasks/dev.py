@@ -1,6 +1,8 @@
 """Dev tasks — code quality, linting, tests."""
 
+import json
 import logging
+import sys
 from pathlib import Path
 from typing import cast
 
@@ -9,6 +11,8 @@ from invoke import Collection, Context, Task, task
 logging.basicConfig(level=logging.INFO, format="%(asctime)s  %(levelname)-8s  %(message)s")
 log = logging.getLogger("dev")
 
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
 
 def _ensure_pytest_basetemp(basetemp: str) -> Path:
     path = Path(basetemp).expanduser()
@@ -105,6 +109,115 @@ def clean_testcontainers(context: Context) -> None:
         context.run(cmd, pty=True, warn=True)
 
 
+@task(optional=["artifact", "output"])
+def query_usage(context: Context, artifact: str = "", output: str = "") -> None:  # noqa: ARG001
+    """Report query fields that no transform code or template of an artifact reads.
+
+    Statically matches every field of the artifact's query against the keys
+    read by its transform (and the project modules it imports) and by its Jinja
+    templates. The payload saving is averaged over the smoke fixtures.
+
+    Options:
+        --artifact  Space-separated artifact definition names (default: all)
+        --output    Write the full report as JSON
+
+    Examples:
+        uv run invoke dev.query-usage
+        uv run invoke dev.query-usage --artifact "leaf_config spine_config" --output usage.json
+    """
+    sys.path.insert(0, str(_PROJECT_ROOT))
+    from utils.query_usage import analyze
+
+    reports = analyze(artifact.split())
+    for report in reports:
+        log.info(report.summary())
+        for usage in report.unused:
+            log.info("    %-70s %6.0f bytes", usage.dotted, usage.bytes_per_payload)
+
+    if output:
+        Path(output).write_text(json.dumps([report.to_dict() for report in reports], indent=2), encoding="utf-8")
+        log.info("Report written to %s", output)
+
+
+@task(optional=["query", "output"])
+def query_cost(context: Context, query: str = "", output: str = "") -> None:  # noqa: ARG001
+    """Estimate the worst-case node fan-out of every GraphQL query against its budget.
+
+    Counts the nodes each query can return on the sample deployment of
+    queries/budget.yml and exits non-zero when a query exceeds its budget.
+
+    Options:
+        --query   Space-separated operation names (default: all)
+        --output  Write the estimates as JSON
+
+    Examples:
+        uv run invoke dev.query-cost
+        uv run invoke dev.query-cost --query "leaf_config spine_config"
+    """
+    sys.path.insert(0, str(_PROJECT_ROOT))
+    from utils.query_cost import estimate_queries, load_budget
+
+    budget = load_budget()
+    wanted = set(query.split())
+    costs = [cost for cost in estimate_queries(budget) if not wanted or cost.name in wanted]
+    over = [cost for cost in costs if cost.nodes > budget.limit(cost.name)]
+    for cost in costs:
+        log.log(
+            logging.ERROR if cost in over else logging.INFO,
+            "%s (budget %s)",
+            cost.summary(),
+            f"{budget.limit(cost.name):,}",
+        )
+
+    if output:
+        report = [{**vars(cost), "budget": budget.limit(cost.name)} for cost in costs]
+        Path(output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        log.info("Report written to %s", output)
+    if over:
+        raise SystemExit(f"{len(over)} query(ies) over budget: {', '.join(cost.name for cost in over)}")
+
+
+@task(optional=["module", "repeat", "target", "output"])
+def import_time(
+    context: Context,  # noqa: ARG001
+    module: str = "",
+    repeat: int = 3,
+    target: float = 0.0,
+    output: str = "",
+) -> None:
+    """Measure the cold-start import time of every transform and check worker.
+
+    Imports each module of .infrahub.yml in a fresh interpreter after the SDK
+    and reports the time it adds, and whether it loads the device rendering
+    stack (Jinja, netutils, transforms.helpers.device). Exits non-zero when a
+    module adds more than the target.
+
+    Options:
+        --module  Only modules whose name contains this keyword
+        --repeat  Runs per module, best one is kept (default: 3)
+        --target  Milliseconds a module may add over the SDK (default: 150)
+        --output  Write the measurements as JSON
+
+    Examples:
+        uv run invoke dev.import-time
+        uv run invoke dev.import-time --module transforms --repeat 5 --output import-time.json
+    """
+    sys.path.insert(0, str(_PROJECT_ROOT))
+    from utils.import_time import DEFAULT_TARGET_MS, measure_workers
+
+    target = target or DEFAULT_TARGET_MS
+    timings = measure_workers(module, repeat)
+    over = [timing for timing in timings if timing.module_ms > target]
+    for timing in timings:
+        log.log(logging.ERROR if timing in over else logging.INFO, timing.summary(target))
+
+    if output:
+        Path(output).write_text(json.dumps([vars(timing) for timing in timings], indent=2), encoding="utf-8")
+        log.info("Report written to %s", output)
+    if over:
+        raise SystemExit(f"{len(over)} module(s) over {target:.0f} ms: {', '.join(t.module for t in over)}")
+
+
 ns = Collection("dev")
 ns.add_task(cast(Task, setup_precommit), name="setup-precommit")
 ns.add_task(cast(Task, validate))
@@ -112,3 +225,6 @@ ns.add_task(cast(Task, test_unit), name="test-unit")
 ns.add_task(cast(Task, test_integration), name="test-integration")
 ns.add_task(cast(Task, release))
 ns.add_task(cast(Task, clean_testcontainers), name="clean-testcontainers")
+ns.add_task(cast(Task, query_usage), name="query-usage")
+ns.add_task(cast(Task, query_cost), name="query-cost")
+ns.add_task(cast(Task, import_time), name="import-time")
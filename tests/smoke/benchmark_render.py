@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Render throughput benchmark over the smoke fixtures.
+
+Usage:
+    python tests/smoke/benchmark_render.py --output baseline.json
+    python tests/smoke/benchmark_render.py --compare baseline.json --threshold 0.15
+    python tests/smoke/benchmark_render.py -k arista_eos --iterations 50
+
+Replays every configs/{name}/input.json through its transform class (the same
+prefix → class mapping as test_configs_smoke.py) and reports, per role and
+platform:
+
+    renders/s  — renders divided by the time spent rendering
+    p50 / p99  — per-render latency in milliseconds
+    peak KiB   — tracemalloc peak of one render (measured in a separate pass)
+
+Each fixture is rendered once untimed first, so module-level caches (cloud IR,
+templates on disk) are warm, as they are in a long-running worker.
+
+--compare flags a group whose p50, p99 or peak memory grew, or whose renders/s
+dropped, by more than --threshold relative to the baseline, and exits with
+status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import platform as _platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from test_configs_smoke import fixture_dirs, fixture_prefix, make_transform, transform_class_for
+
+from utils.data_cleaning import get_data
+
+DEFAULT_ITERATIONS = 20
+DEFAULT_THRESHOLD = 0.15
+
+
+@dataclass
+class GroupResult:
+    """Throughput of the fixtures of one role and platform."""
+
+    fixtures: int
+    renders: int
+    renders_per_s: float
+    p50_ms: float
+    p99_ms: float
+    peak_kib: float
+
+
+def fixture_group(fixture_dir: Path, data: dict[str, Any]) -> str:
+    """``<role>/<platform>`` of a fixture: transform prefix and device platform (or cloud provider)."""
+    prefix = fixture_prefix(fixture_dir) or "unknown"
+    try:
+        device = get_data(data)
+    except ValueError:
+        device = None
+    platform = (device.get("platform") or {}).get("name") if isinstance(device, dict) else None
+    if not platform:
+        platform = fixture_dir.name[len(prefix) + 1 :].split("_")[0]
+    return f"{prefix}/{platform}"
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def benchmark_fixture(fixture_dir: Path, iterations: int) -> tuple[list[float], int]:
+    """Per-render latencies (seconds) and tracemalloc peak (bytes) of one fixture."""
+    data = json.loads((fixture_dir / "input.json").read_text())
+    transform = make_transform(transform_class_for(fixture_dir))  # type: ignore[arg-type]
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(transform.transform(data))
+        latencies = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            loop.run_until_complete(transform.transform(data))
+            latencies.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        try:
+            loop.run_until_complete(transform.transform(data))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        loop.close()
+    return latencies, peak
+
+
+def run_benchmark(iterations: int = DEFAULT_ITERATIONS, keyword: str = "") -> dict[str, Any]:
+    """Benchmark every fixture whose name contains ``keyword``; results grouped by role and platform."""
+    latencies: dict[str, list[float]] = {}
+    peaks: dict[str, list[int]] = {}
+    fixtures: dict[str, int] = {}
+    for fixture_dir in fixture_dirs():
+        if transform_class_for(fixture_dir) is None or keyword not in fixture_dir.name:
+            continue
+        group = fixture_group(fixture_dir, json.loads((fixture_dir / "input.json").read_text()))
+        samples, peak = benchmark_fixture(fixture_dir, iterations)
+        latencies.setdefault(group, []).extend(samples)
+        peaks.setdefault(group, []).append(peak)
+        fixtures[group] = fixtures.get(group, 0) + 1
+
+    groups = {
+        group: GroupResult(
+            fixtures=fixtures[group],
+            renders=len(samples),
+            renders_per_s=round(len(samples) / sum(samples), 1),
+            p50_ms=round(statistics.median(samples) * 1000, 3),
+            p99_ms=round(_percentile(samples, 99) * 1000, 3),
+            peak_kib=round(max(peaks[group]) / 1024, 1),
+        )
+        for group, samples in sorted(latencies.items())
+    }
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": _platform.python_version(),
+        "iterations": iterations,
+        "groups": {group: asdict(result) for group, result in groups.items()},
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """Regressions of ``current`` over ``baseline`` larger than ``threshold`` (0.15 = 15%)."""
+    regressions = []
+    for group, result in current["groups"].items():
+        base = baseline["groups"].get(group)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p99_ms", "peak_kib"):
+            if base[metric] and result[metric] > base[metric] * (1 + threshold):
+                regressions.append(
+                    f"{group}: {metric} {base[metric]} → {result[metric]} (+{result[metric] / base[metric] - 1:.0%})"
+                )
+        if base["renders_per_s"] and result["renders_per_s"] < base["renders_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{group}: renders_per_s {base['renders_per_s']} → {result['renders_per_s']}"
+                f" ({result['renders_per_s'] / base['renders_per_s'] - 1:.0%})"
+            )
+    return regressions
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [f"{'group':<28} {'fixtures':>8} {'renders/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak KiB':>9}"]
+    for group, result in report["groups"].items():
+        lines.append(
+            f"{group:<28} {result['fixtures']:>8} {result['renders_per_s']:>10} {result['p50_ms']:>9}"
+            f" {result['p99_ms']:>9} {result['peak_kib']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="timed renders per fixture")
+    parser.add_argument("-k", "--keyword", default="", help="only fixtures whose name contains this")
+    parser.add_argument("--output", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed regression (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.iterations, args.keyword)
+    print(format_report(report))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline written to {args.output}")
+    if args.compare:
+        regressions = compare(json.loads(Path(args.compare).read_text()), report, args.threshold)
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%} against {args.compare}")
+        for regression in regressions:
+            print(f"  ✗ {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -742,6 +742,108 @@ def build_gcp() -> dict:
     }
 
 
+def build_aws_scaled(vpcs: int = 200, subnets_per_vpc: int = 4, sgs_per_vpc: int = 4) -> dict:
+    """Synthetic AWS account for benchmarks: ``vpcs`` VPCs spread over three regions.
+
+    Every VPC gets its subnets, security groups, one instance per subnet, an
+    IGW, a NAT, a route table with two routes and a NACL.
+    """
+    account = _make_account(name="bench-aws-account")
+    regions = ("eu-central-1", "eu-west-1", "us-east-1")
+    data: dict[str, list[dict]] = {
+        key: []
+        for key in (
+            "CloudVirtualNetwork",
+            "CloudSecurityGroup",
+            "CloudInstance",
+            "CloudInternetGateway",
+            "CloudNATGateway",
+            "CloudRouteTable",
+            "CloudRoute",
+            "CloudNetworkACL",
+        )
+    }
+    for v in range(vpcs):
+        vpc_name = f"bench-vpc-{v}"
+        region = regions[v % len(regions)]
+        subnet_names = [f"{vpc_name}-subnet-{s}" for s in range(subnets_per_vpc)]
+        sg_names = [f"{vpc_name}-sg-{g}" for g in range(sgs_per_vpc)]
+        subnets = [
+            _make_subnet(
+                sub_id=f"sub-{v}-{s}",
+                name=name,
+                cidr=f"10.{v % 256}.{s}.0/24",
+                az=f"{region}{'abc'[s % 3]}",
+                is_public=s == 0,
+            )
+            for s, name in enumerate(subnet_names)
+        ]
+        data["CloudVirtualNetwork"].append(
+            _make_vpc(
+                vpc_id=f"vpc-{v}",
+                vpc_name=vpc_name,
+                region=region,
+                cidr=f"10.{v % 256}.0.0/16",
+                account=account,
+                subnets=subnets,
+            )
+        )
+        data["CloudSecurityGroup"] += [_make_sg(f"sg-{v}-{g}", name, vpc_name) for g, name in enumerate(sg_names)]
+        data["CloudInstance"] += [
+            _make_instance(
+                inst_id=f"i-{v}-{s}",
+                name=f"{vpc_name}-instance-{s}",
+                cloud_id=f"i-{v:04x}{s:04x}",
+                instance_type="t3.micro",
+                image="ami-12345678",
+                os_type="linux",
+                private_ip=f"10.{v % 256}.{s}.10",
+                subnet_name=name,
+                vpc_name=vpc_name,
+                az=f"{region}{'abc'[s % 3]}",
+                sg_names=sg_names[:2],
+            )
+            for s, name in enumerate(subnet_names)
+        ]
+        data["CloudInternetGateway"].append(_make_igw(f"igw-{v}", f"{vpc_name}-igw", vpc_name))
+        data["CloudNATGateway"].append(
+            _make_nat(nat_id=f"nat-{v}", name=f"{vpc_name}-nat", vpc_name=vpc_name, subnet_names=subnet_names[:1])
+        )
+        data["CloudRouteTable"].append(
+            _make_route_table(rt_id=f"rt-{v}", name=f"{vpc_name}-rt", vpc_name=vpc_name, subnet_names=subnet_names)
+        )
+        data["CloudRoute"] += [
+            _make_route(
+                route_id=f"route-{v}-igw",
+                name=f"{vpc_name}-route-igw",
+                rt_name=f"{vpc_name}-rt",
+                destination="0.0.0.0/0",
+                igw_name=f"{vpc_name}-igw",
+            ),
+            _make_route(
+                route_id=f"route-{v}-nat",
+                name=f"{vpc_name}-route-nat",
+                rt_name=f"{vpc_name}-rt",
+                destination="192.168.0.0/16",
+                nat_name=f"{vpc_name}-nat",
+            ),
+        ]
+        data["CloudNetworkACL"].append(
+            _make_nacl(nacl_id=f"nacl-{v}", name=f"{vpc_name}-nacl", vpc_name=vpc_name, subnet_names=subnet_names)
+        )
+
+    empty = (
+        "CloudPublicIP",
+        "CloudTransitGateway",
+        "CloudVPNGateway",
+        "CloudCustomerGateway",
+        "CloudVirtualNetworkPeering",
+        "CloudDirectConnect",
+        "CloudVirtualInterface",
+    )
+    return {**{key: _edges(nodes) for key, nodes in data.items()}, **{key: _edges([]) for key in empty}}
+
+
 # ============================================================================
 # Runner
 # ============================================================================
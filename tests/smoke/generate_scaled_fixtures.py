@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""Generate synthetic large-scale payloads for stress benchmarks.
+
+Usage:
+    python tests/smoke/generate_scaled_fixtures.py
+    python tests/smoke/generate_scaled_fixtures.py --scale 10 100 1000 --role spine --platform cisco_nxos
+    python tests/smoke/generate_scaled_fixtures.py --scale 100 --segments 500 --rules 10000 --output /tmp/scaled
+
+Builds on the smoke fixture builders (generate_config_fixtures.py and
+generate_cloud_fixtures.py) and grows each payload along named dimensions:
+
+    ports     physical interfaces of the device (and per spine of the planner pod)
+    peerings  BGP sessions of the overlay process (underlay: one per cabled port)
+    segments  segment deployments of the device's data center
+    rules     security policy rules, spread over the segments' policies
+    vpcs      VPCs of the synthetic cloud account
+
+A ScaleProfile at 1× is about the size of the hand-written smoke fixtures;
+``--scale N`` multiplies every dimension. Payloads are deterministic for a
+given --seed, so timings of two runs (or two commits) are comparable.
+
+For every scale the script reports payload size and the time spent in
+clean_data, the device and cloud transforms, and the cabling and routing
+planners. --output writes the payloads (input.json, no output.txt, so the
+smoke tests ignore them).
+"""
+
+from __future__ import annotations
+
+import argparse
+import ipaddress
+import json
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from generate_cloud_fixtures import build_aws_scaled
+from generate_config_fixtures import (
+    DEVICE_CONFIGS,
+    _edges,
+    _make_bgp_peering,
+    _make_interface,
+    _make_policy_rule,
+    _make_security_policy,
+    _make_segment_deployment,
+    _node,
+    _v,
+    run_transform,
+)
+
+from generators.helpers.cabling import CablingPlanner
+from generators.helpers.records import InterfaceRecord, LoopbackRecord, ProcessRecord
+from generators.helpers.routing import RoutingPlanInput, RoutingPlanner
+from transforms.cloud_vpc_terraform import CloudVpcTerraform
+from utils.data_cleaning import clean_data
+
+PLANNER_SPINES = 4
+DEFAULT_SCALES = [1, 10, 100]
+
+
+@dataclass(frozen=True)
+class ScaleProfile:
+    """Size of a synthetic payload along each dimension."""
+
+    ports: int = 4
+    peerings: int = 2
+    segments: int = 2
+    rules: int = 3
+    vpcs: int = 1
+    seed: int = 0
+
+    def scaled(self, factor: int) -> ScaleProfile:
+        """Every dimension multiplied by ``factor`` (same seed)."""
+        return replace(
+            self,
+            ports=self.ports * factor,
+            peerings=self.peerings * factor,
+            segments=self.segments * factor,
+            rules=self.rules * factor,
+            vpcs=self.vpcs * factor,
+        )
+
+
+def _host(network: str, index: int, prefixlen: int) -> str:
+    return f"{ipaddress.ip_network(network)[index]}/{prefixlen}"
+
+
+def _bgp_process(name: str, asn: int, router_id: str, peerings: list[dict]) -> dict:
+    return {
+        "__typename": "ManagedBGP",
+        "name": _v(name),
+        "status": _v("active"),
+        "multipath": _v(True),
+        "graceful_restart": _v(True),
+        "confederation_identifier": _v(None),
+        "local_as": _node({"asn": _v(asn)}),
+        "router_id": _node({"address": _v(router_id)}),
+        "peerings": _edges(peerings),
+    }
+
+
+def _segment_deployments(profile: ScaleProfile, rng: random.Random) -> list[dict]:
+    """``profile.segments`` deployments; ``profile.rules`` rules dealt round-robin over their policies."""
+    rules_per_segment = [profile.rules // profile.segments] * profile.segments if profile.segments else []
+    for index in range(profile.rules % profile.segments if profile.segments else 0):
+        rules_per_segment[index] += 1
+
+    vrfs = max(1, profile.segments // 50)
+    deployments = []
+    for index, rule_count in enumerate(rules_per_segment):
+        vxlan = rng.random() < 0.7
+        rules = [
+            _make_policy_rule(
+                index=10 * (rule + 1),
+                name=f"rule-{index}-{rule}",
+                action=rng.choice(("permit", "permit", "deny")),
+                protocol=(protocol := rng.choice(("tcp", "udp", "icmp"))),
+                port_start=None if protocol == "icmp" else rng.randint(1, 65535),
+                log=rng.random() < 0.1,
+            )
+            for rule in range(rule_count)
+        ]
+        deployments.append(
+            _make_segment_deployment(
+                vlan_id=100 + index % 3900,
+                vni=10000 + index if vxlan else None,
+                seg_name=f"seg-{index:05d}",
+                seg_type="ManagedVxlanSegment" if vxlan else "ManagedVlanSegment",
+                gateway_ip=_host(f"10.{128 + index // 256 % 128}.{index % 256}.0/24", 1, 24),
+                ns_name=f"VRF_{index % vrfs}",
+                security_policies=[_make_security_policy(name=f"policy-seg-{index:05d}", rules=rules)]
+                if rules
+                else None,
+                fw_gateway_ip=_host(f"10.{128 + index // 256 % 128}.{index % 256}.0/24", 254, 24)
+                if rng.random() < 0.5
+                else None,
+                num_deployments=rng.choice((1, 1, 2)),
+            )
+        )
+    return deployments
+
+
+def build_scaled_device_data(
+    profile: ScaleProfile,
+    *,
+    device_name: str = "dc1-spine-01",
+    role: str = "spine",
+    platform: str = "arista_eos",
+) -> dict:
+    """Raw device config query response (as build_device_data) grown to ``profile``.
+
+    eBGP underlay over the first ``min(ports, peerings)`` ports, each cabled to
+    its own peer; iBGP overlay with ``peerings`` sessions to peer loopbacks;
+    the remaining ports are uncabled.
+    """
+    rng = random.Random(profile.seed)
+    router_id = "10.0.0.1/32"
+    underlay_asn, overlay_asn = 65001, 65000
+    peer_role = "leaf" if role in ("spine", "super_spine") else "spine"
+    links = min(profile.ports, profile.peerings)
+
+    interfaces = [
+        _make_interface(
+            name="Loopback0",
+            device_name=device_name,
+            description="Router ID",
+            role="loopback",
+            ip_address=router_id,
+            typename="DcimVirtualInterface",
+        )
+    ]
+    underlay = []
+    for index in range(profile.ports):
+        name = f"Ethernet{index + 1}"
+        if index >= links:
+            role_of_port = "server" if peer_role == "spine" else peer_role
+            interfaces.append(_make_interface(name=name, device_name=device_name, role=role_of_port))
+            continue
+        remote = f"{peer_role}-{index + 1:04d}"
+        local_ip, remote_ip = _host("10.64.0.0/10", 2 * index + 1, 31), _host("10.64.0.0/10", 2 * index, 31)
+        interfaces.append(
+            _make_interface(
+                name=name,
+                device_name=device_name,
+                description=f"to {remote}",
+                role=peer_role,
+                ip_address=local_ip,
+                remote_name=f"Ethernet{rng.randint(1, 64)}",
+                remote_ip=remote_ip,
+                remote_device=remote,
+            )
+        )
+        underlay.append(
+            _make_bgp_peering(
+                device_name=device_name,
+                device_ip=local_ip,
+                device_asn=underlay_asn,
+                remote_name=remote,
+                remote_ip=remote_ip,
+                remote_asn=65100 + index,
+                local_iface_name=name,
+            )
+        )
+
+    overlay = [
+        _make_bgp_peering(
+            device_name=device_name,
+            device_ip=router_id,
+            device_asn=overlay_asn,
+            remote_name=f"{peer_role}-{index + 1:04d}",
+            remote_ip=_host("10.0.0.0/16", 256 + index, 32),
+            remote_asn=overlay_asn,
+            session_type="IBGP",
+            ttl=2,
+            route_reflector_client=peer_role == "leaf",
+        )
+        for index in range(profile.peerings)
+    ]
+
+    device_node: dict[str, Any] = {
+        "__typename": "DcimPhysicalDevice",
+        "id": f"dev-{device_name}",
+        "name": _v(device_name),
+        "role": _v(role),
+        "platform": _node(
+            {
+                "id": f"plat-{platform}",
+                "name": _v(platform),
+                "netmiko_device_type": _v(platform),
+                "napalm_driver": _v(platform),
+                "ansible_network_os": _v(platform),
+            }
+        ),
+        "primary_address": _node({"address": _v(router_id), "ip_namespace": _node({"name": _v("default")})}),
+        "tags": _edges([]),
+        "device_capabilities": _edges(
+            [
+                _bgp_process("bgp-underlay", underlay_asn, router_id, underlay),
+                _bgp_process("bgp-overlay", overlay_asn, router_id, overlay),
+            ]
+        ),
+        "interfaces": _edges(interfaces),
+        "deployment": _node(
+            {"id": "dc-1", "name": _v("DC-1"), "segment_deployments": _edges(_segment_deployments(profile, rng))}
+        ),
+    }
+    return {"DcimDevice": _edges([device_node])}
+
+
+def build_scaled_cloud_data(profile: ScaleProfile) -> dict:
+    """Synthetic AWS account with ``profile.vpcs`` VPCs (build_aws_scaled)."""
+    return build_aws_scaled(vpcs=profile.vpcs)
+
+
+def build_planner_records(
+    profile: ScaleProfile,
+) -> tuple[list[InterfaceRecord], list[InterfaceRecord], list[LoopbackRecord]]:
+    """Leaf uplinks, spine downlinks and loopbacks of a pod: PLANNER_SPINES spines of ``profile.ports`` ports.
+
+    One leaf per spine port, each with one uplink per spine. Records come in a
+    seeded random order, as SDK query results do; the planners sort them.
+    """
+    rng = random.Random(profile.seed)
+    spines = [f"spine-{index + 1:02d}" for index in range(PLANNER_SPINES)]
+    leafs = [f"leaf-{index + 1:04d}" for index in range(profile.ports)]
+
+    top = [
+        InterfaceRecord(f"{spine}-if{port}", f"Ethernet{port}", spine, f"dev-{spine}")
+        for spine in spines
+        for port in range(1, profile.ports + 1)
+    ]
+    bottom = [
+        InterfaceRecord(f"{leaf}-if{port}", f"Ethernet{port}", leaf, f"dev-{leaf}")
+        for leaf in leafs
+        for port in range(1, PLANNER_SPINES + 1)
+    ]
+    loopbacks = [
+        LoopbackRecord(
+            f"{name}-lo0",
+            f"dev-{name}",
+            name,
+            "spine" if name in spines else "leaf",
+            f"ip-{name}",
+            _host("10.0.0.0/16", index + 1, 32),
+        )
+        for index, name in enumerate(spines + leafs)
+    ]
+    rng.shuffle(top)
+    rng.shuffle(bottom)
+    return bottom, top, loopbacks
+
+
+def run_planners(profile: ScaleProfile) -> dict[str, int]:
+    """Cable the planner pod, then plan its eBGP underlay and iBGP overlay (spines already have theirs)."""
+    bottom, top, loopbacks = build_planner_records(profile)
+    cables = CablingPlanner(bottom_interfaces=bottom, top_interfaces=top).build_cabling_plan(scenario="pod")
+    endpoints = []
+    for pair in cables:
+        cable_name = "__".join(sorted(f"{intf.device}-{intf.name}" for intf in pair))
+        endpoints += [intf._replace(cable_id=cable_name, cable_name=cable_name) for intf in pair]
+    spines = sorted({record.device for record in top})
+    plan = RoutingPlanner(deployment_id="scaled").build_routing_plan(
+        RoutingPlanInput(
+            bottom_devices=sorted({record.device for record in bottom}),
+            top_devices=spines,
+            overlay=[ProcessRecord(spine) for spine in spines],
+            interfaces=endpoints,
+            loopback_interfaces=loopbacks,
+            options={"design": True, "asn_pool": "scaled-asn-pool", "overlay_as_id": "as-overlay"},
+            routing_strategy="ebgp-ibgp",
+        )
+    )
+    return {"cables": len(cables), "bgp_processes": len(plan.bgp_processes), "bgp_peerings": len(plan.bgp_peerings)}
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, round((time.perf_counter() - started) * 1000, 1)
+
+
+def stress(profile: ScaleProfile, role: str = "spine", platform: str = "arista_eos") -> dict[str, Any]:
+    """Payload sizes and milliseconds spent in clean_data, the transforms and the planners at ``profile``."""
+    transform_cls = next(cls for cls, config_role, _, _ in DEVICE_CONFIGS if config_role == role)
+    device = build_scaled_device_data(
+        profile, device_name=f"dc1-{role.replace('_', '-')}-01", role=role, platform=platform
+    )
+    cloud = build_scaled_cloud_data(profile)
+
+    _, clean_ms = _timed(lambda: clean_data(device))
+    config, device_ms = _timed(lambda: run_transform(transform_cls, device))
+    _, cloud_ms = _timed(lambda: run_transform(CloudVpcTerraform, cloud))
+    planned, planner_ms = _timed(lambda: run_planners(profile))
+    return {
+        "profile": profile.__dict__,
+        "device_payload_kib": round(len(json.dumps(device)) / 1024, 1),
+        "config_lines": config.count("\n"),
+        "clean_data_ms": clean_ms,
+        f"{transform_cls.__name__}_ms": device_ms,
+        "CloudVpcTerraform_ms": cloud_ms,
+        "planners_ms": planner_ms,
+        **planned,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, nargs="+", default=DEFAULT_SCALES, help="factors over the 1× profile")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--role", default="spine", choices=[role for _, role, _, _ in DEVICE_CONFIGS])
+    parser.add_argument("--platform", default="arista_eos")
+    for dimension in ("ports", "peerings", "segments", "rules", "vpcs"):
+        parser.add_argument(
+            f"--{dimension}", type=int, help=f"1× {dimension} (default: {getattr(ScaleProfile, dimension)})"
+        )
+    parser.add_argument("--output", help="write input.json payloads under this directory")
+    args = parser.parse_args(argv)
+
+    overrides = {
+        dimension: value
+        for dimension in ("ports", "peerings", "segments", "rules", "vpcs")
+        if (value := getattr(args, dimension)) is not None
+    }
+    base = ScaleProfile(seed=args.seed, **overrides)
+    for factor in args.scale:
+        profile = base.scaled(factor)
+        if args.output:
+            for name, data in (
+                (
+                    f"{args.role}_{args.platform}_x{factor}",
+                    build_scaled_device_data(profile, role=args.role, platform=args.platform),
+                ),
+                (f"cloud_aws_x{factor}", build_scaled_cloud_data(profile)),
+            ):
+                target = Path(args.output) / name
+                target.mkdir(parents=True, exist_ok=True)
+                (target / "input.json").write_text(json.dumps(data) + "\n")
+        print(f"{factor}×: {json.dumps(stress(profile, args.role, args.platform))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -48,19 +49,48 @@ _PREFIX_TO_CLASS: list[tuple[str, type]] = sorted(
 )
 
 
-def _run_transform(transform_cls: type, data: dict) -> str:
-    """Run a transform against data using a mock client (no server needed)."""
+def fixture_prefix(fixture_dir: Path) -> str | None:
+    """Transform prefix of a fixture directory name (``leaf``, ``cloud_vpc_terraform``, ...)."""
+    for prefix, _ in _PREFIX_TO_CLASS:
+        if fixture_dir.name.startswith(prefix + "_"):
+            return prefix
+    return None
+
+
+def transform_class_for(fixture_dir: Path) -> type | None:
+    """Transform class of a fixture directory, from its name prefix."""
+    return dict(_PREFIX_TO_CLASS).get(fixture_prefix(fixture_dir) or "")
+
+
+def fixture_dirs() -> list[Path]:
+    """Fixture directories with both input.json and output.txt, in name order."""
+    if not CONFIGS_DIR.exists():
+        return []
+    return [
+        d
+        for d in sorted(CONFIGS_DIR.iterdir())
+        if d.is_dir() and (d / "input.json").exists() and (d / "output.txt").exists()
+    ]
+
+
+def make_transform(transform_cls: type) -> Any:
+    """Instantiate a transform on a mock client (no server needed)."""
     mock_client = MagicMock()
     mock_client.clone.return_value = mock_client
     mock_client.schema = MagicMock()
     mock_client.schema.get = AsyncMock(return_value=MagicMock())
     mock_client.execute_graphql = AsyncMock(side_effect=Exception("no server"))
 
-    instance = transform_cls(
+    return transform_cls(
         client=mock_client,
         infrahub_node=MagicMock(),
         root_directory=str(PROJECT_ROOT),
     )
+
+
+def _run_transform(transform_cls: type, data: dict) -> str:
+    """Run a transform against data using a mock client (no server needed)."""
+    instance = make_transform(transform_cls)
     loop = asyncio.new_event_loop()
     try:
         return loop.run_until_complete(instance.transform(data))
@@ -69,21 +99,7 @@ def _run_transform(transform_cls: type, data: dict) -> str:
 
 
 def _fixture_params() -> list:
-    if not CONFIGS_DIR.exists():
-        return []
-    params = []
-    for d in sorted(CONFIGS_DIR.iterdir()):
-        if not d.is_dir():
-            continue
-        input_file = d / "input.json"
-        output_file = d / "output.txt"
-        if not input_file.exists() or not output_file.exists():
-            continue
-        for prefix, cls in _PREFIX_TO_CLASS:
-            if d.name.startswith(prefix + "_"):
-                params.append(pytest.param(cls, d, id=d.name))
-                break
-    return params
+    return [pytest.param(cls, d, id=d.name) for d in fixture_dirs() if (cls := transform_class_for(d)) is not None]
 
 
 @pytest.mark.parametrize("transform_cls,fixture_dir", _fixture_params())
@@ -0,0 +1,633 @@
+"""End-to-end generator benchmark against the in-memory Infrahub client.
+
+Seeds an ``InMemoryInfrahubClient`` with what the bootstrap and demo object
+files would have loaded for one data center (parent pools, device templates,
+designs, DC, pods, suites, racks and optionally servers), then runs the real
+generators in the order Infrahub would trigger them:
+
+    DCTopologyGenerator → PodTopologyGenerator (per pod)
+    → RackGenerator (network racks first, then the rest)
+    → EndpointConnectivityGenerator (per server)
+
+Each run goes through ``InfrahubGenerator.run()`` (stored query, tracking
+group, unused-node cleanup), so the recorded client calls and round trips are
+what the generators would cost against a server. The stored GraphQL queries
+are answered by the resolvers below, which return the same response shape as
+``queries/topology/add/*.gql``.
+
+Example:
+    >>> dc = load_data_centers(DATA_DIR / "demos" / "01_data_center" / "dc1")[0]
+    >>> result = asyncio.run(GeneratorBenchmark(dc, latency=0.002).run())
+    >>> result.as_dict()["totals"]["round_trips"]
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from infrahub_sdk.node import InfrahubNode
+
+from generators.add.dc import DCTopologyGenerator
+from generators.add.endpoint import EndpointConnectivityGenerator
+from generators.add.pod import PodTopologyGenerator
+from generators.add.rack import RackGenerator
+from generators.common import CommonGenerator
+from .memory_client import ClientStats, InMemoryInfrahubClient, InMemoryStore, _Record
+from generators.simulator import DEFAULT_PARENT_POOLS, DataCenterSpec, InterfaceTemplate, RackSpec
+
+SERVER_TEMPLATE = "benchmark-server"
+SERVER_INTERFACES = (
+    InterfaceTemplate("eth0", "uplink", "100gbase-x-qsfp28"),
+    InterfaceTemplate("eth1", "uplink", "100gbase-x-qsfp28"),
+)
+"""Dual-homed 100G server, like ``data/demos/06_servers`` (matches ToR/leaf customer ports)."""
+DEVICE_GROUPS = ("super-spines", "spines", "leafs", "tors", "endpoints")
+
+
+# ============================================================================
+# GraphQL Response Builders
+# ============================================================================
+
+
+def _attrs(record: _Record, *names: str) -> dict[str, Any]:
+    return {name: {"value": record.attributes.get(name)} for name in names}
+
+
+def _node(store: InMemoryStore, record_id: str | None, build: Any) -> dict[str, Any]:
+    record = store.records.get(record_id or "")
+    return {"node": build(record) if record is not None else None}
+
+
+def _edges(records: Iterable[Any], build: Any) -> dict[str, Any]:
+    return {"edges": [{"node": build(record)} for record in records]}
+
+
+def _pool(record: _Record) -> dict[str, Any]:
+    return {"id": record.id, **_attrs(record, "name")}
+
+
+def _template(store: InMemoryStore, record: _Record, interface_role: str, with_role: bool = False) -> dict[str, Any]:
+    interfaces = [intf for intf in store.templates.get(record.id, ()) if intf.role == interface_role]
+    return {
+        "id": record.id,
+        **_attrs(record, "template_name"),
+        "platform": {"node": None},
+        "device_type": {"node": None},
+        "interfaces": _edges(
+            interfaces,
+            lambda intf: {"name": {"value": intf.name}, **({"role": {"value": intf.role}} if with_role else {})},
+        ),
+    }
+
+
+def _dc_design(record: _Record) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        **_attrs(
+            record,
+            "routing_strategy",
+            "underlay_protocol",
+            "max_pods",
+            "max_super_spines_per_fabric",
+            "max_spines_per_pod",
+        ),
+    }
+
+
+def _pod_design(record: _Record) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        **_attrs(
+            record,
+            "name",
+            "rows",
+            "compute_racks_per_row",
+            "network_racks_per_row",
+            "max_leafs_per_network_rack",
+            "max_tors_per_network_rack",
+            "max_tors_per_compute_rack",
+            "max_spines_per_pod",
+        ),
+    }
+
+
+def _physical_interface(store: InMemoryStore, record: _Record) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        **_attrs(record, "name", "interface_type", "role", "status"),
+        "cable": _node(store, record.one.get("cable"), lambda cable: {"id": cable.id}),
+    }
+
+
+def resolve_topology_dc(store: InMemoryStore, variables: dict[str, Any]) -> dict[str, Any]:
+    """Answer ``queries/topology/add/dc.gql``."""
+
+    def _build(dc: _Record) -> dict[str, Any]:
+        one = dc.one
+        return {
+            "id": dc.id,
+            **_attrs(
+                dc,
+                "name",
+                "index",
+                "amount_of_super_spines",
+                "naming_convention",
+                "overlay_technology",
+                "loopback_prefix_length",
+                "technical_prefix_length",
+                "management_prefix_length",
+            ),
+            "design": _node(store, one.get("design"), _dc_design),
+            **{
+                name: _node(store, one.get(name), _pool)
+                for name in ("loopback_pool", "technical_pool", "management_pool", "super_spine_asn_pool")
+            },
+            "children": _edges(
+                store.find("TopologyPod", parent__ids=[dc.id]),
+                lambda pod: {"id": pod.id, **_attrs(pod, "checksum")},
+            ),
+            "super_spine_template": _node(
+                store, one.get("super_spine_template"), lambda tpl: _template(store, tpl, "downlink")
+            ),
+        }
+
+    return {"TopologyDeployment": _edges(store.find("TopologyDeployment", name__value=variables["name"]), _build)}
+
+
+def resolve_topology_pod(store: InMemoryStore, variables: dict[str, Any]) -> dict[str, Any]:
+    """Answer ``queries/topology/add/pod.gql``."""
+
+    def _dc(dc: _Record) -> dict[str, Any]:
+        return {
+            "id": dc.id,
+            "devices": _edges(
+                store.find("DcimPhysicalDevice", deployment__ids=[dc.id], role__value="super-spine"),
+                lambda device: {"id": device.id, **_attrs(device, "name", "role")},
+            ),
+            **_attrs(
+                dc,
+                "name",
+                "index",
+                "amount_of_super_spines",
+                "naming_convention",
+                "overlay_technology",
+                "fabric_interface_sorting_method",
+            ),
+            "super_spine_template": _node(
+                store, dc.one.get("super_spine_template"), lambda tpl: _template(store, tpl, "downlink")
+            ),
+            "design": _node(store, dc.one.get("design"), _dc_design),
+            "super_spine_asn_pool": _node(store, dc.one.get("super_spine_asn_pool"), _pool),
+            "management_pool": _node(store, dc.one.get("management_pool"), _pool),
+        }
+
+    def _build(pod: _Record) -> dict[str, Any]:
+        one = pod.one
+        return {
+            "id": pod.id,
+            **_attrs(
+                pod,
+                "name",
+                "checksum",
+                "index",
+                "deployment_type",
+                "amount_of_spines",
+                "leaf_interface_sorting_method",
+                "spine_interface_sorting_method",
+            ),
+            "design": _node(store, one.get("design"), _pod_design),
+            "spine_template": _node(store, one.get("spine_template"), lambda tpl: _template(store, tpl, "uplink")),
+            **{name: _node(store, one.get(name), _pool) for name in ("loopback_pool", "prefix_pool", "asn_pool")},
+            "parent": _node(store, one.get("parent"), _dc),
+        }
+
+    return {"TopologyPod": _edges(store.find("TopologyPod", name__value=variables["name"]), _build)}
+
+
+def resolve_rack(store: InMemoryStore, variables: dict[str, Any]) -> dict[str, Any]:
+    """Answer ``queries/topology/add/rack.gql``."""
+
+    def _element(element: _Record) -> dict[str, Any]:
+        return {
+            **_attrs(element, "role", "quantity"),
+            "template": _node(
+                store, element.one.get("template"), lambda tpl: _template(store, tpl, "uplink", with_role=True)
+            ),
+        }
+
+    def _spine(device: _Record) -> dict[str, Any]:
+        return {
+            "id": device.id,
+            **_attrs(device, "name"),
+            "interfaces": _edges(
+                store.find("DcimPhysicalInterface", device__ids=[device.id], role__value="downlink"),
+                lambda intf: {
+                    "id": intf.id,
+                    **_attrs(intf, "name"),
+                    "cable": _node(
+                        store, intf.one.get("cable"), lambda cable: {"id": cable.id, **_attrs(cable, "name")}
+                    ),
+                },
+            ),
+        }
+
+    def _dc(dc: _Record) -> dict[str, Any]:
+        return {
+            "id": dc.id,
+            **_attrs(dc, "name", "index", "naming_convention"),
+            "management_pool": _node(store, dc.one.get("management_pool"), _pool),
+            "design": _node(
+                store,
+                dc.one.get("design"),
+                lambda design: {"id": design.id, **_attrs(design, "routing_strategy", "underlay_protocol")},
+            ),
+        }
+
+    def _pod(pod: _Record) -> dict[str, Any]:
+        one = pod.one
+        return {
+            "id": pod.id,
+            **_attrs(
+                pod,
+                "name",
+                "index",
+                "deployment_type",
+                "amount_of_spines",
+                "leaf_interface_sorting_method",
+                "spine_interface_sorting_method",
+            ),
+            "design": _node(store, one.get("design"), _pod_design),
+            "parent": _node(store, one.get("parent"), _dc),
+            "loopback_pool": _node(store, one.get("loopback_pool"), lambda pool: {"id": pool.id}),
+            "prefix_pool": _node(store, one.get("prefix_pool"), lambda pool: {"id": pool.id}),
+            "asn_pool": _node(store, one.get("asn_pool"), _pool),
+            "spine_template": _node(store, one.get("spine_template"), lambda tpl: _template(store, tpl, "downlink")),
+            "devices": _edges(store.find("DcimPhysicalDevice", deployment__ids=[pod.id], role__value="spine"), _spine),
+        }
+
+    def _build(rack: _Record) -> dict[str, Any]:
+        elements = [store.records[element_id] for element_id in rack.many.get("fabric_templates", [])]
+        return {
+            "id": rack.id,
+            **_attrs(rack, "name", "checksum", "index", "rack_type", "row_index"),
+            "parent": _node(store, rack.one.get("parent"), lambda suite: _attrs(suite, "index")),
+            "leafs": _edges((e for e in elements if e.attributes.get("role") == "leaf"), _element),
+            "tors": _edges((e for e in elements if e.attributes.get("role") == "tor"), _element),
+            "pod": _node(store, rack.one.get("pod"), _pod),
+        }
+
+    return {"LocationRack": _edges(store.find("LocationRack", name__value=variables["name"]), _build)}
+
+
+def resolve_endpoint_connectivity(store: InMemoryStore, variables: dict[str, Any]) -> dict[str, Any]:
+    """Answer ``queries/topology/add/endpoint.gql``."""
+
+    def _interfaces(device: _Record) -> dict[str, Any]:
+        return _edges(
+            store.find("DcimPhysicalInterface", device__ids=[device.id]),
+            lambda intf: _physical_interface(store, intf),
+        )
+
+    def _rack_device(device: _Record) -> dict[str, Any]:
+        return {
+            "id": device.id,
+            **_attrs(device, "name", "role"),
+            "rack": _node(store, device.one.get("rack"), lambda rack: {"id": rack.id, **_attrs(rack, "row_index")}),
+            "interfaces": _interfaces(device),
+        }
+
+    def _pod(pod: _Record) -> dict[str, Any]:
+        return {
+            "id": pod.id,
+            **_attrs(pod, "name", "deployment_type", "index"),
+            "parent": _node(store, pod.one.get("parent"), lambda dc: {"id": dc.id, **_attrs(dc, "name")}),
+        }
+
+    def _rack(rack: _Record) -> dict[str, Any]:
+        return {
+            "id": rack.id,
+            **_attrs(rack, "name", "index", "row_index", "rack_type"),
+            "pod": _node(store, rack.one.get("pod"), _pod),
+            "devices": _edges(
+                store.find("DcimPhysicalDevice", rack__ids=[rack.id], role__values=["leaf", "tor"]), _rack_device
+            ),
+        }
+
+    def _build(device: _Record) -> dict[str, Any]:
+        return {
+            "id": device.id,
+            **_attrs(device, "name", "role"),
+            "rack": _node(store, device.one.get("rack"), _rack),
+            "interfaces": _interfaces(device),
+        }
+
+    return {"DcimDevice": _edges(store.find("DcimDevice", name__value=variables["device_name"]), _build)}
+
+
+QUERY_RESOLVERS = {
+    "topology_dc": resolve_topology_dc,
+    "topology_pod": resolve_topology_pod,
+    "rack": resolve_rack,
+    "endpoint_connectivity": resolve_endpoint_connectivity,
+}
+
+
+# ============================================================================
+# Seeding
+# ============================================================================
+
+
+def seed_fabric(client: InMemoryInfrahubClient, dc: DataCenterSpec, servers_per_rack: int = 0) -> list[str]:
+    """Seed ``client`` with the bootstrap and demo objects for ``dc``.
+
+    ``servers_per_rack`` servers (``SERVER_INTERFACES``) are added to every non-network rack.
+
+    Returns:
+        Names of the seeded servers.
+    """
+    for name, query in QUERY_RESOLVERS.items():
+        client.register_query(name, query)
+
+    client.seed("IpamNamespace", {"name": "default", "default": True})
+    client.seed("BuiltinTag", {"name": "fabric-p2p"})
+    for group in DEVICE_GROUPS:
+        client.seed("CoreStandardGroup", {"name": group})
+    for name, prefix in DEFAULT_PARENT_POOLS.items():
+        client.add_prefix_pool(name, prefix)
+
+    template_ids = {
+        name: client.add_device_template(name, template.interfaces).id for name, template in dc.templates.items()
+    }
+
+    dc_design = client.seed("TopologyDataCenterDesign", dc.design.model_dump(exclude={"id"}) | {"name": dc.design.id})
+    dc_node = client.seed(
+        "TopologyDataCenter",
+        {
+            "name": dc.name,
+            "index": dc.index,
+            "amount_of_super_spines": dc.amount_of_super_spines,
+            "naming_convention": dc.naming_convention,
+            "overlay_technology": dc.overlay_technology,
+            "fabric_interface_sorting_method": dc.fabric_interface_sorting_method,
+            "loopback_prefix_length": dc.loopback_prefix_length,
+            "technical_prefix_length": dc.technical_prefix_length,
+            "management_prefix_length": dc.management_prefix_length,
+            "design": dc_design.id,
+            "super_spine_template": template_ids[dc.super_spine_template],
+        },
+    )
+
+    pod_ids: dict[int, str] = {}
+    for pod in dc.pods:
+        design_id = None
+        if pod.design is not None:
+            design_id = client.seed("TopologyPodDesign", pod.design.model_dump(exclude={"id"})).id
+        pod_ids[pod.index] = str(
+            client.seed(
+                "TopologyPod",
+                {
+                    "name": pod.name,
+                    "index": pod.index,
+                    "parent": dc_node.id,
+                    "design": design_id,
+                    "deployment_type": pod.deployment_type,
+                    "amount_of_spines": pod.amount_of_spines,
+                    "leaf_interface_sorting_method": pod.leaf_interface_sorting_method,
+                    "spine_interface_sorting_method": pod.spine_interface_sorting_method,
+                    "spine_template": template_ids[pod.spine_template],
+                },
+            ).id
+        )
+
+    suite_ids = {
+        index: client.seed("LocationSuite", {"name": f"{dc.fabric_name}-suite-{index}", "index": index}).id
+        for index in sorted({rack.suite_index for rack in dc.racks})
+    }
+
+    servers: list[str] = []
+    server_template = client.add_device_template(SERVER_TEMPLATE, SERVER_INTERFACES).id
+    for rack in dc.racks:
+        elements = [
+            client.seed(
+                "TopologyElement",
+                {
+                    "name": f"{rack.name}-{role.role}-{position}",
+                    "role": role.role,
+                    "quantity": role.quantity,
+                    "template": template_ids[role.template],
+                },
+            ).id
+            for position, role in enumerate(rack.roles, start=1)
+        ]
+        rack_node = client.seed(
+            "LocationRack",
+            {
+                "name": rack.name,
+                "index": rack.index,
+                "row_index": rack.row_index,
+                "rack_type": rack.rack_type,
+                "pod": pod_ids[rack.pod_index],
+                "parent": suite_ids[rack.suite_index],
+                "fabric_templates": elements,
+            },
+        )
+        if rack.rack_type == "network":
+            continue
+        for position in range(1, servers_per_rack + 1):
+            name = f"{rack.name}-srv-{position:02d}".lower()
+            client.seed(
+                "DcimPhysicalDevice",
+                {
+                    "name": name,
+                    "role": "endpoint",
+                    "status": "active",
+                    "object_template": server_template,
+                    "rack": rack_node.id,
+                },
+            )
+            servers.append(name)
+    return servers
+
+
+def rack_order(racks: Iterable[RackSpec]) -> list[RackSpec]:
+    """Order racks as their checksums cascade: per pod, network racks first, then by row and index."""
+    return sorted(racks, key=lambda rack: (rack.pod_index, rack.rack_type != "network", rack.row_index, rack.index))
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+
+class _ErrorCollector(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(level=logging.ERROR)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@dataclass
+class GeneratorRun:
+    generator: str
+    target: str
+    seconds: float
+    stats: ClientStats
+    errors: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "generator": self.generator,
+            "target": self.target,
+            "seconds": round(self.seconds, 4),
+            "errors": self.errors,
+            **self.stats.as_dict(),
+        }
+
+
+@dataclass
+class BenchmarkResult:
+    data_center: str
+    latency: float
+    runs: list[GeneratorRun]
+    stats: ClientStats
+    objects: dict[str, int]
+
+    @property
+    def seconds(self) -> float:
+        return sum(run.seconds for run in self.runs)
+
+    @property
+    def errors(self) -> list[str]:
+        return [f"{run.generator}[{run.target}]: {error}" for run in self.runs for error in run.errors]
+
+    def by_generator(self) -> dict[str, dict[str, Any]]:
+        """Aggregate runs per generator class (runs, seconds, calls, round trips)."""
+        summary: dict[str, dict[str, Any]] = {}
+        for run in self.runs:
+            entry = summary.setdefault(run.generator, {"runs": 0, "seconds": 0.0, "calls": 0, "round_trips": 0})
+            entry["runs"] += 1
+            entry["seconds"] = round(entry["seconds"] + run.seconds, 4)
+            entry["calls"] += sum(run.stats.calls.values())
+            entry["round_trips"] += run.stats.round_trips
+        return summary
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "data_center": self.data_center,
+            "latency_s": self.latency,
+            "seconds": round(self.seconds, 4),
+            "totals": self.stats.as_dict(),
+            "objects": self.objects,
+            "generators": self.by_generator(),
+            "errors": self.errors,
+            "runs": [run.as_dict() for run in self.runs],
+        }
+
+
+class GeneratorBenchmark:
+    """Run the DC, Pod, Rack and Endpoint generators for one data center in memory.
+
+    Args:
+        dc: Data center to build (see ``load_data_centers`` / ``replicate_rows``).
+        latency: Simulated seconds per server round trip.
+        servers_per_rack: Servers seeded in every non-network rack (0 skips endpoints).
+        client: Pre-built client (defaults to a fresh ``InMemoryInfrahubClient``).
+    """
+
+    def __init__(
+        self,
+        dc: DataCenterSpec,
+        latency: float = 0.0,
+        servers_per_rack: int = 0,
+        client: InMemoryInfrahubClient | None = None,
+    ) -> None:
+        self.dc = dc
+        self.latency = latency
+        self.client = client or InMemoryInfrahubClient(latency=latency)
+        self.servers = seed_fabric(self.client, dc, servers_per_rack)
+        self.runs: list[GeneratorRun] = []
+
+    async def run(self) -> BenchmarkResult:
+        """Run every generator once, in trigger order, and return timings and call counts."""
+        await self.run_generator(DCTopologyGenerator, "add_dc", "topology_dc", {"name": self.dc.name})
+        for pod in self.dc.pods:
+            await self.run_generator(PodTopologyGenerator, "add_pod", "topology_pod", {"name": pod.name})
+        for rack in rack_order(self.dc.racks):
+            await self.run_generator(RackGenerator, "add_rack", "rack", {"name": rack.name})
+        for server in self.servers:
+            await self.run_generator(
+                EndpointConnectivityGenerator, "add_endpoint", "endpoint_connectivity", {"device_name": server}
+            )
+        return self.result()
+
+    async def run_generator(
+        self,
+        generator_class: type[CommonGenerator],
+        definition: str,
+        query: str,
+        params: dict[str, Any],
+    ) -> GeneratorRun:
+        """Run one generator through ``InfrahubGenerator.run()`` and record its cost."""
+        logger = logging.getLogger(f"generators.benchmark.{definition}")
+        collector = _ErrorCollector()
+        logger.addHandler(collector)
+
+        generator = generator_class(
+            query=query,
+            client=self.client,  # type: ignore[arg-type]
+            infrahub_node=InfrahubNode,
+            branch="main",
+            params=params,
+            execute_after_merge=False,
+            logger=logger,
+        )
+        generator.interface_settle_delay = 0
+
+        before = self.client.stats.snapshot()
+        start = time.perf_counter()
+        try:
+            await generator.run(identifier=definition)
+        except Exception as exc:  # noqa: BLE001 - a failed generator is a benchmark result, not a crash
+            collector.messages.append(f"{type(exc).__name__}: {exc}")
+        finally:
+            logger.removeHandler(collector)
+
+        run = GeneratorRun(
+            generator=generator_class.__name__,
+            target=next(iter(params.values())),
+            seconds=time.perf_counter() - start,
+            stats=self.client.stats - before,
+            errors=collector.messages,
+        )
+        self.runs.append(run)
+        return run
+
+    def result(self) -> BenchmarkResult:
+        store = self.client.store
+        objects = {
+            kind: len(store.by_kind.get(kind, {}))
+            for kind in (
+                "DcimPhysicalDevice",
+                "DcimPhysicalInterface",
+                "DcimCable",
+                "IpamIPAddress",
+                "IpamPrefix",
+                "RoutingAutonomousSystem",
+                "ManagedBGP",
+                "ManagedBGPPeering",
+                "ManagedOSPF",
+                "RoutingOSPFInterface",
+            )
+        }
+        return BenchmarkResult(
+            data_center=self.dc.name,
+            latency=self.latency,
+            runs=list(self.runs),
+            stats=self.client.stats.snapshot(),
+            objects=objects,
+        )
@@ -0,0 +1,1086 @@
+"""In-memory stand-in for the subset of ``InfrahubClient`` used by the generators.
+
+``InMemoryInfrahubClient`` keeps nodes in a process-local store and implements
+what the DC / Pod / Rack / Endpoint generators call on ``self.client``:
+
+- ``create`` / ``get`` / ``filters`` / ``create_batch`` and ``node.save`` / ``node.delete``
+  with upsert by id or human-friendly id
+- ``allocate_next_ip_address`` / ``allocate_next_ip_prefix`` backed by the
+  simulator pools, and ``{"from_pool": ...}`` attribute values backed by
+  in-memory CoreNumberPool allocations
+- ``group_context`` and ``start_tracking``, including group update and
+  deletion of unused nodes when a tracked run finishes
+- ``query_gql_query`` / ``execute_graphql`` dispatched to registered resolvers
+- device templates: saving a device with ``object_template`` instantiates the
+  template's physical interfaces, like the server does
+
+Every call is counted in ``ClientStats`` and each server round trip can be
+delayed by a configurable simulated latency, so generator cost (and round-trip
+regressions) can be measured end to end on one machine. See
+``tests/unit/simulators/benchmark.py`` for the harness that drives the generators.
+
+The schema is not loaded: relationship names and human-friendly ids are taken
+from the small tables below, which cover the kinds the generators write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+from infrahub_sdk.batch import InfrahubBatch
+from infrahub_sdk.exceptions import NodeNotFoundError, ValidationError
+from infrahub_sdk.query_groups import InfrahubGroupContextBase
+
+from generators.simulator import InMemoryNumberPool, InMemoryPrefixPool, InterfaceTemplate
+
+# ============================================================================
+# Schema Tables
+# ============================================================================
+
+ONE_RELATIONSHIPS = frozenset(
+    {
+        "area",
+        "asn_pool",
+        "cable",
+        "deployment",
+        "design",
+        "device",
+        "device_type",
+        "ip_address",
+        "ip_namespace",
+        "l3_vni_pool",
+        "local_as",
+        "loopback_pool",
+        "management_pool",
+        "object_template",
+        "ospf_process",
+        "parent",
+        "platform",
+        "pod",
+        "prefix_pool",
+        "primary_address",
+        "rack",
+        "remote_as",
+        "router_id",
+        "spine_template",
+        "super_spine_asn_pool",
+        "super_spine_template",
+        "technical_pool",
+        "template",
+        "vlan_pool",
+        "vni_pool",
+    }
+)
+"""Cardinality-one relationships: values are node ids, ``{"id"}`` / ``{"hfid"}`` refs or nodes."""
+
+MANY_RELATIONSHIPS = frozenset(
+    {
+        "bgp_processes",
+        "children",
+        "device_capabilities",
+        "devices",
+        "endpoints",
+        "interfaces",
+        "member_of_groups",
+        "members",
+        "resources",
+        "tags",
+    }
+)
+"""Cardinality-many relationships."""
+
+HFID_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "DcimPhysicalInterface": ("device__name", "name"),
+    "DcimVirtualInterface": ("device__name", "name"),
+    "IpamIPAddress": ("address",),
+    "IpamPrefix": ("prefix",),
+    "RoutingAutonomousSystem": ("asn",),
+    "TemplateDcimPhysicalDevice": ("template_name",),
+}
+"""Human-friendly id components per kind (``rel__attr`` reads the peer); default is ``name``."""
+
+GENERIC_KINDS: dict[str, tuple[str, ...]] = {
+    "DcimDevice": ("DcimPhysicalDevice", "DcimVirtualDevice"),
+    "DcimInterface": ("DcimPhysicalInterface", "DcimVirtualInterface"),
+    "TopologyDeployment": ("TopologyDataCenter", "TopologyPod"),
+    "CoreGroup": ("CoreStandardGroup", "CoreGeneratorGroup", "CoreGeneratorAwareGroup"),
+}
+
+GROUP_KINDS = frozenset(GENERIC_KINDS["CoreGroup"])
+
+_QUERY_OPTIONS = frozenset(
+    {
+        "at",
+        "branch",
+        "exclude",
+        "fragment",
+        "include",
+        "include_metadata",
+        "limit",
+        "offset",
+        "order",
+        "parallel",
+        "partial_match",
+        "populate_store",
+        "prefetch_relationships",
+        "priority",
+        "property",
+        "query_name",
+        "timeout",
+    }
+)
+"""``get`` / ``filters`` keyword arguments that are not node filters."""
+
+
+def _kind_name(kind: str | type) -> str:
+    return kind if isinstance(kind, str) else kind.__name__
+
+
+def _concrete_kinds(kind: str | type) -> tuple[str, ...]:
+    name = _kind_name(kind)
+    return GENERIC_KINDS.get(name, (name,))
+
+
+def _same(stored: Any, expected: Any) -> bool:
+    return stored == expected or (stored is not None and str(stored) == str(expected))
+
+
+# ============================================================================
+# Call Statistics
+# ============================================================================
+
+
+@dataclass
+class ClientStats:
+    """Counts every client call and the simulated server round trips it cost.
+
+    ``calls`` is keyed by method (``filters``, ``save``, ...), ``calls_by_kind``
+    by ``"<method>:<kind>"``. ``create`` and ``create_batch`` are local (no round
+    trip), IP allocations cost two (mutation + fetch), like the SDK.
+    """
+
+    calls: Counter[str] = field(default_factory=Counter)
+    calls_by_kind: Counter[str] = field(default_factory=Counter)
+    round_trips: int = 0
+    simulated_latency: float = 0.0
+    nodes_created: int = 0
+    nodes_updated: int = 0
+    nodes_deleted: int = 0
+
+    def record(self, method: str, kind: str | None = None, round_trips: int = 1, latency: float = 0.0) -> None:
+        self.calls[method] += 1
+        if kind:
+            self.calls_by_kind[f"{method}:{kind}"] += 1
+        self.round_trips += round_trips
+        self.simulated_latency += latency
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.calls_by_kind.clear()
+        self.round_trips = 0
+        self.simulated_latency = 0.0
+        self.nodes_created = self.nodes_updated = self.nodes_deleted = 0
+
+    def snapshot(self) -> ClientStats:
+        return ClientStats(
+            calls=Counter(self.calls),
+            calls_by_kind=Counter(self.calls_by_kind),
+            round_trips=self.round_trips,
+            simulated_latency=self.simulated_latency,
+            nodes_created=self.nodes_created,
+            nodes_updated=self.nodes_updated,
+            nodes_deleted=self.nodes_deleted,
+        )
+
+    def __sub__(self, other: ClientStats) -> ClientStats:
+        return ClientStats(
+            calls=self.calls - other.calls,
+            calls_by_kind=self.calls_by_kind - other.calls_by_kind,
+            round_trips=self.round_trips - other.round_trips,
+            simulated_latency=self.simulated_latency - other.simulated_latency,
+            nodes_created=self.nodes_created - other.nodes_created,
+            nodes_updated=self.nodes_updated - other.nodes_updated,
+            nodes_deleted=self.nodes_deleted - other.nodes_deleted,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": dict(sorted(self.calls.items())),
+            "total_calls": sum(self.calls.values()),
+            "round_trips": self.round_trips,
+            "simulated_latency_s": round(self.simulated_latency, 4),
+            "nodes_created": self.nodes_created,
+            "nodes_updated": self.nodes_updated,
+            "nodes_deleted": self.nodes_deleted,
+        }
+
+
+# ============================================================================
+# Store
+# ============================================================================
+
+
+@dataclass
+class _Record:
+    kind: str
+    id: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    one: dict[str, str | None] = field(default_factory=dict)
+    many: dict[str, list[str]] = field(default_factory=dict)
+
+    def peer_ids(self, name: str) -> list[str]:
+        if name in self.many:
+            return self.many[name]
+        peer_id = self.one.get(name)
+        return [peer_id] if peer_id else []
+
+
+QueryResolver = Callable[["InMemoryStore", dict[str, Any]], dict[str, Any]]
+GraphQLHandler = Callable[["InMemoryStore", str, dict[str, Any]], dict[str, Any]]
+RoundTripObserver = Callable[[str, float], None]
+
+
+class InMemoryStore:
+    """Node records, pools and registered query resolvers shared by cloned clients."""
+
+    def __init__(self) -> None:
+        self.records: dict[str, _Record] = {}
+        self.by_kind: dict[str, dict[str, _Record]] = {}
+        self.hfid_index: dict[tuple[str, tuple[str, ...]], str] = {}
+        self.templates: dict[str, tuple[InterfaceTemplate, ...]] = {}
+        self.prefix_pools: dict[str, InMemoryPrefixPool] = {}
+        self.number_pools: dict[str, InMemoryNumberPool] = {}
+        self.allocations: dict[tuple[str, str], str] = {}
+        self.queries: dict[str, QueryResolver] = {}
+        self.graphql: dict[str, GraphQLHandler] = {"RackDevicesWithInterfaces": _rack_devices_with_interfaces}
+        self._ids = itertools.count(1)
+
+    # ---------------------------------------------------------------- lookup
+
+    def new_id(self, kind: str) -> str:
+        return f"{kind.lower()}-{next(self._ids):06d}"
+
+    def of_kind(self, kind: str | type) -> Iterator[_Record]:
+        for name in _concrete_kinds(kind):
+            yield from self.by_kind.get(name, {}).values()
+
+    def hfid(self, record: _Record) -> tuple[str, ...] | None:
+        components: list[str] = []
+        for path in HFID_ATTRIBUTES.get(record.kind, ("name",)):
+            if "__" in path:
+                rel, attr = path.split("__", 1)
+                peer = self.records.get(record.one.get(rel) or "")
+                value = peer.attributes.get(attr) if peer else None
+            else:
+                value = record.attributes.get(path)
+            if value is None:
+                return None
+            components.append(str(value))
+        return tuple(components)
+
+    def lookup_hfid(self, hfid: Iterable[str], kind: str | type | None = None) -> _Record | None:
+        key = tuple(str(part) for part in hfid)
+        kinds = _concrete_kinds(kind) if kind else tuple(self.by_kind)
+        for name in kinds:
+            record_id = self.hfid_index.get((name, key))
+            if record_id:
+                return self.records[record_id]
+        return None
+
+    def find(self, kind: str | type, **filters: Any) -> list[_Record]:
+        """Return the records of ``kind`` matching SDK-style filters (``name__value``, ``pod__ids``, ...)."""
+        ids = filters.pop("ids", None)
+        results = []
+        for record in self.of_kind(kind):
+            if ids is not None and record.id not in ids:
+                continue
+            if all(self._matches(record, key, expected) for key, expected in filters.items()):
+                results.append(record)
+        return results
+
+    def _matches(self, record: _Record, key: str, expected: Any) -> bool:
+        *path, op = key.split("__")
+        if op in ("ids", "id"):
+            wanted = set(expected) if op == "ids" else {expected}
+            return bool(wanted.intersection(record.peer_ids(path[0]))) if path else record.id in wanted
+        if op not in ("value", "values") or not 1 <= len(path) <= 2:
+            raise ValueError(f"Unsupported in-memory filter '{key}'")
+
+        def _check(value: Any) -> bool:
+            if op == "values":
+                return any(_same(value, item) for item in expected)
+            return _same(value, expected)
+
+        if len(path) == 1:
+            return _check(record.attributes.get(path[0]))
+        rel, attr = path
+        return any(
+            _check(peer.attributes.get(attr))
+            for peer in (self.records.get(peer_id) for peer_id in record.peer_ids(rel))
+            if peer is not None
+        )
+
+    # ---------------------------------------------------------------- writes
+
+    def insert(self, record: _Record) -> None:
+        self.records[record.id] = record
+        self.by_kind.setdefault(record.kind, {})[record.id] = record
+        self._index(record)
+
+    def reindex(self, record: _Record, previous: tuple[str, ...] | None) -> None:
+        if previous is not None:
+            self.hfid_index.pop((record.kind, previous), None)
+        self._index(record)
+
+    def _index(self, record: _Record) -> None:
+        hfid = self.hfid(record)
+        if hfid is not None:
+            self.hfid_index[(record.kind, hfid)] = record.id
+
+    def remove(self, record_id: str) -> _Record | None:
+        record = self.records.pop(record_id, None)
+        if record is None:
+            return None
+        self.by_kind.get(record.kind, {}).pop(record_id, None)
+        hfid = self.hfid(record)
+        if hfid is not None and self.hfid_index.get((record.kind, hfid)) == record_id:
+            del self.hfid_index[(record.kind, hfid)]
+        for other in self.records.values():
+            for name, peer_id in other.one.items():
+                if peer_id == record_id:
+                    other.one[name] = None
+            for name, peer_ids in other.many.items():
+                if record_id in peer_ids:
+                    other.many[name] = [peer for peer in peer_ids if peer != record_id]
+        return record
+
+    def instantiate_template(self, device: _Record) -> None:
+        """Create the template's physical interfaces on a new device (server-side, no round trip)."""
+        for template in self.templates.get(device.one.get("object_template") or "", ()):
+            interface = _Record(
+                kind="DcimPhysicalInterface",
+                id=self.new_id("DcimPhysicalInterface"),
+                attributes={
+                    "name": template.name,
+                    "role": template.role,
+                    "interface_type": template.interface_type,
+                    "status": "free",
+                },
+                one={"device": device.id},
+            )
+            self.insert(interface)
+
+    # ---------------------------------------------------------------- pools
+
+    def prefix_pool(self, record: _Record) -> InMemoryPrefixPool:
+        pool = self.prefix_pools.get(record.id)
+        if pool is None:
+            resources = [
+                self.records[peer_id] for peer_id in record.many.get("resources", []) if peer_id in self.records
+            ]
+            if not resources:
+                raise ValueError(f"Pool {record.attributes.get('name')} has no resources")
+            pool = InMemoryPrefixPool(
+                str(record.attributes.get("name")),
+                str(resources[0].attributes["prefix"]),
+                address_pool=record.kind == "CoreIPAddressPool",
+            )
+            self.prefix_pools[record.id] = pool
+        return pool
+
+    def number_pool(self, pool_id: str) -> InMemoryNumberPool:
+        pool = self.number_pools.get(pool_id)
+        if pool is None:
+            record = self.records.get(pool_id)
+            if record is None or record.kind != "CoreNumberPool":
+                raise ValueError(f"Number pool {pool_id} not found")
+            attrs = record.attributes
+            pool = InMemoryNumberPool(str(attrs.get("name")), int(attrs["start_range"]), int(attrs["end_range"]))
+            self.number_pools[pool_id] = pool
+        return pool
+
+
+# ============================================================================
+# Node Model
+# ============================================================================
+
+
+class InMemoryAttribute:
+    """Attribute wrapper exposing ``.value`` like the SDK."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any = None) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"InMemoryAttribute({self.value!r})"
+
+
+class InMemoryRelatedNode:
+    """Cardinality-one relationship; resolves ``id`` / ``hfid`` references lazily."""
+
+    __slots__ = ("_client", "_id", "_hfid", "_node")
+
+    def __init__(self, client: InMemoryInfrahubClient, value: Any = None) -> None:
+        self._client = client
+        self._id: str | None = None
+        self._hfid: list[str] | None = None
+        self._node: InMemoryNode | None = None
+        if isinstance(value, InMemoryNode):
+            self._node = value
+        elif isinstance(value, InMemoryRelatedNode):
+            self._id, self._hfid, self._node = value._id, value._hfid, value._node
+        elif isinstance(value, str):
+            self._id = value
+        elif isinstance(value, dict):
+            self._id = value.get("id")
+            hfid = value.get("hfid")
+            self._hfid = [hfid] if isinstance(hfid, str) else hfid
+
+    @property
+    def id(self) -> str | None:
+        if self._node is not None:
+            return self._node.id
+        if self._id:
+            return self._id
+        if self._hfid:
+            record = self._client.store.lookup_hfid(self._hfid)
+            return record.id if record else None
+        return None
+
+    @property
+    def initialized(self) -> bool:
+        return self.id is not None
+
+    @property
+    def peer(self) -> InMemoryNode | None:
+        if self._node is None:
+            record = self._client.store.records.get(self.id or "")
+            if record is not None:
+                self._node = InMemoryNode.from_record(self._client, record)
+        return self._node
+
+    @property
+    def _peer(self) -> InMemoryNode | None:
+        return self.peer
+
+    @property
+    def hfid(self) -> list[str] | None:
+        peer = self.peer
+        return peer.hfid if peer is not None else self._hfid
+
+    @property
+    def display_label(self) -> str | None:
+        peer = self.peer
+        return peer.display_label if peer is not None else None
+
+    @property
+    def typename(self) -> str | None:
+        peer = self.peer
+        return peer.get_kind() if peer is not None else None
+
+    async def fetch(self) -> None:
+        await self._client._round_trip("fetch", self.typename)
+
+    def __getattr__(self, name: str) -> Any:
+        # Prefetched peers expose their fields on the related node, like the SDK
+        if name.startswith("_"):
+            raise AttributeError(name)
+        peer = self.peer
+        if peer is None:
+            raise AttributeError(name)
+        return getattr(peer, name)
+
+    def __repr__(self) -> str:
+        return f"InMemoryRelatedNode(id={self.id!r})"
+
+
+class InMemoryRelationshipManager:
+    """Cardinality-many relationship with SDK-like ``peers`` / ``add`` / ``remove``."""
+
+    def __init__(self, client: InMemoryInfrahubClient, values: Iterable[Any] = ()) -> None:
+        self._client = client
+        self.peers: list[InMemoryRelatedNode] = []
+        self.extend(values)
+
+    @property
+    def peer_ids(self) -> list[str]:
+        return [peer_id for peer_id in (peer.id for peer in self.peers) if peer_id]
+
+    @property
+    def initialized(self) -> bool:
+        return True
+
+    def add(self, value: Any) -> None:
+        related = InMemoryRelatedNode(self._client, value)
+        if related.id is None or related.id not in self.peer_ids:
+            self.peers.append(related)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.add(value)
+
+    def remove(self, value: Any) -> None:
+        target = InMemoryRelatedNode(self._client, value).id
+        self.peers = [peer for peer in self.peers if peer.id != target]
+
+    async def fetch(self) -> None:
+        await self._client._round_trip("fetch")
+
+    def __iter__(self) -> Iterator[InMemoryRelatedNode]:
+        return iter(self.peers)
+
+    def __len__(self) -> int:
+        return len(self.peers)
+
+    def __getitem__(self, index: int) -> InMemoryRelatedNode:
+        return self.peers[index]
+
+
+_Field = InMemoryAttribute | InMemoryRelatedNode | InMemoryRelationshipManager
+
+
+class InMemoryNode:
+    """Client-side node view. Changes reach the store only on ``save()``, like SDK nodes.
+
+    Attributes and relationships are created from ``data`` on ``create`` or from
+    the stored record on ``get`` / ``filters``; reading an unknown name returns an
+    empty attribute (or relationship, per the schema tables) that is only saved
+    once it holds a value.
+    """
+
+    def __init__(self, client: InMemoryInfrahubClient, kind: str, data: dict[str, Any] | None = None) -> None:
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_kind", kind)
+        object.__setattr__(self, "_fields", {})
+        object.__setattr__(self, "_lazy", set())
+        object.__setattr__(self, "id", None)
+        for name, value in (data or {}).items():
+            if name == "id":
+                object.__setattr__(self, "id", value)
+            else:
+                setattr(self, name, value)
+
+    @classmethod
+    def from_record(cls, client: InMemoryInfrahubClient, record: _Record) -> InMemoryNode:
+        node = cls(client, record.kind)
+        object.__setattr__(node, "id", record.id)
+        fields = node._fields
+        for name, value in record.attributes.items():
+            fields[name] = InMemoryAttribute(value)
+        for name, peer_id in record.one.items():
+            fields[name] = InMemoryRelatedNode(client, peer_id)
+        for name, peer_ids in record.many.items():
+            fields[name] = InMemoryRelationshipManager(client, peer_ids)
+        return node
+
+    # ---------------------------------------------------------------- fields
+
+    def _make_field(self, name: str, value: Any) -> _Field:
+        client = self._client
+        if isinstance(value, (InMemoryAttribute, InMemoryRelatedNode, InMemoryRelationshipManager)):
+            return value
+        if name in MANY_RELATIONSHIPS or isinstance(value, (list, tuple)):
+            return InMemoryRelationshipManager(client, value or ())
+        if (
+            name in ONE_RELATIONSHIPS
+            or isinstance(value, InMemoryNode)
+            or (isinstance(value, dict) and ("id" in value or "hfid" in value) and "from_pool" not in value)
+        ):
+            return InMemoryRelatedNode(client, value)
+        if isinstance(value, dict) and "value" in value:
+            value = value["value"]
+        return InMemoryAttribute(value)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        fields = self._fields
+        if name not in fields:
+            fields[name] = self._make_field(name, None)
+            self._lazy.add(name)
+        return fields[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "id" or name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        self._fields[name] = self._make_field(name, value)
+        self._lazy.discard(name)
+
+    # ---------------------------------------------------------------- identity
+
+    def get_kind(self) -> str:
+        return self._kind
+
+    @property
+    def typename(self) -> str:
+        return self._kind
+
+    @property
+    def hfid(self) -> list[str] | None:
+        components: list[str] = []
+        for path in HFID_ATTRIBUTES.get(self._kind, ("name",)):
+            rel, _, attr = path.partition("__")
+            field_ = self._fields.get(rel)
+            if attr:
+                peer = field_.peer if isinstance(field_, InMemoryRelatedNode) else None
+                value = getattr(peer._fields.get(attr), "value", None) if peer is not None else None
+            else:
+                value = field_.value if isinstance(field_, InMemoryAttribute) else None
+            if value is None or isinstance(value, dict):
+                # Unset, or still a {"from_pool": ...} request: no hfid until saved
+                return None
+            components.append(str(value))
+        return components
+
+    @property
+    def display_label(self) -> str:
+        hfid = self.hfid
+        return " ".join(hfid) if hfid else f"{self._kind} {self.id}"
+
+    # ---------------------------------------------------------------- persistence
+
+    async def save(self, allow_upsert: bool = False, update_group_context: bool | None = None, **_: Any) -> None:
+        await self._client._save(self, allow_upsert=allow_upsert, update_group_context=update_group_context)
+
+    async def delete(self, **_: Any) -> None:
+        await self._client.delete(kind=self._kind, id=self.id)
+
+    def __repr__(self) -> str:
+        return f"InMemoryNode({self._kind}, id={self.id!r}, hfid={self.hfid!r})"
+
+
+# ============================================================================
+# Group Context
+# ============================================================================
+
+
+class InMemoryGroupContext(InfrahubGroupContextBase):
+    """Tracks related node ids during a run and updates the generator group on exit."""
+
+    def __init__(self, client: InMemoryInfrahubClient) -> None:
+        super().__init__()
+        self.client = client
+        self.branch: str | None = None
+
+    async def add_related_nodes(self, ids: list[str], update_group_context: bool | None = None) -> None:
+        if update_group_context is not False and (self.client.tracking or update_group_context):
+            self.related_node_ids.extend(ids)
+
+    async def add_related_groups(self, ids: list[str], update_group_context: bool | None = None) -> None:
+        if update_group_context is not False and (self.client.tracking or update_group_context):
+            self.related_group_ids.extend(ids)
+
+    async def update_group(self) -> None:
+        """Upsert the tracking group and, if requested, delete members no longer produced."""
+        members = list(dict.fromkeys(self.related_group_ids + self.related_node_ids))
+        if not members:
+            return
+
+        group_name = self._generate_group_name()
+        existing = None
+        if self.delete_unused_nodes:
+            existing = await self.client.get(kind=self.group_type, name__value=group_name, raise_when_missing=False)
+
+        group = await self.client.create(kind=self.group_type, data={"name": group_name, "members": members})
+        await group.save(allow_upsert=True, update_group_context=False)
+
+        if existing is None:
+            return
+        self.unused_member_ids = sorted(set(existing.members.peer_ids) - set(members))
+        for member_id in self.unused_member_ids:
+            record = self.client.store.records.get(member_id)
+            if record is not None:
+                await self.client.delete(kind=record.kind, id=member_id)
+
+
+# ============================================================================
+# Client
+# ============================================================================
+
+
+class InMemoryInfrahubClient:
+    """Drop-in for the ``InfrahubClient`` calls made by the generators.
+
+    Args:
+        latency: Simulated seconds per server round trip (``0`` disables sleeping).
+        latency_overrides: Per-method latency, e.g. ``{"filters": 0.02}``.
+        max_concurrent_execution: Concurrency of ``create_batch()`` batches (SDK default 5).
+        store: Shared store (set by ``clone``).
+        stats: Shared call statistics (set by ``clone``).
+        round_trip_observers: Callbacks ``(method, simulated_seconds)`` run after every
+            round trip (see ``generators/instrumentation.py``).
+
+    Example:
+        >>> client = InMemoryInfrahubClient(latency=0.005)
+        >>> node = await client.create(kind="LocationRack", data={"name": "R1"})
+        >>> await node.save(allow_upsert=True)
+        >>> client.stats.as_dict()["round_trips"]
+        1
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_overrides: dict[str, float] | None = None,
+        max_concurrent_execution: int = 5,
+        store: InMemoryStore | None = None,
+        stats: ClientStats | None = None,
+        round_trip_observers: list[RoundTripObserver] | None = None,
+    ) -> None:
+        self.latency = latency
+        self.latency_overrides = latency_overrides or {}
+        self.max_concurrent_execution = max_concurrent_execution
+        self.store = store if store is not None else InMemoryStore()
+        self.stats = stats if stats is not None else ClientStats()
+        self.round_trip_observers = round_trip_observers if round_trip_observers is not None else []
+        self.group_context = InMemoryGroupContext(self)
+        self.tracking = False
+        self.default_branch = "main"
+
+    def clone(self, branch: str | None = None) -> InMemoryInfrahubClient:
+        """Return a client sharing store, stats and latency, with its own group context."""
+        return InMemoryInfrahubClient(
+            latency=self.latency,
+            latency_overrides=self.latency_overrides,
+            max_concurrent_execution=self.max_concurrent_execution,
+            store=self.store,
+            stats=self.stats,
+            round_trip_observers=self.round_trip_observers,
+        )
+
+    # ---------------------------------------------------------------- tracking
+
+    def start_tracking(
+        self,
+        identifier: str | None = None,
+        params: dict[str, Any] | None = None,
+        delete_unused_nodes: bool = False,
+        group_type: str | None = None,
+        group_params: dict[str, Any] | None = None,
+        branch: str | None = None,
+    ) -> InMemoryInfrahubClient:
+        self.tracking = True
+        self.group_context = InMemoryGroupContext(self)
+        self.group_context.set_properties(
+            identifier=identifier or "python-sdk",
+            params=params,
+            delete_unused_nodes=delete_unused_nodes,
+            group_type=group_type,
+            group_params=group_params,
+            branch=branch,
+        )
+        return self
+
+    async def __aenter__(self) -> InMemoryInfrahubClient:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None and self.tracking:
+            await self.group_context.update_group()
+        self.tracking = False
+
+    # ---------------------------------------------------------------- seeding
+
+    def seed(self, kind: str | type, data: dict[str, Any]) -> InMemoryNode:
+        """Insert a node without counting a call (fixtures, benchmark setup)."""
+        node = InMemoryNode(self, _kind_name(kind), data)
+        record = self._write(node, allow_upsert=True)
+        return InMemoryNode.from_record(self, record)
+
+    def add_device_template(self, name: str, interfaces: Iterable[InterfaceTemplate]) -> InMemoryNode:
+        """Seed a TemplateDcimPhysicalDevice whose interfaces are created on every device using it."""
+        template = self.seed("TemplateDcimPhysicalDevice", {"template_name": name, "name": name})
+        self.store.templates[str(template.id)] = tuple(interfaces)
+        return template
+
+    def add_prefix_pool(self, name: str, prefix: str) -> InMemoryNode:
+        """Seed a CoreIPPrefixPool with a single IpamPrefix resource."""
+        resource = self.seed("IpamPrefix", {"prefix": prefix, "is_pool": True})
+        return self.seed("CoreIPPrefixPool", {"name": name, "resources": [resource.id]})
+
+    def register_query(self, name: str, resolver: QueryResolver) -> None:
+        """Answer ``query_gql_query(name=...)`` (a generator's stored query) with ``resolver``."""
+        self.store.queries[name] = resolver
+
+    def register_graphql(self, operation: str, handler: GraphQLHandler) -> None:
+        """Answer ``execute_graphql`` for queries named ``operation``."""
+        self.store.graphql[operation] = handler
+
+    # ---------------------------------------------------------------- SDK API
+
+    async def create(self, kind: str | type, data: dict | None = None, **kwargs: Any) -> InMemoryNode:
+        kind_name = _kind_name(kind)
+        self.stats.record("create", kind_name, round_trips=0)
+        fields = dict(data or {})
+        fields.update({k: v for k, v in kwargs.items() if k not in ("branch", "timeout")})
+        return InMemoryNode(self, kind_name, fields)
+
+    async def create_batch(self, return_exceptions: bool = False) -> InfrahubBatch:
+        self.stats.record("create_batch", round_trips=0)
+        return InfrahubBatch(
+            max_concurrent_execution=self.max_concurrent_execution, return_exceptions=return_exceptions
+        )
+
+    async def filters(self, kind: str | type, **kwargs: Any) -> list[InMemoryNode]:
+        kind_name = _kind_name(kind)
+        await self._round_trip("filters", kind_name)
+        return self._query(kind_name, kwargs)
+
+    async def get(
+        self,
+        kind: str | type,
+        raise_when_missing: bool = True,
+        id: str | None = None,
+        hfid: list[str] | None = None,
+        **kwargs: Any,
+    ) -> InMemoryNode | None:
+        kind_name = _kind_name(kind)
+        await self._round_trip("get", kind_name)
+        if hfid is not None:
+            record = self.store.lookup_hfid(hfid, kind_name)
+            nodes = [InMemoryNode.from_record(self, record)] if record else []
+        else:
+            if id is not None:
+                kwargs["ids"] = [id]
+            nodes = self._query(kind_name, kwargs)
+        if len(nodes) > 1:
+            raise IndexError("More than 1 node returned")
+        if not nodes:
+            if raise_when_missing:
+                filters = {k: v for k, v in kwargs.items() if k not in _QUERY_OPTIONS}
+                raise NodeNotFoundError(
+                    identifier={key: [str(value)] for key, value in {**filters, "hfid": hfid}.items() if value},
+                    node_type=kind_name,
+                )
+            return None
+        return nodes[0]
+
+    async def delete(self, kind: str | type, id: str | None) -> None:
+        await self._round_trip("delete", _kind_name(kind))
+        if id and self.store.remove(id) is not None:
+            self.stats.nodes_deleted += 1
+
+    async def allocate_next_ip_prefix(
+        self,
+        resource_pool: Any,
+        kind: Any = None,
+        identifier: str | None = None,
+        prefix_length: int | None = None,
+        member_type: str | None = None,
+        prefix_type: str | None = None,
+        data: dict[str, Any] | None = None,
+        **_: Any,
+    ) -> InMemoryNode | None:
+        pool = self._pool_record(resource_pool, "CoreIPPrefixPool")
+        await self._round_trip("allocate_next_ip_prefix", pool.kind, round_trips=2)
+        length = prefix_length or int(pool.attributes.get("default_prefix_length") or 0)
+        key = identifier or self.store.new_id("allocation")
+        prefix = self.store.prefix_pool(pool).allocate_prefix(key, length)
+        fields = {**(data or {}), "prefix": str(prefix), "ip_namespace": self._namespace_ref()}
+        if member_type:
+            fields["member_type"] = member_type
+        return self._allocated(pool, key, "IpamPrefix", fields)
+
+    async def allocate_next_ip_address(
+        self,
+        resource_pool: Any,
+        kind: Any = None,
+        identifier: str | None = None,
+        prefix_length: int | None = None,
+        address_type: str | None = None,
+        data: dict[str, Any] | None = None,
+        **_: Any,
+    ) -> InMemoryNode | None:
+        pool = self._pool_record(resource_pool, "CoreIPAddressPool")
+        await self._round_trip("allocate_next_ip_address", pool.kind, round_trips=2)
+        key = identifier or self.store.new_id("allocation")
+        prefix_pool = self.store.prefix_pool(pool)
+        address = prefix_pool.allocate_address(key)
+        length = prefix_length or int(pool.attributes.get("default_prefix_length") or prefix_pool.network.max_prefixlen)
+        fields = {**(data or {}), "address": f"{address}/{length}", "ip_namespace": self._namespace_ref()}
+        return self._allocated(pool, key, "IpamIPAddress", fields)
+
+    async def execute_graphql(self, query: str, variables: dict | None = None, **_: Any) -> dict:
+        match = re.search(r"(?:query|mutation)\s+(\w+)", query)
+        operation = match.group(1) if match else ""
+        await self._round_trip("execute_graphql", operation or None)
+        handler = self.store.graphql.get(operation)
+        if handler is None:
+            raise NotImplementedError(f"No in-memory handler for GraphQL operation '{operation}'")
+        return handler(self.store, query, variables or {})
+
+    async def query_gql_query(self, name: str, variables: dict | None = None, **_: Any) -> dict:
+        await self._round_trip("query_gql_query", name)
+        resolver = self.store.queries.get(name)
+        if resolver is None:
+            raise NotImplementedError(f"No in-memory resolver registered for query '{name}'")
+        return {"data": resolver(self.store, variables or {})}
+
+    # ---------------------------------------------------------------- internals
+
+    async def _round_trip(self, method: str, kind: str | None = None, round_trips: int = 1) -> None:
+        delay = self.latency_overrides.get(method, self.latency) * round_trips
+        self.stats.record(method, kind, round_trips=round_trips, latency=delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        for observer in self.round_trip_observers:
+            observer(method, delay)
+
+    def _query(self, kind: str, kwargs: dict[str, Any]) -> list[InMemoryNode]:
+        filters = {k: v for k, v in kwargs.items() if k not in _QUERY_OPTIONS}
+        records = self.store.find(kind, **filters)
+        offset, limit = kwargs.get("offset") or 0, kwargs.get("limit")
+        records = records[offset : offset + limit if limit else None]
+        return [InMemoryNode.from_record(self, record) for record in records]
+
+    def _pool_record(self, resource_pool: Any, kind: str) -> _Record:
+        pool_id = resource_pool if isinstance(resource_pool, str) else getattr(resource_pool, "id", None)
+        record = self.store.records.get(pool_id or "")
+        if record is None or record.kind != kind:
+            raise ValueError(f"resource_pool is not a {kind}")
+        return record
+
+    def _namespace_ref(self) -> dict[str, Any]:
+        record = self.store.lookup_hfid(["default"], "IpamNamespace")
+        return {"id": record.id} if record else {}
+
+    def _allocated(self, pool: _Record, identifier: str, kind: str, fields: dict[str, Any]) -> InMemoryNode:
+        key = (pool.id, identifier)
+        record_id = self.store.allocations.get(key)
+        record = self.store.records.get(record_id or "")
+        if record is None:
+            record = self._write(InMemoryNode(self, kind, fields), allow_upsert=True)
+            self.store.allocations[key] = record.id
+        return InMemoryNode.from_record(self, record)
+
+    async def _save(self, node: InMemoryNode, allow_upsert: bool, update_group_context: bool | None) -> None:
+        await self._round_trip("save", node.get_kind())
+        self._write(node, allow_upsert=allow_upsert)
+        if node.get_kind() in GROUP_KINDS:
+            await self.group_context.add_related_groups([node.id], update_group_context=update_group_context)
+        else:
+            await self.group_context.add_related_nodes([node.id], update_group_context=update_group_context)
+
+    def _write(self, node: InMemoryNode, allow_upsert: bool) -> _Record:
+        """Create or upsert ``node`` into the store and set its id."""
+        store = self.store
+        kind = node.get_kind()
+        record = store.records.get(node.id or "")
+        if record is None:
+            hfid = node.hfid
+            record_id = store.hfid_index.get((kind, tuple(hfid))) if hfid else None
+            if record_id is not None:
+                if not allow_upsert:
+                    raise ValidationError(identifier=kind, message=f"{kind} {hfid} already exists")
+                record = store.records[record_id]
+
+        created = record is None
+        if record is None:
+            record = _Record(kind=kind, id=node.id or store.new_id(kind))
+        previous_hfid = None if created else store.hfid(record)
+
+        for name, value in node._fields.items():
+            if name in node._lazy and _is_empty(value):
+                continue
+            if isinstance(value, InMemoryAttribute):
+                record.attributes[name] = self._attribute_value(record, value.value)
+            elif isinstance(value, InMemoryRelatedNode):
+                record.one[name] = self._resolve(value, kind, name)
+            else:
+                record.many[name] = [self._resolve(peer, kind, name) for peer in value.peers]
+
+        object.__setattr__(node, "id", record.id)
+        if created:
+            store.insert(record)
+            if kind == "DcimPhysicalDevice":
+                store.instantiate_template(record)
+            self.stats.nodes_created += 1
+        else:
+            store.reindex(record, previous_hfid)
+            self.stats.nodes_updated += 1
+
+        # Cable endpoints and interface cables are the two sides of one relationship
+        if kind == "DcimCable":
+            for peer_id in record.many.get("endpoints", []):
+                peer = store.records.get(peer_id)
+                if peer is not None:
+                    peer.one["cable"] = record.id
+        return record
+
+    def _attribute_value(self, record: _Record, value: Any) -> Any:
+        if isinstance(value, dict) and "from_pool" in value:
+            pool_id = value["from_pool"].get("id")
+            identifier = value.get("identifier") or value["from_pool"].get("identifier") or record.id
+            return self.store.number_pool(pool_id).allocate(str(identifier))
+        return value
+
+    def _resolve(self, related: InMemoryRelatedNode, kind: str, name: str) -> Any:
+        peer_id = related.id
+        if peer_id is None and related._hfid:
+            raise ValidationError(identifier=kind, message=f"{kind}.{name}: unable to find node {related._hfid}")
+        return peer_id
+
+
+def _is_empty(value: _Field) -> bool:
+    if isinstance(value, InMemoryAttribute):
+        return value.value is None
+    if isinstance(value, InMemoryRelatedNode):
+        return value.id is None
+    return not value.peers
+
+
+# ============================================================================
+# Built-in GraphQL Handlers
+# ============================================================================
+
+
+def _rack_devices_with_interfaces(store: InMemoryStore, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    """Answer ``RackGenerator.fetch_rack_devices_with_interfaces``."""
+    device_role = re.search(r'devices\(role__value:\s*"([^"]+)"\)', query)
+    interface_role = re.search(r'interfaces\(role__value:\s*"([^"]+)"\)', query)
+
+    racks = store.find("LocationRack", pod__ids=[variables["pod_id"]], row_index__value=variables["row_index"])
+    edges = []
+    for rack in racks:
+        device_filters: dict[str, Any] = {"rack__ids": [rack.id]}
+        if device_role:
+            device_filters["role__value"] = device_role.group(1)
+        device_edges = []
+        for device in store.find("DcimPhysicalDevice", **device_filters):
+            interface_filters: dict[str, Any] = {"device__ids": [device.id]}
+            if interface_role:
+                interface_filters["role__value"] = interface_role.group(1)
+            interfaces = store.find("DcimPhysicalInterface", **interface_filters)
+            device_edges.append(
+                {
+                    "node": {
+                        "id": device.id,
+                        "name": {"value": device.attributes.get("name")},
+                        "role": {"value": device.attributes.get("role")},
+                        "interfaces": {
+                            "edges": [
+                                {"node": {"id": intf.id, "name": {"value": intf.attributes.get("name")}}}
+                                for intf in interfaces
+                            ]
+                        },
+                    }
+                }
+            )
+        edges.append(
+            {
+                "node": {
+                    "id": rack.id,
+                    "name": {"value": rack.attributes.get("name")},
+                    "devices": {"edges": device_edges},
+                }
+            }
+        )
+    return {"LocationRack": {"edges": edges}}
@@ -0,0 +1,248 @@
+"""Unit tests for ACL / zone policy compaction.
+
+Covers transforms/helpers/acl_compaction.py and the ``compact`` option of
+get_acls() / get_zone_policies():
+- Shadowed rule elimination (single rule and union of port ranges)
+- Port range merging and prefix aggregation
+- Redundant rule elimination and the rules that block it
+- First-match equivalence on sampled packets
+- Entry counts reported per ACL
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from ipaddress import ip_address, ip_network
+from typing import Any, Optional
+
+import pytest
+
+from transforms.common import compact_rules, get_acls, get_zone_policies
+
+
+def _rule(
+    seq: int,
+    action: str = "permit",
+    protocol: str = "tcp",
+    src: str = "any",
+    dst: str = "any",
+    dst_port: Optional[str] = None,
+    log: bool = False,
+    **extra: Any,
+) -> dict[str, Any]:
+    return {
+        "seq": seq,
+        "action": action,
+        "protocol": protocol,
+        "src": src,
+        "dst": dst,
+        "dst_port": dst_port,
+        "log": log,
+        "name": f"r{seq}",
+        **extra,
+    }
+
+
+DENY_ALL = _rule(9990, action="deny", protocol="ip", log=True)
+
+
+def _hit(rules: list[dict[str, Any]], protocol: str, src: str, dst: str, port: int) -> tuple:
+    """Outcome of the first rule matching a packet (reference first-match evaluator)."""
+    for rule in rules:
+        if rule["protocol"] not in ("ip", protocol):
+            continue
+        if rule["src"] != "any" and ip_address(src) not in ip_network(rule["src"]):
+            continue
+        if rule["dst"] != "any" and ip_address(dst) not in ip_network(rule["dst"]):
+            continue
+        if rule["protocol"] in ("tcp", "udp") and rule["dst_port"]:
+            parts = rule["dst_port"].split()
+            low, high = int(parts[1]), int(parts[-1])
+            if not low <= port <= high:
+                continue
+        return (rule["action"], rule["log"])
+    return ("none", False)
+
+
+def _assert_equivalent(before: list[dict[str, Any]], after: list[dict[str, Any]]) -> None:
+    addresses = ["10.0.0.1", "10.0.0.130", "10.0.1.5", "10.1.0.1", "192.168.1.1"]
+    ports = [22, 79, 80, 81, 85, 90, 91, 443, 8080]
+    for protocol, src, dst, port in itertools.product(("tcp", "udp", "icmp"), addresses, addresses, ports):
+        assert _hit(before, protocol, src, dst, port) == _hit(after, protocol, src, dst, port), (
+            protocol,
+            src,
+            dst,
+            port,
+        )
+
+
+class TestShadowing:
+    def test_rule_covered_by_earlier_rule_is_dropped(self) -> None:
+        rules = [_rule(10, dst="10.0.0.0/16"), _rule(20, action="deny", dst="10.0.1.0/24", dst_port="eq 80"), DENY_ALL]
+
+        compacted = compact_rules(rules)
+
+        assert [r["seq"] for r in compacted] == [10, 9990]
+        _assert_equivalent(rules, compacted)
+
+    def test_union_of_port_ranges_shadows(self) -> None:
+        rules = [
+            _rule(10, dst_port="eq 80"),
+            _rule(20, action="deny", dst_port="range 81 90"),
+            _rule(30, action="deny", log=True, dst_port="range 80 85"),
+            DENY_ALL,
+        ]
+
+        compacted = compact_rules(rules)
+
+        assert 30 not in [r["seq"] for r in compacted]
+        _assert_equivalent(rules, compacted)
+
+
+class TestMerging:
+    def test_adjacent_port_ranges_merge(self) -> None:
+        rules = [_rule(10, dst_port="eq 80"), _rule(20, dst_port="range 81 90"), DENY_ALL]
+
+        compacted = compact_rules(rules)
+
+        assert compacted[0]["dst_port"] == "range 80 90"
+        assert len(compacted) == 2
+        _assert_equivalent(rules, compacted)
+
+    def test_sibling_prefixes_aggregate(self) -> None:
+        rules = [_rule(10, src="10.0.0.0/25", dst_port="eq 443"), _rule(20, src="10.0.0.128/25", dst_port="eq 443")]
+
+        compacted = compact_rules(rules + [DENY_ALL])
+
+        assert compacted[0]["src"] == "10.0.0.0/24"
+        assert [r["seq"] for r in compacted] == [10, 9990]
+
+    def test_conflicting_rule_in_between_blocks_merge(self) -> None:
+        rules = [
+            _rule(10, dst_port="eq 80"),
+            _rule(20, action="deny", src="10.0.0.0/24", dst_port="eq 81"),
+            _rule(30, dst_port="eq 81"),
+            DENY_ALL,
+        ]
+
+        compacted = compact_rules(rules)
+
+        assert compacted[0]["dst_port"] == "eq 80"
+        _assert_equivalent(rules, compacted)
+
+    def test_different_log_flags_do_not_merge(self) -> None:
+        rules = [_rule(10, dst_port="eq 80"), _rule(20, dst_port="eq 81", log=True), DENY_ALL]
+
+        assert len(compact_rules(rules)) == 3
+
+
+class TestRedundancy:
+    def test_deny_before_equivalent_default_deny_is_dropped(self) -> None:
+        rules = [_rule(10, dst_port="eq 443"), _rule(20, action="deny", dst_port="eq 23", log=True), DENY_ALL]
+
+        compacted = compact_rules(rules)
+
+        assert [r["seq"] for r in compacted] == [10, 9990]
+        _assert_equivalent(rules, compacted)
+
+    def test_unparseable_rules_are_kept_and_block_compaction(self) -> None:
+        rules = [
+            _rule(10, action="deny", dst_port="eq 23", log=True),
+            _rule(20, dst="not-a-prefix"),
+            DENY_ALL,
+        ]
+
+        assert compact_rules(rules) == rules
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_rule_lists_keep_first_match(self, seed: int) -> None:
+        rng = random.Random(seed)
+        prefixes = ["any", "10.0.0.0/24", "10.0.0.0/25", "10.0.0.128/25", "10.0.0.0/16", "10.0.1.0/24"]
+        ports = [None, "eq 80", "eq 81", "range 80 85", "range 86 90", "eq 443", "range 1 1024"]
+        rules = [
+            _rule(
+                (i + 1) * 10,
+                action=rng.choice(["permit", "deny"]),
+                protocol=rng.choice(["tcp", "tcp", "udp", "ip"]),
+                src=rng.choice(prefixes),
+                dst=rng.choice(prefixes),
+                dst_port=rng.choice(ports),
+            )
+            for i in range(12)
+        ]
+        for rule in rules:
+            if rule["protocol"] == "ip":
+                rule["dst_port"] = None
+
+        compacted = compact_rules(rules + [DENY_ALL])
+
+        assert len(compacted) <= len(rules) + 1
+        _assert_equivalent(rules + [DENY_ALL], compacted)
+
+
+def _segment(seg_id: str, vlan: int, prefix: str, rules: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "vlan_id": vlan,
+        "segment": {
+            "id": seg_id,
+            "name": f"seg-{vlan}",
+            "prefix": {"prefix": prefix},
+            "security_policies": [{"name": f"pol-{vlan}", "enabled": True, "rules": rules}],
+        },
+    }
+
+
+class TestReports:
+    def test_get_acls_reports_entries_per_acl(self) -> None:
+        rules = [
+            {"index": 10, "name": "web", "action": "permit", "protocol": "tcp", "port_start": 80, "port_end": 80},
+            {"index": 20, "name": "web-alt", "action": "permit", "protocol": "tcp", "port_start": 81, "port_end": 90},
+        ]
+        activations = [_segment("s1", 100, "10.0.1.0/24", rules)]
+
+        plain = get_acls(activations=activations)
+        compacted = get_acls(activations=activations, compact=True)
+
+        assert "entries_before" not in plain[0]
+        assert compacted[0]["entries_before"] == 3
+        assert compacted[0]["entries_after"] == 2
+        assert compacted[0]["rules"][0]["dst_port"] == "range 80 90"
+
+    def test_zone_policies_keep_zone_matching(self) -> None:
+        policies = [
+            {
+                "name": "east-west",
+                "enabled": True,
+                "rules": [
+                    {
+                        "index": 10,
+                        "action": "permit",
+                        "protocol": "tcp",
+                        "port_start": 443,
+                        "destination_zone": {"name": "a"},
+                    },
+                    {
+                        "index": 20,
+                        "action": "deny",
+                        "protocol": "tcp",
+                        "port_start": 443,
+                        "destination_zone": {"name": "b"},
+                    },
+                    {
+                        "index": 30,
+                        "action": "permit",
+                        "protocol": "tcp",
+                        "port_start": 443,
+                        "destination_zone": {"name": "a"},
+                    },
+                ],
+            }
+        ]
+
+        policy = get_zone_policies(policies, compact=True)[0]
+
+        assert [r["seq"] for r in policy["rules"]] == [10, 20, 9990]
+        assert (policy["entries_before"], policy["entries_after"]) == (4, 3)
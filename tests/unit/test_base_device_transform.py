@@ -217,7 +217,7 @@ class TestTransformDataRouting:
     async def test_no_platform_returns_comment(self) -> None:
         t = _make_transform()
         # Clean data with no platform
-        with patch("transforms.common.clean_data") as mock_clean:
+        with patch("transforms.helpers.device.clean_data") as mock_clean:
             mock_clean.return_value = {"DcimPhysicalDevice": [_device_data(platform=None, name="no-platform-dev")]}
             result = await t.transform({"raw": "data"})
         assert "no-platform-dev" in result
@@ -234,7 +234,7 @@ class TestTransformDataRouting:
         fake_template.render.return_value = "! rendered"
 
         with (
-            patch("transforms.common.clean_data") as mock_clean,
+            patch("transforms.helpers.device.clean_data") as mock_clean,
             patch.object(t, "_load_template", return_value=fake_template),
         ):
             mock_clean.return_value = {"DcimPhysicalDevice": [device]}
@@ -254,7 +254,7 @@ class TestTransformDataRouting:
         fake_template.render.return_value = "! rendered"
 
         with (
-            patch("transforms.common.clean_data") as mock_clean,
+            patch("transforms.helpers.device.clean_data") as mock_clean,
             patch.object(t, "_load_template", return_value=fake_template),
         ):
             mock_clean.return_value = {"DcimPhysicalDevice": [device]}
@@ -271,7 +271,7 @@ class TestTransformDataRouting:
         fake_template.render.return_value = "! config"
 
         with (
-            patch("transforms.common.clean_data") as mock_clean,
+            patch("transforms.helpers.device.clean_data") as mock_clean,
             patch.object(t, "_load_template", return_value=fake_template),
         ):
             mock_clean.return_value = {"DcimPhysicalDevice": [device]}
@@ -294,7 +294,7 @@ class TestTransformDataRouting:
 
         extra_key_value = [{"id": "fw-1"}]
         with (
-            patch("transforms.common.clean_data") as mock_clean,
+            patch("transforms.helpers.device.clean_data") as mock_clean,
             patch.object(t, "_load_template", return_value=fake_template),
             patch.object(t, "_extra_config", return_value={}) as mock_extra,
         ):
@@ -344,7 +344,7 @@ class TestToRClassAttributes:
     @pytest.mark.asyncio
     async def test_transform_no_platform_returns_comment(self) -> None:
         t = _make_tor()
-        with patch("transforms.common.clean_data") as mock_clean:
+        with patch("transforms.helpers.device.clean_data") as mock_clean:
             mock_clean.return_value = {"DcimPhysicalDevice": [_device_data(platform=None, name="tor-01")]}
             result = await t.transform({"raw": "data"})
         assert "tor-01" in result
@@ -357,7 +357,7 @@ class TestToRClassAttributes:
         fake_template.render.return_value = "! tor config"
 
         with (
-            patch("transforms.common.clean_data") as mock_clean,
+            patch("transforms.helpers.device.clean_data") as mock_clean,
             patch.object(t, "_load_template", return_value=fake_template),
         ):
             mock_clean.return_value = {"DcimPhysicalDevice": [_device_data(role="tor")]}
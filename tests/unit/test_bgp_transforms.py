@@ -1,10 +1,20 @@
 """Unit tests for BGP transform functions.
 
 Tests verify correct BGP session building, peer group assignment,
-and route reflector client detection from peering_interfaces data.
+and route reflector client detection from peering_interfaces data,
+down to the rendered peer groups of an RR cluster design.
 """
 
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
 from transforms.common import _build_peer_groups, _build_session_from_peering, get_bgp_profile
+from transforms.spine import Spine
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SPINE_FIXTURE = PROJECT_ROOT / "tests" / "smoke" / "configs" / "spine_arista_eos_ospf_ibgp" / "input.json"
 
 # ============================================================================
 # Helpers to build test data matching GraphQL response structure
@@ -656,6 +666,28 @@ class TestBuildPeerGroups:
         names = {pg["name"] for pg in pgs}
         assert names == {"UNDERLAY-PEERS", "EVPN-PEERS"}
 
+    def test_rr_clients_split_from_non_client_sessions(self):
+        """RR cluster member: reflects for its leafs, peers with its cluster head as a non-client."""
+        sessions = [
+            {**_session(session_type="IBGP", ttl=255, rr_client=True, name="o1"), "remote_role": "leaf"},
+            {**_session(session_type="IBGP", ttl=255, rr_client=False, name="o2"), "remote_role": "spine"},
+        ]
+        pgs = {pg["name"]: pg for pg in _build_peer_groups(sessions, device_role="spine")}
+        assert pgs["EVPN-RR-CLIENTS"]["route_reflector_client"] is True
+        assert pgs["EVPN-PEERS"]["route_reflector_client"] is False
+        assert [s["peer_group"] for s in sessions] == ["EVPN-RR-CLIENTS", "EVPN-PEERS"]
+
+    def test_spine_is_not_rr_of_its_super_spines(self):
+        """Spine clients of super-spine clusters: the super-spine end reflects."""
+        sessions = [
+            {**_session(session_type="IBGP", ttl=255, rr_client=True, name=f"o{i}"), "remote_role": "super-spine"}
+            for i in range(2)
+        ]
+        pgs = _build_peer_groups(sessions, device_role="spine")
+        assert [(pg["name"], pg["route_reflector_client"]) for pg in pgs] == [("EVPN-PEERS", False)]
+        from_super_spine = [{**session, "remote_role": "spine"} for session in sessions]
+        assert _build_peer_groups(from_super_spine, device_role="super-spine")[0]["route_reflector_client"] is True
+
     def test_ibgp_remote_as_from_peer_group(self):
         """iBGP sessions in a peer group get remote_as_from_peer_group flag."""
         sessions = [
@@ -848,3 +880,43 @@ class TestGetBgpProfile:
         ]
         result = get_bgp_profile(services, device_name="leaf-01")
         assert result == []
+
+
+# ============================================================================
+# Rendered peer groups of an RR cluster design
+# ============================================================================
+
+
+def _render_spine(remote_roles: dict[str, str], rr_clients: dict[str, bool]) -> str:
+    """Render the spine fixture with the given remote roles and RR client flags per remote device."""
+    data = json.loads(SPINE_FIXTURE.read_text())
+    for capability in data["DcimDevice"]["edges"][0]["node"]["device_capabilities"]["edges"]:
+        for edge in (capability["node"].get("peerings") or {}).get("edges", []):
+            peering = edge["node"]
+            remote = peering["interfaces"]["edges"][1]["node"]["device"]["node"]
+            remote["role"] = {"value": remote_roles[remote["name"]["value"]]}
+            peering["route_reflector_client"] = {"value": rr_clients[remote["name"]["value"]]}
+    client = MagicMock()
+    client.clone.return_value = client
+    transform = Spine(client=client, infrahub_node=MagicMock(), root_directory=str(PROJECT_ROOT))
+    return asyncio.run(transform.transform(data))
+
+
+class TestRenderedRRClusterPeerGroups:
+    """Spine configs rendered from clustered overlay peerings (RoutingOptions.rr_redundancy)."""
+
+    def test_cluster_member_reflects_for_leafs_only(self):
+        output = _render_spine({"spine-01": "leaf", "spine-02": "spine"}, {"spine-01": True, "spine-02": False})
+
+        assert "neighbor 10.0.0.100 peer-group EVPN-RR-CLIENTS" in output
+        assert "neighbor 10.0.0.101 peer-group EVPN-PEERS" in output
+        assert "neighbor EVPN-RR-CLIENTS route-reflector-client" in output
+        assert "neighbor EVPN-PEERS route-reflector-client" not in output
+
+    def test_spine_uplinks_to_super_spines_are_not_clients(self):
+        output = _render_spine(
+            {"spine-01": "super-spine", "spine-02": "super-spine"}, {"spine-01": True, "spine-02": True}
+        )
+
+        assert "neighbor 10.0.0.100 peer-group EVPN-PEERS" in output
+        assert "route-reflector-client" not in output
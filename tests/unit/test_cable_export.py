@@ -0,0 +1,161 @@
+"""Unit tests for the streaming cable matrix export.
+
+Covers transforms/topology_cabling.py:
+- Rows streamed one at a time, deduplicated by cable ID
+- CSV output identical to the smoke baseline, JSON Lines output
+- Pod of each cable taken from its endpoints' racks (deployment cables payload)
+- Pod / rack partitioned files
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transforms.topology_cabling import TopologyCabling, TopologyCablingJsonl, iter_export, write_partitioned
+
+CABLING_DIR = Path(__file__).resolve().parents[1] / "smoke" / "cabling"
+
+
+@pytest.fixture
+def baseline() -> dict[str, Any]:
+    return json.loads((CABLING_DIR / "input.json").read_text())["data"]
+
+
+def _endpoint(device: str, interface: str, rack: str | None = None, pod: str | None = None) -> dict[str, Any]:
+    rack_info = {"name": rack, "pod": {"name": pod} if pod else None} if rack else None
+    return {"hfid": [device, interface], "device": {"name": device, "rack": rack_info}}
+
+
+def _cable(cable_id: str, source: str, destination: str, rack: str) -> dict[str, Any]:
+    return {
+        "id": cable_id,
+        "type": "smf",
+        "endpoints": [_endpoint(source, "Ethernet1", rack), _endpoint(destination, "Ethernet2", rack)],
+    }
+
+
+def _deployment_cables() -> dict[str, Any]:
+    """The topology_cabling query: the DC's cables, each endpoint with its rack's pod."""
+    return {
+        "TopologyPhysicalDeployment": [
+            {
+                "name": "DC-1",
+                "cables": [
+                    {
+                        "id": "c1",
+                        "type": "smf",
+                        "endpoints": [_endpoint("spine1", "Ethernet1", "R1", "Pod 1"), _endpoint("leaf1", "Ethernet1")],
+                    },
+                    {
+                        "id": "c2",
+                        "type": "smf",
+                        "endpoints": [
+                            _endpoint("ss1", "Ethernet1", "R0"),
+                            _endpoint("spine2", "Ethernet9", "R2", "Pod 2"),
+                        ],
+                    },
+                    {
+                        "id": "c3",
+                        "type": "smf",
+                        "endpoints": [_endpoint("ss1", "Ethernet2", "R0"), _endpoint("ss2", "Ethernet2", "R0")],
+                    },
+                ],
+            }
+        ]
+    }
+
+
+def _pods() -> dict[str, Any]:
+    """Legacy format: the same cable is seen from both of its interfaces."""
+    shared = _cable("c1", "spine1", "leaf1", "R1")
+    return {
+        "TopologyDeployment": [
+            {
+                "name": "DC-1",
+                "children": [
+                    {
+                        "name": "Pod 1",
+                        "devices": [
+                            {"interfaces": [{"cable": shared}, {"cable": None}]},
+                            {"interfaces": [{"cable": shared}, {"cable": _cable("c2", "spine1", "leaf2", "R2")}]},
+                        ],
+                    },
+                    {"name": "Pod 2", "devices": [{"interfaces": [{"cable": _cable("c3", "spine2", "leaf3", "R3")}]}]},
+                ],
+            }
+        ]
+    }
+
+
+def _transform(cls: type[TopologyCabling] = TopologyCabling) -> TopologyCabling:
+    return cls.__new__(cls)
+
+
+class TestStreaming:
+    def test_rows_are_yielded_lazily_and_deduplicated(self) -> None:
+        rows = _transform().iter_cables(_pods())
+
+        first = next(rows)
+
+        assert first["source_device"] == "spine1" and first["pod"] == "Pod 1"
+        assert [row["destination_device"] for row in rows] == ["leaf2", "leaf3"]
+
+    @pytest.mark.asyncio
+    async def test_csv_matches_baseline(self, baseline: dict[str, Any]) -> None:
+        output = await _transform().transform(baseline)
+
+        assert output == (CABLING_DIR / "output.txt").read_text()
+
+    @pytest.mark.asyncio
+    async def test_jsonl_has_one_object_per_cable(self, baseline: dict[str, Any]) -> None:
+        lines = (await _transform(TopologyCablingJsonl).transform(baseline)).splitlines()
+
+        rows = [json.loads(line) for line in lines]
+        assert len(rows) == len((CABLING_DIR / "output.txt").read_text().splitlines()) - 1
+        assert rows[0]["pod"] == "Pod-1"
+        assert set(rows[0]) >= {"source_device", "destination_interface", "cable_type"}
+
+    def test_pod_comes_from_the_endpoint_racks(self) -> None:
+        rows = list(_transform().iter_cables(_deployment_cables()))
+
+        assert [row["pod"] for row in rows] == ["Pod 1", "Pod 2", "DC-1"]
+
+    def test_csv_quotes_values_with_commas(self) -> None:
+        row = {"pod": "Pod 1, hall A", "source_device": "spine1"}
+
+        lines = list(iter_export([row]))
+
+        assert next(csv.reader([lines[1]]))[0] == "Pod 1, hall A"
+
+    def test_unknown_format_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown export format 'xml'"):
+            list(iter_export([], "xml"))
+
+
+class TestPartitioned:
+    @pytest.mark.parametrize(("partition_by", "expected"), [("pod", ["Pod_1", "Pod_2"]), ("rack", ["R1", "R2", "R3"])])
+    def test_one_file_per_partition(self, tmp_path: Path, partition_by: str, expected: list[str]) -> None:
+        paths = write_partitioned(_transform().iter_cables(_pods()), tmp_path, partition_by=partition_by)
+
+        assert sorted(path.stem for path in paths.values()) == expected
+        for path in paths.values():
+            assert path.read_text().startswith("Pod,Source Rack,")
+
+    def test_deployment_cables_partition_by_pod(self, tmp_path: Path) -> None:
+        paths = write_partitioned(_transform().iter_cables(_deployment_cables()), tmp_path, "jsonl")
+
+        assert sorted(paths) == ["DC-1", "Pod 1", "Pod 2"]
+        pod2 = [json.loads(line) for line in paths["Pod 2"].read_text().splitlines()]
+        assert [(row["source_device"], row["destination_device"]) for row in pod2] == [("ss1", "spine2")]
+
+    def test_jsonl_partitions_have_no_header(self, tmp_path: Path) -> None:
+        paths = write_partitioned(_transform().iter_cables(_pods()), tmp_path, "jsonl")
+
+        pod1 = [json.loads(line) for line in paths["Pod 1"].read_text().splitlines()]
+        assert [row["destination_device"] for row in pod1] == ["leaf1", "leaf2"]
+        assert paths["Pod 1"].suffix == ".jsonl"
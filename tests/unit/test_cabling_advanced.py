@@ -282,9 +282,9 @@ class TestPodCablingStrategy:
         plan_offset0 = strategy.build_plan(cabling_offset=0)
         plan_offset1 = strategy.build_plan(cabling_offset=1)
 
-        # First element of each tuple is the top (spine) interface
-        top_intfs_offset0 = [top.name.value for top, _ in plan_offset0]
-        top_intfs_offset1 = [top.name.value for top, _ in plan_offset1]
+        # First element of each tuple is the top (spine) interface record
+        top_intfs_offset0 = [top.name for top, _ in plan_offset0]
+        top_intfs_offset1 = [top.name for top, _ in plan_offset1]
         assert top_intfs_offset0 != top_intfs_offset1
 
     def test_pod_plan_empty_bottom(self) -> None:
@@ -2,6 +2,8 @@
 
 Covers:
 - prepare_cloud_data()           — provider detection, filtering, grouping, region tracking
+- route indexes / LineBuffer     — routes by route table and VPC, buffered output
+- render_vpc_blocks()            — per-VPC blocks rendered in worker processes
 - CloudVpcTerraform.transform()  — AWS, Azure, GCP HCL output
 - CloudVpcPulumi.transform()     — AWS, Azure, GCP TypeScript output
 """
@@ -15,7 +17,8 @@ import pytest
 
 from transforms.cloud_vpc_pulumi import CloudVpcPulumi
 from transforms.cloud_vpc_terraform import CloudVpcTerraform
-from transforms.helpers.cloud import prepare_cloud_data
+from transforms.helpers import cloud
+from transforms.helpers.cloud import LineBuffer, prepare_cloud_data
 
 # ---------------------------------------------------------------------------
 # Shared fixture data — minimal cleaned AWS GraphQL response
@@ -332,6 +335,20 @@ class TestPrepareCloudDataEmpty:
         assert ctx["routes"] == []
 
 
+class TestCloudIr:
+    def test_routes_indexed_by_route_table_and_vpc(self) -> None:
+        ctx = prepare_cloud_data(_aws_cleaned())
+        assert [r["name"] for r in ctx["routes_by_rt"]["prod-rt"]] == ["route-igw"]
+        assert [r["name"] for r in ctx["routes_by_vpc"]["prod-vpc"]] == ["route-igw"]
+
+    @pytest.mark.parametrize("blocks", [[["a", "b"], [], ["c"]], [[""], ["x"]], [[], []], [["", ""]]])
+    def test_line_buffer_matches_join(self, blocks: list[list[str]]) -> None:
+        out = LineBuffer()
+        for block in blocks:
+            out.extend(block)
+        assert out.getvalue() == "\n".join(line for block in blocks for line in block)
+
+
 # ===========================================================================
 # CloudVpcTerraform tests
 # ===========================================================================
@@ -937,3 +954,49 @@ class TestSmokeCloudTransforms:
 
         assert 'new aws.ec2.Vpc("prod-vpc"' in result
         assert 'new aws.ec2.Vpc("prod-vpc-west"' in result
+
+
+class TestParallelVpcEmission:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("transform_cls", "module"),
+        [(CloudVpcTerraform, "cloud_vpc_terraform"), (CloudVpcPulumi, "cloud_vpc_pulumi")],
+    )
+    async def test_worker_output_matches_serial(self, transform_cls: type, module: str) -> None:
+        transform = transform_cls.__new__(transform_cls)
+        with (
+            patch(f"transforms.{module}.clean_data", return_value=_full_aws_cleaned()),
+            patch.object(cloud, "PARALLEL_VPC_MIN", 1),
+        ):
+            serial = await transform.transform({})
+            transform.vpc_workers = 2
+            parallel = await transform.transform({})
+
+        assert parallel == serial
+        assert serial.index("prod_vpc_west") > serial.index("prod_vpc")
+
+    @pytest.mark.asyncio
+    async def test_accounts_below_threshold_render_in_process(self) -> None:
+        transform = _make_terraform()
+        transform.vpc_workers = 4
+        with (
+            patch("transforms.cloud_vpc_terraform.clean_data", return_value=_full_aws_cleaned()),
+            patch.object(cloud, "PARALLEL_VPC_MIN", 16),
+            patch.object(cloud, "ProcessPoolExecutor") as pool,
+        ):
+            await transform.transform({})
+
+        pool.assert_not_called()
+
+    def test_single_job_renders_in_process(self) -> None:
+        with patch.object(cloud, "ProcessPoolExecutor") as pool:
+            blocks = cloud.render_vpc_blocks(
+                lambda vpc, suffix: [vpc["name"] + suffix], [({"name": "a"}, {})], ("!",), 4
+            )
+
+        assert blocks == [["a!"]]
+        pool.assert_not_called()
+
+    def test_worker_job_without_initializer(self) -> None:
+        with pytest.raises(RuntimeError, match="_init_vpc_worker"):
+            cloud._render_vpc_job(({"name": "a"}, {}))
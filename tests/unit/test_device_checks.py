@@ -0,0 +1,136 @@
+"""Unit tests for the device checks and their slim validation query.
+
+Covers checks/common.py DeviceCheck and the device checks built on it:
+- Checks findings identical on the slim device_validation payload and the full config payload
+- Slim payload a fraction of the config payload for every smoke fixture
+- Loopbacks without IP address and devices without interfaces reported
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from graphql import FieldNode, InlineFragmentNode, OperationDefinitionNode, SelectionSetNode, parse
+
+from checks.border_leaf import CheckBorderLeaf
+from checks.common import DeviceCheck
+from checks.edge import CheckEdge
+from checks.leaf import CheckLeaf
+from checks.spine import CheckSpine
+from checks.super_spine import CheckSuperSpine
+from checks.tor import CheckToR
+
+ROOT = Path(__file__).resolve().parents[2]
+CONFIGS_DIR = ROOT / "tests" / "smoke" / "configs"
+CHECKS = {
+    "border_leaf": CheckBorderLeaf,
+    "edge": CheckEdge,
+    "leaf": CheckLeaf,
+    "spine": CheckSpine,
+    "super_spine": CheckSuperSpine,
+    "tor": CheckToR,
+}
+FIXTURES = sorted({path.parent for role in CHECKS for path in CONFIGS_DIR.glob(f"{role}_*/input.json")})
+
+
+def _selection(query_file: str) -> SelectionSetNode:
+    document = parse((ROOT / "queries" / "validation" / query_file).read_text())
+    operation = next(d for d in document.definitions if isinstance(d, OperationDefinitionNode))
+    return operation.selection_set
+
+
+def _project(value: Any, selection_set: SelectionSetNode) -> Any:
+    """What the server would return for ``selection_set``, cut out of a larger response."""
+    if isinstance(value, list):
+        return [_project(item, selection_set) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected: dict[str, Any] = {}
+    for selection in selection_set.selections:
+        if isinstance(selection, InlineFragmentNode):
+            projected.update(_project(value, selection.selection_set))
+        elif isinstance(selection, FieldNode) and selection.name.value in value:
+            field = value[selection.name.value]
+            projected[selection.name.value] = (
+                _project(field, selection.selection_set) if selection.selection_set else field
+            )
+    return projected
+
+
+def _check_for(fixture: Path) -> type[DeviceCheck]:
+    role = max((role for role in CHECKS if fixture.name.startswith(f"{role}_")), key=len)
+    return CHECKS[role]
+
+
+def _findings(check_cls: type[DeviceCheck], data: dict[str, Any]) -> list[tuple[str, str]]:
+    check = check_cls()
+    check.validate(data)
+    return [(log["level"], log["message"]) for log in check.logs]
+
+
+def _device(interfaces: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"DcimDevice": {"edges": [{"node": {"name": {"value": "leaf-1"}, "interfaces": {"edges": interfaces}}}]}}
+
+
+class TestSlimQuery:
+    @pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.name)
+    def test_findings_match_config_payload(self, fixture: Path) -> None:
+        full = json.loads((fixture / "input.json").read_text())
+        slim = _project(full, _selection("device.gql"))
+        check_cls = _check_for(fixture)
+
+        assert check_cls.query == "device_validation"
+        assert _findings(check_cls, slim) == _findings(check_cls, full)
+
+    def test_payload_and_runtime_shrink(self) -> None:
+        full_bytes = slim_bytes = 0
+        full_seconds = slim_seconds = 0.0
+        for fixture in FIXTURES:
+            full = json.loads((fixture / "input.json").read_text())
+            slim = _project(full, _selection("device.gql"))
+            full_bytes += len(json.dumps(full))
+            slim_bytes += len(json.dumps(slim))
+            for payload, is_slim in ((full, False), (slim, True)):
+                started = time.perf_counter()
+                for _ in range(5):
+                    _findings(_check_for(fixture), payload)
+                elapsed = time.perf_counter() - started
+                if is_slim:
+                    slim_seconds += elapsed
+                else:
+                    full_seconds += elapsed
+
+        assert len(FIXTURES) >= 60
+        assert slim_bytes * 10 < full_bytes
+        assert slim_seconds < full_seconds
+
+
+class TestValidators:
+    def test_loopback_without_ip_is_an_error(self) -> None:
+        data = _device(
+            [
+                {"node": {"name": {"value": "Loopback0"}, "role": {"value": "loopback"}, "ip_address": {"node": None}}},
+                {
+                    "node": {
+                        "name": {"value": "Loopback1"},
+                        "role": {"value": "loopback"},
+                        "ip_address": {"node": {"address": {"value": "10.0.0.1/32"}}},
+                    }
+                },
+            ]
+        )
+
+        assert _findings(CheckLeaf, data) == [("ERROR", "Loopback interface 'Loopback0' has no IP address assigned.")]
+
+    def test_device_without_interfaces_is_an_error(self) -> None:
+        assert _findings(CheckSpine, _device([]))[0][1].startswith("Device has no interfaces configured")
+
+    def test_extra_validators_run_in_order(self) -> None:
+        class _Check(DeviceCheck):
+            validators = (*DeviceCheck.validators, lambda device: [f"checked {device['name']}"])
+
+        assert _findings(_Check, _device([]))[-1] == ("ERROR", "checked leaf-1")
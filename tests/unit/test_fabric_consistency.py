@@ -0,0 +1,223 @@
+"""Unit tests for the fabric-wide consistency check.
+
+Covers checks/fabric_consistency.py on synthetic spine/leaf payloads shaped
+like the fabric_consistency query:
+- A consistent fabric (DC-level and pod-level devices) passes
+- Duplicate IPs, overlapping loopbacks, shared underlay ASNs, asymmetric
+  BGP sessions and single-ended cables each reported once
+- Sessions to devices outside the data center are not reported
+- Thousands of devices checked in one pass
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+
+from checks.fabric_consistency import CheckFabricConsistency, fabric_violations, index_fabric
+
+OVERLAY_AS = 65000
+
+
+def _edges(nodes: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"edges": [{"node": node} for node in nodes]}
+
+
+def _interface(name: str, address: str | None, role: str = "fabric") -> dict[str, Any]:
+    return {
+        "name": {"value": name},
+        "role": {"value": role},
+        "ip_address": {"node": {"address": {"value": address}} if address else None},
+    }
+
+
+def _peering(name: str, session_type: str, processes: int = 2) -> dict[str, Any]:
+    return {"name": {"value": name}, "session_type": {"value": session_type}, "bgp_processes": {"count": processes}}
+
+
+def _bgp(name: str, asn: int, peerings: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "__typename": "ManagedBGP",
+        "name": {"value": name},
+        "local_as": {"node": {"asn": {"value": asn}}},
+        "peerings": _edges(peerings),
+    }
+
+
+def _fabric(spines: int = 2, leafs: int = 4) -> dict[str, Any]:
+    """Every leaf cabled to every spine: eBGP underlay per cable, iBGP overlay per pair."""
+    names = [f"spine-{s}" for s in range(spines)] + [f"leaf-{leaf}" for leaf in range(leafs)]
+    interfaces: dict[str, list[dict[str, Any]]] = {
+        name: [_interface("Loopback0", f"10.255.{i // 250}.{i % 250 + 1}/32", "loopback")]
+        for i, name in enumerate(names)
+    }
+    underlay: dict[str, list[dict[str, Any]]] = {name: [] for name in names}
+    overlay: dict[str, list[dict[str, Any]]] = {name: [] for name in names}
+    cables = []
+    link = 0
+    for leaf in range(leafs):
+        for spine in range(spines):
+            s, lf = f"spine-{spine}", f"leaf-{leaf}"
+            base = f"10.{link // 32768}.{link // 128 % 256}.{link % 128 * 2}"
+            host = base.rsplit(".", 1)[0] + f".{link % 128 * 2 + 1}"
+            interfaces[s].append(_interface(f"Ethernet{leaf + 1}", f"{base}/31"))
+            interfaces[lf].append(_interface(f"Ethernet{spine + 1}", f"{host}/31"))
+            cables.append(
+                {
+                    "name": {"value": f"{s}-Ethernet{leaf + 1}__{lf}-Ethernet{spine + 1}"},
+                    "endpoints": _edges(
+                        [
+                            {"name": {"value": f"Ethernet{leaf + 1}"}, "device": {"node": {"name": {"value": s}}}},
+                            {"name": {"value": f"Ethernet{spine + 1}"}, "device": {"node": {"name": {"value": lf}}}},
+                        ]
+                    ),
+                }
+            )
+            for device in (s, lf):
+                underlay[device].append(_peering(f"underlay--{lf}--{s}", "EBGP"))
+                overlay[device].append(_peering(f"overlay-evpn--{lf}--{s}", "IBGP"))
+            link += 1
+
+    def device(i: int, name: str) -> dict[str, Any]:
+        return {
+            "name": {"value": name},
+            "role": {"value": name.split("-")[0]},
+            "interfaces": _edges(interfaces[name]),
+            "device_capabilities": _edges(
+                [
+                    _bgp(f"{name}-bgp-underlay", 65100 + i, underlay[name]),
+                    _bgp(f"{name}-bgp-overlay", OVERLAY_AS, overlay[name]),
+                ]
+            ),
+        }
+
+    devices = [device(i, name) for i, name in enumerate(names)]
+    return {
+        "TopologyDataCenter": _edges(
+            [{"name": {"value": "DC1"}, "cables": _edges(cables), "devices": _edges(devices[:spines])}]
+        ),
+        "TopologyPod": _edges([{"devices": _edges(devices[spines:])}]),
+    }
+
+
+def _device(data: dict[str, Any], name: str) -> dict[str, Any]:
+    pods = data["TopologyDataCenter"]["edges"] + data["TopologyPod"]["edges"]
+    return next(d["node"] for p in pods for d in p["node"]["devices"]["edges"] if d["node"]["name"]["value"] == name)
+
+
+def _capability(data: dict[str, Any], device: str, suffix: str) -> dict[str, Any]:
+    edges = _device(data, device)["device_capabilities"]["edges"]
+    return next(e["node"] for e in edges if e["node"]["name"]["value"].endswith(suffix))
+
+
+def _violations(data: dict[str, Any]) -> list[str]:
+    return fabric_violations(index_fabric(data))
+
+
+class TestConsistentFabric:
+    def test_no_violations(self) -> None:
+        data = _fabric()
+        index = index_fabric(data)
+
+        assert _violations(data) == []
+        assert (index.devices, len(index.cables), len(index.sessions)) == (6, 8, 16)
+
+    def test_devices_listed_twice_are_indexed_once(self) -> None:
+        data = _fabric()
+        data["TopologyPod"]["edges"].append(copy.deepcopy(data["TopologyPod"]["edges"][0]))
+
+        assert index_fabric(data).devices == 6
+        assert _violations(data) == []
+
+    def test_session_to_a_device_outside_the_dc(self) -> None:
+        data = _fabric()
+        _capability(data, "leaf-0", "overlay")["peerings"]["edges"].append(
+            {"node": _peering("overlay-evpn--leaf-0--dc2-spine-0", "IBGP")}
+        )
+
+        assert _violations(data) == []
+
+
+class TestViolations:
+    def test_duplicate_ip(self) -> None:
+        data = _fabric()
+        _device(data, "leaf-1")["interfaces"]["edges"][1]["node"] = _interface("Ethernet1", "10.0.0.1/31")
+
+        assert _violations(data) == ["IP 10.0.0.1 assigned to 2 interfaces: leaf-0 Ethernet1, leaf-1 Ethernet1"]
+
+    def test_overlapping_loopbacks(self) -> None:
+        data = _fabric()
+        _device(data, "leaf-3")["interfaces"]["edges"][0]["node"] = _interface("Loopback0", "10.255.0.0/30", "loopback")
+
+        assert _violations(data) == [
+            "Loopback 10.255.0.1/32 (spine-0 Loopback0) overlaps 10.255.0.0/30 (leaf-3 Loopback0)",
+            "Loopback 10.255.0.2/32 (spine-1 Loopback0) overlaps 10.255.0.0/30 (leaf-3 Loopback0)",
+            "Loopback 10.255.0.3/32 (leaf-0 Loopback0) overlaps 10.255.0.0/30 (leaf-3 Loopback0)",
+        ]
+
+    def test_shared_underlay_asn(self) -> None:
+        data = _fabric()
+        for leaf in ("leaf-0", "leaf-1"):
+            _capability(data, leaf, "underlay")["local_as"]["node"]["asn"]["value"] = 65199
+
+        assert "Underlay AS65199 shared by leaf-0, leaf-1" in _violations(data)
+
+    def test_shared_overlay_asn_is_expected(self) -> None:
+        assert not any("AS65000" in error for error in _violations(_fabric()))
+
+    @pytest.mark.parametrize(
+        ("peering", "message"),
+        [
+            (_peering("underlay--leaf-0--spine-0", "EBGP", processes=1), "has 1 BGP process(es), expected 2"),
+            (_peering("underlay--leaf-0--spine-0", "IBGP"), "is IBGP between AS65100 (spine-0) and AS65102 (leaf-0)"),
+            (_peering("overlay-evpn--leaf-0--spine-0", "EBGP_MULTIHOP"), "is EBGP_MULTIHOP within AS65000"),
+        ],
+    )
+    def test_asymmetric_sessions(self, peering: dict[str, Any], message: str) -> None:
+        data = _fabric()
+        suffix = "underlay" if peering["name"]["value"].startswith("underlay") else "overlay"
+        for device in ("leaf-0", "spine-0"):
+            peerings = _capability(data, device, suffix)["peerings"]["edges"]
+            index = next(i for i, e in enumerate(peerings) if e["node"]["name"] == peering["name"])
+            peerings[index] = {"node": peering}
+
+        (error,) = _violations(data)
+        assert error.startswith(f"BGP session {peering['name']['value']} ") and message in error
+
+    def test_session_to_itself(self) -> None:
+        data = _fabric()
+        _capability(data, "leaf-0", "overlay")["peerings"]["edges"].append(
+            {"node": _peering("overlay-evpn--leaf-0--spine-0", "IBGP")}
+        )
+        _capability(data, "spine-0", "overlay")["peerings"]["edges"].pop(0)
+
+        assert _violations(data) == ["BGP session overlay-evpn--leaf-0--spine-0 connects leaf-0 to itself"]
+
+    def test_single_ended_cable(self) -> None:
+        data = _fabric()
+        cable = data["TopologyDataCenter"]["edges"][0]["node"]["cables"]["edges"][0]["node"]
+        cable["endpoints"]["edges"].pop()
+
+        assert _violations(data) == [f"Cable {cable['name']['value']} has 1 endpoint(s), expected 2"]
+
+    def test_check_logs_every_violation(self) -> None:
+        data = _fabric()
+        for leaf in ("leaf-0", "leaf-1"):
+            _capability(data, leaf, "underlay")["local_as"]["node"]["asn"]["value"] = 65199
+        data["TopologyDataCenter"]["edges"][0]["node"]["cables"]["edges"][0]["node"]["endpoints"]["edges"] = []
+
+        check = CheckFabricConsistency()
+        check.validate(data)
+
+        assert [log["level"] for log in check.logs] == ["ERROR", "ERROR"]
+
+
+class TestScale:
+    def test_thousands_of_devices_in_one_pass(self) -> None:
+        data = _fabric(spines=2, leafs=2000)
+        index = index_fabric(data)
+
+        assert index.devices == 2002 and len(index.cables) == 4000
+        assert _violations(data) == []
@@ -0,0 +1,205 @@
+"""Unit tests for the offline fabric simulator.
+
+Covers generators/simulator.py:
+- In-memory prefix / number pools (alignment, idempotence, exhaustion)
+- Loading demo DC scenarios from data/ object files
+- Whole-DC simulation: devices, unique cables and P2P addresses, routing
+- Route-reflector clusters of the iBGP overlay (rr_redundancy)
+- Row replication for capacity what-ifs, with pool, prefix-length and spine overrides
+- Segment deployments: VLAN / VNI allocation and pool exhaustion
+- calculate_cabling_offset (shared with RackGenerator)
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from generators.helpers import calculate_cabling_offset
+from generators.simulator import (
+    DATA_DIR,
+    FabricSimulator,
+    InMemoryNumberPool,
+    InMemoryPrefixPool,
+    PoolExhaustedError,
+    load_data_centers,
+    load_segments,
+    replicate_rows,
+    replicate_segments,
+)
+
+DC_DIR = DATA_DIR / "demos" / "01_data_center"
+
+
+def _load(scenario: str):
+    return load_data_centers(DC_DIR / scenario)[0]
+
+
+class TestInMemoryPools:
+    def test_prefix_allocation_is_aligned_and_idempotent(self) -> None:
+        pool = InMemoryPrefixPool("tech", "10.0.0.0/24")
+
+        first = pool.allocate_prefix("a", 31)
+        second = pool.allocate_prefix("b", 30)
+
+        assert str(first) == "10.0.0.0/31"
+        assert str(second) == "10.0.0.4/30"
+        assert pool.allocate_prefix("a", 31) == first
+        assert pool.allocations == 2
+
+    def test_prefix_pool_exhaustion(self) -> None:
+        pool = InMemoryPrefixPool("tiny", "10.0.0.0/30")
+        pool.allocate_prefix("a", 31)
+        pool.allocate_prefix("b", 31)
+
+        with pytest.raises(PoolExhaustedError):
+            pool.allocate_prefix("c", 31)
+
+    def test_number_pool(self) -> None:
+        pool = InMemoryNumberPool("asn", 65000, 65001)
+
+        assert pool.allocate("leaf-1") == 65000
+        assert pool.allocate("leaf-2") == 65001
+        assert pool.allocate("leaf-1") == 65000
+        with pytest.raises(PoolExhaustedError):
+            pool.allocate("leaf-3")
+
+
+class TestFabricSimulator:
+    def test_dc1_plan_is_complete(self) -> None:
+        dc = _load("dc1")
+
+        result = FabricSimulator(dc).run()
+
+        stats = result.stats
+        assert stats.errors == []
+        assert stats.uncabled_devices == []
+        assert stats.port_conflicts == 0
+        assert len([d for d in result.devices if d.role == "super-spine"]) == dc.amount_of_super_spines
+        assert len({c.name for c in result.cables}) == len(result.cables)
+        addresses = [addr for c in result.cables for addr in (c.a_address, c.b_address) if addr]
+        assert len(set(addresses)) == len(addresses)
+        assert stats.bgp_peerings > 0
+
+    @pytest.mark.parametrize("scenario", ["dc2", "dc3"])
+    def test_ospf_underlay_scenarios(self, scenario: str) -> None:
+        result = FabricSimulator(_load(scenario)).run()
+
+        assert result.stats.errors == []
+        assert result.stats.ospf_interfaces > 0
+
+    def test_rr_redundancy_plans_rr_clusters(self) -> None:
+        dc = _load("dc2")
+
+        def _overlay(result) -> list[dict]:
+            return [p for p in result.routing.bgp_peerings if p["name"].startswith("overlay-evpn--")]
+
+        flat = _overlay(FabricSimulator(dc).run())
+        result = FabricSimulator(dc, rr_redundancy=1).run()
+        clustered = _overlay(result)
+        from_design = _overlay(
+            FabricSimulator(replace(dc, design=dc.design.model_copy(update={"rr_redundancy": 1}))).run()
+        )
+
+        assert result.stats.errors == []
+        assert all(p["route_reflector_client"] for p in flat)
+        assert len(clustered) < len(flat)
+        assert any(not p["route_reflector_client"] for p in clustered)
+        assert clustered == from_design
+
+    def test_replicate_rows_scales_racks(self) -> None:
+        dc = _load("dc1")
+
+        scaled = replicate_rows(
+            dc,
+            rows=4,
+            technical_prefix_length=18,
+            loopback_prefix_length=22,
+            management_prefix_length=23,
+            spines=4,
+            spine_template="N9K-C9364C-GX_SPINE",
+        )
+        result = FabricSimulator(scaled).run()
+
+        assert not result.errors
+        assert len(scaled.racks) > len(dc.racks)
+        assert result.stats.racks == len(scaled.racks)
+        assert len({rack.name for rack in scaled.racks}) == len(scaled.racks)
+        assert {pod.amount_of_spines for pod in scaled.pods} == {4}
+
+    def test_replicate_rows_without_overrides_reports_uncabled_tors(self) -> None:
+        result = FabricSimulator(replicate_rows(_load("dc1"), rows=4)).run()
+
+        assert result.stats.errors == []
+        assert result.stats.uncabled_devices
+        assert all("-tor-" in error for error in result.errors)
+
+    def test_replicate_rows_dc_pool_overrides_plan_every_pod(self) -> None:
+        dc = _load("dc1")
+
+        undersized = FabricSimulator(replicate_rows(dc, rows=20)).run()
+        scaled = replicate_rows(
+            dc, rows=20, technical_prefix_length=15, loopback_prefix_length=20, management_prefix_length=20
+        )
+        result = FabricSimulator(scaled).run()
+
+        assert any("was not planned" in error for error in undersized.stats.errors)
+        assert result.stats.errors == []
+        assert result.stats.racks == len(scaled.racks)
+
+    def test_replicate_rows_pod_prefix_lengths(self) -> None:
+        scaled = replicate_rows(_load("dc1"), rows=2, pod_prefix_lengths={1: {"technical": 117}})
+        result = FabricSimulator(scaled).run()
+
+        pool = next(pool for pool in result.pools if pool.name == "dc1-1-pod-1-technical-pool")
+        assert pool.resource.endswith("/117")
+        assert result.stats.errors == []
+
+    def test_replicate_rows_rejects_unknown_spine_template(self) -> None:
+        with pytest.raises(ValueError, match="Unknown device template"):
+            replicate_rows(_load("dc1"), rows=2, spine_template="NOPE")
+
+    def test_replicate_rows_rejects_zero(self) -> None:
+        with pytest.raises(ValueError):
+            replicate_rows(_load("dc1"), rows=0)
+
+
+class TestSegments:
+    def test_catalog_segments_allocate_vlans_and_vnis(self) -> None:
+        segments = load_segments()
+        result = FabricSimulator(replace(_load("dc1"), segments=segments)).run()
+
+        usage = {pool.name: pool.allocations for pool in result.pools}
+        vxlan = [segment for segment in segments if segment.kind == "vxlan"]
+        assert result.errors == []
+        assert result.stats.segment_deployments == len(segments)
+        assert usage["dc1-vlan-pool"] == len(segments)
+        assert usage["dc1-vni-pool"] == len(vxlan)
+        assert usage["dc1-l3vni-pool"] == len({segment.namespace for segment in vxlan if segment.namespace})
+
+    def test_vlan_pool_exhaustion_is_reported(self) -> None:
+        segments = replicate_segments(load_segments(), 4000)
+        result = FabricSimulator(replace(_load("dc1"), segments=segments)).run()
+
+        assert result.stats.segment_deployments == 3900
+        assert len(result.stats.errors) == 100
+        assert all("dc1-vlan-pool" in error for error in result.stats.errors)
+
+    def test_replicated_segments_have_unique_names(self) -> None:
+        segments = replicate_segments(load_segments(), 25)
+
+        assert len({segment.name for segment in segments}) == 25
+
+
+class TestCablingOffset:
+    def test_middle_rack_tor_starts_at_zero(self) -> None:
+        assert calculate_cabling_offset("middle_rack", "tor", 2, rack_index=3, row_index=2) == 0
+
+    def test_mixed_leaf_offset_by_row(self) -> None:
+        assert calculate_cabling_offset("mixed", "leaf", 2, rack_index=1, row_index=3) == 4
+
+    def test_tor_offset_uses_previous_rows(self) -> None:
+        offset = calculate_cabling_offset("tor", "tor", 2, rack_index=2, row_index=2, racks_in_previous_rows=3)
+
+        assert offset == 3 * 2 + 2
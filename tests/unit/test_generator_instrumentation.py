@@ -0,0 +1,167 @@
+"""Unit tests for opt-in generator client instrumentation.
+
+Covers generators/instrumentation.py and its CommonGenerator hook:
+- Nearest-rank latency percentiles and GraphQL request classification
+- Phase nesting, innermost/full-path attribution and task inheritance
+- Attaching to an SDK-style client (execute_graphql, create_batch) and restoring it
+- Round-trip observers of the in-memory client
+- GENERATOR_METRICS parsing and JSON summaries written by a real generator run
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.unit.simulators.benchmark import GeneratorBenchmark
+from generators.common import CommonGenerator
+from generators.instrumentation import (
+    METRICS_ENV,
+    GeneratorMetrics,
+    classify_graphql,
+    current_phase,
+    metrics_setting,
+    percentiles,
+    phase,
+    phased,
+)
+from tests.unit.simulators.memory_client import InMemoryInfrahubClient
+from generators.simulator import DATA_DIR, load_data_centers
+
+
+class _SDKClient:
+    """Minimal stand-in exposing the two methods instrumentation wraps."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def execute_graphql(self, query: str, variables: dict | None = None, tracker: str | None = None) -> dict:
+        self.sent.append(query)
+        return {}
+
+    async def create_batch(self, return_exceptions: bool = False):
+        from infrahub_sdk.batch import InfrahubBatch
+
+        return InfrahubBatch(return_exceptions=return_exceptions)
+
+
+class TestHelpers:
+    def test_percentiles_nearest_rank_in_ms(self) -> None:
+        samples = [i / 1000 for i in range(1, 101)]
+
+        result = percentiles(samples)
+
+        assert result["p50"] == 50.0
+        assert result["p90"] == 90.0
+        assert result["p99"] == 99.0
+        assert result["max"] == 100.0
+        assert percentiles([]) == {}
+
+    def test_classify_graphql(self) -> None:
+        assert classify_graphql("query { DcimDevice { count } }") == "queries"
+        assert classify_graphql("mutation { DcimCableUpsert { ok } }") == "mutations"
+        assert classify_graphql("{ x }", tracker="mutation-dcimcable-upsert") == "mutations"
+        assert classify_graphql("mutation { InfrahubIPPrefixPoolGetResource { ok } }") == "allocations"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("", (False, None)), ("0", (False, None)), ("true", (True, None)), ("/tmp/m", (True, Path("/tmp/m")))],
+    )
+    def test_metrics_setting(self, monkeypatch: pytest.MonkeyPatch, value: str, expected: tuple) -> None:
+        monkeypatch.setenv(METRICS_ENV, value)
+
+        assert metrics_setting() == expected
+
+
+class TestPhases:
+    def test_nesting_and_reentry(self) -> None:
+        with phase("leafs"):
+            with phase("cabling"):
+                assert current_phase() == ("leafs", "cabling")
+                with phase("cabling"):
+                    assert current_phase() == ("leafs", "cabling")
+            assert current_phase() == ("leafs",)
+        assert current_phase() == ()
+
+    @pytest.mark.asyncio
+    async def test_decorator_and_task_inheritance(self) -> None:
+        @phased("routing")
+        async def _work() -> tuple[str, ...]:
+            return await asyncio.create_task(_phase())
+
+        async def _phase() -> tuple[str, ...]:
+            return current_phase()
+
+        assert await _work() == ("routing",)
+
+
+class TestAttach:
+    @pytest.mark.asyncio
+    async def test_counts_by_phase_and_restores_client(self) -> None:
+        client = _SDKClient()
+        metrics = GeneratorMetrics("RackGenerator", "R1")
+
+        with metrics.attach(client):
+            with phase("devices"):
+                await client.execute_graphql("query { DcimDevice { count } }")
+                await client.execute_graphql("mutation { DcimDeviceUpsert { ok } }")
+                batch = await client.create_batch()
+                batch.add(task=client.execute_graphql, query="mutation { DcimCableUpsert { ok } }")
+                async for _ in batch.execute():
+                    pass
+            await client.execute_graphql("mutation { InfrahubIPAddressPoolGetResource { ok } }")
+        await client.execute_graphql("query { ignored }")
+
+        summary = metrics.summary()
+        assert summary["phases"]["devices"]["queries"] == 1
+        assert summary["phases"]["devices"]["mutations"] == 2
+        assert summary["phases"]["devices"]["batches"] == 1
+        assert summary["phases"]["devices"]["batch_tasks"] == 1
+        assert summary["phases"]["other"]["allocations"] == 1
+        assert summary["total"]["round_trips"] == 4
+        assert "execute_graphql" not in vars(client)
+        assert "create_batch" not in vars(client)
+
+    @pytest.mark.asyncio
+    async def test_in_memory_client_observer(self) -> None:
+        client = InMemoryInfrahubClient()
+        metrics = GeneratorMetrics("PodTopologyGenerator")
+
+        with metrics.attach(client):
+            with phase("pools"):
+                pool = client.add_prefix_pool("technical", "10.0.0.0/24")
+                await client.allocate_next_ip_prefix(resource_pool=pool, identifier="a", prefix_length=31)
+                await (await client.create(kind="LocationRack", data={"name": "R1"})).save()
+
+        phases = metrics.summary()["phases"]
+        assert phases["pools"]["allocations"] == 1
+        assert phases["pools"]["mutations"] == 1
+        assert client.round_trip_observers == []
+
+
+class TestGeneratorRun:
+    @pytest.mark.asyncio
+    async def test_summaries_written_per_generator(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setenv(METRICS_ENV, str(tmp_path))
+        dc = load_data_centers(DATA_DIR / "demos" / "01_data_center" / "dc1")[0]
+
+        result = await GeneratorBenchmark(dc).run()
+
+        assert result.errors == []
+        pod = json.loads((tmp_path / f"PodTopologyGenerator-{dc.pods[0].name}.json").read_text())
+        assert {"query", "pools", "devices", "routing", "checksum"} <= set(pod["phases"])
+        assert pod["phases"]["pools"]["allocations"] > 0
+        rack_files = sorted(tmp_path.glob("RackGenerator-*.json"))
+        assert rack_files
+        paths = set().union(*(json.loads(path.read_text())["paths"] for path in rack_files))
+        assert "leafs/devices" in paths
+        assert "leafs/cabling" in paths
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(METRICS_ENV, raising=False)
+
+        assert CommonGenerator.metrics_enabled is None
+        assert metrics_setting() == (False, None)
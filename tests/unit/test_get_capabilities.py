@@ -1,12 +1,31 @@
 """Unit tests for get_capabilities() transform helper.
 
 Capabilities are derived from device_capabilities (ManagedBGP/ManagedOSPF),
-not from separate capability profile nodes.
+not from separate capability profile nodes. CapabilityIndex buckets them once
+per device; every helper gives the same result from the index as from the list.
 """
 
 import pytest
 
-from transforms.common import get_capabilities
+from transforms.common import CapabilityIndex, get_bgp_profile, get_capabilities, get_ospf
+from transforms.helpers.management import get_aaa, get_ntp, get_snmp, get_syslog
+from transforms.helpers.mlag import get_mlag
+
+CAPABILITIES = [
+    {"typename": "ManagedBGP", "name": "underlay", "local_as": {"asn": 65001}, "peerings": []},
+    {"typename": "ManagedOSPF", "process_id": 2, "router_id": {"address": "10.0.0.2"}, "area": {"area": 0}},
+    {"typename": "ManagedOSPF", "process_id": 1, "router_id": {"address": "10.0.0.1"}, "area": {"area": 0}},
+    {"typename": "ManagedMLAG", "name": "mlag-1", "domain_id": 10, "devices": [{"name": "leaf-1"}]},
+    {"typename": "ManagedNTP", "servers": [{"address": "10.1.1.1"}]},
+    {"typename": "ManagedSyslog", "servers": [{"address": "10.1.1.2"}]},
+    {"typename": "ManagedSNMP", "community_ro": "public", "trap_targets": []},
+    {"typename": "ManagedAAA", "servers": [{"address": "10.1.1.3"}]},
+]
+INTERFACES = [
+    {"name": "Ethernet1", "role": "uplink"},
+    {"name": "Ethernet47", "role": "mlag-peer"},
+    {"name": "Ethernet48", "role": "mlag-peer"},
+]
 
 
 class TestGetCapabilities:
@@ -35,3 +54,28 @@ class TestGetCapabilities:
         result = get_capabilities(data)
         assert result["bgp_enabled"] is bgp
         assert result["ospf_enabled"] is ospf
+
+
+class TestCapabilityIndex:
+    def test_buckets_keep_query_order(self) -> None:
+        index = CapabilityIndex(CAPABILITIES, INTERFACES)
+
+        assert [c["process_id"] for c in index.of_type("ManagedOSPF")] == [2, 1]
+        assert index.first_interface("mlag-peer") == {"name": "Ethernet47", "role": "mlag-peer"}
+        assert index.of_type("ManagedDHCP") == [] and "ManagedDHCP" not in index
+
+    @pytest.mark.parametrize("helper", [get_ospf, get_ntp, get_syslog, get_snmp, get_aaa, get_bgp_profile])
+    def test_helpers_match_list_input(self, helper) -> None:
+        assert helper(CapabilityIndex(CAPABILITIES, INTERFACES)) == helper(CAPABILITIES)
+
+    def test_mlag_peer_link_from_index(self) -> None:
+        expected = get_mlag(CAPABILITIES, INTERFACES)
+
+        assert get_mlag(CapabilityIndex(CAPABILITIES, INTERFACES)) == expected
+        assert expected is not None and expected["peer_link"] == "Ethernet47"
+
+    def test_flags_from_prebuilt_index(self) -> None:
+        flags = get_capabilities({}, CapabilityIndex(CAPABILITIES))
+
+        assert all(flags.values())
+        assert flags == get_capabilities({"device_capabilities": CAPABILITIES})
@@ -0,0 +1,64 @@
+"""Unit tests for lazy loading of transforms.common and the import-time benchmark.
+
+Covers transforms/common.py and utils/import_time.py:
+- Worker modules listed from .infrahub.yml
+- Non-device transforms and checks import without the device rendering stack
+- Lazy attributes of transforms.common resolve, cache and fail like module attributes
+- Measurements of a cold import after the SDK
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import transforms.common as common
+from transforms.helpers.device import BaseDeviceTransform
+from utils.import_time import HEAVY_MODULES, ImportTime, loaded_heavy_modules, measure, probe, worker_modules
+
+
+class TestWorkerModules:
+    def test_transforms_and_checks_from_infrahub_yml(self) -> None:
+        modules = worker_modules()
+
+        assert modules["transforms.leaf"] == "transform"
+        assert modules["transforms.topology_cabling"] == "transform"
+        assert modules["checks.capability_guard"] == "check"
+        assert not any(module.startswith("generators.") for module in modules)
+
+
+class TestLazyCommon:
+    @pytest.mark.parametrize("module", ["transforms.topology_cabling", "transforms.topology_clab", "checks.leaf"])
+    def test_light_workers_skip_the_rendering_stack(self, module: str) -> None:
+        assert loaded_heavy_modules(probe(module)["loaded"]) == []
+
+    def test_device_transform_loads_the_rendering_stack(self) -> None:
+        assert loaded_heavy_modules(probe("transforms.leaf")["loaded"]) == list(HEAVY_MODULES)
+
+    def test_lazy_attributes_resolve_and_cache(self) -> None:
+        assert common.BaseDeviceTransform is BaseDeviceTransform
+        assert "BaseDeviceTransform" in vars(common)
+        assert set(common.__all__) <= set(dir(common))
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            common.missing  # noqa: B018
+
+
+class TestMeasure:
+    def test_measure_reports_sdk_and_module_time(self) -> None:
+        timing = measure("transforms.topology_clab", "transform", repeat=1)
+
+        assert timing.module == "transforms.topology_clab"
+        assert timing.sdk_ms > 0 and timing.module_ms >= 0
+        assert timing.heavy == []
+
+    def test_summary_flags_modules_over_target(self) -> None:
+        timing = ImportTime(module="transforms.leaf", kind="transform", sdk_ms=900.0, module_ms=96.2, heavy=["jinja2"])
+
+        assert timing.summary(150).startswith("✓ transforms.leaf: +96.2 ms")
+        assert timing.summary(50).startswith("✗")
+        assert timing.summary().endswith("[jinja2]")
+
+    def test_import_failure(self) -> None:
+        with pytest.raises(RuntimeError, match="transforms.missing"):
+            probe("transforms.missing")
@@ -0,0 +1,164 @@
+"""Unit tests for concurrent DNS validation in CheckLoadBalancer.
+
+Covers checks/dns.py and checks/loadbalancer.py:
+- Concurrent resolution, per-lookup timeout and de-duplicated hostnames
+- TTL-bounded cache, negative caching and cache hits reported as cached
+- Backend DNS lookups are opt-in and informational (mismatches, failures, latency)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from typing import Any
+
+import pytest
+
+from checks.dns import DNSCache, Resolution, resolve, resolve_all
+from checks.loadbalancer import CheckLoadBalancer
+
+
+class _Resolver:
+    """Local stand-in resolver with a fixed table and artificial latency."""
+
+    def __init__(self, table: dict[str, str], delay: float = 0.0) -> None:
+        self.table = table
+        self.delay = delay
+        self.calls: list[str] = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, hostname: str) -> str:
+        self.calls.append(hostname)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if hostname not in self.table:
+                raise socket.gaierror(f"Name or service not known: {hostname}")
+            return self.table[hostname]
+        finally:
+            self.running -= 1
+
+
+class TestResolve:
+    @pytest.mark.asyncio
+    async def test_resolves_concurrently_and_deduplicates(self) -> None:
+        resolver = _Resolver({f"web-{i}": f"10.0.0.{i}" for i in range(20)}, delay=0.01)
+
+        results = await resolve_all([f"web-{i}" for i in range(20)] + ["web-0"], resolver=resolver, cache=None)
+
+        assert len(results) == 20
+        assert results["web-3"].address == "10.0.0.3"
+        assert resolver.peak > 1
+        assert len(resolver.calls) == 20
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_failure_are_results(self) -> None:
+        resolver = _Resolver({"slow": "10.0.0.1"}, delay=0.2)
+
+        slow = await resolve("slow", resolver=resolver, timeout=0.01, cache=None)
+        missing = await resolve("missing", resolver=_Resolver({}), cache=None)
+
+        assert not slow.ok and "timed out" in (slow.error or "")
+        assert not missing.ok and "missing" in (missing.error or "")
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_marked_and_expire(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = DNSCache(ttl=10, negative_ttl=1)
+        resolver = _Resolver({"web": "10.0.0.1"})
+        now = [1000.0]
+        monkeypatch.setattr("checks.dns.time.monotonic", lambda: now[0])
+
+        first = await resolve("web", resolver=resolver, cache=cache)
+        await resolve("missing", resolver=resolver, cache=cache)
+        second = await resolve("web", resolver=resolver, cache=cache)
+        now[0] += 5
+        await resolve("missing", resolver=resolver, cache=cache)
+
+        assert not first.cached and second.cached
+        assert resolver.calls == ["web", "missing", "missing"]
+
+    def test_cache_is_bounded(self) -> None:
+        cache = DNSCache(max_entries=2)
+        for name in ("a", "b", "c"):
+            cache.put(Resolution(name, address="10.0.0.1"))
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+
+
+def _lb_data(servers: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "OnpremLoadbalancer": [
+            {
+                "name": "lb-1",
+                "frontend_servers": [{"name": "fe-1"}, {"name": "fe-2"}],
+                "vip_services": [
+                    {
+                        "hostname": "www.demo.local",
+                        "protocol": "https",
+                        "port": 443,
+                        "backend_pool": {"name": "web-pool", "onprem_servers": servers},
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class TestCheckLoadBalancer:
+    @pytest.mark.asyncio
+    async def test_dns_findings_are_informational(self) -> None:
+        class _Check(CheckLoadBalancer):
+            resolve_backends = True
+            resolver = staticmethod(_Resolver({"web-01": "10.0.0.1", "web-02": "10.9.9.9"}))
+            dns_cache = None
+
+        check = _Check()
+        servers = [
+            {"hostname": "web-01", "ip_address": {"address": "10.0.0.1/24"}},
+            {"hostname": "web-02", "ip_address": {"address": "10.0.0.2/24"}},
+            {"hostname": "web-03", "ip_address": {"address": "10.0.0.3/24"}},
+        ]
+
+        passed = await check.run(data=_lb_data(servers))
+
+        messages = {(log["level"], log["message"].split(":")[0]) for log in check.logs}
+        assert passed
+        assert ("INFO", "DNS mismatch for 'web-02' (VIP") in messages
+        assert ("INFO", "DNS resolution test for 'web-03' (VIP") in messages
+        assert any(log["message"].startswith("Resolved 2/3 backend hostname(s)") for log in check.logs)
+        assert all("ms" in log["message"] for log in check.logs if "web-01" in log["message"])
+
+    @pytest.mark.asyncio
+    async def test_consistent_backends_pass(self) -> None:
+        class _Check(CheckLoadBalancer):
+            resolve_backends = True
+            resolver = staticmethod(_Resolver({"web-01": "10.0.0.1", "web-02": "10.0.0.2"}))
+            dns_cache = DNSCache()
+
+        servers = [
+            {"hostname": "web-01", "ip_address": {"address": "10.0.0.1/24"}},
+            {"hostname": "web-02", "ip_address": {"address": "10.0.0.2/24"}},
+        ]
+
+        assert await _Check().run(data=_lb_data(servers))
+        check = _Check()
+        assert await check.run(data=_lb_data(servers))
+        assert any("(2 cached)" in log["message"] for log in check.logs)
+
+    @pytest.mark.asyncio
+    async def test_no_lookups_by_default(self) -> None:
+        resolver = _Resolver({"web-01": "10.9.9.9"})
+
+        class _Check(CheckLoadBalancer):
+            dns_cache = None
+
+        _Check.resolver = resolver  # type: ignore[assignment]
+        check = _Check()
+        servers = [{"hostname": "web-01", "ip_address": {"address": "10.0.0.1/24"}}]
+
+        assert await check.run(data=_lb_data(servers))
+        assert resolver.calls == []
+        assert not any("DNS" in log["message"] for log in check.logs)
@@ -0,0 +1,205 @@
+"""Unit tests for the in-memory Infrahub client and the generator benchmark.
+
+Covers tests/unit/simulators/memory_client.py and tests/unit/simulators/benchmark.py:
+- create / save / get / filters with upsert by human-friendly id
+- Attribute, relationship and relationship-attribute filters
+- IP pool and number pool allocation (idempotent per identifier)
+- Template interface instantiation on device save
+- Call counting and simulated latency
+- Tracking groups deleting nodes a rerun no longer creates
+- End-to-end DC/Pod/Rack/Endpoint generator run on a demo scenario
+"""
+
+from __future__ import annotations
+
+import pytest
+from infrahub_sdk.exceptions import NodeNotFoundError, ValidationError
+
+from tests.unit.simulators.benchmark import GeneratorBenchmark
+from tests.unit.simulators.memory_client import InMemoryInfrahubClient
+from generators.simulator import DATA_DIR, InterfaceTemplate, load_data_centers
+
+
+def _dc1():
+    return load_data_centers(DATA_DIR / "demos" / "01_data_center" / "dc1")[0]
+
+
+class TestNodes:
+    @pytest.mark.asyncio
+    async def test_upsert_by_hfid_reuses_record(self) -> None:
+        client = InMemoryInfrahubClient()
+
+        first = await client.create(kind="LocationRack", data={"name": "R1", "index": 1})
+        await first.save(allow_upsert=True)
+        second = await client.create(kind="LocationRack", data={"name": "R1", "index": 2})
+        await second.save(allow_upsert=True)
+
+        assert second.id == first.id
+        assert client.stats.nodes_created == 1
+        assert client.stats.nodes_updated == 1
+        rack = await client.get(kind="LocationRack", name__value="R1")
+        assert rack.index.value == 2
+
+    @pytest.mark.asyncio
+    async def test_save_without_upsert_rejects_duplicate(self) -> None:
+        client = InMemoryInfrahubClient()
+        await (await client.create(kind="LocationRack", data={"name": "R1"})).save()
+
+        with pytest.raises(ValidationError):
+            await (await client.create(kind="LocationRack", data={"name": "R1"})).save()
+
+    @pytest.mark.asyncio
+    async def test_get_missing_raises_or_returns_none(self) -> None:
+        client = InMemoryInfrahubClient()
+
+        with pytest.raises(NodeNotFoundError):
+            await client.get(kind="LocationRack", name__value="missing")
+        assert await client.get(kind="LocationRack", name__value="missing", raise_when_missing=False) is None
+
+    @pytest.mark.asyncio
+    async def test_filters_by_attribute_and_relationship(self) -> None:
+        client = InMemoryInfrahubClient()
+        pod = client.seed("TopologyPod", {"name": "pod-1"})
+        client.seed("LocationRack", {"name": "R1", "rack_type": "network", "pod": pod.id})
+        client.seed("LocationRack", {"name": "R2", "rack_type": "tor", "pod": pod.id})
+        client.seed("LocationRack", {"name": "R3", "rack_type": "tor"})
+
+        by_pod = await client.filters(kind="LocationRack", pod__ids=[pod.id])
+        by_pod_name = await client.filters(kind="LocationRack", pod__name__value="pod-1", rack_type__value="tor")
+
+        assert sorted(rack.name.value for rack in by_pod) == ["R1", "R2"]
+        assert [rack.name.value for rack in by_pod_name] == ["R2"]
+        assert by_pod_name[0].pod.name.value == "pod-1"
+
+    def test_device_template_instantiates_interfaces(self) -> None:
+        client = InMemoryInfrahubClient()
+        template = client.add_device_template(
+            "leaf", [InterfaceTemplate("Ethernet1", "uplink"), InterfaceTemplate("Ethernet2", "customer")]
+        )
+
+        device = client.seed("DcimPhysicalDevice", {"name": "leaf-01", "object_template": template.id})
+
+        interfaces = client.store.find("DcimPhysicalInterface", device__ids=[device.id])
+        assert sorted(record.attributes["name"] for record in interfaces) == ["Ethernet1", "Ethernet2"]
+        assert client.store.lookup_hfid(["leaf-01", "Ethernet1"], "DcimInterface") is not None
+
+
+class TestPools:
+    @pytest.mark.asyncio
+    async def test_ip_allocation_is_idempotent_per_identifier(self) -> None:
+        client = InMemoryInfrahubClient()
+        pool = client.add_prefix_pool("technical", "10.0.0.0/24")
+
+        first = await client.allocate_next_ip_prefix(resource_pool=pool, identifier="a", prefix_length=31)
+        again = await client.allocate_next_ip_prefix(resource_pool=pool, identifier="a", prefix_length=31)
+        other = await client.allocate_next_ip_prefix(resource_pool=pool, identifier="b", prefix_length=31)
+
+        assert first.id == again.id
+        assert first.prefix.value == "10.0.0.0/31"
+        assert other.prefix.value == "10.0.0.2/31"
+        assert client.stats.calls["allocate_next_ip_prefix"] == 3
+        assert client.stats.round_trips == 6
+
+    @pytest.mark.asyncio
+    async def test_from_pool_attribute_allocates_number(self) -> None:
+        client = InMemoryInfrahubClient()
+        pool = client.seed("CoreNumberPool", {"name": "asn", "start_range": 65000, "end_range": 65010})
+
+        first = await client.create(kind="RoutingAutonomousSystem", data={"asn": {"from_pool": {"id": pool.id}}})
+        await first.save(allow_upsert=True)
+        second = await client.create(kind="RoutingAutonomousSystem", data={"asn": {"from_pool": {"id": pool.id}}})
+        await second.save(allow_upsert=True)
+
+        assert first.id != second.id
+        assert sorted(node.asn.value for node in await client.filters(kind="RoutingAutonomousSystem")) == [65000, 65001]
+
+
+class TestStats:
+    @pytest.mark.asyncio
+    async def test_latency_is_recorded_per_round_trip(self) -> None:
+        client = InMemoryInfrahubClient(latency=0.001, latency_overrides={"filters": 0.002})
+
+        await client.filters(kind="LocationRack")
+        await client.get(kind="LocationRack", raise_when_missing=False, name__value="x")
+        await client.create(kind="LocationRack", data={"name": "R1"})
+
+        assert client.stats.round_trips == 2
+        assert client.stats.simulated_latency == pytest.approx(0.003)
+        assert client.stats.calls_by_kind["filters:LocationRack"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_difference(self) -> None:
+        client = InMemoryInfrahubClient()
+        await client.filters(kind="LocationRack")
+        before = client.stats.snapshot()
+
+        await client.filters(kind="LocationRack")
+        await client.filters(kind="LocationRack")
+
+        assert (client.stats - before).round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_saves_every_node(self) -> None:
+        client = InMemoryInfrahubClient()
+        batch = await client.create_batch()
+        for index in range(3):
+            node = await client.create(kind="LocationRack", data={"name": f"R{index}"})
+            batch.add(task=node.save, allow_upsert=True, node=node)
+
+        async for _node, _result in batch.execute():
+            pass
+
+        assert len(client.store.by_kind["LocationRack"]) == 3
+        assert client.stats.calls["save"] == 3
+
+
+class TestTracking:
+    @pytest.mark.asyncio
+    async def test_rerun_deletes_nodes_no_longer_created(self) -> None:
+        client = InMemoryInfrahubClient()
+
+        async def _run(names: list[str]) -> None:
+            async with client.start_tracking(identifier="gen", delete_unused_nodes=True) as tracked:
+                for name in names:
+                    await (await tracked.create(kind="LocationRack", data={"name": name})).save(allow_upsert=True)
+
+        await _run(["R1", "R2"])
+        await _run(["R1"])
+
+        assert [node.name.value for node in await client.filters(kind="LocationRack")] == ["R1"]
+        assert client.stats.nodes_deleted == 1
+
+
+class TestGeneratorBenchmark:
+    @pytest.mark.asyncio
+    async def test_dc1_builds_fabric_without_errors(self) -> None:
+        benchmark = GeneratorBenchmark(_dc1(), servers_per_rack=1)
+
+        result = await benchmark.run()
+
+        assert result.errors == []
+        assert result.objects["DcimPhysicalDevice"] > 0
+        assert result.objects["DcimCable"] > 0
+        assert result.stats.round_trips > 0
+        assert set(result.by_generator()) == {
+            "DCTopologyGenerator",
+            "PodTopologyGenerator",
+            "RackGenerator",
+            "EndpointConnectivityGenerator",
+        }
+
+    @pytest.mark.asyncio
+    async def test_dc1_rerun_is_idempotent(self) -> None:
+        benchmark = GeneratorBenchmark(_dc1())
+        await benchmark.run()
+        created = benchmark.client.stats.nodes_created
+
+        before = benchmark.client.stats.snapshot()
+        benchmark.runs.clear()
+        rerun = await benchmark.run()
+        delta = rerun.stats - before
+
+        assert rerun.errors == []
+        assert delta.nodes_created == 0
+        assert delta.nodes_deleted == 0
+        assert benchmark.client.stats.nodes_created == created
@@ -0,0 +1,184 @@
+"""Unit tests for the in-process bulk object loader.
+
+Covers utils/object_loader.py:
+- Reading object files from directories (recursive, path order, invalid files)
+- Reference, nested-object and resource-pool dependency detection
+- Wave grouping, self-references and cycle breaking
+- Batched loading order and error reporting with a stub client
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import yaml
+from infrahub_sdk.batch import InfrahubBatch
+from infrahub_sdk.spec.object import InfrahubObjectFileData
+
+from utils.object_loader import (
+    RESOURCE_POOL_KIND,
+    kind_dependencies,
+    load_object_files,
+    load_waves,
+    read_object_files,
+    scan_object,
+)
+
+BOOTSTRAP_DIR = Path(__file__).resolve().parents[2] / "data" / "bootstrap"
+
+
+def _schema(kind: str, relationships: dict[str, str] | None = None, inherit_from: list[str] | None = None) -> Any:
+    return SimpleNamespace(
+        kind=kind,
+        relationships=[SimpleNamespace(name=name, peer=peer) for name, peer in (relationships or {}).items()],
+        inherit_from=inherit_from or [],
+    )
+
+
+SCHEMAS = {
+    "LocationRegion": _schema("LocationRegion", {"children": "LocationGeneric"}, ["LocationGeneric"]),
+    "LocationBuilding": _schema("LocationBuilding", {"parent": "LocationGeneric"}, ["LocationGeneric"]),
+    "LocationSuite": _schema("LocationSuite", {"parent": "LocationGeneric"}, ["LocationGeneric"]),
+    "OrganizationManufacturer": _schema("OrganizationManufacturer"),
+    "DcimDeviceType": _schema("DcimDeviceType", {"manufacturer": "OrganizationManufacturer"}),
+    "RoutingAutonomousSystem": _schema("RoutingAutonomousSystem"),
+    "CoreNumberPool": _schema("CoreNumberPool", inherit_from=[RESOURCE_POOL_KIND]),
+}
+
+
+def _write(directory: Path, name: str, kind: str, data: list[dict]) -> None:
+    content = {"apiVersion": "infrahub.app/v1", "kind": "Object", "spec": {"kind": kind, "data": data}}
+    (directory / name).write_text(yaml.safe_dump(content))
+
+
+class TestReadFiles:
+    def test_bootstrap_tree_is_read_in_path_order(self) -> None:
+        files = read_object_files([BOOTSTRAP_DIR])
+
+        assert len(files) > 30
+        assert [str(file.location) for file in files] == sorted(str(file.location) for file in files)
+        assert files[0].spec.kind == "CoreAccount"
+
+    def test_invalid_file_raises(self, tmp_path: Path) -> None:
+        (tmp_path / "broken.yml").write_text("apiVersion: infrahub.app/v1\nkind: Menu\nspec: {}\n")
+
+        with pytest.raises(ValueError, match="broken.yml"):
+            read_object_files([tmp_path])
+
+
+class TestDependencies:
+    def test_scan_counts_nested_objects_and_references(self) -> None:
+        item = {
+            "name": "EMEA",
+            "children": {"kind": "LocationBuilding", "data": [{"name": "PAR-1"}, {"name": "FRA-1"}]},
+        }
+
+        scan = scan_object(SCHEMAS, "LocationRegion", item)
+
+        assert scan.objects == 3
+        assert scan.kinds == {"LocationRegion", "LocationBuilding"}
+        assert scan.references == set()
+
+    def test_from_pool_references_resource_pools(self) -> None:
+        scan = scan_object(SCHEMAS, "RoutingAutonomousSystem", {"asn": {"from_pool": {"hfid": ["ASN"]}}})
+
+        assert scan.references == {RESOURCE_POOL_KIND}
+
+    def test_references_match_nested_kinds_and_generics(self, tmp_path: Path) -> None:
+        _write(tmp_path, "00_suites.yml", "LocationSuite", [{"name": "S1", "parent": ["PAR-1"]}])
+        _write(
+            tmp_path,
+            "01_regions.yml",
+            "LocationRegion",
+            [{"name": "EMEA", "children": {"kind": "LocationBuilding", "data": [{"name": "PAR-1"}]}}],
+        )
+        _write(tmp_path, "02_types.yml", "DcimDeviceType", [{"name": "7050", "manufacturer": "Arista"}])
+        _write(tmp_path, "03_vendors.yml", "OrganizationManufacturer", [{"name": "Arista"}])
+
+        dependencies = kind_dependencies(read_object_files([tmp_path]), SCHEMAS)
+
+        # The suite's parent is created nested in the region file; LocationSuite
+        # also inherits LocationGeneric, so it depends on itself as well
+        assert dependencies["LocationSuite"] == {"LocationRegion", "LocationSuite"}
+        assert dependencies["DcimDeviceType"] == {"OrganizationManufacturer"}
+        assert dependencies["OrganizationManufacturer"] == set()
+
+
+class TestWaves:
+    def test_waves_follow_dependencies_and_ignore_self(self) -> None:
+        waves = load_waves({"a": {"a"}, "b": {"a"}, "c": set(), "d": {"b", "c"}})
+
+        assert waves == [["a", "c"], ["b"], ["d"]]
+
+    def test_cycle_is_broken_in_input_order(self) -> None:
+        assert load_waves({"x": {"y"}, "y": {"x"}, "z": {"y"}}) == [["x"], ["y"], ["z"]]
+
+
+class _Client:
+    """Stub exposing what the loader uses: schema lookups and batches."""
+
+    def __init__(self) -> None:
+        self.schema = SimpleNamespace(all=self._all, get=self._get)
+
+    async def _all(self, branch: str | None = None) -> dict[str, Any]:
+        return SCHEMAS
+
+    async def _get(self, kind: str, branch: str | None = None) -> Any:
+        return SCHEMAS[kind]
+
+    async def create_batch(self, return_exceptions: bool = False) -> InfrahubBatch:
+        return InfrahubBatch(max_concurrent_execution=4, return_exceptions=return_exceptions)
+
+
+class TestLoad:
+    @pytest.fixture
+    def created(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        created: list[str] = []
+
+        async def _validate(self: Any, client: Any, branch: str | None = None) -> list:
+            return []
+
+        async def _create_node(cls: Any, client: Any, schema: Any, data: dict, **kwargs: Any) -> None:
+            await asyncio.sleep(0)
+            if data["name"] == "fail":
+                raise ValueError("boom")
+            created.append(f"{schema.kind}:{data['name']}")
+
+        monkeypatch.setattr(InfrahubObjectFileData, "validate_format", _validate)
+        monkeypatch.setattr(InfrahubObjectFileData, "create_node", classmethod(_create_node))
+        return created
+
+    @pytest.mark.asyncio
+    async def test_dependencies_load_first(self, tmp_path: Path, created: list[str]) -> None:
+        _write(tmp_path, "01_types.yml", "DcimDeviceType", [{"name": "7050", "manufacturer": "Arista"}])
+        _write(tmp_path, "02_vendors.yml", "OrganizationManufacturer", [{"name": "Arista"}, {"name": "Cisco"}])
+
+        report = await load_object_files(_Client(), [tmp_path], branch="main")  # type: ignore[arg-type]
+
+        assert report.waves == [["OrganizationManufacturer"], ["DcimDeviceType"]]
+        assert created[-1] == "DcimDeviceType:7050"
+        assert report.objects == 3
+        assert report.objects_per_second > 0
+
+    @pytest.mark.asyncio
+    async def test_self_referencing_kind_keeps_file_order(self, tmp_path: Path, created: list[str]) -> None:
+        _write(tmp_path, "01_a.yml", "LocationSuite", [{"name": f"S{i}", "parent": ["B"]} for i in range(5)])
+        _write(tmp_path, "02_b.yml", "LocationSuite", [{"name": "S5"}])
+
+        await load_object_files(_Client(), [tmp_path])  # type: ignore[arg-type]
+
+        assert created == [f"LocationSuite:S{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_failures_stop_after_the_wave(self, tmp_path: Path, created: list[str]) -> None:
+        _write(tmp_path, "01_vendors.yml", "OrganizationManufacturer", [{"name": "fail"}, {"name": "Arista"}])
+        _write(tmp_path, "02_types.yml", "DcimDeviceType", [{"name": "7050", "manufacturer": "Arista"}])
+
+        with pytest.raises(RuntimeError, match="01_vendors.yml: boom"):
+            await load_object_files(_Client(), [tmp_path])  # type: ignore[arg-type]
+
+        assert created == ["OrganizationManufacturer:Arista"]
@@ -0,0 +1,117 @@
+"""Unit tests for the concurrent demo phase runner.
+
+Covers utils/phase_runner.py:
+- Parallelism limit and failure isolation of PhaseRunner.gather()
+- Stop on the first failure when PhaseRunner.gather() runs serially
+- Per-step log prefixes for concurrent steps
+- Phase and step rows of the timing table
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from utils.phase_runner import PHASE_TOTAL, PhaseRunner
+
+
+class TestGather:
+    @pytest.mark.asyncio
+    async def test_respects_parallel_limit(self) -> None:
+        runner = PhaseRunner(logging.getLogger("test-phase-runner"))
+        running = 0
+        peak = 0
+
+        async def _work() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        results = await runner.gather("01", [(f"dc{i}", _work) for i in range(5)], max_parallel=2)
+
+        assert [result.name for result in results] == ["dc0", "dc1", "dc2", "dc3", "dc4"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_other_steps(self) -> None:
+        runner = PhaseRunner(logging.getLogger("test-phase-runner"))
+        finished: list[str] = []
+
+        async def _fail() -> None:
+            raise SystemExit(1)
+
+        async def _ok() -> None:
+            await asyncio.sleep(0.01)
+            finished.append("dc2")
+
+        with pytest.raises(RuntimeError, match="1 of 2 step\\(s\\) failed in phase 01: dc1"):
+            await runner.gather("01", [("dc1", _fail), ("dc2", _ok)], max_parallel=2)
+
+        assert finished == ["dc2"]
+        assert [result.status for result in runner.results] == ["failed", "ok"]
+
+    @pytest.mark.asyncio
+    async def test_serial_failure_stops_remaining_steps(self) -> None:
+        runner = PhaseRunner(logging.getLogger("test-phase-runner"))
+        finished: list[str] = []
+
+        async def _fail() -> None:
+            raise SystemExit(1)
+
+        async def _ok() -> None:
+            finished.append("dc2")
+
+        with pytest.raises(RuntimeError, match="1 of 2 step\\(s\\) failed in phase 01: dc1"):
+            await runner.gather("01", [("dc1", _fail), ("dc2", _ok)], max_parallel=1)
+
+        assert finished == []
+        assert [result.name for result in runner.results] == ["dc1"]
+
+
+class TestLogging:
+    @pytest.mark.asyncio
+    async def test_messages_prefixed_with_step(self) -> None:
+        logger = logging.getLogger("test-phase-runner-scope")
+        logger.setLevel(logging.INFO)
+        runner = PhaseRunner(logger)
+        messages: list[str] = []
+        handler = logging.Handler()
+        handler.emit = lambda record: messages.append(record.getMessage())  # type: ignore[method-assign]
+        logger.addHandler(handler)
+
+        async def _work() -> None:
+            logger.info("loading")
+
+        try:
+            await runner.gather("01", [("dc1", _work), ("dc2", _work)], max_parallel=2)
+            logger.info("done")
+        finally:
+            logger.removeHandler(handler)
+
+        assert sorted(messages) == ["[dc1] loading", "[dc2] loading", "done"]
+
+
+class TestTimingTable:
+    @pytest.mark.asyncio
+    async def test_table_lists_steps_then_phase_total(self) -> None:
+        runner = PhaseRunner(logging.getLogger("test-phase-runner"))
+
+        async def _noop() -> None:
+            return None
+
+        with runner.phase("01 Data Centers"):
+            await runner.gather("01 Data Centers", [("dc1", _noop)])
+        with pytest.raises(RuntimeError), runner.phase("02 Switch"):
+            raise RuntimeError("boom")
+
+        lines = runner.timing_table().splitlines()
+        assert lines[0].split() == ["Phase", "Step", "Status", "Seconds"]
+        assert [line.split()[-3:-1] for line in lines[2:]] == [
+            ["dc1", "ok"],
+            [PHASE_TOTAL, "ok"],
+            [PHASE_TOTAL, "failed"],
+        ]
@@ -0,0 +1,171 @@
+"""Unit tests for compact planner input records.
+
+Covers generators/helpers/records.py and its use by the planners:
+- Adapters flatten SDK-like nodes once and pass records through unchanged
+- CablingPlanner plans on records and hands back the original nodes
+- CablingPlanner / RoutingPlanner run on hand-built records (no mocks)
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, Mock
+
+from conftest import create_mock_interfaces
+
+from generators.helpers import (
+    CablingPlanner,
+    InterfaceRecord,
+    LoopbackRecord,
+    ProcessRecord,
+    RoutingPlanInput,
+    RoutingPlanner,
+    as_interface_records,
+    as_loopback_records,
+    as_process_records,
+)
+
+
+def _design() -> MagicMock:
+    d = MagicMock()
+    d.model_dump = MagicMock(return_value={})
+    return d
+
+
+class TestAdapters:
+    def test_interface_record_from_node(self) -> None:
+        intf = create_mock_interfaces("leaf-01", ["Ethernet1/1"])[0]
+        intf.interface_type = Mock(value="100gbase-x-qsfp28")
+        intf.cable = Mock(_peer=None, id="c1")
+        intf.cable.name = Mock(value="leaf-01-Ethernet1/1__spine-01-Ethernet1/1")
+
+        record = as_interface_records([intf])[0]
+
+        assert record.name == "Ethernet1/1"
+        assert record.device == "leaf-01"
+        assert record.speed == 100
+        assert record.cable_id == "c1"
+        assert record.cable_name == "leaf-01-Ethernet1/1__spine-01-Ethernet1/1"
+        assert "node" not in record._fields
+
+    def test_records_pass_through_unchanged(self) -> None:
+        record = InterfaceRecord(id="i1", name="Ethernet1/1", device="leaf-01")
+        loopback = LoopbackRecord(id="lb1", device_id="l1", device_name="leaf-01", device_role="leaf")
+        process = ProcessRecord(device_name="leaf-01", as_id="as-1")
+
+        assert as_interface_records([record])[0] is record
+        assert as_loopback_records([loopback])[0] is loopback
+        assert as_process_records([process])[0] is process
+
+    def test_process_record_without_local_as(self) -> None:
+        """ManagedOSPF nodes have no local_as — only the device name is extracted."""
+        ospf = MagicMock(spec=["device_capabilities"])
+        ospf.device_capabilities.peers = [MagicMock()]
+        ospf.device_capabilities.peers[0].name.value = "spine-1"
+
+        record = as_process_records([ospf])[0]
+
+        assert record == ProcessRecord(device_name="spine-1", as_id=None)
+
+
+class TestCablingPlannerOnRecords:
+    def test_plan_returns_original_nodes(self) -> None:
+        bottom = create_mock_interfaces("leaf-01", ["Ethernet1/1", "Ethernet1/2"])
+        top = create_mock_interfaces("spine-01", ["Ethernet1/1", "Ethernet1/2"])
+
+        plan = CablingPlanner(bottom, top).build_cabling_plan(scenario="rack")
+
+        assert plan
+        for src, dst in plan:
+            assert src in bottom
+            assert dst in top
+
+    def test_speed_aware_plan_returns_original_nodes(self) -> None:
+        bottom = create_mock_interfaces("leaf-01", ["Ethernet1/1", "Ethernet1/2"])
+        top = create_mock_interfaces("spine-01", ["Ethernet1/1", "Ethernet1/2"])
+        for intf in bottom + top:
+            intf.interface_type = Mock(value="100gbase-x-qsfp28")
+            intf.cable = None
+
+        plan = CablingPlanner(bottom, top).build_cabling_plan(scenario="rack", speed_aware=True)
+
+        assert plan
+        assert all(src in bottom and dst in top for src, dst in plan)
+
+    def test_plan_from_records_returns_records(self) -> None:
+        bottom = [InterfaceRecord(id=f"l{i}", name=f"Ethernet1/{i}", device="leaf-01") for i in (1, 2)]
+        top = [InterfaceRecord(id=f"s{i}", name=f"Ethernet1/{i}", device="spine-01") for i in (1, 2)]
+
+        plan = CablingPlanner(bottom, top).build_cabling_plan(scenario="rack")
+
+        assert plan == [(bottom[0], top[0])]
+
+    def test_existing_cable_names_drive_intra_rack_reuse(self) -> None:
+        cable = "tor-01-Ethernet1/1__leaf-02-Ethernet1/1"
+        bottom = [InterfaceRecord(id="t1", name="Ethernet1/1", device="tor-01", cable_id="c1", cable_name=cable)]
+        top = [
+            InterfaceRecord(id="a1", name="Ethernet1/1", device="leaf-01"),
+            InterfaceRecord(id="b1", name="Ethernet1/1", device="leaf-02"),
+        ]
+
+        plan = CablingPlanner(bottom, top).build_cabling_plan(scenario="intra_rack")
+
+        assert [(src.device, dst.device) for src, dst in plan] == [("tor-01", "leaf-02")]
+
+
+class TestRoutingPlannerOnRecords:
+    def test_records_and_mocks_give_same_plan(self) -> None:
+        loopbacks = [
+            LoopbackRecord(
+                id="lb-s1",
+                device_id="s1",
+                device_name="spine-1",
+                device_role="spine",
+                ip_id="ip-s1",
+                ip_label="10.0.0.1/32",
+            ),
+            LoopbackRecord(
+                id="lb-l1",
+                device_id="l1",
+                device_name="leaf-1",
+                device_role="leaf",
+                ip_id="ip-l1",
+                ip_label="10.0.1.1/32",
+            ),
+        ]
+        interfaces = [
+            InterfaceRecord(id="if1", name="Ethernet1/1", device="spine-1", device_id="s1", cable_id="c1"),
+            InterfaceRecord(id="if2", name="Ethernet1/1", device="leaf-1", device_id="l1", cable_id="c1"),
+        ]
+        mock_loopbacks = []
+        for lb in loopbacks:
+            mock = MagicMock()
+            mock.id = lb.id
+            mock.device.peer.id = lb.device_id
+            mock.device.peer.name.value = lb.device_name
+            mock.device.peer.role.value = lb.device_role
+            mock.ip_address.id = lb.ip_id
+            mock.ip_address.display_label = lb.ip_label
+            mock_loopbacks.append(mock)
+        mock_interfaces = []
+        for intf in interfaces:
+            mock = MagicMock()
+            mock.id = intf.id
+            mock.name.value = intf.name
+            mock.device.id = intf.device_id
+            mock.cable.id = intf.cable_id
+            mock_interfaces.append(mock)
+
+        def _plan(lbs: list, ifaces: list) -> list[str]:
+            plan = RoutingPlanner(deployment_id="dc-1").build_routing_plan(
+                RoutingPlanInput(
+                    bottom_devices=["leaf-1"],
+                    top_devices=["spine-1"],
+                    interfaces=ifaces,
+                    loopback_interfaces=lbs,
+                    options={"design": _design(), "asn_pool": "pool-1"},
+                )
+            )
+            return sorted(p["name"] for p in plan.bgp_peerings)
+
+        assert _plan(loopbacks, interfaces) == _plan(mock_loopbacks, mock_interfaces)
+        assert "underlay--leaf-1--Ethernet1_1--spine-1--Ethernet1_1" in _plan(loopbacks, interfaces)
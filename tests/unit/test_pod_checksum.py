@@ -0,0 +1,74 @@
+"""Unit tests for the pod → rack checksum cascade.
+
+Covers PodTopologyGenerator.update_checksum:
+- Mixed deployments trigger network racks only (ToR racks are triggered by
+  their network rack's generator)
+- Other deployment types trigger every rack
+- Racks already on the pod checksum are not saved again
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from generators.add.pod import PodTopologyGenerator
+
+
+def _mock_rack(name: str, rack_type: str, row_index: int, checksum: str = "") -> MagicMock:
+    rack = MagicMock()
+    rack.id = f"id-{name}"
+    rack.name = MagicMock(value=name)
+    rack.rack_type = MagicMock(value=rack_type)
+    rack.row_index = MagicMock(value=row_index)
+    rack.checksum = MagicMock(value=checksum)
+    rack.save = AsyncMock()
+    return rack
+
+
+def _build_pod_generator(deployment_type: str, racks: list[Any]) -> Any:
+    gen = PodTopologyGenerator.__new__(PodTopologyGenerator)
+    gen.data = MagicMock(id="pod-1", deployment_type=deployment_type)
+    gen.logger = MagicMock()
+    gen.client = MagicMock()
+    gen.client.group_context = MagicMock(related_node_ids=[], related_group_ids=[])
+    gen.client.filters = AsyncMock(return_value=racks)
+    gen.calculate_checksum = MagicMock(return_value="pod-cs")
+    return gen
+
+
+class TestPodUpdateChecksum:
+    @pytest.mark.asyncio
+    async def test_mixed_triggers_network_racks_only(self) -> None:
+        net = _mock_rack("NET", "network", 1)
+        tor = _mock_rack("TOR", "tor", 1)
+        gen = _build_pod_generator("mixed", [net, tor])
+
+        await gen.update_checksum()
+
+        assert net.checksum.value == "pod-cs"
+        net.save.assert_awaited_once_with(allow_upsert=True)
+        tor.save.assert_not_awaited()
+        assert gen.client.group_context.related_node_ids == [net.id, tor.id]
+        gen.client.filters.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_tor_deployment_triggers_all_racks(self) -> None:
+        racks = [_mock_rack(f"TOR-{i}", "tor", 1) for i in range(3)]
+        gen = _build_pod_generator("tor", racks)
+
+        await gen.update_checksum()
+
+        for rack in racks:
+            rack.save.assert_awaited_once_with(allow_upsert=True)
+
+    @pytest.mark.asyncio
+    async def test_racks_on_the_pod_checksum_are_not_saved(self) -> None:
+        rack = _mock_rack("TOR-1", "tor", 1, checksum="pod-cs")
+        gen = _build_pod_generator("tor", [rack])
+
+        await gen.update_checksum()
+
+        rack.save.assert_not_awaited()
@@ -0,0 +1,189 @@
+"""Unit tests for opt-in profiling of generator, transform and check runs.
+
+Covers utils/profiling.py and its hooks:
+- PROFILING / PROFILING_DIR / PROFILING_TOP parsing
+- Target names read from raw GraphQL payloads and safe file name stems
+- pstats and top-N allocation files written by profiled(), nothing when off
+- BaseDeviceTransform, BaseCheck and CommonGenerator runs named by artifact and target
+"""
+
+from __future__ import annotations
+
+import json
+import pstats
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from checks.common import BaseCheck
+from checks.firewall import CheckFirewall
+from checks.leaf import CheckLeaf
+from tests.unit.simulators.benchmark import GeneratorBenchmark
+from generators.simulator import DATA_DIR, load_data_centers
+from transforms.leaf import Leaf
+from utils.profiling import (
+    DEFAULT_TOP,
+    PROFILING_DIR_ENV,
+    PROFILING_ENV,
+    PROFILING_TOP_ENV,
+    ProfilingSetting,
+    payload_target,
+    profile_stem,
+    profiled,
+    profiling_setting,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+LEAF_FIXTURE = ROOT / "tests" / "smoke" / "configs" / "leaf_arista_eos_ebgp_ibgp" / "input.json"
+
+
+@pytest.fixture
+def profile_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setenv(PROFILING_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+def _leaf_transform() -> Leaf:
+    client = MagicMock()
+    client.clone.return_value = client
+    client.schema.get = AsyncMock(return_value=MagicMock())
+    return Leaf(client=client, infrahub_node=MagicMock(), root_directory=str(ROOT))
+
+
+class TestSetting:
+    @pytest.mark.parametrize(
+        ("value", "cpu", "memory"),
+        [("cpu", True, False), ("memory", False, True), ("1", True, True), ("cpu, memory", True, True)],
+    )
+    def test_modes(self, monkeypatch: pytest.MonkeyPatch, value: str, cpu: bool, memory: bool) -> None:
+        monkeypatch.setenv(PROFILING_ENV, value)
+        monkeypatch.setenv(PROFILING_TOP_ENV, "5")
+        monkeypatch.delenv(PROFILING_DIR_ENV, raising=False)
+
+        assert profiling_setting() == ProfilingSetting(cpu=cpu, memory=memory, directory=Path("profiles"), top=5)
+
+    @pytest.mark.parametrize("value", ["", "0", "off"])
+    def test_off(self, monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+        monkeypatch.setenv(PROFILING_ENV, value)
+
+        assert profiling_setting() is None
+
+    def test_unknown_mode_turns_profiling_off(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "cpu,gpu")
+
+        assert profiling_setting() is None
+
+    def test_malformed_top_falls_back_to_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "cpu")
+        monkeypatch.setenv(PROFILING_TOP_ENV, "ten")
+
+        setting = profiling_setting()
+
+        assert setting is not None and setting.top == DEFAULT_TOP
+
+    @pytest.mark.asyncio
+    async def test_mistyped_mode_does_not_fail_runs(self, monkeypatch: pytest.MonkeyPatch, profile_dir: Path) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "cpuu")
+
+        config = await _leaf_transform().run(data=json.loads(LEAF_FIXTURE.read_text()))
+
+        assert "hostname" in config
+        assert list(profile_dir.iterdir()) == []
+
+
+class TestNames:
+    def test_payload_target(self) -> None:
+        data = json.loads(LEAF_FIXTURE.read_text())
+
+        assert payload_target(data) == "dc1-leaf-01"
+        assert payload_target({"data": data}) == "dc1-leaf-01"
+        assert payload_target({"TopologyDataCenter": [{"name": "DC-1"}]}) == "DC-1"
+        assert payload_target({"DcimDevice": {"edges": []}}) == ""
+        assert payload_target(None) == ""
+
+    def test_stem_is_file_name_safe(self) -> None:
+        assert (
+            profile_stem("generator", "PodTopologyGenerator", "DC1 / pod:1")
+            == "generator-PodTopologyGenerator-DC1_pod_1"
+        )
+        assert profile_stem("check", "CheckFirewall", "") == "check-CheckFirewall"
+
+
+class TestProfiled:
+    def test_off_writes_nothing(self, monkeypatch: pytest.MonkeyPatch, profile_dir: Path) -> None:
+        monkeypatch.delenv(PROFILING_ENV, raising=False)
+        target = MagicMock(return_value="x")
+
+        with profiled("transform", "leaf", target) as written:
+            sum(range(1000))
+
+        assert written == []
+        assert list(profile_dir.iterdir()) == []
+        target.assert_not_called()
+
+    def test_cpu_and_memory(self, monkeypatch: pytest.MonkeyPatch, profile_dir: Path) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "all")
+        monkeypatch.setenv(PROFILING_TOP_ENV, "3")
+
+        with profiled("transform", "leaf", "dc1-leaf-01") as written:
+            blocks = [bytearray(1024) for _ in range(200)]
+
+        assert [path.name for path in written] == [
+            "transform-leaf-dc1-leaf-01.memory.txt",
+            "transform-leaf-dc1-leaf-01.pstats",
+        ]
+        memory = written[0].read_text().splitlines()
+        assert memory[0].startswith("peak: ") and len(memory) == 3 + 3
+        assert pstats.Stats(str(written[1])).total_calls > 0
+        assert len(blocks) == 200
+
+    def test_nested_blocks_leave_the_outer_profiler_alone(
+        self, monkeypatch: pytest.MonkeyPatch, profile_dir: Path
+    ) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "all")
+
+        with profiled("generator", "outer") as outer:
+            with profiled("transform", "inner") as inner:
+                pass
+
+        assert [path.suffix for path in outer] == [".txt", ".pstats"]
+        assert inner == []
+
+
+class TestHooks:
+    @pytest.mark.asyncio
+    async def test_transform_run(self, monkeypatch: pytest.MonkeyPatch, profile_dir: Path) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "cpu")
+
+        config = await _leaf_transform().run(data=json.loads(LEAF_FIXTURE.read_text()))
+
+        assert "hostname" in config
+        stats = pstats.Stats(str(profile_dir / "transform-Leaf-dc1-leaf-01.pstats"))
+        assert any(func[2] == "render" for func in stats.stats)  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_check_runs_named_by_params_or_payload(
+        self, monkeypatch: pytest.MonkeyPatch, profile_dir: Path
+    ) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "memory")
+
+        assert await CheckLeaf(params={"device": "dc1-leaf-01"}).run(data=json.loads(LEAF_FIXTURE.read_text()))
+        await CheckFirewall().run(data={"SecurityZone": {"edges": []}, "SecurityPolicy": {"edges": []}})
+
+        assert issubclass(CheckFirewall, BaseCheck)
+        assert sorted(path.name for path in profile_dir.iterdir()) == [
+            "check-CheckFirewall.memory.txt",
+            "check-CheckLeaf-dc1-leaf-01.memory.txt",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generator_runs_named_by_params(self, monkeypatch: pytest.MonkeyPatch, profile_dir: Path) -> None:
+        monkeypatch.setenv(PROFILING_ENV, "cpu")
+        dc = load_data_centers(DATA_DIR / "demos" / "01_data_center" / "dc1")[0]
+
+        result = await GeneratorBenchmark(dc).run()
+
+        assert result.errors == []
+        assert (profile_dir / f"generator-PodTopologyGenerator-{dc.pods[0].name}.pstats").exists()
+        assert list(profile_dir.glob("generator-RackGenerator-*.pstats"))
@@ -0,0 +1,202 @@
+"""Unit tests for the GraphQL query fan-out estimator and its budget.
+
+Covers utils/query_cost.py and queries/budget.yml:
+- Nested many relationships multiply, one relationships do not
+- Root fields filtered on unique attributes / ids, limit, inline fragments and fragment spreads
+- Schema loading: inheritance, extensions, relationships of a generic's implementations
+- Sample deployment counts from object files and the fabric simulator
+- Every query under queries/ within its node budget
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from utils.query_cost import (
+    CostModel,
+    KindSchema,
+    QueryCost,
+    SchemaIndex,
+    estimate_document,
+    estimate_queries,
+    load_budget,
+    object_counts,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _schema() -> SchemaIndex:
+    return SchemaIndex(
+        {
+            "DcimDevice": KindSchema(
+                "DcimDevice",
+                relationships={"interfaces": ("DcimInterface", "many"), "platform": ("DcimPlatform", "one")},
+                unique={"name"},
+            ),
+            "DcimPhysicalDevice": KindSchema("DcimPhysicalDevice", inherit_from=["DcimDevice"]),
+            "DcimInterface": KindSchema("DcimInterface", relationships={"cable": ("DcimCable", "one")}),
+            "DcimPhysicalInterface": KindSchema(
+                "DcimPhysicalInterface",
+                inherit_from=["DcimInterface"],
+                relationships={"ip_address": ("IpamIPAddress", "one")},
+            ),
+            "DcimCable": KindSchema("DcimCable", relationships={"endpoints": ("DcimInterface", "many")}),
+            "DcimPlatform": KindSchema("DcimPlatform"),
+        }
+    )
+
+
+def _model(**max_per_parent: int) -> CostModel:
+    return CostModel(
+        counts={"DcimPhysicalDevice": 10, "DcimPhysicalInterface": 400, "DcimCable": 150, "DcimPlatform": 3},
+        max_per_parent={key.replace("__", "."): value for key, value in max_per_parent.items()},
+    )
+
+
+def _estimate(query: str, model: CostModel | None = None) -> QueryCost:
+    (cost,) = estimate_document(query, _schema(), model or _model())
+    return cost
+
+
+DEVICE_QUERY = """
+query device($device: String!) {
+  DcimDevice(name__value: $device) {
+    edges { node {
+      name { value }
+      platform { node { name { value } } }
+      interfaces { edges { node {
+        name { value }
+        cable { node { endpoints { edges { node { id } } } } }
+      } } }
+    } }
+  }
+}
+"""
+
+
+class TestEstimate:
+    def test_many_relationships_multiply(self) -> None:
+        cost = _estimate(DEVICE_QUERY, _model(DcimDevice__interfaces=40, DcimCable__endpoints=2))
+
+        # device + platform + 40 interfaces + 40 cables + 80 endpoints
+        assert cost.nodes == 1 + 1 + 40 + 40 + 80
+        assert cost.depth == 2
+        assert cost.hottest == "DcimDevice.interfaces.cable.endpoints"
+
+    def test_unbounded_many_uses_the_peer_kind_count(self) -> None:
+        cost = _estimate(DEVICE_QUERY)
+
+        # implementations of the DcimInterface generic are counted
+        assert cost.hottest_nodes == 400 * 400
+
+    def test_root_without_unique_filter_returns_every_object(self) -> None:
+        cost = _estimate('query { DcimDevice(role__value: "leaf") { edges { node { id } } } }')
+
+        assert cost.nodes == 10
+
+    @pytest.mark.parametrize(
+        ("arguments", "expected"),
+        [('ids: ["a", "b", "c"]', 3), ("ids: $ids", 1), ("limit: 4", 4), ('name__value: "leaf1"', 1)],
+    )
+    def test_root_selection(self, arguments: str, expected: int) -> None:
+        cost = _estimate(f"query q($ids: [ID]) {{ DcimDevice({arguments}) {{ edges {{ node {{ id }} }} }} }}")
+
+        assert cost.nodes == expected
+
+    def test_fragments_narrow_the_kind(self) -> None:
+        query = """
+        query {
+          DcimDevice(name__value: "leaf1") { edges { node {
+            interfaces(limit: 5) { edges { node { ...Ip } } }
+          } } }
+        }
+        fragment Ip on DcimPhysicalInterface { ip_address { node { id } } }
+        """
+
+        cost = _estimate(query)
+
+        assert cost.nodes == 1 + 5 + 5
+
+    def test_unknown_relationships_use_the_query_shape(self) -> None:
+        query = (
+            'query { DcimDevice(name__value: "x") { edges { node { member_of_groups { edges { node { id } } } } } } }'
+        )
+
+        assert _estimate(query).nodes == 1 + 10
+
+    def test_every_operation_of_a_document_is_estimated(self) -> None:
+        query = 'query a { DcimPlatform { edges { node { id } } } } query b { DcimDevice(name__value: "x") { edges { node { id } } } }'
+
+        costs = estimate_document(query, _schema(), _model())
+
+        assert [(cost.name, cost.nodes) for cost in costs] == [("a", 3), ("b", 1)]
+
+
+class TestSchema:
+    def test_extensions_and_implementations(self, tmp_path: Path) -> None:
+        (tmp_path / "base.yml").write_text(
+            """
+generics:
+  - {name: Device, namespace: Dcim, attributes: [{name: name, kind: Text, unique: true}]}
+nodes:
+  - name: PhysicalDevice
+    namespace: Dcim
+    inherit_from: [DcimDevice]
+    relationships: [{name: rack, peer: LocationRack, cardinality: one}]
+"""
+        )
+        (tmp_path / "ext.yml").write_text(
+            "extensions:\n  nodes:\n    - kind: DcimDevice\n      relationships: [{name: device_capabilities, peer: ManagedGeneric}]\n"
+        )
+
+        schema = SchemaIndex.load(tmp_path)
+
+        assert schema.relationship("DcimPhysicalDevice", "device_capabilities") == (
+            "DcimDevice",
+            "ManagedGeneric",
+            "many",
+        )
+        assert schema.relationship("DcimDevice", "rack") == ("DcimPhysicalDevice", "LocationRack", "one")
+        assert schema.is_unique("DcimPhysicalDevice", "name")
+        assert schema.count("DcimDevice", {"DcimPhysicalDevice": 4}) == 4
+        assert schema.count("LocationRack", {}) is None
+
+    def test_object_counts_include_children(self, tmp_path: Path) -> None:
+        (tmp_path / "dc.yml").write_text(
+            """
+kind: Object
+spec:
+  kind: TopologyDataCenter
+  data:
+    - name: DC1
+      children: {kind: TopologyPod, data: [{index: 1}, {index: 2}]}
+"""
+        )
+
+        assert object_counts([tmp_path]) == {"TopologyDataCenter": 1, "TopologyPod": 2}
+
+
+class TestBudget:
+    def test_sample_deployment_comes_from_data_and_simulator(self) -> None:
+        budget = load_budget()
+
+        assert budget.model.counts["DcimPhysicalDevice"] > 50
+        assert budget.model.counts["SecurityPolicyRule"] > 0
+        assert budget.model.max_per_parent["ManagedBGP.peerings"] > 2
+        assert budget.model.max_per_parent["DcimCable.endpoints"] == 2
+
+    def test_every_query_fits_its_budget(self) -> None:
+        budget = load_budget()
+
+        costs = estimate_queries(budget)
+
+        assert {cost.file for cost in costs} == {
+            path.relative_to(ROOT).as_posix() for path in ROOT.glob("queries/**/*.gql")
+        }
+        over = [
+            f"{cost.summary()} > {budget.limit(cost.name):,}" for cost in costs if cost.nodes > budget.limit(cost.name)
+        ]
+        assert not over, "Queries over their fan-out budget (queries/budget.yml):\n" + "\n".join(over)
@@ -0,0 +1,136 @@
+"""Unit tests for the GraphQL field usage analyzer.
+
+Covers utils/query_usage.py:
+- Field paths in the clean_data shape (wrappers dropped, fragments expanded)
+- Keys read by Python modules and Jinja templates (includes followed)
+- Unused fields and payload saving reported per artifact definition
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from utils.query_usage import (
+    PROJECT_ROOT,
+    analyze,
+    field_bytes,
+    imported_modules,
+    module_keys,
+    query_fields,
+    template_keys,
+)
+
+QUERY = """
+query device($device: String!) {
+  DcimDevice(name__value: $device) {
+    edges {
+      node {
+        __typename
+        name { value }
+        platform { node { name { value } napalm_driver { value } } }
+        ...Capabilities
+      }
+    }
+  }
+}
+
+fragment Capabilities on DcimDevice {
+  device_capabilities {
+    edges { node { ... on ManagedBGP { local_as { node { asn { value } } } } } }
+  }
+}
+"""
+
+
+class TestQueryFields:
+    def test_paths_follow_cleaned_shape(self) -> None:
+        assert query_fields(QUERY) == [
+            ("DcimDevice",),
+            ("DcimDevice", "typename"),
+            ("DcimDevice", "name"),
+            ("DcimDevice", "platform"),
+            ("DcimDevice", "platform", "name"),
+            ("DcimDevice", "platform", "napalm_driver"),
+            ("DcimDevice", "device_capabilities"),
+            ("DcimDevice", "device_capabilities", "local_as"),
+            ("DcimDevice", "device_capabilities", "local_as", "asn"),
+        ]
+
+    def test_field_bytes_reads_raw_response(self) -> None:
+        raw = {
+            "DcimDevice": {
+                "edges": [
+                    {"node": {"platform": {"node": {"napalm_driver": {"value": "eos"}}}}},
+                    {"node": {"platform": {"node": None}}},
+                ]
+            }
+        }
+
+        assert field_bytes(raw, ("DcimDevice", "platform", "napalm_driver")) == len('"napalm_driver":{"value":"eos"},')
+
+
+class TestKeysRead:
+    def test_python_keys_skip_docstrings(self, tmp_path: Path) -> None:
+        module = tmp_path / "mod.py"
+        module.write_text(
+            '"""napalm_driver"""\n\ndef f(d):\n    """asn"""\n    return d.get("local_as"), d["name"], "a b"\n'
+        )
+
+        assert module_keys([module]) == {"local_as", "name"}
+
+    def test_template_keys_follow_includes(self) -> None:
+        env = Environment(
+            loader=DictLoader(
+                {
+                    "leafs/eos.j2": "hostname {{ hostname }}\n{% include 'common/bgp.j2' %}",
+                    "common/bgp.j2": "{% for p in bgp.peerings | selectattr('session_type') %}{{ p['remote_ip'] }}{% endfor %}",
+                }
+            )
+        )
+
+        keys, visited = template_keys(env, ["leafs/eos.j2"])
+
+        assert visited == ["leafs/eos.j2", "common/bgp.j2"]
+        assert {"hostname", "peerings", "session_type", "remote_ip"} <= keys
+
+    def test_imports_are_followed_within_the_project(self) -> None:
+        modules = imported_modules(PROJECT_ROOT / "transforms" / "leaf.py")
+
+        names = {path.relative_to(PROJECT_ROOT).as_posix() for path in modules}
+        assert {
+            "transforms/leaf.py",
+            "transforms/common.py",
+            "transforms/helpers/bgp.py",
+            "utils/data_cleaning.py",
+        } <= names
+        assert not any(name.startswith("infrahub_sdk") for name in names)
+
+
+class TestReport:
+    def test_leaf_artifact_reports_unused_platform_fields(self) -> None:
+        (report,) = analyze(["leaf_config"])
+
+        unused = {usage.dotted for usage in report.unused}
+        assert report.query_file == "queries/config/leaf.gql"
+        assert "leafs/arista_eos.j2" in report.templates and "common/arista_eos_bgp.j2" in report.templates
+        assert {"DcimDevice.platform.napalm_driver", "DcimDevice.platform.ansible_network_os"} <= unused
+        assert "DcimDevice.name" not in unused and "DcimDevice.interfaces" not in unused
+        assert report.samples > 0 and 0 < report.saving_bytes < report.payload_bytes
+
+    def test_descendants_of_unused_fields_are_not_repeated(self) -> None:
+        (report,) = analyze(["leaf_config"])
+
+        paths = [usage.path for usage in report.unused]
+        assert ("DcimDevice", "primary_address") in paths
+        assert not any(path[:2] == ("DcimDevice", "primary_address") and len(path) > 2 for path in paths)
+        assert report.to_dict()["unused"][0] == {
+            "field": report.unused[0].dotted,
+            "bytes_per_payload": round(report.unused[0].bytes_per_payload),
+        }
+
+    def test_unknown_artifact_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown artifact definition"):
+            analyze(["nope"])
@@ -2,15 +2,15 @@
 
 Covers:
 - _parse_rack_data()      – direct node dict vs GQL result vs unknown shape
-- update_checksum()       – only fires for mixed+network; stagger sleep called
-- update_checksum()       – no ToR racks → no sleep; single ToR → no sleep
+- update_checksum()       – only fires for mixed+network; all ToR racks triggered at once
+- update_checksum()       – ToR racks already on the checksum are saved again (re-run after an early trigger)
 - update_checksum()       – skips when no leafs in rack
 """
 
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -172,7 +172,14 @@ class TestParseRackData:
                                             "index": {"value": 2},
                                             "naming_convention": {"value": "standard"},
                                             "management_pool": None,
-                                            "design": None,
+                                            "design": {
+                                                "node": {
+                                                    "id": "design-2",
+                                                    "routing_strategy": {"value": "ebgp-ibgp"},
+                                                    "underlay_protocol": {"value": "ipv6"},
+                                                    "rr_redundancy": {"value": 2},
+                                                }
+                                            },
                                             "fabric_interface_sorting_method": {"value": "top_down"},
                                         }
                                     },
@@ -186,6 +193,8 @@ class TestParseRackData:
         result = RackGenerator._parse_rack_data(raw)
         assert result.name == "GQL-RACK"
         assert result.rack_type == "tor"
+        design = result.pod.parent.design
+        assert design is not None and design.rr_redundancy == 2
 
     def test_empty_edges_raises_value_error(self) -> None:
         raw = {"LocationRack": {"edges": []}}
@@ -315,7 +324,7 @@ class TestUpdateChecksumMixed:
         tor_rack.save.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_single_tor_rack_no_stagger(self) -> None:
+    async def test_single_tor_rack_triggered(self) -> None:
         gen = _build_rack_generator(deployment_type="mixed", rack_type="network", checksum="new-cs")
         leaf_data = [{"device_id": "leaf-1", "device_name": "leaf-01", "interfaces": []}]
         gen.fetch_rack_devices_with_interfaces = AsyncMock(return_value=leaf_data)
@@ -324,30 +333,24 @@ class TestUpdateChecksumMixed:
         tor_rack = _mock_rack("TOR-RACK-1", "tor", checksum="")
         gen.client.filters = AsyncMock(return_value=[net_rack, tor_rack])
 
-        with patch("generators.add.rack.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await gen.update_checksum()
+        await gen.update_checksum()
 
-        mock_sleep.assert_not_called()
         tor_rack.save.assert_awaited_once_with(allow_upsert=True)
 
     @pytest.mark.asyncio
-    async def test_multiple_tor_racks_stagger_sleep(self) -> None:
+    async def test_multiple_tor_racks_triggered_without_stagger(self) -> None:
         gen = _build_rack_generator(deployment_type="mixed", rack_type="network", checksum="new-cs")
         leaf_data = [{"device_id": "leaf-1", "device_name": "leaf-01", "interfaces": []}]
         gen.fetch_rack_devices_with_interfaces = AsyncMock(return_value=leaf_data)
 
         net_rack = _mock_rack("NET-RACK-1", "network", checksum="new-cs")
-        tor1 = _mock_rack("TOR-RACK-1", "tor", checksum="")
-        tor2 = _mock_rack("TOR-RACK-9", "tor", checksum="")
-        gen.client.filters = AsyncMock(return_value=[net_rack, tor1, tor2])
+        tors = [_mock_rack(f"TOR-RACK-{i}", "tor", checksum="") for i in range(3)]
+        gen.client.filters = AsyncMock(return_value=[net_rack] + tors)
 
-        with patch("generators.add.rack.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await gen.update_checksum()
+        await gen.update_checksum()
 
-        # First ToR: no sleep; second ToR: sleep(5)
-        mock_sleep.assert_called_once_with(5)
-        tor1.save.assert_awaited_once_with(allow_upsert=True)
-        tor2.save.assert_awaited_once_with(allow_upsert=True)
+        for tor in tors:
+            tor.save.assert_awaited_once_with(allow_upsert=True)
 
     @pytest.mark.asyncio
     async def test_checksum_set_on_tor_rack(self) -> None:
@@ -359,23 +362,22 @@ class TestUpdateChecksumMixed:
         tor_rack = _mock_rack("TOR-RACK-1", "tor", checksum="")
         gen.client.filters = AsyncMock(return_value=[net_rack, tor_rack])
 
-        with patch("generators.add.rack.asyncio.sleep", new_callable=AsyncMock):
-            await gen.update_checksum()
+        await gen.update_checksum()
 
         assert tor_rack.checksum.value == "new-cs"
 
     @pytest.mark.asyncio
-    async def test_three_tor_racks_sleep_called_twice(self) -> None:
+    async def test_tor_rack_on_current_checksum_saved_again(self) -> None:
         gen = _build_rack_generator(deployment_type="mixed", rack_type="network", checksum="cs-3")
         leaf_data = [{"device_id": "leaf-1", "device_name": "leaf-01", "interfaces": []}]
         gen.fetch_rack_devices_with_interfaces = AsyncMock(return_value=leaf_data)
 
         net_rack = _mock_rack("NET-RACK-1", "network", checksum="cs-3")
-        tors = [_mock_rack(f"TOR-RACK-{i}", "tor", checksum="") for i in range(3)]
-        gen.client.filters = AsyncMock(return_value=[net_rack] + tors)
+        current = _mock_rack("TOR-RACK-1", "tor", checksum="cs-3")
+        stale = _mock_rack("TOR-RACK-2", "tor", checksum="old")
+        gen.client.filters = AsyncMock(return_value=[net_rack, current, stale])
 
-        with patch("generators.add.rack.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await gen.update_checksum()
+        await gen.update_checksum()
 
-        assert mock_sleep.call_count == 2
-        assert mock_sleep.call_args_list == [call(5), call(5)]
+        current.save.assert_awaited_once_with(allow_upsert=True)
+        stale.save.assert_awaited_once_with(allow_upsert=True)
@@ -0,0 +1,94 @@
+"""Unit tests for the render throughput benchmark.
+
+Covers tests/smoke/benchmark_render.py:
+- Fixtures grouped by transform role and device platform (cloud provider for cloud fixtures)
+- Per-group renders/s, latency percentiles and peak memory
+- Baseline comparison flagging regressions beyond the threshold
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "smoke"))
+
+from benchmark_render import compare, fixture_group, main, run_benchmark  # noqa: E402
+from test_configs_smoke import CONFIGS_DIR  # noqa: E402
+
+
+def _report(**groups: dict[str, float]) -> dict[str, Any]:
+    defaults = {"fixtures": 1, "renders": 10, "renders_per_s": 100.0, "p50_ms": 10.0, "p99_ms": 20.0, "peak_kib": 500.0}
+    return {"groups": {name.replace("__", "/"): {**defaults, **metrics} for name, metrics in groups.items()}}
+
+
+class TestGroups:
+    @pytest.mark.parametrize(
+        ("fixture", "expected"),
+        [
+            ("leaf_arista_eos_ebgp_ibgp", "leaf/arista_eos"),
+            ("super_spine_nokia_sros_ospf_ibgp", "super_spine/nokia_sros"),
+            ("cloud_terraform_aws_single_region", "cloud_terraform/aws"),
+        ],
+    )
+    def test_role_and_platform(self, fixture: str, expected: str) -> None:
+        fixture_dir = CONFIGS_DIR / fixture
+        if not fixture_dir.exists():
+            pytest.skip(f"fixture {fixture} not generated")
+
+        data = json.loads((fixture_dir / "input.json").read_text())
+
+        assert fixture_group(fixture_dir, data) == expected
+
+
+class TestRun:
+    def test_metrics_per_group(self) -> None:
+        report = run_benchmark(iterations=2, keyword="firewall_")
+
+        assert report["iterations"] == 2
+        assert report["groups"]
+        for result in report["groups"].values():
+            assert result["renders"] == 2 * result["fixtures"]
+            assert result["renders_per_s"] > 0
+            assert 0 < result["p50_ms"] <= result["p99_ms"]
+            assert result["peak_kib"] > 0
+
+    def test_main_writes_baseline_and_passes_against_itself(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+
+        assert main(["--iterations", "1", "-k", "firewall_fortinet", "--output", str(baseline)]) == 0
+        saved = json.loads(baseline.read_text())
+        assert list(saved["groups"]) == ["firewall/fortinet_fortios"]
+        assert (
+            main(["--iterations", "1", "-k", "firewall_fortinet", "--compare", str(baseline), "--threshold", "100"])
+            == 0
+        )
+
+
+class TestCompare:
+    def test_within_threshold_is_not_flagged(self) -> None:
+        baseline = _report(leaf__arista_eos={})
+        current = _report(leaf__arista_eos={"p50_ms": 11.0, "renders_per_s": 90.0})
+
+        assert compare(baseline, current, threshold=0.15) == []
+
+    def test_slower_and_larger_groups_are_flagged(self) -> None:
+        baseline = _report(leaf__arista_eos={}, spine__sonic={})
+        current = _report(
+            leaf__arista_eos={"p99_ms": 30.0, "renders_per_s": 60.0},
+            spine__sonic={"peak_kib": 800.0},
+        )
+
+        regressions = compare(baseline, current, threshold=0.15)
+
+        assert len(regressions) == 3
+        assert any(r.startswith("leaf/arista_eos: p99_ms") for r in regressions)
+        assert any(r.startswith("leaf/arista_eos: renders_per_s") for r in regressions)
+        assert any(r.startswith("spine/sonic: peak_kib") for r in regressions)
+
+    def test_new_groups_are_ignored(self) -> None:
+        assert compare(_report(), _report(edge__cisco_ios={"p50_ms": 1000.0})) == []
@@ -0,0 +1,133 @@
+"""Unit tests for route-reflector cluster planning of the iBGP overlay.
+
+Tests verify _BGPSessionPlanner.build_cluster_plan() and its use by
+RoutingPlanner._plan_overlay_peerings() with ``rr_redundancy`` set:
+- Cluster split, remainder handling and per-cluster sessions
+- Deterministic, stable client assignment
+- Spines as clients of super-spine clusters
+- Session counts before and after clustering
+- Peerings: RR-to-RR links as non-clients, RR links kept by the scope filter
+- eBGP overlay and rr_redundancy=0 keep the flat design
+"""
+
+from typing import Any
+
+from generators.helpers.routing import (
+    RoutingPlan,
+    RoutingPlanner,
+    RRClusterPlan,
+    _BGPDevice,
+    _BGPSessionPlanner,
+)
+
+
+def _devices(role: str, prefix: str, count: int) -> list[_BGPDevice]:
+    return [_BGPDevice(name=f"{prefix}-{i:02d}", id=f"{prefix}{i}", role=role) for i in range(1, count + 1)]
+
+
+def _cluster_plan(devices: list[_BGPDevice], redundancy: int = 2) -> RRClusterPlan:
+    return _BGPSessionPlanner(devices).build_cluster_plan("ibgp", redundancy)
+
+
+def _peers(plan: RRClusterPlan, name: str) -> set[str]:
+    return {s.dev2_name if s.dev1_name == name else s.dev1_name for s in plan.sessions if name in (s[0], s[2])}
+
+
+def _overlay_inputs(devices: list[_BGPDevice]) -> tuple[list[dict], dict[str, dict[str, Any]]]:
+    bgp = [{"name": f"{d.name}-bgp-overlay", "device_capabilities": [{"id": d.id}]} for d in devices]
+    device_map = {
+        d.name: {"id": d.id, "role": d.role, "loopback_ip": f"10.0.0.{i}", "loopback_interface_id": f"lb-{d.id}"}
+        for i, d in enumerate(devices, start=1)
+    }
+    return bgp, device_map
+
+
+class TestClusterPlan:
+    def test_clients_peer_with_every_rr_of_one_cluster(self) -> None:
+        spines, leafs = _devices("spine", "spine", 8), _devices("leaf", "leaf", 40)
+
+        plan = _cluster_plan(spines + leafs)
+
+        assert plan.clusters == [
+            ["spine-01", "spine-02"],
+            ["spine-03", "spine-04"],
+            ["spine-05", "spine-06"],
+            ["spine-07", "spine-08"],
+        ]
+        for leaf in leafs:
+            assert _peers(plan, leaf.name) == set(plan.clusters[plan.assignments[leaf.name]])
+        assert plan.head_mesh == {
+            frozenset((a, b))
+            for i, a in enumerate(["spine-01", "spine-03", "spine-05", "spine-07"])
+            for b in ["spine-01", "spine-03", "spine-05", "spine-07"][i + 1 :]
+        }
+        assert _peers(plan, "spine-02") - {leaf.name for leaf in leafs} == {"spine-01"}
+        assert len(plan.sessions) == 40 * 2 + 6 + 4
+
+    def test_remainder_joins_the_last_cluster(self) -> None:
+        plan = _cluster_plan(_devices("super-spine", "ss", 5))
+
+        assert [len(cluster) for cluster in plan.clusters] == [2, 3]
+        assert plan.assignments == {}
+        assert len(plan.sessions) == 1 + 1 + 2
+
+    def test_assignment_is_deterministic_and_stable(self) -> None:
+        spines = _devices("spine", "spine", 6)
+        small = _cluster_plan(spines + _devices("leaf", "leaf", 10))
+        large = _cluster_plan(spines + _devices("leaf", "leaf", 30))
+
+        assert _cluster_plan(spines + _devices("leaf", "leaf", 10)).sessions == small.sessions
+        assert {name: large.assignments[name] for name in small.assignments} == small.assignments
+
+    def test_spines_are_clients_of_super_spines(self) -> None:
+        plan = _cluster_plan(_devices("super-spine", "ss", 4) + _devices("spine", "spine", 6))
+
+        assert plan.clusters == [["ss-01", "ss-02"], ["ss-03", "ss-04"]]
+        assert set(plan.assignments) == {f"spine-{i:02d}" for i in range(1, 7)}
+
+    def test_session_counts_before_and_after(self) -> None:
+        plan = _cluster_plan(_devices("spine", "spine", 8) + _devices("leaf", "leaf", 100))
+
+        assert plan.sessions_before["spine-01"] == 100 and plan.sessions_before["leaf-01"] == 8
+        assert plan.sessions_after["leaf-01"] == 2
+        assert max(plan.sessions_after.values()) < 100
+        assert sum(plan.sessions_after.values()) == 2 * len(plan.sessions)
+        assert plan.summary().startswith("RR clusters: 4 [2/2/2/2 RRs], overlay sessions 800 -> ")
+
+
+class TestClusteredPeerings:
+    def _plan(self, overlay_type: str, rr_redundancy: int, **scope: set[str]) -> list[dict]:
+        spines, leafs = _devices("spine", "spine", 4), _devices("leaf", "leaf", 6)
+        bgp, device_map = _overlay_inputs(spines + leafs)
+        plan = RoutingPlan()
+        RoutingPlanner(deployment_id="dc-1")._plan_overlay_peerings(
+            plan,
+            overlay_type=overlay_type,
+            bgp_processes=bgp,
+            device_map=device_map,
+            rr_redundancy=rr_redundancy,
+            **scope,
+        )
+        return plan.bgp_peerings
+
+    def test_ibgp_uses_clusters(self) -> None:
+        peerings = {p["name"]: p for p in self._plan("ibgp", 2)}
+
+        assert len(peerings) == 6 * 2 + 1 + 2
+        assert peerings["overlay-evpn--spine-01--spine-03"]["route_reflector_client"] is False
+        assert peerings["overlay-evpn--spine-01--spine-02"]["route_reflector_client"] is False
+        assert all(p["route_reflector_client"] for name, p in peerings.items() if "leaf" in name)
+
+    def test_cross_layer_scope_keeps_rr_links(self) -> None:
+        peerings = self._plan(
+            "ibgp",
+            2,
+            bottom_device_names={f"leaf-{i:02d}" for i in range(1, 7)},
+            top_device_names={f"spine-{i:02d}" for i in range(1, 5)},
+        )
+
+        assert len(peerings) == 6 * 2 + 1 + 2
+
+    def test_flat_design_without_redundancy_or_with_ebgp(self) -> None:
+        assert len(self._plan("ibgp", 0)) == 6 * 4
+        assert len(self._plan("ebgp", 2)) == 6 * 4
@@ -0,0 +1,80 @@
+"""Unit tests for the synthetic large-scale fixture generator.
+
+Covers tests/smoke/generate_scaled_fixtures.py:
+- Every dimension of a ScaleProfile reaches the payload (ports, peerings, segments, rules, VPCs)
+- Same seed, same payload; different seed, different payload
+- Scaled payloads still render and feed the cabling and routing planners
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "smoke"))
+
+from generate_scaled_fixtures import (  # noqa: E402
+    PLANNER_SPINES,
+    ScaleProfile,
+    build_scaled_cloud_data,
+    build_scaled_device_data,
+    run_planners,
+    stress,
+)
+
+from utils.data_cleaning import get_data  # noqa: E402
+
+PROFILE = ScaleProfile(ports=12, peerings=5, segments=7, rules=30, vpcs=3)
+
+
+class TestProfile:
+    def test_scaled_multiplies_every_dimension(self) -> None:
+        assert ScaleProfile(seed=7).scaled(10) == ScaleProfile(
+            ports=40, peerings=20, segments=20, rules=30, vpcs=10, seed=7
+        )
+
+    def test_device_payload_follows_dimensions(self) -> None:
+        device = get_data(build_scaled_device_data(PROFILE))
+
+        physical = [i for i in device["interfaces"] if i["typename"] == "DcimPhysicalInterface"]
+        assert len(physical) == 12
+        assert sum(1 for i in physical if i["cable"]) == 5
+        underlay, overlay = device["device_capabilities"]
+        assert (len(underlay["peerings"]), len(overlay["peerings"])) == (5, 5)
+        deployments = device["deployment"]["segment_deployments"]
+        assert len(deployments) == 7
+        rules = [
+            len(policy["rules"])
+            for deployment in deployments
+            for policy in deployment["segment"].get("security_policies", [])
+        ]
+        assert sum(rules) == 30 and max(rules) - min(rules) <= 1
+
+    def test_cloud_payload_follows_vpcs(self) -> None:
+        assert len(build_scaled_cloud_data(PROFILE)["CloudVirtualNetwork"]["edges"]) == 3
+
+
+class TestDeterminism:
+    def test_same_seed_same_payload(self) -> None:
+        assert json.dumps(build_scaled_device_data(PROFILE)) == json.dumps(build_scaled_device_data(PROFILE))
+
+    def test_seed_changes_payload(self) -> None:
+        other = ScaleProfile(**{**PROFILE.__dict__, "seed": 1})
+
+        assert json.dumps(build_scaled_device_data(PROFILE)) != json.dumps(build_scaled_device_data(other))
+
+
+class TestStress:
+    def test_planners_cable_and_peer_the_pod(self) -> None:
+        planned = run_planners(PROFILE)
+
+        # one leaf per spine port, one uplink per spine; underlay + overlay session per cable
+        assert planned["cables"] == PLANNER_SPINES * 12
+        assert planned["bgp_peerings"] == 2 * PLANNER_SPINES * 12
+
+    def test_stress_renders_the_scaled_payloads(self) -> None:
+        report = stress(ScaleProfile().scaled(2), role="leaf", platform="cisco_nxos")
+
+        assert report["config_lines"] > 0
+        assert {"clean_data_ms", "Leaf_ms", "CloudVpcTerraform_ms", "planners_ms"} <= report.keys()
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from infrahub_sdk.task.models import TaskState
 
-from utils.task_manager import _get_task_workflow, _should_monitor_task, wait_for_branch_tasks
+from utils.task_manager import TaskWaitPolicy, _get_task_workflow, _should_monitor_task, wait_for_branch_tasks
 
 
 # Mock classes for testing
@@ -206,8 +207,8 @@ class TestWaitForBranchTasks:
             poll_interval=0.1,
         )
 
-        # Should have multiple filter calls (failure checks + active checks + stability checks)
-        assert client.task.filter.call_count >= 4  # 2 stability checks minimum
+        # At least 2 stable active-task polls plus the final failure sweep
+        assert client.task.filter.call_count >= 3
 
     @pytest.mark.asyncio
     async def test_custom_workflows_include_mode(self) -> None:
@@ -224,7 +225,7 @@ class TestWaitForBranchTasks:
             poll_interval=0.1,
         )
 
-        assert client.task.filter.call_count >= 4
+        assert client.task.filter.call_count >= 3
 
     @pytest.mark.asyncio
     async def test_no_filtering_when_mode_is_none(self) -> None:
@@ -240,7 +241,7 @@ class TestWaitForBranchTasks:
             poll_interval=0.1,
         )
 
-        assert client.task.filter.call_count >= 4
+        assert client.task.filter.call_count >= 3
 
     @pytest.mark.asyncio
     async def test_completes_when_no_tasks_with_stability(self) -> None:
@@ -251,8 +252,10 @@ class TestWaitForBranchTasks:
         # Should complete after 2 stable checks
         await wait_for_branch_tasks(client=client, branch="test-branch", timeout=5, poll_interval=0.1)  # type: ignore
 
-        # Should have at least 4 calls: 2 pairs of (failure + active) checks for stability
-        assert client.task.filter.call_count >= 4
+        # One active-task query per poll, failures are only swept once at the end
+        states = [call.kwargs["filter"].state[0] for call in client.task.filter.call_args_list]
+        assert states.count(TaskState.RUNNING) >= 2
+        assert states[-1] == TaskState.FAILED
 
     @pytest.mark.asyncio
     async def test_timeout_raises_error(self) -> None:
@@ -353,26 +356,16 @@ class TestWaitForBranchTasks:
         logger = MagicMock()
 
         active_task = MockTask(task_id="task-1", state=TaskState.RUNNING)
-
-        call_count = 0
+        # Active polls: first stable, then a new task runs for two polls, then it completes
+        active_polls = [[], [active_task], [active_task]]
 
         async def mock_filter(**kwargs):
-            nonlocal call_count
-            call_count += 1
-
-            # Failure checks always return empty
-            if kwargs["filter"].state[0] == TaskState.FAILED:
+            task_filter = kwargs["filter"]
+            if task_filter.ids:
+                return [MockTask(task_id="task-1", state=TaskState.COMPLETED)]
+            if task_filter.state[0] == TaskState.FAILED:
                 return []
-
-            # Active checks: first stable, then new task, then stable again
-            if call_count <= 2:
-                return []  # First stable check
-            elif call_count <= 4:
-                return [active_task]  # New task appears (resets stability)
-            elif call_count <= 6:
-                return [active_task]  # Task still running
-            else:
-                return []  # Task completes
+            return active_polls.pop(0) if active_polls else []
 
         client.task.filter = mock_filter
 
@@ -389,6 +382,81 @@ class TestWaitForBranchTasks:
         assert any("resetting stability" in str(call).lower() for call in log_calls)
 
 
+class TestAdaptivePolling:
+    """Test backoff, per-task state diffs and failure detection of wait_for_branch_tasks."""
+
+    def test_policy_backs_off_and_resets_on_change(self) -> None:
+        policy = TaskWaitPolicy(min_interval=1, max_interval=5, backoff=2, jitter=0)
+
+        assert policy.next_interval(1, changed=False) == 2
+        assert policy.next_interval(4, changed=False) == 5
+        assert policy.next_interval(5, changed=True) == 1
+        assert policy.jittered(3) == 3
+
+    def test_policy_from_poll_interval(self) -> None:
+        policy = TaskWaitPolicy.from_poll_interval(0.1)
+
+        assert policy.min_interval == policy.max_interval == policy.settle == 0.1
+
+    @pytest.mark.asyncio
+    async def test_finished_task_failure_detected_by_id_lookup(self) -> None:
+        client = MockClient()
+        polls = [[MockTask(task_id="gen-1", state=TaskState.RUNNING)]]
+        lookups: list[list[str]] = []
+
+        async def mock_filter(**kwargs):
+            task_filter = kwargs["filter"]
+            if task_filter.ids:
+                lookups.append(task_filter.ids)
+                return [MockTask(task_id="gen-1", state=TaskState.CRASHED)]
+            if task_filter.state[0] == TaskState.FAILED:
+                return []
+            return polls.pop(0) if polls else []
+
+        client.task.filter = mock_filter
+
+        with pytest.raises(RuntimeError, match="gen-1"):
+            await wait_for_branch_tasks(client=client, branch="test-branch", timeout=1, poll_interval=0.05)  # type: ignore
+        assert lookups == [["gen-1"]]
+
+    @pytest.mark.asyncio
+    async def test_failures_before_since_are_ignored(self) -> None:
+        client = MockClient()
+        since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        old = MockTask(task_id="old", state=TaskState.FAILED)
+        old.updated_at = since - timedelta(hours=1)
+
+        async def mock_filter(**kwargs):
+            return [old] if kwargs["filter"].state[0] == TaskState.FAILED else []
+
+        client.task.filter = mock_filter
+
+        await wait_for_branch_tasks(client=client, branch="test-branch", timeout=1, poll_interval=0.05, since=since)  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_failures_logged_when_not_raising(self) -> None:
+        client = MockClient()
+        logger = MagicMock()
+
+        async def mock_filter(**kwargs):
+            if kwargs["filter"].state[0] == TaskState.FAILED:
+                return [MockTask(task_id="new", state=TaskState.FAILED)]
+            return []
+
+        client.task.filter = mock_filter
+
+        await wait_for_branch_tasks(
+            client=client,  # type: ignore
+            branch="test-branch",
+            timeout=1,
+            poll_interval=0.05,
+            logger=logger,
+            raise_on_failure=False,
+        )
+
+        assert "new" in str(logger.warning.call_args)
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
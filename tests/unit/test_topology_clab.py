@@ -0,0 +1,151 @@
+"""Unit tests for the containerlab topology transform.
+
+Covers transforms/topology_clab.py:
+- Equivalence with templates/clab_topology.j2 on a large synthetic fabric
+  (the template walks device interfaces, the transform the deployment cables)
+- Links from the deployment cables: one per cable, incomplete cables skipped
+- Deployments without devices
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+from jinja2 import Environment, FileSystemLoader
+
+from transforms.common import clean_data
+from transforms.topology_clab import TopologyClab
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _value(value: Any) -> dict[str, Any]:
+    return {"value": value}
+
+
+def _device(name: str, cables: list[tuple[str | None, str]], address: str | None = "172.20.0.10/24") -> dict:
+    return {
+        "node": {
+            "name": _value(name),
+            "os_version": _value("ceos:4.34"),
+            "device_type": {"node": {"name": _value("7050")}},
+            "platform": {"node": {"containerlab_os": _value("ceos")}},
+            "primary_address": {"node": {"address": _value(address)}} if address else {"node": None},
+            "interfaces": {
+                "edges": [
+                    {"node": {"cable": {"node": {"id": cable_id, "display_label": label}}}}
+                    for cable_id, label in cables
+                ]
+                + [{"node": {"cable": {"node": None}}}]
+            },
+        }
+    }
+
+
+def _cable(cable_id: str | None, *endpoints: tuple[str, str]) -> dict[str, Any]:
+    return {"node": {"id": cable_id, "endpoints": {"edges": [{"node": {"hfid": list(e)}} for e in endpoints]}}}
+
+
+def _fabric(spines: int, leafs: int) -> dict[str, Any]:
+    """Raw query response: every leaf cabled to every spine.
+
+    Devices list their cables from both ends for the template; the
+    deployment lists each cable once for the transform.
+    """
+    cables = {
+        (spine, leaf): (f"cable-{spine}-{leaf}", f"spine{spine}:Ethernet{leaf}__leaf{leaf}:Ethernet{spine}")
+        for spine in range(spines)
+        for leaf in range(leafs)
+    }
+    devices = [_device(f"spine{spine}", [cables[(spine, leaf)] for leaf in range(leafs)]) for spine in range(spines)]
+    devices += [
+        _device(f"leaf{leaf}", [cables[(spine, leaf)] for spine in range(spines)], address=None)
+        for leaf in range(leafs)
+    ]
+    deployment_cables = [
+        _cable(f"cable-{spine}-{leaf}", (f"spine{spine}", f"Ethernet{leaf}"), (f"leaf{leaf}", f"Ethernet{spine}"))
+        for spine in range(spines)
+        for leaf in range(leafs)
+    ]
+    return {
+        "TopologyDeployment": {
+            "edges": [
+                {
+                    "node": {
+                        "name": _value("DC-1"),
+                        "devices": {"edges": devices},
+                        "cables": {"edges": deployment_cables},
+                    }
+                },
+                {"node": {"name": _value("DC-2"), "devices": {"edges": []}}},
+            ]
+        }
+    }
+
+
+def _render_template(data: dict[str, Any]) -> str:
+    env = Environment(loader=FileSystemLoader(str(ROOT / "templates")), autoescape=False)
+    return env.get_template("clab_topology.j2").render(data=clean_data(data))
+
+
+async def _transform(data: dict[str, Any]) -> str:
+    return await TopologyClab.__new__(TopologyClab).transform(data)
+
+
+class TestEquivalence:
+    @pytest.mark.asyncio
+    async def test_matches_template_output(self) -> None:
+        data = _fabric(spines=4, leafs=48)
+
+        output = await _transform(data)
+
+        expected = list(yaml.safe_load_all(_render_template(data)))
+        assert list(yaml.safe_load_all(output)) == expected
+        assert len(expected[0]["topology"]["links"]) == 4 * 48
+        assert expected[0]["topology"]["nodes"]["spine0"]["management"] == {"ipv4": "172.20.0.10/24"}
+        assert "management" not in expected[0]["topology"]["nodes"]["leaf0"]
+
+
+class TestLinks:
+    @pytest.mark.asyncio
+    async def test_one_link_per_complete_cable(self) -> None:
+        cable = _cable("c1", ("spine1", "Ethernet1"), ("leaf1", "Ethernet1"))
+        data = {
+            "TopologyDeployment": {
+                "edges": [
+                    {
+                        "node": {
+                            "name": _value("DC"),
+                            "devices": {"edges": [_device("spine1", []), _device("leaf1", [])]},
+                            "cables": {
+                                "edges": [
+                                    cable,
+                                    cable,
+                                    _cable("c2", ("spine1", "Ethernet2")),
+                                    _cable("c3", ("spine1", "Ethernet3"), ("leaf1",)),
+                                ]
+                            },
+                        }
+                    }
+                ]
+            }
+        }
+
+        topology = yaml.safe_load(await _transform(data))
+
+        assert topology["topology"]["links"] == [{"endpoints": ["spine1:eth1", "leaf1:eth1"]}]
+
+    @pytest.mark.asyncio
+    async def test_deployment_without_devices_has_no_topology(self) -> None:
+        data = {"TopologyDeployment": {"edges": [{"node": {"name": _value("Empty")}}]}}
+
+        topology = yaml.safe_load(await _transform(data))
+
+        assert topology == {
+            "name": "Empty",
+            "prefix": "",
+            "mgmt": {"network": "empty", "ipv4-subnet": "172.20.0.0/24"},
+        }
@@ -4,7 +4,7 @@ from typing import Any
 
 from infrahub_sdk.transforms import InfrahubTransform
 
-from transforms.helpers.cloud import prepare_cloud_data
+from transforms.helpers.cloud import LineBuffer, prepare_cloud_data, render_vpc_blocks
 from utils.data_cleaning import clean_data
 
 
@@ -26,7 +26,7 @@ def _vpc_blocks_aws(
     nacls_by_vpc: dict,
     vpngws_by_vpc: dict,
     asgs_by_vpc: dict,
-    routes: list,
+    routes_by_rt: dict,
     public_ips: list,
     provider_var: str = "",
 ) -> list[str]:
@@ -148,10 +148,7 @@ def _vpc_blocks_aws(
             "}}" + opts + ");",
             "",
         ]
-        for route in routes:
-            route_rt = (route.get("route_table") or {}).get("name", "")
-            if route_rt != rt_name:
-                continue
+        for route in routes_by_rt.get(rt_name) or []:
             route_name = route.get("name", "")
             dest = (route.get("destination") or {}).get("prefix", "")
             igw_ref = (route.get("internet_gateway") or {}).get("name", "")
@@ -355,7 +352,7 @@ def _vpc_blocks_azure(
     nacls_by_vpc: dict,
     vpngws_by_vpc: dict,
     asgs_by_vpc: dict,
-    routes: list,
+    routes_by_rt: dict,
     public_ips: list,
     rg_name: str,
     location: str,
@@ -482,10 +479,7 @@ def _vpc_blocks_azure(
             "});",
             "",
         ]
-        for route in routes:
-            route_rt = (route.get("route_table") or {}).get("name", "")
-            if route_rt != rt_name:
-                continue
+        for route in routes_by_rt.get(rt_name) or []:
             route_name = route.get("name", "")
             dest = (route.get("destination") or {}).get("prefix", "")
             igw_ref = (route.get("internet_gateway") or {}).get("name", "")
@@ -665,7 +659,7 @@ def _vpc_blocks_gcp(
     rts_by_vpc: dict,
     vpngws_by_vpc: dict,
     asgs_by_vpc: dict,
-    routes: list,
+    routes_by_vpc: dict,
     public_ips: list,
     region: str,
 ) -> list[str]:
@@ -766,11 +760,7 @@ def _vpc_blocks_gcp(
         ]
 
     # Routes
-    for route in routes:
-        route_rt = (route.get("route_table") or {}).get("name", "")
-        rt_obj = next((rt for rt in (rts_by_vpc.get(vpc_name) or []) if rt.get("name") == route_rt), None)
-        if rt_obj is None:
-            continue
+    for route in routes_by_vpc.get(vpc_name) or []:
         route_name = route.get("name", "")
         dest = (route.get("destination") or {}).get("prefix", "")
         igw_ref = (route.get("internet_gateway") or {}).get("name", "")
@@ -909,10 +899,11 @@ class CloudVpcPulumi(InfrahubTransform):
     """Generate a TypeScript Pulumi index.ts for all VPCs in a CloudAccount."""
 
     query = "cloud_vpc_config"
+    vpc_workers = 0
+    """Worker processes rendering the per-VPC blocks (0 renders them in-process)."""
 
     async def transform(self, data: Any) -> str:
-        cleaned = clean_data(data)
-        ctx = prepare_cloud_data(cleaned)
+        ctx = prepare_cloud_data(clean_data(data))
         if not ctx["vpcs"]:
             raise ValueError("No CloudVirtualNetwork found for this account")
 
@@ -923,7 +914,6 @@ class CloudVpcPulumi(InfrahubTransform):
         transit_gateways = ctx["transit_gateways"]
         customer_gateways = ctx["customer_gateways"]
         direct_connects = ctx["direct_connects"]
-        routes = ctx["routes"]
         peerings = ctx["peerings"]
         vifs = ctx["vifs"]
         sgs_by_vpc = ctx["sgs_by_vpc"]
@@ -934,32 +924,41 @@ class CloudVpcPulumi(InfrahubTransform):
         vpngws_by_vpc = ctx["vpngws_by_vpc"]
         inst_by_vpc = ctx["inst_by_vpc"]
         asgs_by_vpc = ctx["asgs_by_vpc"]
+        routes_by_rt = ctx["routes_by_rt"]
+        routes_by_vpc = ctx["routes_by_vpc"]
 
-        lines: list[str] = []
+        out = LineBuffer()
 
         if provider_name == "aws":
             regions_seen = ctx["regions_seen"]
             vpc_region_map = ctx["vpc_region_map"]
 
-            lines += [
-                'import * as aws from "@pulumi/aws";',
-                'import * as pulumi from "@pulumi/pulumi";',
-                "",
-            ]
+            out.extend(
+                [
+                    'import * as aws from "@pulumi/aws";',
+                    'import * as pulumi from "@pulumi/pulumi";',
+                    "",
+                ]
+            )
 
             # Provider instances per region
             for region in regions_seen:
                 pvar = f"aws_{_ts_id(region)}"
-                lines += [
-                    f'const {pvar} = new aws.Provider("{region}", {{ region: "{region}" }});',
-                    "",
-                ]
+                out.extend(
+                    [
+                        f'const {pvar} = new aws.Provider("{region}", {{ region: "{region}" }});',
+                        "",
+                    ]
+                )
 
+            jobs = []
             for vpc in vpcs:
                 region = vpc_region_map.get(vpc.get("name", ""), "")
-                provider_var = f"aws_{_ts_id(region)}" if region else ""
-                lines += _vpc_blocks_aws(
-                    vpc,
+                jobs.append((vpc, {"provider_var": f"aws_{_ts_id(region)}" if region else ""}))
+            for lines in render_vpc_blocks(
+                _vpc_blocks_aws,
+                jobs,
+                (
                     sgs_by_vpc,
                     inst_by_vpc,
                     igws_by_vpc,
@@ -968,12 +967,16 @@ class CloudVpcPulumi(InfrahubTransform):
                     nacls_by_vpc,
                     vpngws_by_vpc,
                     asgs_by_vpc,
-                    routes,
+                    routes_by_rt,
                     public_ips,
-                    provider_var=provider_var,
+                ),
+                self.vpc_workers,
+            ):
+                out.extend(lines)
+            out.extend(
+                _account_blocks_aws(
+                    transit_gateways, customer_gateways, peerings, direct_connects, public_ips, provider_var=""
                 )
-            lines += _account_blocks_aws(
-                transit_gateways, customer_gateways, peerings, direct_connects, public_ips, provider_var=""
             )  # TGW is account-wide; use default
 
         elif provider_name == "azure":
@@ -981,10 +984,11 @@ class CloudVpcPulumi(InfrahubTransform):
             region_obj = vpcs[0].get("region") or {}
             location = region_obj.get("name", "eastus") if region_obj else "eastus"
             rg_name = f"{account_name}-rg"
-            lines += ['import * as azure_native from "@pulumi/azure-native";', ""]
-            for vpc in vpcs:
-                lines += _vpc_blocks_azure(
-                    vpc,
+            out.extend(['import * as azure_native from "@pulumi/azure-native";', ""])
+            for lines in render_vpc_blocks(
+                _vpc_blocks_azure,
+                [(vpc, {}) for vpc in vpcs],
+                (
                     sgs_by_vpc,
                     inst_by_vpc,
                     igws_by_vpc,
@@ -993,32 +997,41 @@ class CloudVpcPulumi(InfrahubTransform):
                     nacls_by_vpc,
                     vpngws_by_vpc,
                     asgs_by_vpc,
-                    routes,
+                    routes_by_rt,
                     public_ips,
                     rg_name,
                     location,
-                )
-            lines += _account_blocks_azure(
-                transit_gateways, customer_gateways, peerings, direct_connects, rg_name, location
+                ),
+                self.vpc_workers,
+            ):
+                out.extend(lines)
+            out.extend(
+                _account_blocks_azure(transit_gateways, customer_gateways, peerings, direct_connects, rg_name, location)
             )
 
         else:  # gcp
             region_obj = vpcs[0].get("region") or {}
             region = region_obj.get("name", "") if region_obj else ""
-            lines += ['import * as gcp from "@pulumi/gcp";', ""]
-            for vpc in vpcs:
-                lines += _vpc_blocks_gcp(
-                    vpc,
+            out.extend(['import * as gcp from "@pulumi/gcp";', ""])
+            for lines in render_vpc_blocks(
+                _vpc_blocks_gcp,
+                [(vpc, {}) for vpc in vpcs],
+                (
                     sgs_by_vpc,
                     inst_by_vpc,
                     nats_by_vpc,
                     rts_by_vpc,
                     vpngws_by_vpc,
                     asgs_by_vpc,
-                    routes,
+                    routes_by_vpc,
                     public_ips,
                     region,
-                )
-            lines += _account_blocks_gcp(transit_gateways, customer_gateways, peerings, direct_connects, vifs, region)
+                ),
+                self.vpc_workers,
+            ):
+                out.extend(lines)
+            out.extend(
+                _account_blocks_gcp(transit_gateways, customer_gateways, peerings, direct_connects, vifs, region)
+            )
 
-        return "\n".join(lines)
+        return out.getvalue()
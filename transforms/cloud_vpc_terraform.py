@@ -4,7 +4,7 @@ from typing import Any
 
 from infrahub_sdk.transforms import InfrahubTransform
 
-from transforms.helpers.cloud import prepare_cloud_data
+from transforms.helpers.cloud import LineBuffer, prepare_cloud_data, render_vpc_blocks
 from utils.data_cleaning import clean_data
 
 
@@ -115,7 +115,7 @@ def _vpc_blocks_aws(
     nacls_by_vpc: dict,
     vpngws_by_vpc: dict,
     asgs_by_vpc: dict,
-    routes: list,
+    routes_by_rt: dict,
     public_ips: list,
     tgws: list,
     cgws: list,
@@ -269,10 +269,7 @@ def _vpc_blocks_aws(
         )
 
         # Routes belonging to this route table
-        for route in routes:
-            route_rt = (route.get("route_table") or {}).get("name", "")
-            if route_rt != rt_name:
-                continue
+        for route in routes_by_rt.get(rt_name) or []:
             route_name = route.get("name", "")
             route_id = (
                 _tf_id(route_name)
@@ -500,7 +497,7 @@ def _vpc_blocks_azure(
     nacls_by_vpc: dict,
     vpngws_by_vpc: dict,
     asgs_by_vpc: dict,
-    routes: list,
+    routes_by_rt: dict,
     public_ips: list,
     rg_ref: str,
     location: str,
@@ -642,10 +639,7 @@ def _vpc_blocks_azure(
             "}",
             "",
         ]
-        for route in routes:
-            route_rt = (route.get("route_table") or {}).get("name", "")
-            if route_rt != rt_name:
-                continue
+        for route in routes_by_rt.get(rt_name) or []:
             route_name = route.get("name", "")
             dest = (route.get("destination") or {}).get("prefix", "")
             igw_ref = (route.get("internet_gateway") or {}).get("name", "")
@@ -833,7 +827,7 @@ def _vpc_blocks_gcp(
     rts_by_vpc: dict,
     vpngws_by_vpc: dict,
     asgs_by_vpc: dict,
-    routes: list,
+    routes_by_vpc: dict,
     public_ips: list,
     region: str,
 ) -> list[str]:
@@ -940,12 +934,7 @@ def _vpc_blocks_gcp(
         ]
 
     # Routes
-    for route in routes:
-        route_rt = (route.get("route_table") or {}).get("name", "")
-        # For GCP, filter routes belonging to this VPC via route table grouping
-        rt_obj = next((rt for rt in (rts_by_vpc.get(vpc_name) or []) if rt.get("name") == route_rt), None)
-        if rt_obj is None:
-            continue
+    for route in routes_by_vpc.get(vpc_name) or []:
         route_name = route.get("name", "")
         dest = (route.get("destination") or {}).get("prefix", "")
         igw_ref = (route.get("internet_gateway") or {}).get("name", "")
@@ -1088,10 +1077,11 @@ class CloudVpcTerraform(InfrahubTransform):
     """Generate native HCL Terraform for all VPCs in a CloudAccount."""
 
     query = "cloud_vpc_config"
+    vpc_workers = 0
+    """Worker processes rendering the per-VPC blocks (0 renders them in-process)."""
 
     async def transform(self, data: Any) -> str:
-        cleaned = clean_data(data)
-        ctx = prepare_cloud_data(cleaned)
+        ctx = prepare_cloud_data(clean_data(data))
         if not ctx["vpcs"]:
             raise ValueError("No CloudVirtualNetwork found for this account")
 
@@ -1102,7 +1092,6 @@ class CloudVpcTerraform(InfrahubTransform):
         transit_gateways = ctx["transit_gateways"]
         customer_gateways = ctx["customer_gateways"]
         direct_connects = ctx["direct_connects"]
-        routes = ctx["routes"]
         peerings = ctx["peerings"]
         vifs = ctx["vifs"]
         sgs_by_vpc = ctx["sgs_by_vpc"]
@@ -1113,21 +1102,26 @@ class CloudVpcTerraform(InfrahubTransform):
         vpngws_by_vpc = ctx["vpngws_by_vpc"]
         inst_by_vpc = ctx["inst_by_vpc"]
         asgs_by_vpc = ctx["asgs_by_vpc"]
+        routes_by_rt = ctx["routes_by_rt"]
+        routes_by_vpc = ctx["routes_by_vpc"]
 
-        lines: list[str] = []
+        out = LineBuffer()
 
         if provider_name == "aws":
             regions_seen = ctx["regions_seen"]
             vpc_region_map = ctx["vpc_region_map"]
             default_region = regions_seen[0] if regions_seen else ""
-            lines += _provider_block_aws(regions_seen)
+            out.extend(_provider_block_aws(regions_seen))
 
+            jobs = []
             for vpc in vpcs:
                 region = vpc_region_map.get(vpc.get("name", ""), "")
                 alias = _tf_id(region) if region else ""
-                provider_attr = f"aws.{alias}" if region != default_region and alias else ""
-                lines += _vpc_blocks_aws(
-                    vpc,
+                jobs.append((vpc, {"provider_attr": f"aws.{alias}" if region != default_region and alias else ""}))
+            for lines in render_vpc_blocks(
+                _vpc_blocks_aws,
+                jobs,
+                (
                     sgs_by_vpc,
                     inst_by_vpc,
                     igws_by_vpc,
@@ -1136,16 +1130,18 @@ class CloudVpcTerraform(InfrahubTransform):
                     nacls_by_vpc,
                     vpngws_by_vpc,
                     asgs_by_vpc,
-                    routes,
+                    routes_by_rt,
                     public_ips,
                     transit_gateways,
                     customer_gateways,
                     peerings,
                     direct_connects,
-                    provider_attr=provider_attr,
-                )
-            lines += _account_blocks_aws(
-                transit_gateways, customer_gateways, peerings, direct_connects, provider_attr=""
+                ),
+                self.vpc_workers,
+            ):
+                out.extend(lines)
+            out.extend(
+                _account_blocks_aws(transit_gateways, customer_gateways, peerings, direct_connects, provider_attr="")
             )  # TGW is account-wide; use default
 
         elif provider_name == "azure":
@@ -1153,10 +1149,11 @@ class CloudVpcTerraform(InfrahubTransform):
             region_obj = vpcs[0].get("region") or {}
             location = region_obj.get("name", "eastus") if region_obj else "eastus"
             rg_ref = "var.resource_group_name"
-            lines += _provider_block_azure(account_name)
-            for vpc in vpcs:
-                lines += _vpc_blocks_azure(
-                    vpc,
+            out.extend(_provider_block_azure(account_name))
+            for lines in render_vpc_blocks(
+                _vpc_blocks_azure,
+                [(vpc, {}) for vpc in vpcs],
+                (
                     sgs_by_vpc,
                     inst_by_vpc,
                     igws_by_vpc,
@@ -1165,33 +1162,42 @@ class CloudVpcTerraform(InfrahubTransform):
                     nacls_by_vpc,
                     vpngws_by_vpc,
                     asgs_by_vpc,
-                    routes,
+                    routes_by_rt,
                     public_ips,
                     rg_ref,
                     location,
-                )
-            lines += _account_blocks_azure(
-                transit_gateways, customer_gateways, peerings, direct_connects, rg_ref, location
+                ),
+                self.vpc_workers,
+            ):
+                out.extend(lines)
+            out.extend(
+                _account_blocks_azure(transit_gateways, customer_gateways, peerings, direct_connects, rg_ref, location)
             )
 
         else:  # gcp
             project = account.get("account_id", "")
             region_obj = vpcs[0].get("region") or {}
             region = region_obj.get("name", "") if region_obj else ""
-            lines += _provider_block_gcp(project, region)
-            for vpc in vpcs:
-                lines += _vpc_blocks_gcp(
-                    vpc,
+            out.extend(_provider_block_gcp(project, region))
+            for lines in render_vpc_blocks(
+                _vpc_blocks_gcp,
+                [(vpc, {}) for vpc in vpcs],
+                (
                     sgs_by_vpc,
                     inst_by_vpc,
                     nats_by_vpc,
                     rts_by_vpc,
                     vpngws_by_vpc,
                     asgs_by_vpc,
-                    routes,
+                    routes_by_vpc,
                     public_ips,
                     region,
-                )
-            lines += _account_blocks_gcp(transit_gateways, customer_gateways, peerings, direct_connects, vifs, region)
+                ),
+                self.vpc_workers,
+            ):
+                out.extend(lines)
+            out.extend(
+                _account_blocks_gcp(transit_gateways, customer_gateways, peerings, direct_connects, vifs, region)
+            )
 
-        return "\n".join(lines)
+        return out.getvalue()
@@ -41,7 +41,7 @@ class Firewall(BaseDeviceTransform):
             {
                 "fw_interfaces": fw_interfaces,
                 "zones": zones,
-                "zone_policies": get_zone_policies(policies_data),
+                "zone_policies": get_zone_policies(policies_data, compact=self.compact_acls),
                 "static_routes": get_firewall_static_routes(fw_interfaces, zones),
             }
         )
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from transforms.helpers.acl_compaction import compact_acl
 from transforms.helpers.segments import _get_segment_prefix_str
 
 
@@ -55,7 +56,7 @@ def _build_acl_rule(rule: dict[str, Any], *, mirror_dst: bool = False) -> dict[s
     }
 
 
-def get_acls(activations: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
+def get_acls(activations: list[dict[str, Any]] | None = None, compact: bool = False) -> list[dict[str, Any]]:
     """Build ACL list from SegmentDeployment security policies (zero-trust).
 
     Generates inbound ACLs for each segment with security_policies present.
@@ -71,6 +72,8 @@ def get_acls(activations: list[dict[str, Any]] | None = None) -> list[dict[str,
 
     Args:
         activations: List of SegmentDeployment dicts (after clean_data).
+        compact: Run ``compact_acl`` on every ACL (first-match semantics are
+            kept); compacted ACLs also carry ``entries_before`` / ``entries_after``.
 
     Returns:
         List of ACL dicts:
@@ -198,4 +201,6 @@ def get_acls(activations: list[dict[str, Any]] | None = None) -> list[dict[str,
         seen_vlans.add(vlan_id)
 
     acls.sort(key=lambda a: a.get("vlan_id") or 0)
+    if compact:
+        return [compact_acl(acl) for acl in acls]
     return acls
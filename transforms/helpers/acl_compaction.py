@@ -0,0 +1,304 @@
+"""ACL compaction helpers for device transforms.
+
+``get_acls`` and ``get_zone_policies`` emit one entry per SecurityPolicyRule
+(plus a mirrored entry per East-West rule), which quickly fills hardware
+TCAM. ``compact_rules`` shrinks an ordered rule list without changing which
+rule a packet hits first, or what that rule does:
+
+1. **Shadowed rules** are dropped: a rule whose match is covered by the
+   union of earlier rules can never be hit. Port coverage is computed as a
+   union of intervals, so ``eq 80`` + ``range 81 90`` shadows ``range 80 85``.
+2. **Ranges and prefixes are merged**: two rules with the same outcome that
+   differ only in adjacent/overlapping destination ports, or only in sibling
+   prefixes (``10.0.0.0/25`` + ``10.0.0.128/25`` → ``10.0.0.0/24``), become one
+   rule at the earlier position — if no rule in between with another outcome
+   overlaps the moved traffic.
+3. **Redundant rules** are dropped: a rule covered by a later rule with the
+   same outcome, with no rule in between with another outcome overlapping it.
+
+The outcome of a rule is its action, log flag and security profile. Rules
+whose prefixes or ports cannot be parsed are kept as-is and block any
+compaction across them.
+"""
+
+from dataclasses import dataclass
+from ipaddress import IPv4Network, IPv6Network, collapse_addresses, ip_network
+from typing import Any, Optional, Union
+
+IPNetwork = Union[IPv4Network, IPv6Network]
+
+PORT_MIN = 0
+PORT_MAX = 65535
+_PORT_PROTOCOLS = ("tcp", "udp")
+_OUTCOME_FIELDS = ("action", "log", "security_profile")
+
+
+@dataclass(frozen=True)
+class _Match:
+    """Packet space matched by one rule. ``None`` prefixes and zones mean any."""
+
+    protocol: str
+    src: Optional[IPNetwork]
+    dst: Optional[IPNetwork]
+    ports: tuple[int, int]
+    src_zone: Optional[str]
+    dst_zone: Optional[str]
+
+    @property
+    def has_ports(self) -> bool:
+        return self.protocol in _PORT_PROTOCOLS
+
+
+def _parse_prefix(value: Any) -> Optional[IPNetwork]:
+    if value in (None, "", "any"):
+        return None
+    return ip_network(str(value), strict=False)
+
+
+def _parse_ports(value: Any) -> tuple[int, int]:
+    if not value:
+        return (PORT_MIN, PORT_MAX)
+    parts = str(value).split()
+    if parts[0] == "eq" and len(parts) == 2:
+        return (int(parts[1]), int(parts[1]))
+    if parts[0] == "range" and len(parts) == 3:
+        return (int(parts[1]), int(parts[2]))
+    raise ValueError(f"Unsupported port match: {value}")
+
+
+def _format_ports(ports: tuple[int, int]) -> Optional[str]:
+    if ports == (PORT_MIN, PORT_MAX):
+        return None
+    if ports[0] == ports[1]:
+        return f"eq {ports[0]}"
+    return f"range {ports[0]} {ports[1]}"
+
+
+def _parse_match(rule: dict[str, Any], zone_aware: bool) -> Optional[_Match]:
+    """Return the match of ``rule``, or None if it cannot be reasoned about."""
+    protocol = rule.get("protocol") or "ip"
+    try:
+        return _Match(
+            protocol=protocol,
+            src=_parse_prefix(rule.get("src")),
+            dst=_parse_prefix(rule.get("dst")),
+            ports=_parse_ports(rule.get("dst_port")) if protocol in _PORT_PROTOCOLS else (PORT_MIN, PORT_MAX),
+            src_zone=rule.get("src_zone") if zone_aware else None,
+            dst_zone=rule.get("dst_zone") if zone_aware else None,
+        )
+    except ValueError:
+        return None
+
+
+def _outcome(rule: dict[str, Any]) -> tuple:
+    return tuple(rule.get(name) for name in _OUTCOME_FIELDS)
+
+
+# ============================================================================
+# Match algebra
+# ============================================================================
+
+
+def _prefix_covers(outer: Optional[IPNetwork], inner: Optional[IPNetwork]) -> bool:
+    if outer is None:
+        return True
+    if inner is None or outer.version != inner.version:
+        return False
+    return inner.subnet_of(outer)  # type: ignore[arg-type]
+
+
+def _prefix_overlaps(a: Optional[IPNetwork], b: Optional[IPNetwork]) -> bool:
+    if a is None or b is None:
+        return True
+    return a.version == b.version and a.overlaps(b)  # type: ignore[arg-type]
+
+
+def _zone_covers(outer: Optional[str], inner: Optional[str]) -> bool:
+    return outer is None or outer == inner
+
+
+def _zone_overlaps(a: Optional[str], b: Optional[str]) -> bool:
+    return a is None or b is None or a == b
+
+
+def _covers_except_ports(outer: _Match, inner: _Match) -> bool:
+    return (
+        outer.protocol in ("ip", inner.protocol)
+        and _prefix_covers(outer.src, inner.src)
+        and _prefix_covers(outer.dst, inner.dst)
+        and _zone_covers(outer.src_zone, inner.src_zone)
+        and _zone_covers(outer.dst_zone, inner.dst_zone)
+    )
+
+
+def _covers(outer: _Match, inner: _Match) -> bool:
+    if not _covers_except_ports(outer, inner):
+        return False
+    return not outer.has_ports or (outer.ports[0] <= inner.ports[0] and inner.ports[1] <= outer.ports[1])
+
+
+def _overlaps(a: _Match, b: _Match) -> bool:
+    if not ("ip" in (a.protocol, b.protocol) or a.protocol == b.protocol):
+        return False
+    if a.has_ports and b.has_ports and (a.ports[1] < b.ports[0] or b.ports[1] < a.ports[0]):
+        return False
+    return (
+        _prefix_overlaps(a.src, b.src)
+        and _prefix_overlaps(a.dst, b.dst)
+        and _zone_overlaps(a.src_zone, b.src_zone)
+        and _zone_overlaps(a.dst_zone, b.dst_zone)
+    )
+
+
+def _intervals_cover(intervals: list[tuple[int, int]], target: tuple[int, int]) -> bool:
+    """Return True if the union of ``intervals`` contains ``target``."""
+    reach = target[0] - 1
+    for low, high in sorted(intervals):
+        if low > reach + 1:
+            break
+        reach = max(reach, high)
+        if reach >= target[1]:
+            return True
+    return False
+
+
+# ============================================================================
+# Passes
+# ============================================================================
+
+
+def _drop_shadowed(rules: list[dict[str, Any]], matches: list[Optional[_Match]]) -> list[int]:
+    """Return the indexes of rules that are not shadowed by earlier rules."""
+    kept: list[int] = []
+    for index, match in enumerate(matches):
+        if match is not None:
+            intervals: list[tuple[int, int]] = []
+            shadowed = False
+            for earlier in (matches[i] for i in kept):
+                if earlier is None or not _covers_except_ports(earlier, match):
+                    continue
+                if not earlier.has_ports:
+                    shadowed = True
+                    break
+                intervals.append(earlier.ports)
+            if shadowed or (match.has_ports and intervals and _intervals_cover(intervals, match.ports)):
+                continue
+        kept.append(index)
+    return kept
+
+
+def _can_move_up(
+    rules: list[dict[str, Any]], matches: list[Optional[_Match]], start: int, end: int, match: _Match
+) -> bool:
+    """Return True if the traffic of ``match`` may be decided at ``start`` instead of ``end``."""
+    outcome = _outcome(rules[end])
+    for k in range(start + 1, end):
+        between = matches[k]
+        if _outcome(rules[k]) != outcome and (between is None or _overlaps(between, match)):
+            return False
+    return True
+
+
+def _merged(first: _Match, second: _Match) -> Optional[_Match]:
+    """Return one match equal to the union of two, or None if it is not a single rule."""
+    if (first.protocol, first.src_zone, first.dst_zone) != (second.protocol, second.src_zone, second.dst_zone):
+        return None
+    same_src, same_dst, same_ports = first.src == second.src, first.dst == second.dst, first.ports == second.ports
+    if same_src and same_dst and first.has_ports and not same_ports:
+        if first.ports[0] <= second.ports[1] + 1 and second.ports[0] <= first.ports[1] + 1:
+            ports = (min(first.ports[0], second.ports[0]), max(first.ports[1], second.ports[1]))
+            return _Match(first.protocol, first.src, first.dst, ports, first.src_zone, first.dst_zone)
+        return None
+    if not same_ports or same_src == same_dst:
+        return None
+    a, b = (first.src, second.src) if not same_src else (first.dst, second.dst)
+    if a is None or b is None or a.version != b.version:
+        return None
+    collapsed = list(collapse_addresses([a, b]))  # type: ignore[list-item]
+    if len(collapsed) != 1:
+        return None
+    if not same_src:
+        return _Match(first.protocol, collapsed[0], first.dst, first.ports, first.src_zone, first.dst_zone)
+    return _Match(first.protocol, first.src, collapsed[0], first.ports, first.src_zone, first.dst_zone)
+
+
+def _merge_once(rules: list[dict[str, Any]], matches: list[Optional[_Match]]) -> bool:
+    """Merge the first mergeable pair in place; return True if one was merged."""
+    for i, first in enumerate(matches):
+        if first is None:
+            continue
+        for j in range(i + 1, len(rules)):
+            second = matches[j]
+            if second is None or _outcome(rules[j]) != _outcome(rules[i]):
+                continue
+            if (rules[i].get("src_zone"), rules[i].get("dst_zone")) != (
+                rules[j].get("src_zone"),
+                rules[j].get("dst_zone"),
+            ):
+                continue
+            merged = _merged(first, second)
+            if merged is None or not _can_move_up(rules, matches, i, j, second):
+                continue
+            rule = dict(rules[i])
+            if merged.src != first.src:
+                rule["src"] = str(merged.src)
+            if merged.dst != first.dst:
+                rule["dst"] = str(merged.dst)
+            if merged.ports != first.ports:
+                rule["dst_port"] = _format_ports(merged.ports)
+            rules[i] = rule
+            matches[i] = merged
+            del rules[j], matches[j]
+            return True
+    return False
+
+
+def _drop_redundant_once(rules: list[dict[str, Any]], matches: list[Optional[_Match]]) -> bool:
+    """Drop the first rule covered by a later rule with the same outcome; return True if one was dropped."""
+    for i, match in enumerate(matches):
+        if match is None:
+            continue
+        for j in range(i + 1, len(rules)):
+            later = matches[j]
+            if later is None:
+                break
+            if _outcome(rules[j]) == _outcome(rules[i]) and _covers(later, match):
+                del rules[i], matches[i]
+                return True
+            if _outcome(rules[j]) != _outcome(rules[i]) and _overlaps(later, match):
+                break
+    return False
+
+
+def compact_rules(rules: list[dict[str, Any]], zone_aware: bool = False) -> list[dict[str, Any]]:
+    """Return an equivalent, shorter first-match rule list.
+
+    Args:
+        rules: Ordered ACL rule dicts (``protocol``, ``src``, ``dst``, ``dst_port``,
+            ``action``, ``log`` …) as built by ``get_acls`` / ``get_zone_policies``.
+        zone_aware: Match on ``src_zone`` / ``dst_zone`` (zone policies). For
+            interface ACLs zones are only remarks and do not affect matching.
+
+    Returns:
+        New list of rule dicts; kept rules keep their ``seq`` and ``name``.
+    """
+    matches = [_parse_match(rule, zone_aware) for rule in rules]
+    kept = _drop_shadowed(rules, matches)
+    compacted = [rules[i] for i in kept]
+    matches = [matches[i] for i in kept]
+
+    changed = True
+    while changed:
+        changed = _merge_once(compacted, matches) or _drop_redundant_once(compacted, matches)
+        if changed:
+            kept = _drop_shadowed(compacted, matches)
+            compacted = [compacted[i] for i in kept]
+            matches = [matches[i] for i in kept]
+    return compacted
+
+
+def compact_acl(acl: dict[str, Any], zone_aware: bool = False) -> dict[str, Any]:
+    """Return a copy of ``acl`` with compacted ``rules`` and ``entries_before`` / ``entries_after`` counts."""
+    rules = acl.get("rules") or []
+    compacted = compact_rules(rules, zone_aware=zone_aware)
+    return {**acl, "rules": compacted, "entries_before": len(rules), "entries_after": len(compacted)}
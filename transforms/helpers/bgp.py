@@ -3,6 +3,8 @@
 from ipaddress import ip_address
 from typing import Any
 
+from transforms.helpers.capabilities import Capabilities, capabilities_of_type
+
 
 def _sort_key_ip(ip_obj: Any) -> tuple:
     """Return a sort key for an IP address object (dict or string).
@@ -170,9 +172,12 @@ def _build_session_from_peering(
         if remote_asn:
             session["remote_as"] = {"asn": remote_asn}
 
-    # Remote device name
+    # Remote device name and role (role: which end of an RR client session reflects)
     if remote_device_name:
         session["remote_device"] = remote_device_name
+    remote_role = remote_iface.get("device", {}).get("role")
+    if remote_role:
+        session["remote_role"] = remote_role
 
     # eBGP sessions require remote_as to be useful — skip if not resolved
     if session_type in ("EBGP", "EBGP_MULTIHOP", "EBGP_UNNUMBERED") and "remote_as" not in session:
@@ -191,12 +196,45 @@ def _build_session_from_peering(
     return session
 
 
+_RR_TIER_BY_ROLE: dict[str, int] = {
+    "tor": 0,
+    "leaf": 1,
+    "border-leaf": 1,
+    "spine": 2,
+    "super-spine": 3,
+    "super_spine": 3,
+}
+"""Route-reflector tier of a device role: on an RR client session the higher tier reflects."""
+
+
+def _reflects_for(session: dict[str, Any], device_role: str) -> bool:
+    """Whether this device is the route reflector of an iBGP overlay session.
+
+    ``route_reflector_client`` is set on the peering, not per end: the end
+    with the higher RR tier reflects for the other one. Sessions without
+    the remote role (older payloads) fall back to the device role: spines
+    and super-spines reflect, leafs reflect for their tors.
+    """
+    if not session.get("route_reflector_client"):
+        return False
+    local_tier = _RR_TIER_BY_ROLE.get(device_role)
+    remote_tier = _RR_TIER_BY_ROLE.get(session.get("remote_role") or "")
+    if local_tier is not None and remote_tier is not None:
+        return local_tier > remote_tier
+    if device_role in ("spine", "super-spine", "super_spine"):
+        return True
+    return device_role in ("leaf", "border-leaf") and "tor" in (session.get("remote_device") or "")
+
+
 def _build_peer_groups(sessions: list[dict[str, Any]], device_role: str = "") -> list[dict[str, Any]]:
     """Assign sessions to peer groups and return group definitions.
 
     Always creates a peer group when there is at least one session of the type:
     - UNDERLAY-PEERS: eBGP sessions with TTL=1 (P2P underlay), per-neighbor remote-as
     - EVPN-PEERS: iBGP sessions with TTL!=1 (EVPN overlay), shared remote-as from peer group
+    - EVPN-RR-CLIENTS: iBGP overlay sessions this device reflects for, split out of
+      EVPN-PEERS when the device also has non-client overlay sessions (RR clusters:
+      uplinks to its own RRs, RR-to-RR links)
     - EVPN-OVERLAY: eBGP sessions with TTL!=1 (eBGP EVPN overlay), per-neighbor remote-as
 
     Mutates sessions in-place by adding 'peer_group' (and 'remote_as_from_peer_group' for iBGP)
@@ -226,39 +264,33 @@ def _build_peer_groups(sessions: list[dict[str, Any]], device_role: str = "") ->
             session["peer_group"] = pg_name
 
     if overlay_ibgp:
-        pg_name = "EVPN-PEERS"
         remote_as = None
         for s in overlay_ibgp:
             ra = s.get("remote_as")
             if isinstance(ra, dict) and ra.get("asn"):
                 remote_as = ra["asn"]
                 break
-        _RR_ROLES = ("spine", "super-spine", "super_spine")
-        has_rr_flag = any(bool(s.get("route_reflector_client")) for s in overlay_ibgp)
-        # Spines/super-spines are always RRs when peerings have the RR flag.
-        # Leafs become intermediate RRs in middle_rack/mixed deployments
-        # when they have overlay sessions with tors (2-level RR hierarchy).
-        is_spine_rr = has_rr_flag and device_role in _RR_ROLES
-        is_leaf_rr = (
-            has_rr_flag
-            and device_role in ("leaf", "border-leaf")
-            and any("tor" in (s.get("remote_device") or "") for s in overlay_ibgp)
-        )
-        rr_client = is_spine_rr or is_leaf_rr
-        peer_groups.append(
-            {
-                "name": pg_name,
-                "type": "overlay",
-                "session_type": "IBGP",
-                "remote_as": remote_as,
-                "send_community_extended": True,
-                "route_reflector_client": rr_client,
-                "address_families": ["evpn"],
-            }
-        )
-        for session in overlay_ibgp:
-            session["peer_group"] = pg_name
-            session["remote_as_from_peer_group"] = True
+        rr_clients = [s for s in overlay_ibgp if _reflects_for(s, device_role)]
+        non_clients = [s for s in overlay_ibgp if not _reflects_for(s, device_role)]
+        # One overlay group unless the device both reflects and peers as a non-client
+        groups = [("EVPN-PEERS", overlay_ibgp, bool(rr_clients))]
+        if rr_clients and non_clients:
+            groups = [("EVPN-PEERS", non_clients, False), ("EVPN-RR-CLIENTS", rr_clients, True)]
+        for pg_name, members, rr_client in groups:
+            peer_groups.append(
+                {
+                    "name": pg_name,
+                    "type": "overlay",
+                    "session_type": "IBGP",
+                    "remote_as": remote_as,
+                    "send_community_extended": True,
+                    "route_reflector_client": rr_client,
+                    "address_families": ["evpn"],
+                }
+            )
+            for session in members:
+                session["peer_group"] = pg_name
+                session["remote_as_from_peer_group"] = True
 
     if overlay_ebgp:
         pg_name = "EVPN-OVERLAY"
@@ -280,7 +312,7 @@ def _build_peer_groups(sessions: list[dict[str, Any]], device_role: str = "") ->
 
 
 def get_bgp_profile(
-    device_capabilities: list[dict[str, Any]],
+    device_capabilities: Capabilities,
     interfaces: list[dict[str, Any]] | None = None,
     device_name: str = "",
     device_role: str = "",
@@ -297,15 +329,13 @@ def get_bgp_profile(
     Remote ASN for eBGP: resolved from bgp_processes in the peering data.
     Remote ASN for iBGP: equals local_as (same AS by definition).
     """
-    if not device_capabilities:
+    services = capabilities_of_type(device_capabilities, "ManagedBGP")
+    if not services:
         return []
 
     bgp_configs = []
 
-    for service in device_capabilities:
-        if service.get("typename") != "ManagedBGP":
-            continue
-
+    for service in services:
         bgp_config = {
             "name": service.get("name"),
             "status": service.get("status"),
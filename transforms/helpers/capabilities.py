@@ -0,0 +1,60 @@
+"""Single-pass index of device capabilities for device transforms."""
+
+from typing import Any
+
+CAPABILITY_FLAGS = {
+    "bgp_enabled": "ManagedBGP",
+    "ospf_enabled": "ManagedOSPF",
+    "mlag_enabled": "ManagedMLAG",
+    "ntp_enabled": "ManagedNTP",
+    "syslog_enabled": "ManagedSyslog",
+    "snmp_enabled": "ManagedSNMP",
+    "aaa_enabled": "ManagedAAA",
+}
+"""Template capability flag → capability typename."""
+
+
+class CapabilityIndex:
+    """Device capabilities bucketed by typename, interfaces bucketed by role.
+
+    Built once per device so that the ``get_*`` helpers read their bucket
+    instead of each scanning ``device_capabilities`` (and ``interfaces``) again.
+    Buckets keep the order of the query response.
+    """
+
+    __slots__ = ("by_typename", "interfaces_by_role")
+
+    def __init__(
+        self,
+        device_capabilities: list[dict[str, Any]] | None = None,
+        interfaces: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.by_typename: dict[str, list[dict[str, Any]]] = {}
+        for capability in device_capabilities or []:
+            self.by_typename.setdefault(capability.get("typename") or "", []).append(capability)
+        self.interfaces_by_role: dict[str, list[dict[str, Any]]] = {}
+        for interface in interfaces or []:
+            self.interfaces_by_role.setdefault(interface.get("role") or "", []).append(interface)
+
+    def __contains__(self, typename: object) -> bool:
+        return typename in self.by_typename
+
+    def of_type(self, typename: str) -> list[dict[str, Any]]:
+        """Capabilities of one typename, in query order."""
+        return self.by_typename.get(typename, [])
+
+    def first_interface(self, role: str) -> dict[str, Any] | None:
+        """First interface with the given role, if any."""
+        matches = self.interfaces_by_role.get(role)
+        return matches[0] if matches else None
+
+
+Capabilities = list[dict[str, Any]] | CapabilityIndex | None
+"""What the ``get_*`` helpers accept: the raw list or a prebuilt index."""
+
+
+def capabilities_of_type(device_capabilities: Capabilities, typename: str) -> list[dict[str, Any]]:
+    """Return the capabilities of one typename from a list or a ``CapabilityIndex``."""
+    if isinstance(device_capabilities, CapabilityIndex):
+        return device_capabilities.of_type(typename)
+    return [c for c in device_capabilities or [] if c.get("typename") == typename]
@@ -1,7 +1,52 @@
-"""Shared helpers for cloud transforms (Terraform and Pulumi)."""
+"""Shared helpers for cloud transforms (Terraform and Pulumi).
 
+Both transforms build the filtered and grouped account data (the cloud IR,
+see ``prepare_cloud_data``) from their own query response. The per-VPC blocks
+only depend on one VPC and that data, so large accounts can render them in
+worker processes (``render_vpc_blocks``).
+"""
+
+import io
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
+PARALLEL_VPC_MIN: int | None = None
+"""Fewest VPCs rendered in worker processes; None: not measured, no threshold.
+
+The only measurement so far (``invoke demo.benchmark-cloud``, 200 VPCs, one
+CPU) found the pool slower than in-process rendering at every worker count,
+so no break-even point is known. ``vpc_workers`` stays 0 (in-process) on
+both transforms; set this from ``demo.benchmark-cloud`` on the worker
+hardware before enabling workers.
+"""
+
+_VPC_WORKER_STATE: tuple[Callable[..., list[str]], tuple] | None = None
+
+
+class LineBuffer:
+    """Text buffer fed with blocks of lines.
+
+    ``getvalue()`` equals ``"\\n".join()`` of every line written, without
+    keeping the lines themselves around.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._empty = True
+
+    def extend(self, lines: Iterable[str]) -> None:
+        lines = list(lines)
+        if not lines:
+            return
+        if not self._empty:
+            self._buffer.write("\n")
+        self._buffer.write("\n".join(lines))
+        self._empty = False
+
+    def getvalue(self) -> str:
+        return self._buffer.getvalue()
+
 
 def prepare_cloud_data(cleaned: dict[str, Any]) -> dict[str, Any]:
     """Extract, filter and group all cloud resources from a cleaned GraphQL response.
@@ -102,6 +147,22 @@ def prepare_cloud_data(cleaned: dict[str, Any]) -> dict[str, Any]:
         k = (asg.get("virtual_network") or {}).get("name", "")
         asgs_by_vpc.setdefault(k, []).append(asg)
 
+    routes_by_rt: dict[str, list] = {}
+    for route in routes:
+        routes_by_rt.setdefault((route.get("route_table") or {}).get("name", ""), []).append(route)
+
+    # A route belongs to every VPC having a route table of that name
+    rt_vpcs: dict[str, list[str]] = {}
+    for rt in route_tables:
+        vpc_name = (rt.get("virtual_network") or {}).get("name", "")
+        names = rt_vpcs.setdefault(rt.get("name", ""), [])
+        if vpc_name not in names:
+            names.append(vpc_name)
+    routes_by_vpc: dict[str, list] = {}
+    for route in routes:
+        for vpc_name in rt_vpcs.get((route.get("route_table") or {}).get("name", ""), []):
+            routes_by_vpc.setdefault(vpc_name, []).append(route)
+
     regions_seen: list[str] = []
     vpc_region_map: dict[str, str] = {}
     for vpc in vpcs:
@@ -137,6 +198,50 @@ def prepare_cloud_data(cleaned: dict[str, Any]) -> dict[str, Any]:
         "vpngws_by_vpc": _group(vpn_gateways),
         "inst_by_vpc": inst_by_vpc,
         "asgs_by_vpc": asgs_by_vpc,
+        "routes_by_rt": routes_by_rt,
+        "routes_by_vpc": routes_by_vpc,
         "regions_seen": regions_seen,
         "vpc_region_map": vpc_region_map,
     }
+
+
+def _init_vpc_worker(render: Callable[..., list[str]], shared: tuple) -> None:
+    global _VPC_WORKER_STATE
+    _VPC_WORKER_STATE = (render, shared)
+
+
+def _render_vpc_job(job: tuple[dict, dict]) -> list[str]:
+    if _VPC_WORKER_STATE is None:
+        raise RuntimeError("VPC worker used before _init_vpc_worker() ran")
+    render, shared = _VPC_WORKER_STATE
+    vpc, kwargs = job
+    return render(vpc, *shared, **kwargs)
+
+
+def render_vpc_blocks(
+    render: Callable[..., list[str]],
+    jobs: Sequence[tuple[dict, dict]],
+    shared: tuple,
+    workers: int = 0,
+) -> list[list[str]]:
+    """Render ``render(vpc, *shared, **kwargs)`` for every ``(vpc, kwargs)`` job.
+
+    With ``workers > 1`` and more than one job (at least ``PARALLEL_VPC_MIN``
+    when set), the blocks are rendered in a pool of worker processes. The shared groupings are sent once
+    per worker (pool initializer), each job only carries its VPC. Results are
+    returned in job order, so the output does not depend on the worker count.
+
+    Args:
+        render: Module-level ``_vpc_blocks_*`` function (must be picklable)
+        jobs: ``(vpc, keyword arguments)`` per VPC, in output order
+        shared: Positional arguments following the VPC, identical for all jobs
+        workers: Worker processes; 0 or 1 renders in the calling process
+
+    Returns:
+        The lines of each VPC, in job order
+    """
+    if workers <= 1 or len(jobs) < max(PARALLEL_VPC_MIN or 0, 2):
+        return [render(vpc, *shared, **kwargs) for vpc, kwargs in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_vpc_worker, initargs=(render, shared)) as pool:
+        return list(pool.map(_render_vpc_job, jobs, chunksize=chunksize))
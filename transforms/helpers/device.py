@@ -0,0 +1,179 @@
+"""Base class for device configuration transforms (``BaseDeviceTransform``).
+
+Imported through ``transforms.common``, which loads this module on first use.
+"""
+
+from typing import Any
+
+from infrahub_sdk.transforms import InfrahubTransform
+from jinja2 import Environment, FileSystemLoader, Template
+from netutils.utils import jinja2_convenience_function
+
+from transforms.helpers.acl import get_acls
+from transforms.helpers.bgp import get_bgp_profile
+from transforms.helpers.capabilities import CAPABILITY_FLAGS, CapabilityIndex
+from transforms.helpers.firewall import get_vrf_default_gateways
+from transforms.helpers.management import get_aaa, get_ntp, get_snmp, get_syslog
+from transforms.helpers.mlag import get_mlag
+from transforms.helpers.ospf import get_ospf
+from transforms.helpers.segments import get_vlans
+from transforms.helpers.vxlan import get_interfaces, get_vxlan_config
+from utils.data_cleaning import clean_data
+from utils.profiling import payload_target, profiled
+
+
+def get_capabilities(data: dict[str, Any], index: CapabilityIndex | None = None) -> dict[str, Any]:
+    """Derive device capabilities from services.
+
+    Capabilities are derived from device_capabilities (BGP/OSPF presence).
+
+    Args:
+        data: Device data from GraphQL query (after clean_data)
+        index: Prebuilt index of ``data``'s capabilities (built if omitted)
+
+    Returns:
+        Dict with capability flags for template rendering.
+    """
+    if index is None:
+        index = CapabilityIndex(data.get("device_capabilities"))
+    return {flag: typename in index for flag, typename in CAPABILITY_FLAGS.items()}
+
+
+class BaseDeviceTransform(InfrahubTransform):
+    """Base class for device configuration transforms.
+
+    Eliminates boilerplate shared across device transforms by handling:
+    - GraphQL data extraction and cleaning
+    - Platform detection with null safety
+    - Jinja2 environment setup with netutils filters
+    - Standard config building (interfaces, BGP, OSPF)
+
+    Subclasses set class attributes and optionally override ``_extra_config()``
+    to add device-specific template variables (VLANs, VXLAN, etc.).
+
+    Class attributes:
+        template_subdir: Subdirectory under templates/configs/ for this device type.
+        device_role: Role passed to get_vxlan_config (e.g. "spine", "leaf").
+                     Set to "" to omit VXLAN from the template context.
+        compact_acls: Compact ACLs / zone policies (shadowed rules, adjacent
+                      ports, sibling prefixes) to save TCAM entries.
+    """
+
+    template_subdir: str = ""
+    device_role: str = ""
+    compact_acls: bool = False
+
+    async def run(self, data: dict | None = None) -> Any:
+        """Render the artifact, profiled when ``PROFILING`` is set (see utils/profiling.py)."""
+        with profiled("transform", self.name, lambda: payload_target(data)):
+            return await super().run(data=data)
+
+    async def transform(self, data: Any) -> Any:
+        cleaned = clean_data(data)
+
+        # Device node is always the first root
+        if not isinstance(cleaned, dict) or not cleaned:
+            raise ValueError("clean_data() did not return a non-empty dictionary")
+        first_key = next(iter(cleaned))
+        first_value = cleaned[first_key]
+        device_data = first_value[0] if isinstance(first_value, list) and first_value else (first_value or {})
+
+        # Extra roots (e.g. DcimFirewallInterface for VRF default gateways)
+        extra_roots = {k: v for k, v in cleaned.items() if k != first_key}
+
+        platform = device_data.get("platform") or {}
+        platform_name = platform.get("netmiko_device_type")
+
+        if not platform_name:
+            device_name = device_data.get("name", "Unknown Device")
+            return (
+                f"! Device {device_name} has no platform with "
+                f"netmiko_device_type defined.\n! No configuration generated.\n"
+            )
+
+        # Extract segment activations from deployment context (if present in query)
+        deployment = device_data.get("deployment") or {}
+        activations = deployment.get("segment_deployments")
+        # Fallback: device deployed in TopologyPod — traverse to parent DC
+        if not activations:
+            parent = deployment.get("parent") or {}
+            activations = parent.get("segment_deployments")
+        if activations:
+            device_data["segment_deployments"] = self._filter_segment_deployments(activations)
+
+        config = self._build_config(device_data, platform_name)
+        config.update(self._extra_config(device_data, platform_name, extra_roots=extra_roots))
+
+        template = self._load_template(platform_name)
+        return template.render(**config)
+
+    def _build_config(self, data: dict, platform_name: str) -> dict:
+        """Build the base template context shared by all device transforms."""
+        interfaces = data.get("interfaces") or []
+        # One pass over capabilities and interfaces; every helper below reads its bucket
+        index = CapabilityIndex(data.get("device_capabilities"), interfaces)
+        device_name = data.get("name", "")
+        activations = data.get("segment_deployments")
+        config = {
+            "name": device_name,
+            "hostname": device_name,
+            "device_role": data.get("role", ""),
+            "interfaces": get_interfaces(interfaces, activations=activations),
+            "bgp": get_bgp_profile(
+                index,
+                interfaces,
+                device_name=device_name,
+                device_role=data.get("role", ""),
+            ),
+            "ospf": get_ospf(index),
+            "mlag": get_mlag(index),
+            "ntp": get_ntp(index),
+            "syslog": get_syslog(index),
+            "snmp": get_snmp(index),
+            "aaa": get_aaa(index),
+        }
+        capabilities = get_capabilities(data, index)
+        if capabilities:
+            config["capabilities"] = capabilities
+        return config
+
+    def _extra_config(self, data: dict, platform_name: str, extra_roots: dict | None = None) -> dict:  # noqa: ARG002
+        """Return device-specific template variables.
+
+        Default implementation adds VLANs, VXLAN config, ACLs, and VRF default
+        gateways (Option A: FW as inter-VRF router) when device_role is set.
+        Override in subclasses for different behavior.
+        """
+        if not self.device_role:
+            return {}
+        activations = data.get("segment_deployments")
+        vlans = get_vlans(activations=activations)
+
+        # VRF default gateways: derived from segment → security_zone → firewall_interface
+        vrf_gateways = get_vrf_default_gateways(activations)
+
+        return {
+            "vlans": vlans,
+            "vxlan": get_vxlan_config(data, platform_name, device_role=self.device_role, activations=activations),
+            "acls": get_acls(activations=activations, compact=self.compact_acls),
+            "vrf_gateways": vrf_gateways,
+        }
+
+    def _filter_segment_deployments(self, activations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Filter segment activations before they are used in config generation.
+
+        Override in subclasses to restrict which segments appear in the config.
+        Default: return all activations unchanged.
+        """
+        return activations
+
+    def _load_template(self, platform_name: str) -> Template:
+        """Load the Jinja2 template for the given platform."""
+        path = f"{self.root_directory}/templates/configs"
+        env = Environment(
+            loader=FileSystemLoader(path),
+            autoescape=False,
+            keep_trailing_newline=True,
+        )
+        env.filters.update(jinja2_convenience_function())
+        return env.get_template(f"{self.template_subdir}/{platform_name}.j2")
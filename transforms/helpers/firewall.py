@@ -3,6 +3,7 @@
 from ipaddress import ip_interface, ip_network
 from typing import Any
 
+from transforms.helpers.acl_compaction import compact_acl
 from transforms.helpers.segments import _get_segment_namespace, _get_segment_prefix_str
 
 
@@ -155,7 +156,7 @@ def get_vrf_default_gateways(
     return gateways
 
 
-def get_zone_policies(policies_data: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
+def get_zone_policies(policies_data: list[dict[str, Any]] | None = None, compact: bool = False) -> list[dict[str, Any]]:
     """Build a zone policy list from SecurityPolicy nodes (global query).
 
     Disabled policies and disabled rules are skipped. An implicit deny-all rule
@@ -163,6 +164,8 @@ def get_zone_policies(policies_data: list[dict[str, Any]] | None = None) -> list
 
     Args:
         policies_data: List of cleaned SecurityPolicy dicts.
+        compact: Run ``compact_acl`` (zone-aware) on every policy; compacted
+            policies also carry ``entries_before`` / ``entries_after``.
 
     Returns:
         List of policy dicts:
@@ -264,4 +267,6 @@ def get_zone_policies(policies_data: list[dict[str, Any]] | None = None) -> list
                 "rules": rules,
             }
         )
+    if compact:
+        return [compact_acl(policy, zone_aware=True) for policy in policies]
     return policies
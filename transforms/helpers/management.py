@@ -2,12 +2,12 @@
 
 from typing import Any
 
+from transforms.helpers.capabilities import Capabilities, capabilities_of_type
 
-def get_ntp(device_capabilities: list[dict[str, Any]]) -> dict[str, Any] | None:
+
+def get_ntp(device_capabilities: Capabilities) -> dict[str, Any] | None:
     """Extract NTP configuration from device capabilities."""
-    for service in device_capabilities or []:
-        if service.get("typename") != "ManagedNTP":
-            continue
+    for service in capabilities_of_type(device_capabilities, "ManagedNTP"):
         servers = [
             {
                 "address": s.get("address"),
@@ -24,11 +24,9 @@ def get_ntp(device_capabilities: list[dict[str, Any]]) -> dict[str, Any] | None:
     return None
 
 
-def get_syslog(device_capabilities: list[dict[str, Any]]) -> dict[str, Any] | None:
+def get_syslog(device_capabilities: Capabilities) -> dict[str, Any] | None:
     """Extract Syslog configuration from device capabilities."""
-    for service in device_capabilities or []:
-        if service.get("typename") != "ManagedSyslog":
-            continue
+    for service in capabilities_of_type(device_capabilities, "ManagedSyslog"):
         servers = [
             {
                 "address": s.get("address"),
@@ -42,11 +40,9 @@ def get_syslog(device_capabilities: list[dict[str, Any]]) -> dict[str, Any] | No
     return None
 
 
-def get_snmp(device_capabilities: list[dict[str, Any]]) -> dict[str, Any] | None:
+def get_snmp(device_capabilities: Capabilities) -> dict[str, Any] | None:
     """Extract SNMP configuration from device capabilities."""
-    for service in device_capabilities or []:
-        if service.get("typename") != "ManagedSNMP":
-            continue
+    for service in capabilities_of_type(device_capabilities, "ManagedSNMP"):
         trap_targets = [
             {
                 "address": t.get("address"),
@@ -67,11 +63,9 @@ def get_snmp(device_capabilities: list[dict[str, Any]]) -> dict[str, Any] | None
     return None
 
 
-def get_aaa(device_capabilities: list[dict[str, Any]]) -> dict[str, Any] | None:
+def get_aaa(device_capabilities: Capabilities) -> dict[str, Any] | None:
     """Extract AAA configuration from device capabilities."""
-    for service in device_capabilities or []:
-        if service.get("typename") != "ManagedAAA":
-            continue
+    for service in capabilities_of_type(device_capabilities, "ManagedAAA"):
         servers = [
             {
                 "address": s.get("address"),
@@ -2,9 +2,11 @@
 
 from typing import Any
 
+from transforms.helpers.capabilities import Capabilities, CapabilityIndex, capabilities_of_type
+
 
 def get_mlag(
-    device_capabilities: list[dict[str, Any]] | None, interfaces: list[dict[str, Any]] | None = None
+    device_capabilities: Capabilities, interfaces: list[dict[str, Any]] | None = None
 ) -> dict[str, Any] | None:
     """Extract MLAG domain configuration for template rendering.
 
@@ -14,16 +16,15 @@ def get_mlag(
     the device has no MLAG domain.
 
     If interfaces are provided, the peer-link interface (role == 'mlag-peer')
-    is identified and included as peer_link in the result.
+    is identified and included as peer_link in the result. With a
+    ``CapabilityIndex``, it is read from the index's interfaces by role.
     """
-    for cap in device_capabilities or []:
-        if cap.get("typename") != "ManagedMLAG":
-            continue
-        peer_link = None
-        for iface in interfaces or []:
-            if iface.get("role") == "mlag-peer":
-                peer_link = iface.get("name")
-                break
+    for cap in capabilities_of_type(device_capabilities, "ManagedMLAG"):
+        if isinstance(device_capabilities, CapabilityIndex) and interfaces is None:
+            peer = device_capabilities.first_interface("mlag-peer")
+        else:
+            peer = next((iface for iface in interfaces or [] if iface.get("role") == "mlag-peer"), None)
+        peer_link = peer.get("name") if peer else None
         return {
             "name": cap.get("name"),
             "domain_id": cap.get("domain_id"),
@@ -4,14 +4,13 @@ from infrahub_sdk.transforms import InfrahubTransform
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from netutils.utils import jinja2_convenience_function
 
+from .common import clean_data
+
 
 class LoadBalancer(InfrahubTransform):
     query = "loadbalancer_config"
 
     async def transform(self, data: Any) -> Any:
-        # Clean the data
-        from utils.data_cleaning import clean_data
-
         cleaned_data = clean_data(data)
 
         # Get load balancer data
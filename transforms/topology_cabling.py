@@ -1,23 +1,136 @@
-"""Transform for extracting fabric cabling information from topology."""
-
-from typing import Any
+"""Transform for extracting fabric cabling information from topology.
+
+Cable rows are streamed: ``TopologyCabling.iter_cables`` yields one row per
+unique cable straight from the cleaned deployment, ``iter_export`` turns rows
+into CSV or JSON Lines text one line at a time, and ``write_partitioned``
+writes one file per pod or rack for field teams.
+"""
+
+import csv
+import io
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, Callable, NamedTuple
 
 from infrahub_sdk.transforms import InfrahubTransform
 
 from .common import clean_data
 
+# (row key, CSV header, default) — column order of the cable matrix
+CABLE_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("pod", "Pod", "Not applicable"),
+    ("source_rack", "Source Rack", "TBD"),
+    ("source_device", "Source Device", "Unknown"),
+    ("source_interface", "Source Interface", "Unknown"),
+    ("destination_rack", "Destination Rack", "TBD"),
+    ("destination_device", "Destination Device", "Unknown"),
+    ("destination_interface", "Destination Interface", "Unknown"),
+    ("cable_type", "Cable type", "Unknown"),
+)
+
+# Row key used by each partitioned export mode
+PARTITION_KEYS = {"pod": "pod", "rack": "source_rack"}
+
+
+class ExportFormat(NamedTuple):
+    """Cable matrix text format: file extension, header text and row formatter."""
+
+    extension: str
+    header: str
+    row: Callable[[dict[str, Any]], str]
+
+
+def _csv_line(values: Iterable[str]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+    return buffer.getvalue()
+
+
+def _csv_row(cable: dict[str, Any]) -> str:
+    return _csv_line(str(cable.get(key) or default) for key, _, default in CABLE_COLUMNS)
+
+
+def _jsonl_row(cable: dict[str, Any]) -> str:
+    return json.dumps({key: cable.get(key) or default for key, _, default in CABLE_COLUMNS}) + "\n"
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    "csv": ExportFormat("csv", _csv_line(header for _, header, _ in CABLE_COLUMNS), _csv_row),
+    "jsonl": ExportFormat("jsonl", "", _jsonl_row),
+}
+
+
+def _export_format(output_format: str) -> ExportFormat:
+    try:
+        return EXPORT_FORMATS[output_format]
+    except KeyError:
+        raise ValueError(
+            f"Unknown export format '{output_format}' (expected one of {', '.join(EXPORT_FORMATS)})"
+        ) from None
+
+
+def iter_export(cables: Iterable[dict[str, Any]], output_format: str = "csv") -> Iterator[str]:
+    """Yield the cable matrix line by line (CSV header first)."""
+    export = _export_format(output_format)
+    if export.header:
+        yield export.header
+    for cable in cables:
+        yield export.row(cable)
+
+
+def write_partitioned(
+    cables: Iterable[dict[str, Any]],
+    directory: str | Path,
+    output_format: str = "csv",
+    partition_by: str = "pod",
+) -> dict[str, Path]:
+    """Write one cable matrix file per pod (or source rack) under ``directory``.
+
+    Rows are written as they are produced; one file per partition is kept
+    open, never the rows.
+
+    Returns:
+        Partition name → written file
+    """
+    export = _export_format(output_format)
+    if partition_by not in PARTITION_KEYS:
+        raise ValueError(f"Unknown partition '{partition_by}' (expected one of {', '.join(PARTITION_KEYS)})")
+    key = PARTITION_KEYS[partition_by]
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths: dict[str, Path] = {}
+    handles: dict[str, IO[str]] = {}
+    try:
+        for cable in cables:
+            name = str(cable.get(key) or "unassigned")
+            handle = handles.get(name)
+            if handle is None:
+                paths[name] = directory / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}.{export.extension}"
+                handle = handles[name] = paths[name].open("w", encoding="utf-8", newline="")
+                handle.write(export.header)
+            handle.write(export.row(cable))
+    finally:
+        for handle in handles.values():
+            handle.close()
+    return paths
+
 
 class TopologyCabling(InfrahubTransform):
     """Extract cabling connections from DC and Pod devices.
 
     This transform processes topology data to extract cable connections
-    between devices and generates a CSV cable matrix output.
+    between devices and generates a CSV cable matrix output
+    (``output_format`` selects another entry of ``EXPORT_FORMATS``).
     """
 
     query = "topology_cabling"
+    output_format = "csv"
 
     async def transform(self, data: dict[str, Any]) -> str:
-        """Transform cabling data into CSV format.
+        """Transform cabling data into the cable matrix.
 
         Processes TopologyDeployment data to extract cable connections
         from all pods and devices within the topology. Deduplicates cables
@@ -27,7 +140,7 @@ class TopologyCabling(InfrahubTransform):
             data: Query response containing TopologyDeployment
 
         Returns:
-            CSV string with cabling information
+            Cable matrix text (CSV by default)
 
         Raises:
             ValueError: If data extraction or validation fails
@@ -35,18 +148,13 @@ class TopologyCabling(InfrahubTransform):
         try:
             # Clean the raw GraphQL response
             cleaned_data = clean_data(data)
-
-            # Extract cables with deduplication by cable ID
-            cables = self._extract_unique_cables(cleaned_data)
-
-            # Generate CSV output
-            return self._generate_csv(cables)
+            return "".join(iter_export(self.iter_cables(cleaned_data), self.output_format))
 
         except (ValueError, KeyError, TypeError) as e:
             raise ValueError(f"Failed to transform cabling data: {e}") from e
 
-    def _extract_unique_cables(self, topology_data: dict[str, Any]) -> list[dict[str, Any]]:
-        """Extract unique cables from topology data.
+    def iter_cables(self, topology_data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Yield one row per unique cable, in query order.
 
         Supports two query formats:
         1. New: Cables queried directly via deployment's cables relationship (efficient)
@@ -54,11 +162,8 @@ class TopologyCabling(InfrahubTransform):
 
         Args:
             topology_data: Cleaned topology deployment data from GraphQL
-
-        Returns:
-            List of unique cable dictionaries
         """
-        cables_by_id: dict[str, dict[str, Any]] = {}
+        seen: set[str] = set()
 
         # Normalize root (may be raw or wrapped in TopologyDeployment/TopologyPhysicalDeployment)
         root = topology_data
@@ -72,78 +177,73 @@ class TopologyCabling(InfrahubTransform):
                 root = deployments[0]
 
         if not isinstance(root, dict):
-            return []
+            return
 
         deployment_name = self._get_safe_value(root, "name", "Not applicable")
 
         # Try new format first: direct cables relationship (more efficient)
         cables = root.get("cables", [])
         if cables:
-            for cable in cables:
-                if not isinstance(cable, dict):
+            yield from self._unique_cables(cables, deployment_name, seen)
+            return
+
+        # Fall back to legacy format: traverse devices->interfaces->cable
+        pods = root.get("children", [])
+        if pods:
+            for pod in pods:
+                if not isinstance(pod, dict):
                     continue
+                pod_name = self._get_safe_value(pod, "name", "Not applicable")
+                yield from self._cables_from_devices(pod.get("devices", []), pod_name, seen)
+        else:
+            # Try deployment-level devices
+            yield from self._cables_from_devices(root.get("devices", []), deployment_name, seen)
 
-                cable_id = cable.get("id")
-                if not cable_id or cable_id in cables_by_id:
-                    continue
+    def _extract_unique_cables(self, topology_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return every unique cable row (see ``iter_cables``)."""
+        return list(self.iter_cables(topology_data))
 
-                cable_data = self._extract_cable_data(cable, deployment_name)
-                if cable_data:
-                    cables_by_id[cable_id] = cable_data
-        else:
-            # Fall back to legacy format: traverse devices->interfaces->cable
-            pods = root.get("children", [])
-            if pods:
-                for pod in pods:
-                    if not isinstance(pod, dict):
-                        continue
-                    pod_name = self._get_safe_value(pod, "name", "Not applicable")
-                    devices = pod.get("devices", [])
-                    self._collect_cables_from_devices(devices, pod_name, cables_by_id)
-            else:
-                # Try deployment-level devices
-                devices = root.get("devices", [])
-                self._collect_cables_from_devices(devices, deployment_name, cables_by_id)
-
-        return list(cables_by_id.values())
-
-    def _collect_cables_from_devices(
+    def _unique_cables(self, cables: Iterable[Any], pod_name: str, seen: set[str]) -> Iterator[dict[str, Any]]:
+        """Yield rows for the cables whose ID is not in ``seen`` yet."""
+        for cable in cables:
+            if not isinstance(cable, dict):
+                continue
+
+            cable_id = cable.get("id")
+            if not cable_id or cable_id in seen:
+                continue
+
+            cable_data = self._extract_cable_data(cable, pod_name)
+            if cable_data:
+                seen.add(cable_id)
+                yield cable_data
+
+    def _cables_from_devices(
         self,
         devices: list[dict[str, Any]],
         pod_name: str,
-        cables_by_id: dict[str, dict[str, Any]],
-    ) -> None:
-        """Extract cables from device interfaces (legacy format support)."""
-
+        seen: set[str],
+    ) -> Iterator[dict[str, Any]]:
+        """Yield cables from device interfaces (legacy format support)."""
         for device in devices:
             if not isinstance(device, dict):
                 continue
-
-            for interface in device.get("interfaces", []):
-                if not isinstance(interface, dict):
-                    continue
-
-                cable_info = interface.get("cable")
-                if not cable_info or not isinstance(cable_info, dict):
-                    continue
-
-                cable_id = cable_info.get("id")
-                if not cable_id or cable_id in cables_by_id:
-                    continue
-
-                cable_data = self._extract_cable_data(cable_info, pod_name)
-                if cable_data:
-                    cables_by_id[cable_id] = cable_data
+            yield from self._unique_cables(
+                (interface.get("cable") for interface in device.get("interfaces", []) if isinstance(interface, dict)),
+                pod_name,
+                seen,
+            )
 
     def _extract_cable_data(self, cable_info: dict[str, Any], deployment_name: str) -> dict[str, Any] | None:
         """Extract cable connection data from cable information.
 
         Parses cable endpoints to extract source and destination device/interface
-        information, including rack details.
+        information, including rack details. The pod is the one of the source
+        rack, else of the destination rack, else ``deployment_name``.
 
         Args:
             cable_info: Cable information containing type and endpoints
-            deployment_name: Deployment name for context
+            deployment_name: Deployment (or pod) name used when no endpoint rack has a pod
 
         Returns:
             Cable record dictionary or None if extraction fails
@@ -168,13 +268,19 @@ class TopologyCabling(InfrahubTransform):
         source_rack = self._extract_rack_from_endpoint(source_endpoint)
         dest_rack = self._extract_rack_from_endpoint(dest_endpoint)
 
+        pod = (
+            self._extract_pod_from_endpoint(source_endpoint)
+            or self._extract_pod_from_endpoint(dest_endpoint)
+            or deployment_name
+        )
+
         # Extract cable type
         cable_type = cable_info.get("type", "Unknown")
         if isinstance(cable_type, dict):
             cable_type = cable_type.get("value", "Unknown")
 
         return {
-            "pod": deployment_name,
+            "pod": pod,
             "source_rack": source_rack,
             "source_device": source_device,
             "source_interface": source_interface,
@@ -221,6 +327,16 @@ class TopologyCabling(InfrahubTransform):
                 return rack_info["name"]
         return "TBD"
 
+    @staticmethod
+    def _extract_pod_from_endpoint(endpoint: dict[str, Any]) -> str:
+        """Extract the pod name of the endpoint device's rack ("" if the rack has no pod)."""
+        device_info = endpoint.get("device") or {}
+        rack_info = device_info.get("rack") if isinstance(device_info, dict) else None
+        pod_info = rack_info.get("pod") if isinstance(rack_info, dict) else None
+        if isinstance(pod_info, dict):
+            return pod_info.get("name") or ""
+        return ""
+
     @staticmethod
     def _get_safe_value(data: dict[str, Any], key: str, default: str = "") -> str:
         """Safely extract value from nested data structure.
@@ -241,43 +357,11 @@ class TopologyCabling(InfrahubTransform):
         return str(value) if value else default
 
     def _generate_csv(self, cables: list[dict[str, Any]]) -> str:
-        """Generate CSV output from cable data.
+        """Generate CSV output from cable data (see ``iter_export``)."""
+        return "".join(iter_export(cables, "csv"))
 
-        Args:
-            cables: List of cable dictionaries
 
-        Returns:
-            CSV string with proper formatting
-        """
-        # CSV header
-        header = ",".join(
-            [
-                "Pod",
-                "Source Rack",
-                "Source Device",
-                "Source Interface",
-                "Destination Rack",
-                "Destination Device",
-                "Destination Interface",
-                "Cable type",
-            ]
-        )
-
-        csv_rows = [header]
-
-        for cable in cables:
-            row = ",".join(
-                [
-                    cable.get("pod", "Not applicable"),
-                    cable.get("source_rack", "TBD"),
-                    cable.get("source_device", "Unknown"),
-                    cable.get("source_interface", "Unknown"),
-                    cable.get("destination_rack", "TBD"),
-                    cable.get("destination_device", "Unknown"),
-                    cable.get("destination_interface", "Unknown"),
-                    cable.get("cable_type", "Unknown"),
-                ]
-            )
-            csv_rows.append(row)
+class TopologyCablingJsonl(TopologyCabling):
+    """Cable matrix as JSON Lines (one object per cable)."""
 
-        return "\n".join(csv_rows) + "\n"
+    output_format = "jsonl"
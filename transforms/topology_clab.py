@@ -0,0 +1,96 @@
+"""Transform generating a containerlab topology from a topology deployment."""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from infrahub_sdk.transforms import InfrahubTransform
+
+from .common import clean_data
+
+
+class TopologyClab(InfrahubTransform):
+    """Render a containerlab topology (nodes and links) as YAML.
+
+    Replaces ``templates/clab_topology.j2``, which walked every interface of
+    every device and deduplicated links by scanning a list of processed
+    endpoints (O(L²) in template code). Links come from the deployment's
+    cables, each listed once with its two endpoints, and the YAML is built
+    line by line.
+    """
+
+    query = "topology_simulator"
+
+    async def transform(self, data: dict[str, Any]) -> str:
+        """Transform topology deployments into containerlab YAML.
+
+        Args:
+            data: Query response containing TopologyDeployment
+
+        Returns:
+            One YAML document per deployment
+        """
+        cleaned_data = clean_data(data)
+        if not isinstance(cleaned_data, dict):
+            return ""
+        return "".join(self._iter_yaml(cleaned_data.get("TopologyDeployment") or []))
+
+    def _iter_yaml(self, deployments: Iterable[dict[str, Any]]) -> Iterator[str]:
+        """Yield the topology YAML line by line."""
+        for index, topology in enumerate(deployments):
+            name = _text(topology.get("name"))
+            yield "---\n"
+            yield f"name: {name}\n"
+            yield 'prefix: ""\n\n'
+            yield "mgmt:\n"
+            yield f"  network: {name.lower()}\n"
+            yield f'  ipv4-subnet: "172.20.{index}.0/24"\n\n'
+
+            devices = topology.get("devices") or []
+            if not devices:
+                continue
+            yield "topology:\n"
+            yield "  nodes:\n"
+            for device in devices:
+                yield from self._node_lines(device)
+            yield "\n  links:\n"
+            for endpoint1, endpoint2 in self._links(topology.get("cables") or []):
+                yield f'    - endpoints: ["{endpoint1}", "{endpoint2}"]\n'
+
+    @staticmethod
+    def _node_lines(device: dict[str, Any]) -> Iterator[str]:
+        platform = device.get("platform") or {}
+        device_type = device.get("device_type") or {}
+        address = (device.get("primary_address") or {}).get("address")
+        yield f"    {_text(device.get('name'))}:\n"
+        yield f"      kind: {_text(platform.get('containerlab_os'))}\n"
+        yield f"      type: {_text(device_type.get('name'))}\n"
+        yield f"      image: {_text(device.get('os_version'))}\n"
+        if address:
+            yield "      management:\n"
+            yield f"        ipv4: {address}\n"
+
+    @staticmethod
+    def _links(cables: Iterable[dict[str, Any]]) -> Iterator[tuple[str, str]]:
+        """Yield the ``device:interface`` endpoints of every cable with two endpoints."""
+        seen: set[str] = set()
+        for cable in cables:
+            if not isinstance(cable, dict) or cable.get("id") in seen:
+                continue
+            endpoints = [_endpoint(endpoint) for endpoint in cable.get("endpoints") or [] if endpoint]
+            if len(endpoints) != 2 or not all(endpoints):
+                continue
+            if cable.get("id"):
+                seen.add(cable["id"])
+            yield endpoints[0], endpoints[1]
+
+
+def _endpoint(interface: dict[str, Any]) -> str:
+    """``device:interface`` from the interface HFID, with containerlab ``eth`` names ("" if unknown)."""
+    hfid = interface.get("hfid") or []
+    if len(hfid) < 2:
+        return ""
+    return f"{hfid[0]}:{hfid[1]}".replace("Ethernet", "eth")
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
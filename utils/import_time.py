@@ -0,0 +1,117 @@
+"""Cold-start import time of the transform and check worker modules.
+
+Every Python transform and check of ``.infrahub.yml`` is imported in a fresh
+interpreter, the way a worker loads it before its first run. Two numbers are
+taken per module:
+
+- ``sdk_ms``: importing ``infrahub_sdk.transforms`` and ``infrahub_sdk.checks``
+  (shared by every worker and outside this repository's control)
+- ``module_ms``: importing the module itself on top of the SDK, i.e. the cost
+  this repository adds
+
+Each measurement is the best of ``repeat`` runs. Besides the timings the
+report lists the heavy dependencies (:data:`HEAVY_MODULES`) the module pulled
+in: transforms that never render device configurations must load neither
+``jinja2``, ``netutils`` nor ``transforms.helpers.device``. ``transforms.common``
+keeps that stack behind lazy attributes for this reason.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+SDK_MODULES = ("infrahub_sdk.transforms", "infrahub_sdk.checks")
+"""Imported (and timed) before the worker module."""
+
+HEAVY_MODULES = ("jinja2", "netutils", "transforms.helpers.device")
+"""Packages reported when a worker module loads them (the device rendering stack)."""
+
+DEFAULT_TARGET_MS = 150.0
+"""Import time a worker module may add on top of the SDK (device transforms take ~100 ms)."""
+
+_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+for name in {sdk!r}:
+    importlib.import_module(name)
+sdk = time.perf_counter()
+before = set(sys.modules)
+importlib.import_module({module!r})
+end = time.perf_counter()
+sys.stdout.write(json.dumps({{
+    "sdk": sdk - start,
+    "module": end - sdk,
+    "loaded": sorted(set(sys.modules) - before),
+}}))
+"""
+
+
+@dataclass
+class ImportTime:
+    """Cold-start import cost of one worker module."""
+
+    module: str
+    kind: str
+    sdk_ms: float
+    module_ms: float
+    heavy: list[str] = field(default_factory=list)
+
+    def summary(self, target_ms: float = DEFAULT_TARGET_MS) -> str:
+        marker = "✗" if self.module_ms > target_ms else "✓"
+        heavy = f" [{', '.join(self.heavy)}]" if self.heavy else ""
+        return f"{marker} {self.module}: +{self.module_ms:.1f} ms over SDK ({self.sdk_ms:.1f} ms){heavy}"
+
+
+def worker_modules(root: Path = PROJECT_ROOT) -> dict[str, str]:
+    """Module name -> kind (``transform`` / ``check``) of every worker in ``.infrahub.yml``."""
+    config = yaml.safe_load((root / ".infrahub.yml").read_text(encoding="utf-8"))
+    modules: dict[str, str] = {}
+    for kind, section in (("transform", "python_transforms"), ("check", "check_definitions")):
+        for definition in config.get(section) or []:
+            path = Path(definition["file_path"])
+            modules.setdefault(".".join(path.with_suffix("").parts), kind)
+    return modules
+
+
+def loaded_heavy_modules(loaded: list[str]) -> list[str]:
+    """Entries of :data:`HEAVY_MODULES` found in ``loaded`` (a list of module names)."""
+    return [heavy for heavy in HEAVY_MODULES if any(name == heavy or name.startswith(f"{heavy}.") for name in loaded)]
+
+
+def probe(module: str, root: Path = PROJECT_ROOT) -> dict:
+    """Import ``module`` after the SDK in a fresh interpreter; seconds taken and modules loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(sdk=SDK_MODULES, module=module)],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def measure(module: str, kind: str = "", repeat: int = 3, root: Path = PROJECT_ROOT) -> ImportTime:
+    """Best-of-``repeat`` cold-start import time of ``module``."""
+    runs = [probe(module, root) for _ in range(max(repeat, 1))]
+    return ImportTime(
+        module=module,
+        kind=kind,
+        sdk_ms=round(min(run["sdk"] for run in runs) * 1000, 1),
+        module_ms=round(min(run["module"] for run in runs) * 1000, 1),
+        heavy=loaded_heavy_modules(runs[0]["loaded"]),
+    )
+
+
+def measure_workers(keyword: str = "", repeat: int = 3, root: Path = PROJECT_ROOT) -> list[ImportTime]:
+    """Measure every worker module of ``.infrahub.yml`` whose name contains ``keyword``."""
+    return [measure(module, kind, repeat, root) for module, kind in worker_modules(root).items() if keyword in module]
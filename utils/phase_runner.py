@@ -0,0 +1,140 @@
+"""Concurrent, timed execution of demo phases and their per-target steps."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+_LOG_SCOPE: ContextVar[str] = ContextVar("phase_runner_scope", default="")
+
+PHASE_TOTAL = "(total)"
+"""Step name of the row recording a whole phase."""
+
+
+class LogScopeFilter(logging.Filter):
+    """Prefix records with the step that logged them, e.g. ``[dc2] Loading …``.
+
+    Steps run as separate asyncio tasks, so messages of concurrent steps stay
+    attributable even though they share one logger.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        scope = _LOG_SCOPE.get()
+        if scope and not getattr(record, "log_scope", None):
+            record.log_scope = scope
+            record.msg = f"[{scope}] {record.msg}"
+        return True
+
+
+@dataclass
+class StepResult:
+    """Outcome of one timed step."""
+
+    phase: str
+    name: str
+    seconds: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def status(self) -> str:
+        return "ok" if self.error is None else "failed"
+
+
+class PhaseRunner:
+    """Run demo phases and their steps, recording per-step timings.
+
+    Args:
+        logger: Logger for progress messages; a ``LogScopeFilter`` is added to it.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        if not any(isinstance(f, LogScopeFilter) for f in self.logger.filters):
+            self.logger.addFilter(LogScopeFilter())
+        self.results: list[StepResult] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[StepResult]:
+        """Time the block as phase ``name``."""
+        result = StepResult(phase=name, name=PHASE_TOTAL)
+        started = time.perf_counter()
+        try:
+            yield result
+        except BaseException as exc:
+            result.error = exc
+            raise
+        finally:
+            result.seconds = time.perf_counter() - started
+            self.results.append(result)
+
+    async def step(self, phase: str, name: str, func: Callable[[], Awaitable[object]]) -> StepResult:
+        """Run ``func`` as step ``name`` of ``phase``; errors are recorded, not raised."""
+        result = StepResult(phase=phase, name=name)
+        token = _LOG_SCOPE.set(name)
+        started = time.perf_counter()
+        try:
+            await func()
+        except (Exception, SystemExit) as exc:
+            result.error = exc
+            self.logger.error("✗ step failed: %s", exc)
+        finally:
+            result.seconds = time.perf_counter() - started
+            _LOG_SCOPE.reset(token)
+            self.results.append(result)
+        return result
+
+    async def gather(
+        self,
+        phase: str,
+        steps: Sequence[tuple[str, Callable[[], Awaitable[object]]]],
+        max_parallel: int = 1,
+    ) -> list[StepResult]:
+        """Run independent steps with at most ``max_parallel`` in flight.
+
+        With ``max_parallel`` above 1 every step runs to completion even if
+        others fail. With ``max_parallel`` of 1 the steps run one by one and
+        the first failure stops the remaining steps.
+
+        Raises:
+            RuntimeError: If any step failed (after all started steps finished)
+        """
+        if max_parallel <= 1:
+            results = []
+            for name, func in steps:
+                results.append(await self.step(phase, name, func))
+                if results[-1].error is not None:
+                    break
+        else:
+            semaphore = asyncio.Semaphore(max_parallel)
+
+            async def _limited(name: str, func: Callable[[], Awaitable[object]]) -> StepResult:
+                async with semaphore:
+                    return await self.step(phase, name, func)
+
+            results = list(await asyncio.gather(*(_limited(name, func) for name, func in steps)))
+        failed = [result for result in results if result.error is not None]
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} of {len(steps)} step(s) failed in phase {phase}: "
+                + ", ".join(f"{result.name} ({result.error})" for result in failed)
+            )
+        return results
+
+    def timing_table(self) -> str:
+        """Return the recorded timings as a fixed-width table, grouped by phase."""
+        order = {phase: index for index, phase in enumerate(dict.fromkeys(r.phase for r in self.results))}
+        rows = sorted(self.results, key=lambda r: (order[r.phase], r.name == PHASE_TOTAL))
+        phase_width = max([len("Phase"), *(len(r.phase) for r in rows)])
+        step_width = max([len("Step"), *(len(r.name) for r in rows)])
+        lines = [f"{'Phase':<{phase_width}}  {'Step':<{step_width}}  {'Status':<6}  {'Seconds':>9}"]
+        lines.append("-" * len(lines[0]))
+        lines.extend(
+            f"{r.phase:<{phase_width}}  {r.name:<{step_width}}  {r.status:<6}  {r.seconds:>9.1f}" for r in rows
+        )
+        return "\n".join(lines)
@@ -0,0 +1,177 @@
+"""Opt-in profiling of generator, transform and check runs.
+
+``CommonGenerator``, ``BaseDeviceTransform`` and ``BaseCheck`` run under
+``profiled()`` when the ``PROFILING`` environment variable is set:
+
+- ``PROFILING=cpu`` writes cProfile stats to ``<dir>/<kind>-<name>-<target>.pstats``
+- ``PROFILING=memory`` writes the top allocations (tracemalloc) to ``<...>.memory.txt``
+- ``PROFILING=1`` / ``all`` / ``cpu,memory`` writes both
+
+``PROFILING_DIR`` sets the directory (default ``profiles`` under the working
+directory) and ``PROFILING_TOP`` the number of allocation sites (default 25).
+Read the stats with ``python -m pstats <file>`` or snakeviz.
+
+The profile covers the whole ``run()``: data collection (when no data is
+passed in) and the ``generate()`` / ``transform()`` / ``validate()`` call.
+cProfile traces the thread, so other coroutines scheduled on the same event
+loop during the run are included. When ``PROFILING`` is unset the cost is one
+environment lookup per run.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import re
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+PROFILING_ENV = "PROFILING"
+"""Environment variable enabling profiling (``cpu``, ``memory``, or both)."""
+
+PROFILING_DIR_ENV = "PROFILING_DIR"
+PROFILING_TOP_ENV = "PROFILING_TOP"
+
+DEFAULT_DIR = "profiles"
+DEFAULT_TOP = 25
+
+_ALL_VALUES = frozenset({"1", "true", "yes", "on", "all"})
+_DISABLED_VALUES = frozenset({"", "0", "false", "no", "off"})
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProfilingSetting:
+    """What to profile and where to write it."""
+
+    cpu: bool
+    memory: bool
+    directory: Path
+    top: int = DEFAULT_TOP
+
+
+def profiling_setting() -> ProfilingSetting | None:
+    """Read ``PROFILING`` / ``PROFILING_DIR`` / ``PROFILING_TOP`` (None when profiling is off).
+
+    Profiling is a debug switch: an unknown mode or a malformed
+    ``PROFILING_TOP`` logs a warning and leaves profiling off (or at the
+    default) instead of failing the run.
+    """
+    value = os.getenv(PROFILING_ENV, "").strip().lower()
+    if value in _DISABLED_VALUES:
+        return None
+    modes = {"cpu", "memory"} if value in _ALL_VALUES else {mode.strip() for mode in value.split(",")}
+    if unknown := modes - {"cpu", "memory"}:
+        log.warning(
+            "Unknown %s mode(s) %s (use cpu, memory or all), profiling is off",
+            PROFILING_ENV,
+            ", ".join(sorted(unknown)),
+        )
+        return None
+    top = os.getenv(PROFILING_TOP_ENV) or str(DEFAULT_TOP)
+    if not top.isdigit():
+        log.warning("Invalid %s=%r, using %d", PROFILING_TOP_ENV, top, DEFAULT_TOP)
+        top = str(DEFAULT_TOP)
+    return ProfilingSetting(
+        cpu="cpu" in modes,
+        memory="memory" in modes,
+        directory=Path(os.getenv(PROFILING_DIR_ENV) or DEFAULT_DIR),
+        top=int(top),
+    )
+
+
+def profile_stem(kind: str, name: str, target: str) -> str:
+    """File name stem ``<kind>-<name>-<target>``, reduced to safe characters."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", "-".join(part for part in (kind, name, target) if part))
+
+
+def payload_target(data: Any) -> str:
+    """Name of the first object of a raw GraphQL payload (the device an artifact renders), or ``""``."""
+    if not isinstance(data, dict):
+        return ""
+    data = data.get("data") or data
+    root = next(iter(data.values()), None) if data else None
+    nodes = root.get("edges") if isinstance(root, dict) else root
+    if not isinstance(nodes, list) or not nodes:
+        return ""
+    node = nodes[0].get("node", nodes[0]) if isinstance(nodes[0], dict) else None
+    name = node.get("name") if isinstance(node, dict) else None
+    name = name.get("value") if isinstance(name, dict) else name
+    return str(name) if name else ""
+
+
+def format_allocations(snapshot: tracemalloc.Snapshot, peak: int, top: int) -> str:
+    """Peak traced memory and the ``top`` allocation sites of ``snapshot``, one per line."""
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    stats = snapshot.statistics("lineno")
+    lines = [f"peak: {peak / 1024:.1f} KiB", f"held at end: {sum(stat.size for stat in stats) / 1024:.1f} KiB", ""]
+    lines += [str(stat) for stat in stats[:top]]
+    return "\n".join(lines) + "\n"
+
+
+def _enable(profiler: cProfile.Profile) -> bool:
+    """Start ``profiler`` unless another profiler already runs on this thread."""
+    if sys.getprofile() is not None:  # Python < 3.12 would silently replace it
+        return False
+    try:
+        profiler.enable()
+    except ValueError:  # Python 3.12+: another profiling tool is active
+        return False
+    return True
+
+
+@contextmanager
+def profiled(kind: str, name: str, target: str | Callable[[], str] = "") -> Iterator[list[Path]]:
+    """Profile the block per ``PROFILING``; yields the list the written files are appended to.
+
+    ``target`` may be a callable, evaluated only when profiling is on. A
+    profiler that is already running (nested profiled blocks, an outer
+    ``python -m cProfile``) is left alone and this block skips it.
+    """
+    written: list[Path] = []
+    setting = profiling_setting()
+    if setting is None:
+        yield written
+        return
+
+    stem = profile_stem(kind, name, target() if callable(target) else target)
+    profiler = cProfile.Profile() if setting.cpu else None
+    trace_memory = setting.memory and not tracemalloc.is_tracing()
+    if setting.memory and not trace_memory:
+        log.warning("tracemalloc already tracing, skipping memory profile of %s", stem)
+    if trace_memory:
+        tracemalloc.start()
+    if profiler is not None and not _enable(profiler):
+        log.warning("Another profiler is active, skipping CPU profile of %s", stem)
+        profiler = None
+    try:
+        yield written
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        setting.directory.mkdir(parents=True, exist_ok=True)
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            path = setting.directory / f"{stem}.memory.txt"
+            path.write_text(format_allocations(snapshot, peak, setting.top))
+            written.append(path)
+        if profiler is not None:
+            path = setting.directory / f"{stem}.pstats"
+            profiler.dump_stats(path)
+            written.append(path)
+        for path in written:
+            log.info("Profile written to %s", path)
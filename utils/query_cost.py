@@ -0,0 +1,381 @@
+"""Worst-case fan-out estimate of the GraphQL queries, gated by a node budget.
+
+Nested ``edges`` multiply: a device query selecting interfaces → capabilities
+→ peerings fetches ``interfaces × capabilities × peerings`` nodes per device.
+``estimate_query`` walks a query against the schemas under ``schemas/`` and
+counts the nodes the server may return:
+
+- a root field returns every object of its kind, or one object when it filters
+  on ``id``/``ids``/``hfid`` or on a unique attribute (``limit`` caps both);
+- a relationship of cardinality ``many`` returns, per parent, every object of
+  its peer kind in the sample deployment, unless ``max_per_parent`` bounds it
+  (e.g. a device never has more interfaces than its largest template);
+- a relationship of cardinality ``one`` returns at most one node per parent.
+
+Fields the schemas do not describe (core relationships such as
+``member_of_groups``) fall back on the query shape (``edges`` or ``node``) and
+``default_count``.
+
+The sample deployment counts every object defined in the object files it lists
+and adds the devices, cables, addresses and routing objects that
+``generators.simulator`` plans for its data center, along with the per-parent
+maxima seen in that plan (interfaces per device, sessions per BGP process). ``queries/budget.yml``
+holds the deployment, the per-parent bounds and the node budget of each query.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+from graphql import (
+    ArgumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    ListValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    parse,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BUDGET_FILE = PROJECT_ROOT / "queries" / "budget.yml"
+
+_ID_FILTERS = frozenset({"id", "ids", "hfid"})
+
+
+@dataclass
+class KindSchema:
+    """Relationships, unique attributes and parents of one node or generic."""
+
+    kind: str
+    inherit_from: list[str] = field(default_factory=list)
+    relationships: dict[str, tuple[str, str]] = field(default_factory=dict)
+    """Relationship name → (peer kind, cardinality)."""
+    unique: set[str] = field(default_factory=set)
+
+
+class SchemaIndex:
+    """Kinds of every schema file under a directory, extensions applied."""
+
+    def __init__(self, kinds: dict[str, KindSchema]) -> None:
+        self.kinds = kinds
+        self.implementations: dict[str, set[str]] = {}
+        for schema in kinds.values():
+            for parent in self._ancestors(schema.kind):
+                self.implementations.setdefault(parent, set()).add(schema.kind)
+
+    @classmethod
+    def load(cls, schema_dir: Path = PROJECT_ROOT / "schemas") -> SchemaIndex:
+        kinds: dict[str, KindSchema] = {}
+        extensions: list[dict[str, Any]] = []
+        for path in sorted(schema_dir.rglob("*.yml")):
+            for document in yaml.safe_load_all(path.read_text(encoding="utf-8")):
+                if not isinstance(document, dict):
+                    continue
+                for definition in (document.get("generics") or []) + (document.get("nodes") or []):
+                    schema = KindSchema(
+                        kind=definition["namespace"] + definition["name"],
+                        inherit_from=list(definition.get("inherit_from") or []),
+                    )
+                    _add_fields(schema, definition)
+                    kinds[schema.kind] = schema
+                ext = document.get("extensions") or {}
+                extensions += (ext.get("generics") or []) + (ext.get("nodes") or [])
+        for definition in extensions:
+            _add_fields(kinds.setdefault(definition["kind"], KindSchema(definition["kind"])), definition)
+        return cls(kinds)
+
+    def _ancestors(self, kind: str) -> list[str]:
+        seen: list[str] = []
+        pending = list(self.kinds[kind].inherit_from) if kind in self.kinds else []
+        while pending:
+            parent = pending.pop()
+            if parent not in seen:
+                seen.append(parent)
+                pending += self.kinds[parent].inherit_from if parent in self.kinds else []
+        return seen
+
+    def relationship(self, kind: str, name: str) -> tuple[str, str, str] | None:
+        """``(declaring kind, peer kind, cardinality)`` of ``kind.name``, inherited ones included.
+
+        On a generic, relationships of its implementations are considered too
+        (the first one in name order wins).
+        """
+        implementations = sorted(self.implementations.get(kind, ()))
+        candidates = [kind, *self._ancestors(kind)] + [
+            k for impl in implementations for k in (impl, *self._ancestors(impl))
+        ]
+        for candidate in candidates:
+            schema = self.kinds.get(candidate)
+            if schema and name in schema.relationships:
+                return (candidate, *schema.relationships[name])
+        return None
+
+    def is_unique(self, kind: str, attribute: str) -> bool:
+        return any(attribute in self.kinds[k].unique for k in [kind, *self._ancestors(kind)] if k in self.kinds)
+
+    def count(self, kind: str, counts: dict[str, int]) -> int | None:
+        """Objects of ``kind`` in ``counts``, implementations of a generic included."""
+        members = {kind} | self.implementations.get(kind, set())
+        if not any(member in counts for member in members):
+            return None
+        return sum(counts.get(member, 0) for member in members)
+
+
+def _add_fields(schema: KindSchema, definition: dict[str, Any]) -> None:
+    for relationship in definition.get("relationships") or []:
+        schema.relationships[relationship["name"]] = (relationship["peer"], relationship.get("cardinality", "many"))
+    schema.unique |= {attribute["name"] for attribute in definition.get("attributes") or [] if attribute.get("unique")}
+
+
+# ============================================================================
+# Sample deployment
+# ============================================================================
+
+
+def object_counts(paths: Iterable[Path]) -> Counter[str]:
+    """Objects per kind in the ``kind: Object`` files under ``paths`` (nested children included)."""
+    counts: Counter[str] = Counter()
+
+    def _count(kind: str, data: list[Any] | None) -> None:
+        for item in data or []:
+            counts[kind] += 1
+            for value in item.values() if isinstance(item, dict) else ():
+                if isinstance(value, dict) and "kind" in value and "data" in value:
+                    _count(value["kind"], value["data"])
+
+    for path in paths:
+        files = sorted(p for p in path.rglob("*") if p.suffix in {".yml", ".yaml"}) if path.is_dir() else [path]
+        for file in files:
+            for document in yaml.safe_load_all(file.read_text(encoding="utf-8")):
+                if isinstance(document, dict) and document.get("kind") == "Object":
+                    _count(document["spec"]["kind"], document["spec"].get("data"))
+    return counts
+
+
+def simulate_deployment(dc_dir: Path) -> tuple[Counter[str], dict[str, int]]:
+    """Objects the generators create for the data centers under ``dc_dir``.
+
+    Returns:
+        Objects per kind, and the per-parent maxima observed in the plan
+        (interfaces per device, sessions per BGP process, processes per device).
+    """
+    from generators.simulator import FabricSimulator, load_data_centers, load_device_templates
+
+    templates = load_device_templates()
+    counts: Counter[str] = Counter()
+    bounds: Counter[str] = Counter()
+    for dc in load_data_centers(dc_dir):
+        result = FabricSimulator(dc).run()
+        interfaces = [len(templates[d.template].interfaces) for d in result.devices if d.template in templates]
+        sessions = Counter(p["hfid"] for peering in result.routing.bgp_peerings for p in peering["bgp_processes"])
+        processes = Counter(c["id"] for process in result.routing.bgp_processes for c in process["device_capabilities"])
+        counts["DcimPhysicalDevice"] += len(result.devices)
+        counts["DcimPhysicalInterface"] += sum(interfaces)
+        counts["DcimCable"] += len(result.cables)
+        counts["IpamIPAddress"] += result.stats.addresses
+        counts["RoutingAutonomousSystem"] += result.stats.autonomous_systems
+        counts["ManagedBGP"] += result.stats.bgp_processes
+        counts["ManagedBGPPeering"] += result.stats.bgp_peerings
+        counts["RoutingOSPFInterface"] += result.stats.ospf_interfaces
+        bounds["DcimDevice.interfaces"] = max(bounds["DcimDevice.interfaces"], *interfaces, 0)
+        bounds["ManagedBGP.peerings"] = max(bounds["ManagedBGP.peerings"], *sessions.values(), 0)
+        bounds["DcimDevice.device_capabilities"] = max(bounds["DcimDevice.device_capabilities"], *processes.values(), 0)
+    return counts, {key: value for key, value in bounds.items() if value}
+
+
+# ============================================================================
+# Estimate
+# ============================================================================
+
+
+@dataclass
+class CostModel:
+    """Object counts of the sample deployment and per-parent bounds of ``many`` relationships."""
+
+    counts: dict[str, int]
+    max_per_parent: dict[str, int] = field(default_factory=dict)
+    """``<declaring kind>.<relationship>`` → most peers one parent can have."""
+    default_count: int = 10
+
+    def kind_count(self, schema: SchemaIndex, kind: str | None) -> int:
+        count = schema.count(kind, self.counts) if kind else None
+        return self.default_count if count is None else count
+
+
+@dataclass
+class QueryCost:
+    """Estimated nodes returned by one query."""
+
+    name: str
+    file: str
+    nodes: int = 0
+    depth: int = 0
+    """Most ``many`` relationships nested in one path."""
+    hottest: str = ""
+    """Field path returning the most nodes."""
+    hottest_nodes: int = 0
+
+    def summary(self) -> str:
+        return f"{self.name}: ~{self.nodes:,} node(s), depth {self.depth}, hottest {self.hottest} (~{self.hottest_nodes:,})"
+
+
+def estimate_document(source: str, schema: SchemaIndex, model: CostModel, file: str = "") -> list[QueryCost]:
+    """Estimate the nodes returned by each operation of ``source``, named after the operation."""
+    document = parse(source)
+    fragments = {d.name.value: d for d in document.definitions if isinstance(d, FragmentDefinitionNode)}
+    costs = []
+    for operation in (d for d in document.definitions if isinstance(d, OperationDefinitionNode)):
+        estimator = _Estimator(schema, model, fragments)
+        estimator.cost.name = operation.name.value if operation.name else Path(file).stem
+        estimator.cost.file = file
+        for root, _ in estimator.fields(operation.selection_set):
+            kind = root.name.value
+            estimator.visit(root, kind, estimator.root_multiplicity(root, kind), 0, (kind,))
+        costs.append(estimator.cost)
+    return costs
+
+
+def _argument_count(arguments: Iterable[ArgumentNode], names: Iterable[str]) -> int | None:
+    """Objects selected by the first of ``names`` passed: list length, integer value, or one."""
+    for argument in arguments:
+        if argument.name.value in names:
+            if isinstance(argument.value, ListValueNode):
+                return len(argument.value.values)
+            if isinstance(argument.value, IntValueNode):
+                return int(argument.value.value)
+            return 1
+    return None
+
+
+class _Estimator:
+    """Walks the operations of one document, accumulating a ``QueryCost``."""
+
+    def __init__(self, schema: SchemaIndex, model: CostModel, fragments: dict[str, FragmentDefinitionNode]) -> None:
+        self.schema = schema
+        self.model = model
+        self.fragments = fragments
+        self.cost = QueryCost(name="", file="")
+
+    def fields(
+        self, selection_set: SelectionSetNode | None, kind: str | None = None
+    ) -> list[tuple[FieldNode, str | None]]:
+        """Fields of a selection set with the kind they are selected on (fragments expanded)."""
+        fields: list[tuple[FieldNode, str | None]] = []
+        for selection in selection_set.selections if selection_set else ():
+            if isinstance(selection, FieldNode):
+                fields.append((selection, kind))
+            elif isinstance(selection, InlineFragmentNode):
+                condition = selection.type_condition.name.value if selection.type_condition else kind
+                fields += self.fields(selection.selection_set, condition)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments[selection.name.value]
+                fields += self.fields(fragment.selection_set, fragment.type_condition.name.value)
+        return fields
+
+    def unwrap(self, node: FieldNode) -> tuple[bool | None, list[FieldNode]]:
+        """``(many, node fields)`` of a relationship selection; ``many`` is None for attributes."""
+        inner = [f for f, _ in self.fields(node.selection_set)]
+        edges = [f for f in inner if f.name.value == "edges"]
+        if edges:
+            return True, [f for edge in edges for f, _ in self.fields(edge.selection_set) if f.name.value == "node"]
+        nodes = [f for f in inner if f.name.value == "node"]
+        return (False, nodes) if nodes else (None, [])
+
+    def root_multiplicity(self, root: FieldNode, kind: str) -> int:
+        arguments = root.arguments or ()
+        multiplicity = self.model.kind_count(self.schema, kind)
+        unique = {
+            argument.name.value
+            for argument in arguments
+            if argument.name.value.endswith("__value")
+            and self.schema.is_unique(kind, argument.name.value.removesuffix("__value"))
+        }
+        selected = _argument_count(arguments, _ID_FILTERS | unique)
+        if selected is not None:
+            multiplicity = min(multiplicity, selected) if multiplicity else selected
+        limit = _argument_count(arguments, ("limit",))
+        return min(multiplicity, limit) if limit is not None else multiplicity
+
+    def visit(
+        self, field_node: FieldNode, kind: str | None, multiplicity: int, depth: int, path: tuple[str, ...]
+    ) -> None:
+        """Count ``multiplicity`` nodes of ``kind`` for ``field_node`` and recurse into its relationships."""
+        cost = self.cost
+        cost.nodes += multiplicity
+        cost.depth = max(cost.depth, depth)
+        if multiplicity > cost.hottest_nodes:
+            cost.hottest, cost.hottest_nodes = ".".join(path), multiplicity
+
+        for node_field in self.unwrap(field_node)[1]:
+            for child, on_kind in self.fields(node_field.selection_set, kind):
+                many, _ = self.unwrap(child)
+                if many is None:
+                    continue
+                name = child.name.value
+                relationship = self.schema.relationship(on_kind, name) if on_kind else None
+                declared, peer = (relationship[0], relationship[1]) if relationship else (on_kind, None)
+                per_parent = 1
+                if many:
+                    bound = self.model.max_per_parent.get(f"{declared}.{name}")
+                    per_parent = bound if bound is not None else self.model.kind_count(self.schema, peer)
+                limit = _argument_count(child.arguments or (), ("limit",))
+                if limit is not None:
+                    per_parent = min(per_parent, limit)
+                self.visit(child, peer, multiplicity * per_parent, depth + int(many), (*path, name))
+
+
+# ============================================================================
+# Budget
+# ============================================================================
+
+
+@dataclass
+class Budget:
+    """Sample deployment, per-parent bounds and node budgets of ``queries/budget.yml``."""
+
+    model: CostModel
+    default: int
+    queries: dict[str, int] = field(default_factory=dict)
+
+    def limit(self, query: str) -> int:
+        return self.queries.get(query, self.default)
+
+
+def load_budget(path: Path = BUDGET_FILE, root: Path = PROJECT_ROOT) -> Budget:
+    config = yaml.safe_load(path.read_text(encoding="utf-8"))
+    deployment = config.get("sample_deployment") or {}
+    counts = object_counts(root / p for p in deployment.get("objects") or [])
+    bounds: dict[str, int] = {}
+    if deployment.get("data_center"):
+        simulated, bounds = simulate_deployment(root / deployment["data_center"])
+        counts.update(simulated)
+    counts |= deployment.get("counts") or {}
+    model = CostModel(
+        counts=dict(counts),
+        max_per_parent=bounds | (config.get("max_per_parent") or {}),
+        default_count=int(deployment.get("default_count", 10)),
+    )
+    budget = config.get("budget") or {}
+    return Budget(model=model, default=int(budget["default"]), queries=dict(budget.get("queries") or {}))
+
+
+def estimate_queries(budget: Budget | None = None, root: Path = PROJECT_ROOT) -> list[QueryCost]:
+    """Estimate every operation of every ``.gql`` file under ``queries/``."""
+    budget = budget or load_budget(root=root)
+    schema = SchemaIndex.load(root / "schemas")
+    return [
+        cost
+        for path in sorted((root / "queries").rglob("*.gql"))
+        for cost in estimate_document(
+            path.read_text(encoding="utf-8"), schema, budget.model, path.relative_to(root).as_posix()
+        )
+    ]
@@ -0,0 +1,367 @@
+"""Static usage analysis of the fields fetched by the artifact queries.
+
+For every artifact definition of ``.infrahub.yml`` the analyzer resolves the
+Python transform, its GraphQL query and the Jinja templates it renders, then
+answers one question: which query fields are never read?
+
+1. The query is parsed with graphql-core. Fragments are expanded and every
+   field is named by its path in the ``clean_data`` shape (``edges``/``node``
+   and ``value`` wrappers dropped, ``__typename`` read as ``typename``).
+2. Keys read are collected from the transform module and every project module
+   it imports (transitively): identifier-like string constants, docstrings
+   excluded. The templates (and the templates they include or import) add
+   attribute names, constant subscripts, string constants and variable names
+   of their Jinja ASTs.
+3. A field is used when its key is read and its parent field is used.
+
+Matching is by name and never by data flow, so the result errs on the side of
+"used": a field reported unused is not referenced anywhere the artifact's code
+can reach, while a field reported used may still be dead. The payload saving
+of each unused field is measured on the smoke fixtures of the transformation
+(``tests/smoke/configs/<transformation>_*/input.json``).
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import json
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    parse,
+)
+from jinja2 import Environment, FileSystemLoader, nodes
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LOCAL_PACKAGES = ("transforms", "utils", "checks", "generators")
+"""Top-level packages whose modules are followed through imports."""
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_WRAPPERS = frozenset({"edges", "node", "value"})
+
+FieldPath = tuple[str, ...]
+
+
+@dataclass
+class FieldUsage:
+    """One query field, by its path in the cleaned payload."""
+
+    path: FieldPath
+    used: bool
+    bytes_per_payload: float = 0.0
+
+    @property
+    def dotted(self) -> str:
+        return ".".join(self.path)
+
+
+@dataclass
+class ArtifactUsage:
+    """Field usage of the query behind one artifact definition."""
+
+    artifact: str
+    transformation: str
+    query: str
+    query_file: str
+    modules: list[str] = field(default_factory=list)
+    templates: list[str] = field(default_factory=list)
+    fields: list[FieldUsage] = field(default_factory=list)
+    samples: int = 0
+    payload_bytes: float = 0.0
+
+    @property
+    def unused(self) -> list[FieldUsage]:
+        """Unused fields, without the descendants of an unused field."""
+        unused = [usage for usage in self.fields if not usage.used]
+        return [usage for usage in unused if not any(_is_prefix(other.path, usage.path) for other in unused)]
+
+    @property
+    def saving_bytes(self) -> float:
+        """Average bytes per sample payload spent on unused fields."""
+        return sum(usage.bytes_per_payload for usage in self.unused)
+
+    @property
+    def saving_ratio(self) -> float:
+        return self.saving_bytes / self.payload_bytes if self.payload_bytes else 0.0
+
+    def summary(self) -> str:
+        saving = (
+            f", ~{self.saving_bytes:.0f} of {self.payload_bytes:.0f} bytes per payload ({self.saving_ratio:.0%})"
+            if self.samples
+            else ", no sample payload"
+        )
+        return f"{self.artifact} ({self.query}): {len(self.unused)} unused of {len(self.fields)} field(s){saving}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "artifact": self.artifact,
+            "transformation": self.transformation,
+            "query": self.query,
+            "query_file": self.query_file,
+            "modules": self.modules,
+            "templates": self.templates,
+            "fields": len(self.fields),
+            "samples": self.samples,
+            "payload_bytes": round(self.payload_bytes),
+            "saving_bytes": round(self.saving_bytes),
+            "unused": [
+                {"field": usage.dotted, "bytes_per_payload": round(usage.bytes_per_payload)} for usage in self.unused
+            ],
+        }
+
+
+def _is_prefix(prefix: FieldPath, path: FieldPath) -> bool:
+    return len(prefix) < len(path) and path[: len(prefix)] == prefix
+
+
+# ============================================================================
+# Query fields
+# ============================================================================
+
+
+def query_fields(source: str) -> list[FieldPath]:
+    """Paths of every field selected by the first operation of ``source``, in query order.
+
+    Fields selected more than once (e.g. by two inline fragments) are listed once.
+    """
+    document = parse(source)
+    fragments = {d.name.value: d for d in document.definitions if isinstance(d, FragmentDefinitionNode)}
+    operation = next(d for d in document.definitions if isinstance(d, OperationDefinitionNode))
+    return list(dict.fromkeys(_walk(operation.selection_set, (), fragments)))
+
+
+def _walk(
+    selection_set: SelectionSetNode,
+    parent: FieldPath,
+    fragments: dict[str, FragmentDefinitionNode],
+) -> Iterator[FieldPath]:
+    for selection in selection_set.selections:
+        if isinstance(selection, FragmentSpreadNode):
+            yield from _walk(fragments[selection.name.value].selection_set, parent, fragments)
+        elif isinstance(selection, InlineFragmentNode):
+            yield from _walk(selection.selection_set, parent, fragments)
+        elif isinstance(selection, FieldNode):
+            name = (selection.alias or selection.name).value
+            if name in _WRAPPERS:
+                path = parent
+            else:
+                path = (*parent, name.replace("__", ""))
+                yield path
+            if selection.selection_set:
+                yield from _walk(selection.selection_set, path, fragments)
+
+
+# ============================================================================
+# Keys read
+# ============================================================================
+
+
+def module_keys(paths: Iterable[Path]) -> set[str]:
+    """Identifier-like string constants of Python modules, docstrings excluded."""
+    keys: set[str] = set()
+    for path in paths:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        docstrings = {
+            id(node.body[0].value)
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.body
+            and isinstance(node.body[0], ast.Expr)
+            and isinstance(node.body[0].value, ast.Constant)
+        }
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings:
+                if _IDENTIFIER.match(node.value):
+                    keys.add(node.value)
+    return keys
+
+
+def imported_modules(path: Path, root: Path = PROJECT_ROOT) -> list[Path]:
+    """``path`` and every project module it imports, transitively (imports of ``LOCAL_PACKAGES`` only)."""
+    seen: dict[Path, None] = {}
+    pending = [path.resolve()]
+    while pending:
+        current = pending.pop()
+        if current in seen or not current.is_file():
+            continue
+        seen[current] = None
+        package = current.parent.relative_to(root).parts if current.is_relative_to(root) else ()
+        for node in ast.walk(ast.parse(current.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.ImportFrom):
+                base = list(package[: len(package) - node.level + 1]) if node.level else []
+                module = [*base, *(node.module or "").split(".")] if node.module else base
+                candidates = [module] + [[*module, alias.name] for alias in node.names]
+            elif isinstance(node, ast.Import):
+                candidates = [alias.name.split(".") for alias in node.names]
+            else:
+                continue
+            for parts in candidates:
+                if parts and parts[0] in LOCAL_PACKAGES:
+                    target = root.joinpath(*parts)
+                    pending.extend([target.with_suffix(".py"), target / "__init__.py"])
+    return list(seen)
+
+
+def template_keys(env: Environment, names: Iterable[str]) -> tuple[set[str], list[str]]:
+    """Keys read by the templates ``names`` and the templates they include or import.
+
+    Returns:
+        The keys and the names of every template visited.
+    """
+    keys: set[str] = set()
+    visited: dict[str, None] = {}
+    pending = list(names)
+    while pending:
+        name = pending.pop(0)
+        if name in visited:
+            continue
+        visited[name] = None
+        source, _, _ = env.loader.get_source(env, name)  # type: ignore[union-attr]
+        tree = env.parse(source)
+        for node in tree.find_all((nodes.Getattr, nodes.Getitem, nodes.Const, nodes.Name, nodes.Keyword)):
+            if isinstance(node, nodes.Getattr):
+                keys.add(node.attr)
+            elif isinstance(node, nodes.Name):
+                keys.add(node.name)
+            elif isinstance(node, nodes.Const) and isinstance(node.value, str) and _IDENTIFIER.match(node.value):
+                keys.add(node.value)
+        for node in tree.find_all((nodes.Include, nodes.Import, nodes.FromImport)):
+            if isinstance(node.template, nodes.Const):
+                pending.append(node.template.value)
+    return keys, list(visited)
+
+
+# ============================================================================
+# Payload sizes
+# ============================================================================
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def field_bytes(payload: Any, path: FieldPath) -> int:
+    """Bytes taken by the field at ``path`` (key included) in a raw query response."""
+    if not path:
+        return 0
+    if isinstance(payload, list):
+        return sum(field_bytes(item, path) for item in payload)
+    if not isinstance(payload, dict):
+        return 0
+    if "edges" in payload and len(payload) == 1:
+        return field_bytes([edge.get("node") for edge in payload["edges"] or []], path)
+    if "node" in payload and len(payload) == 1:
+        return field_bytes(payload["node"], path)
+    total = 0
+    for key, value in payload.items():
+        if key.replace("__", "") != path[0]:
+            continue
+        total += (_size(key) + 1 + _size(value) + 1) if len(path) == 1 else field_bytes(value, path[1:])
+    return total
+
+
+# ============================================================================
+# Artifacts
+# ============================================================================
+
+
+def _definitions(root: Path) -> dict[str, Any]:
+    return yaml.safe_load((root / ".infrahub.yml").read_text(encoding="utf-8"))
+
+
+def _transform_class(file_path: str, class_name: str) -> type:
+    module = ".".join(Path(file_path).with_suffix("").parts)
+    return getattr(importlib.import_module(module), class_name)
+
+
+def _template_names(root: Path, transform_cls: type, modules: list[Path]) -> list[str]:
+    """Templates rendered by a transform, relative to ``templates/configs``."""
+    configs = root / "templates" / "configs"
+    subdir = getattr(transform_cls, "template_subdir", "")
+    if subdir:
+        return sorted(path.relative_to(configs).as_posix() for path in (configs / subdir).glob("*.j2"))
+    literals = {
+        node.value
+        for node in ast.walk(ast.parse(modules[0].read_text(encoding="utf-8")))
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.endswith(".j2")
+    }
+    return sorted(path.relative_to(configs).as_posix() for name in literals for path in configs.rglob(name))
+
+
+def analyze_artifact(definition: dict[str, Any], root: Path = PROJECT_ROOT) -> ArtifactUsage:
+    """Field usage of the query behind one ``artifact_definitions`` entry.
+
+    Raises:
+        ValueError: If the transformation or its query is not defined in ``.infrahub.yml``
+    """
+    config = _definitions(root)
+    transformation = definition["transformation"]
+    transform = next((t for t in config.get("python_transforms", []) if t["name"] == transformation), None)
+    if transform is None:
+        raise ValueError(f"Unknown python transform '{transformation}'")
+    transform_cls = _transform_class(transform["file_path"], transform["class_name"])
+    query = next((q for q in config.get("queries", []) if q["name"] == transform_cls.query), None)
+    if query is None:
+        raise ValueError(f"Unknown query '{transform_cls.query}' for transform '{transformation}'")
+
+    modules = imported_modules(root / transform["file_path"], root)
+    keys = module_keys(modules)
+    env = Environment(loader=FileSystemLoader(str(root / "templates" / "configs")), autoescape=False)
+    template_read, templates = template_keys(env, _template_names(root, transform_cls, modules))
+    keys |= template_read
+
+    paths = query_fields((root / query["file_path"]).read_text(encoding="utf-8"))
+    used: set[FieldPath] = set()
+    fields = []
+    for path in paths:
+        # Root fields are unwrapped by position (get_data), not read by name
+        is_used = len(path) == 1 or (path[:-1] in used and path[-1] in keys)
+        if is_used:
+            used.add(path)
+        fields.append(FieldUsage(path, is_used))
+
+    report = ArtifactUsage(
+        artifact=definition["name"],
+        transformation=transformation,
+        query=query["name"],
+        query_file=query["file_path"],
+        modules=[path.relative_to(root).as_posix() for path in modules],
+        templates=templates,
+        fields=fields,
+    )
+    samples = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted((root / "tests" / "smoke" / "configs").glob(f"{transformation}_*/input.json"))
+    ]
+    if samples:
+        report.samples = len(samples)
+        report.payload_bytes = sum(_size(sample) for sample in samples) / len(samples)
+        for usage in report.unused:
+            usage.bytes_per_payload = sum(field_bytes(sample, usage.path) for sample in samples) / len(samples)
+    return report
+
+
+def analyze(artifacts: Iterable[str] = (), root: Path = PROJECT_ROOT) -> list[ArtifactUsage]:
+    """Field usage of every artifact definition (or only of the ``artifacts`` named).
+
+    Raises:
+        ValueError: If a name in ``artifacts`` is not an artifact definition
+    """
+    definitions = _definitions(root).get("artifact_definitions", [])
+    wanted = list(artifacts)
+    missing = sorted(set(wanted) - {d["name"] for d in definitions})
+    if missing:
+        raise ValueError(f"Unknown artifact definition(s): {', '.join(missing)}")
+    return [analyze_artifact(d, root) for d in definitions if not wanted or d["name"] in wanted]
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from infrahub_sdk.task.models import TaskFilter, TaskState
@@ -12,6 +14,64 @@ from infrahub_sdk.task.models import TaskFilter, TaskState
 if TYPE_CHECKING:
     from infrahub_sdk.client import InfrahubClient
 
+ACTIVE_STATES = [TaskState.RUNNING, TaskState.PENDING, TaskState.SCHEDULED]
+FAILURE_STATES = [TaskState.FAILED, TaskState.CANCELLED, TaskState.CRASHED]
+
+
+@dataclass(frozen=True)
+class TaskWaitPolicy:
+    """Polling schedule for ``wait_for_branch_tasks``.
+
+    While tasks are running the interval backs off exponentially from
+    ``min_interval`` to ``max_interval`` (with +/- ``jitter`` so concurrent
+    waiters do not poll in lockstep). Any change - a task starting, changing
+    state or finishing - resets it to ``min_interval``, because finished
+    generators trigger follow-up tasks through events. The branch counts as
+    quiet after ``settle`` seconds (and at least two polls) without tasks or
+    changes.
+
+    Attributes:
+        min_interval: Poll interval after a change and while confirming quiet
+        max_interval: Upper bound of the backoff while tasks are running
+        backoff: Interval growth factor per unchanged poll
+        jitter: Random +/- fraction applied to every interval
+        settle: Seconds without active tasks or changes required to finish
+    """
+
+    min_interval: float = 1.0
+    max_interval: float = 10.0
+    backoff: float = 2.0
+    jitter: float = 0.2
+    settle: float = 5.0
+
+    @classmethod
+    def from_poll_interval(cls, poll_interval: float) -> TaskWaitPolicy:
+        """Policy equivalent to fixed polling every ``poll_interval`` with a one-interval settle window."""
+        return cls(
+            min_interval=min(cls.min_interval, poll_interval),
+            max_interval=poll_interval,
+            settle=poll_interval,
+        )
+
+    def next_interval(self, current: float, changed: bool) -> float:
+        """Return the un-jittered interval following ``current``."""
+        if changed:
+            return self.min_interval
+        return min(max(current, self.min_interval) * self.backoff, self.max_interval)
+
+    def jittered(self, interval: float) -> float:
+        return max(interval * random.uniform(1 - self.jitter, 1 + self.jitter), 0.0)
+
+
+def _changed_since(task: Any, since: datetime) -> bool:
+    """True if ``task`` was created or updated at/after ``since`` (or carries no timestamps)."""
+    stamp = getattr(task, "updated_at", None) or getattr(task, "created_at", None)
+    if not isinstance(stamp, datetime):
+        return True
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp >= since
+
 
 def _should_monitor_task(
     task: Any,
@@ -78,12 +138,19 @@ async def wait_for_branch_tasks(
     workflows: Optional[list[str]] = None,
     workflow_filter_mode: Optional[Literal["include", "exclude"]] = None,
     logger: Optional[logging.Logger] = None,
+    policy: Optional[TaskWaitPolicy] = None,
+    since: Optional[datetime] = None,
+    raise_on_failure: bool = True,
 ) -> None:
-    """Wait for tasks started after now on a branch to finish (fail fast on errors).
+    """Wait until a branch is quiet: no active tasks and no changes for a settle window.
 
-    Captures the set of tasks already active when called and ignores them, so only
-    tasks that start after this point block the wait. Raises on timeout or when any
-    new task ends in a failure state.
+    Each poll issues a single query for the active tasks of the branch and
+    diffs it against the previous poll (per-task state). Tasks that left the
+    active set are looked up by id to learn how they ended, so failures are
+    reported as soon as they are observed. Once the branch is quiet, one final
+    query picks up tasks that failed without ever being seen active. Failures
+    older than ``since`` are ignored, so earlier failed runs on the branch do
+    not block the wait.
 
     Usage:
         # Exclude specific workflows (default behavior)
@@ -106,13 +173,16 @@ async def wait_for_branch_tasks(
         client: InfrahubClient instance to use for task queries
         branch: Branch name to monitor (defaults to client's default branch)
         timeout: Maximum time to wait in seconds
-        poll_interval: Polling interval in seconds
+        poll_interval: Polling interval in seconds, used when no ``policy`` is given
         workflows: List of workflow names to filter (optional).
         workflow_filter_mode: How to apply workflow filter:
             - "exclude": Exclude tasks matching workflows
             - "include": Only monitor tasks matching workflows
             - None: Monitor all workflows without filtering (default)
         logger: Logger instance for progress messages (optional)
+        policy: Backoff and settle schedule (defaults to ``TaskWaitPolicy.from_poll_interval(poll_interval)``)
+        since: Only failures of tasks created or updated after this time count (defaults to now)
+        raise_on_failure: Raise on failed tasks; when False they are only logged
 
     Raises:
         ValueError: If branch cannot be determined
@@ -123,107 +193,108 @@ async def wait_for_branch_tasks(
     if not branch_name:
         raise ValueError("Branch is required to wait for tasks (explicit or client default)")
 
+    policy = policy or TaskWaitPolicy.from_poll_interval(poll_interval)
+    since = since or datetime.now(timezone.utc)
+
     # Determine workflow filter
     workflow_set: Optional[set[str]] = None
     if workflow_filter_mode is not None and workflows is not None:
         workflow_set = set(workflows)
 
-    # Define task states
-    active_states = [TaskState.RUNNING, TaskState.PENDING, TaskState.SCHEDULED]
-    failure_states = [TaskState.FAILED, TaskState.CANCELLED, TaskState.CRASHED]
+    def monitored(tasks: list[Any]) -> list[Any]:
+        return [task for task in tasks if _should_monitor_task(task, workflow_set, workflow_filter_mode)]
+
+    # Last observed state of every active task, and failures already reported
+    states: dict[str, TaskState] = {}
+    reported: set[str] = set()
+
+    def report(failures: list[Any]) -> None:
+        failures = [task for task in failures if task.id not in reported]
+        if not failures:
+            return
+        reported.update(task.id for task in failures)
+        message = f"Tasks failed on branch {branch_name}: " + ", ".join(f"{t.id}:{t.state}" for t in failures)
+        if raise_on_failure:
+            raise RuntimeError(message)
+        if logger:
+            logger.warning(message)
+
+    async def poll() -> bool:
+        """Refresh ``states``; return True if any task started, changed state or finished."""
+        current = {
+            task.id: task
+            for task in monitored(await client.task.filter(filter=TaskFilter(state=ACTIVE_STATES, branch=branch_name)))
+        }
+
+        started = [task for task_id, task in current.items() if task_id not in states]
+        moved = [task for task_id, task in current.items() if task_id in states and states[task_id] != task.state]
+        finished = [task_id for task_id in states if task_id not in current]
 
-    # Track all task IDs we've seen (prevents re-checking tasks that already failed)
-    seen_task_ids: set[str] = set()
+        if finished:
+            ended = await client.task.filter(filter=TaskFilter(ids=finished, branch=branch_name))
+            report([task for task in ended if task.state in FAILURE_STATES])
 
-    # Track consecutive stable checks (no active tasks)
+        if logger:
+            for task in started:
+                logger.info("Task %s started on %s (%s)", task.id, branch_name, task.state)
+            for task in moved:
+                logger.info("Task %s: %s -> %s", task.id, states[task.id], task.state)
+            if finished:
+                logger.info("%d task(s) finished on %s", len(finished), branch_name)
+
+        states.clear()
+        states.update({task_id: task.state for task_id, task in current.items()})
+        return bool(started or moved or finished)
+
+    if logger:
+        logger.info("Starting task monitoring on branch %s - will monitor all active tasks", branch_name)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    last_change = loop.time()
+    interval = policy.min_interval
     stable_checks = 0
-    required_stable_checks = 2  # Require 2 consecutive checks with no active tasks
-
-    async def check_tasks_completed() -> bool:
-        """Predicate function: check if all tasks are completed (fail-fast on errors).
-
-        Returns:
-            True if all tasks completed successfully, False if still active
-
-        Raises:
-            RuntimeError: If any tasks failed
-        """
-        nonlocal stable_checks
-
-        # Re-query ALL tasks on every iteration to detect newly spawned tasks
-        # Check for failures FIRST (fail-fast)
-        failing = await client.task.filter(filter=TaskFilter(state=failure_states, branch=branch_name))
-        new_failures = [
-            task
-            for task in failing
-            if task.id not in seen_task_ids and _should_monitor_task(task, workflow_set, workflow_filter_mode)
-        ]
-        if new_failures:
-            # Mark failed tasks as seen
-            seen_task_ids.update(t.id for t in new_failures)
-            raise RuntimeError(
-                f"Tasks failed on branch {branch_name}: " + ", ".join(f"{t.id}:{t.state}" for t in new_failures)
-            )
 
-        # Query ALL active tasks on the branch (including newly spawned ones)
-        current_active = await client.task.filter(filter=TaskFilter(state=active_states, branch=branch_name))
-        monitored_tasks = [
-            task for task in current_active if _should_monitor_task(task, workflow_set, workflow_filter_mode)
-        ]
+    while True:
+        changed = await poll()
+        now = loop.time()
 
-        if not monitored_tasks:
-            # No active tasks - increment stable counter
+        if changed:
+            last_change = now
+            if stable_checks and logger:
+                logger.info("New tasks detected after stable period - resetting stability window")
+            stable_checks = 0
+        elif not states:
             stable_checks += 1
+            quiet = now - last_change
             if logger:
                 logger.info(
-                    "No active tasks found on branch %s (stable check %d/%d)",
+                    "No active tasks found on branch %s (stable check %d, quiet %.1fs/%.1fs)",
                     branch_name,
                     stable_checks,
-                    required_stable_checks,
+                    quiet,
+                    policy.settle,
                 )
-
-            # Require multiple consecutive checks to ensure no tasks are spawning
-            if stable_checks >= required_stable_checks:
+            if stable_checks >= 2 and quiet >= policy.settle:
+                failing = await client.task.filter(filter=TaskFilter(state=FAILURE_STATES, branch=branch_name))
+                report([task for task in monitored(failing) if _changed_since(task, since)])
                 if logger:
                     logger.info("All tasks completed successfully on branch %s", branch_name)
-                return True
-
-            # Not stable yet, continue monitoring
-            return False
-
-        # Active tasks found - reset stable counter
-        if stable_checks > 0:
-            if logger:
-                logger.info("New tasks detected after stable period - resetting stability counter")
-        stable_checks = 0
-
-        # Update seen task IDs
-        seen_task_ids.update(t.id for t in monitored_tasks)
-
-        # Log current state
-        if logger:
+                return
+        elif logger:
             logger.info(
                 "Waiting for %d active tasks on %s: %s",
-                len(monitored_tasks),
+                len(states),
                 branch_name,
-                ", ".join(f"{t.id}:{t.state}" for t in monitored_tasks),
+                ", ".join(f"{task_id}:{state}" for task_id, state in states.items()),
             )
 
-        return False
-
-    if logger:
-        logger.info("Starting task monitoring on branch %s - will monitor all active tasks", branch_name)
-
-    # Wait until predicate returns True or timeout
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if await check_tasks_completed():
-            return
-        await asyncio.sleep(poll_interval)
-
-    # Timeout reached - query final state for error message
-    final_active = await client.task.filter(filter=TaskFilter(state=active_states, branch=branch_name))
-    monitored_tasks = [task for task in final_active if _should_monitor_task(task, workflow_set, workflow_filter_mode)]
-    raise TimeoutError(
-        f"Timeout waiting for tasks to finish on branch {branch_name}: {[f'{t.id}:{t.state}' for t in monitored_tasks]}"
-    )
+        # Settle at the minimum interval; back off only while known tasks keep running
+        interval = policy.next_interval(interval, changed or not states)
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Timeout waiting for tasks to finish on branch {branch_name}: "
+                f"{[f'{task_id}:{state}' for task_id, state in states.items()]}"
+            )
+        await asyncio.sleep(min(policy.jittered(interval), remaining))